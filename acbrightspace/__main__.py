@@ -0,0 +1,5 @@
+import sys
+
+from acbrightspace.cli import main
+
+sys.exit(main())
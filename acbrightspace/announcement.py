@@ -0,0 +1,212 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import logging
+from typing import Any, Callable, Iterable
+from urllib.parse import quote
+
+from acbrightspace.content import LE_API_VERSION
+from acbrightspace.session import HttpSession
+
+logger = logging.getLogger(__name__)
+
+FEED_VERSION = 1
+"""Version of the data written by `AnnouncementFeed.to_dict`."""
+
+@dataclass
+class Announcement:
+    """Represents an announcement (news item) posted in a course."""
+
+    id: int
+    """ID of the announcement."""
+
+    org_unit_id: int
+    """Organizational unit ID of the course the announcement was posted in."""
+
+    title: str
+    """Title of the announcement."""
+
+    body: str
+    """Body of the announcement as plain text."""
+
+    published_at: datetime
+    """When the announcement was published, in UTC."""
+
+    updated_at: datetime | None
+    """When the announcement was last edited, in UTC."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the announcement as JSON compatible data, with dates in ISO 8601 format.
+
+        Returns:
+            dict[str, Any]: A dictionary that `from_dict` turns back into an equal announcement.
+        """
+        return {
+            "id": self.id,
+            "org_unit_id": self.org_unit_id,
+            "title": self.title,
+            "body": self.body,
+            "published_at": self.published_at.isoformat(),
+            "updated_at": self.updated_at.isoformat() if self.updated_at is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], version: int = 1) -> "Announcement":
+        """Creates an announcement from the data returned by `to_dict`.
+
+        Args:
+            data (dict[str, Any]): The data.
+            version (int): Version of the data format the data was written with.
+
+        Returns:
+            Announcement: The announcement.
+
+        Raises:
+            ValueError: If the version is not supported.
+        """
+        if version != 1:
+            raise ValueError(f"Unsupported Announcement data version: {version}")
+        return cls(
+            id=data["id"],
+            org_unit_id=data["org_unit_id"],
+            title=data["title"],
+            body=data["body"],
+            published_at=datetime.fromisoformat(data["published_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") is not None else None,
+        )
+
+def _utc(value: datetime) -> datetime:
+    """Converts a datetime to UTC, treating naive datetimes as local time."""
+    return value.astimezone(timezone.utc)
+
+def _parse_date(value: str | None) -> datetime | None:
+    return _utc(datetime.fromisoformat(value)) if value else None
+
+def format_since(since: datetime) -> str:
+    """Formats a datetime as the UTC timestamp that the Brightspace API expects, such as "2026-01-12T14:30:00.000Z"."""
+    return _utc(since).strftime("%Y-%m-%dT%H:%M:%S.") + f"{_utc(since).microsecond // 1000:03d}Z"
+
+def news_path(org_unit_id: int | str, since: datetime | None = None) -> str:
+    """Returns the API path of a course's announcements, optionally only those published after `since`."""
+    path = f"/d2l/api/le/{LE_API_VERSION}/{org_unit_id}/news/"
+    return path if since is None else f"{path}?since={quote(format_since(since))}"
+
+def fetch_announcements(session: HttpSession, org_unit_id: int | str, since: datetime | None = None) -> list[Announcement]:
+    """Fetches the visible announcements of a course, newest first.
+
+    With `since`, Brightspace only sends announcements published after it, so polling
+    a course that has nothing new costs one small request. Reading stops at the first
+    announcement that is not newer than `since`, in case the server sends them anyway.
+
+    Args:
+        session (HttpSession): An authenticated HTTP session.
+        org_unit_id (int | str): The organizational unit ID of the course.
+        since (datetime | None): Only return announcements published after this time.
+            Naive datetimes are taken as local time.
+
+    Returns:
+        list[Announcement]: The announcements, newest first.
+    """
+    items = session.get_json(news_path(org_unit_id, since))
+    announcements = []
+    for item in items:
+        published_at = _parse_date(item.get("StartDate") or item.get("CreatedDate"))
+        if item.get("IsHidden") or published_at is None:
+            continue
+        body = item.get("Body") or {}
+        announcements.append(Announcement(
+            id=item["Id"],
+            org_unit_id=int(org_unit_id),
+            title=item.get("Title") or "",
+            body=body.get("Text") or "",
+            published_at=published_at,
+            updated_at=_parse_date(item.get("LastModifiedDate")),
+        ))
+    announcements.sort(key=lambda announcement: announcement.published_at, reverse=True)
+
+    if since is None:
+        return announcements
+    cursor = _utc(since)
+    for index, announcement in enumerate(announcements):
+        if announcement.published_at <= cursor:
+            logger.debug("Reached announcements already seen in %s after %d new ones.", org_unit_id, index)
+            return announcements[:index]
+    return announcements
+
+class AnnouncementFeed:
+    """Announcements of several courses, fetched incrementally.
+
+    The feed keeps a cursor per course: the publication time of the newest announcement
+    seen. Each poll only asks for announcements published after the cursor and then
+    moves it forward. Save the cursors with `to_dict` to continue from them later.
+
+    Example:
+        >>> feed = AnnouncementFeed()
+        >>> new = feed.poll(brightspace.get_announcements, [course.org_unit_id for course in courses])
+        >>> saved = feed.to_dict()
+    """
+
+    def __init__(self, cursors: dict[int, datetime] | None = None) -> None:
+        """Creates a feed.
+
+        Args:
+            cursors (dict[int, datetime] | None): Publication time of the newest announcement
+                already seen in each course, by organizational unit ID.
+        """
+        self.cursors = {int(org_unit_id): _utc(cursor) for org_unit_id, cursor in (cursors or {}).items()}
+
+    def since(self, org_unit_id: int | str) -> datetime | None:
+        """Returns the cursor of a course, or None if none of its announcements were seen."""
+        return self.cursors.get(int(org_unit_id))
+
+    def update(self, announcements: Iterable[Announcement]) -> list[Announcement]:
+        """Moves the cursors past announcements, returning those that were not seen before.
+
+        Args:
+            announcements (Iterable[Announcement]): Announcements of any of the courses.
+
+        Returns:
+            list[Announcement]: The announcements newer than their course's cursor, newest first.
+        """
+        new = [
+            announcement for announcement in announcements
+            if (cursor := self.cursors.get(announcement.org_unit_id)) is None or announcement.published_at > cursor
+        ]
+        for announcement in new:
+            cursor = self.cursors.get(announcement.org_unit_id)
+            if cursor is None or announcement.published_at > cursor:
+                self.cursors[announcement.org_unit_id] = announcement.published_at
+        return sorted(new, key=lambda announcement: announcement.published_at, reverse=True)
+
+    def poll(self, fetch: Callable[[int, datetime | None], list[Announcement]], org_unit_ids: Iterable[int | str]) -> list[Announcement]:
+        """Fetches the announcements published since the last poll in each course.
+
+        Args:
+            fetch (Callable[[int, datetime | None], list[Announcement]]): Fetches the announcements
+                of a course published after a time, such as `Brightspace.get_announcements`.
+            org_unit_ids (Iterable[int | str]): Organizational unit IDs of the courses.
+
+        Returns:
+            list[Announcement]: The new announcements of every course, newest first.
+        """
+        fetched = []
+        for org_unit_id in org_unit_ids:
+            fetched += fetch(int(org_unit_id), self.since(org_unit_id))
+        return self.update(fetched)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the cursors as JSON compatible data that `from_dict` reads."""
+        return {
+            "version": FEED_VERSION,
+            "cursors": {str(org_unit_id): cursor.isoformat() for org_unit_id, cursor in self.cursors.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AnnouncementFeed":
+        """Creates a feed from the data returned by `to_dict`.
+
+        Raises:
+            ValueError: If the version is not supported.
+        """
+        if data.get("version") != FEED_VERSION:
+            raise ValueError(f"Unsupported announcement feed version: {data.get('version')}")
+        return cls({int(org_unit_id): datetime.fromisoformat(cursor) for org_unit_id, cursor in data["cursors"].items()})
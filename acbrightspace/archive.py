@@ -0,0 +1,354 @@
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import math
+import mmap
+import os
+from pathlib import Path
+import struct
+import sys
+from typing import Any, Callable, Iterable, Sequence
+
+from acbrightspace.assignment import Assignment
+from acbrightspace.course import Course, CourseFilter
+from acbrightspace.fraction import Fraction
+from acbrightspace.grade_item import GradeItem
+from acbrightspace.semester import TERMS, Semester
+from acbrightspace.serialization import decode, encode, pack, unpack
+
+MAGIC = b"ACBA"
+"""First bytes of an archive file."""
+
+ARCHIVE_VERSION = 1
+"""Version of the archive layout."""
+
+_HEADER = struct.Struct("<4sB3xQQ")
+"""Magic, version, and the offset and length of the directory at the end of the file."""
+
+_EPOCH = datetime(1970, 1, 1)
+
+_MISSING_DATETIME = -(2**63)
+"""Stored in place of a missing date."""
+
+_MISSING_INTEGER = -(2**63)
+"""Stored in place of a missing integer."""
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+type ArchivedCourse = tuple[Course, Sequence[GradeItem], Sequence[Assignment]]
+"""A closed course with its grades and assignments."""
+
+# Column encodings. Each column is stored as one or more arrays of little endian numbers
+# or bytes, so a query maps in only the arrays of the columns it reads.
+
+def _micros(value: datetime) -> int:
+    if value.tzinfo is not None:
+        raise ValueError(f"Archived dates must be naive like the dates on Brightspace pages, got {value.isoformat()}")
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+def _numbers(typecode: str, values: Iterable[Any]) -> bytes:
+    numbers = array(typecode, values)
+    if not _LITTLE_ENDIAN:
+        numbers.byteswap()
+    return numbers.tobytes()
+
+def _cast(view: memoryview, typecode: str) -> Sequence[Any]:
+    if _LITTLE_ENDIAN:
+        return view.cast(typecode)
+    numbers = array(typecode, view)
+    numbers.byteswap()
+    return numbers
+
+def _encode_text(values: list[str | None]) -> list[bytes]:
+    encoded = [value.encode("utf-8") if value is not None else b"" for value in values]
+    ends = [0]
+    for item in encoded:
+        ends.append(ends[-1] + len(item))
+    present = bytes(value is not None for value in values)
+    return [present, _numbers("q", ends), b"".join(encoded)]
+
+def _encode_fraction(values: list[Fraction | None]) -> list[bytes]:
+    pairs = []
+    for value in values:
+        pairs += [value.numerator, value.denominator] if value is not None else [math.nan, math.nan]
+    return [_numbers("d", pairs)]
+
+def _encode_datetime(values: list[datetime | None]) -> list[bytes]:
+    return [_numbers("q", (_micros(value) if value is not None else _MISSING_DATETIME for value in values))]
+
+def _encode_integer(values: list[int | None]) -> list[bytes]:
+    return [_numbers("q", (value if value is not None else _MISSING_INTEGER for value in values))]
+
+@dataclass(frozen=True)
+class _Kind:
+    """How the values of one type are stored."""
+
+    encode: Callable[[list[Any]], list[bytes]]
+    """Turns the values of a column into its arrays."""
+
+    decode: Callable[[list[memoryview], int, int], list[Any]]
+    """Reads the values of rows `start` to `stop` from the column's arrays."""
+
+def _decode_text(arrays: list[memoryview], start: int, stop: int) -> list[str | None]:
+    present, ends, blob = arrays
+    offsets = _cast(ends, "q")[start:stop + 1]
+    return [
+        str(blob[offsets[index]:offsets[index + 1]], "utf-8") if present[start + index] else None
+        for index in range(stop - start)
+    ]
+
+def _decode_fraction(arrays: list[memoryview], start: int, stop: int) -> list[Fraction | None]:
+    pairs = _cast(arrays[0], "d")[2 * start:2 * stop]
+    return [
+        Fraction(pairs[index], pairs[index + 1]) if not math.isnan(pairs[index]) else None
+        for index in range(0, len(pairs), 2)
+    ]
+
+def _decode_datetime(arrays: list[memoryview], start: int, stop: int) -> list[datetime | None]:
+    return [
+        _EPOCH + timedelta(microseconds=micros) if micros != _MISSING_DATETIME else None
+        for micros in _cast(arrays[0], "q")[start:stop]
+    ]
+
+def _decode_integer(arrays: list[memoryview], start: int, stop: int) -> list[int | None]:
+    return [value if value != _MISSING_INTEGER else None for value in _cast(arrays[0], "q")[start:stop]]
+
+_KINDS = {
+    "text": _Kind(_encode_text, _decode_text),
+    "fraction": _Kind(_encode_fraction, _decode_fraction),
+    "datetime": _Kind(_encode_datetime, _decode_datetime),
+    "integer": _Kind(_encode_integer, _decode_integer),
+}
+
+_TABLES: dict[str, tuple[type, dict[str, str]]] = {
+    "grades": (GradeItem, {"name": "text", "points": "fraction", "weight": "fraction", "comments": "text"}),
+    "assignments": (Assignment, {
+        "name": "text", "starts_at": "datetime", "ends_at": "datetime", "due_at": "datetime",
+        "score": "fraction", "completion_status": "text", "evaluation_status": "text", "folder_id": "integer",
+    }),
+}
+"""The archived tables: the model of their rows, and the kind of each of its fields."""
+
+_TERM_ORDER = {term: index for index, term in enumerate(TERMS.values())}
+
+def write_archive(path: Path | str, courses: Iterable[ArchivedCourse]) -> None:
+    """Freezes closed courses with their grades and assignments into an archive file.
+
+    Every field of the grades and assignments is stored as its own column, so queries
+    read only the columns they need. The rows of a course, and the courses of a semester,
+    are stored next to each other. The file is replaced atomically.
+
+    Example:
+        >>> write_archive("archive.acba", [(course, brightspace.get_grades(str(course.org_unit_id)), [])])
+
+    Args:
+        path (Path | str): The archive file.
+        courses (Iterable[ArchivedCourse]): The courses, with their grades and assignments.
+
+    Raises:
+        ValueError: If a course is still active, appears twice, or has a date with a time zone.
+    """
+    entries = sorted(courses, key=lambda entry: (entry[0].semester.year, _TERM_ORDER[entry[0].semester.term], entry[0].full_code))
+    org_unit_ids = [course.org_unit_id for course, _, _ in entries]
+    active = [course.full_code for course, _, _ in entries if course.is_active]
+    if active:
+        raise ValueError(f"Only closed courses can be archived, since active ones still change: {', '.join(active)}")
+    if len(set(org_unit_ids)) != len(org_unit_ids):
+        raise ValueError("Every course can only be archived once.")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    with temporary.open("wb") as file:
+        file.write(bytes(_HEADER.size))
+
+        def write_array(data: bytes) -> list[int]:
+            # Aligned, so the array can be used in place as numbers
+            file.write(bytes(-file.tell() % 8))
+            segment = [file.tell(), len(data)]
+            file.write(data)
+            return segment
+
+        tables: dict[str, Any] = {}
+        ranges: dict[str, list[list[int]]] = {}
+        # The tables are in the order of the lists in an archived course
+        for index, (table, (_, fields)) in enumerate(_TABLES.items(), start=1):
+            rows = [row for entry in entries for row in entry[index]]
+            starts = [0]
+            for entry in entries:
+                starts.append(starts[-1] + len(entry[index]))
+            ranges[table] = [[starts[position], starts[position + 1]] for position in range(len(entries))]
+            tables[table] = {
+                "rows": len(rows),
+                "columns": {
+                    name: [kind, [write_array(data) for data in _KINDS[kind].encode([getattr(row, name) for row in rows])]]
+                    for name, kind in fields.items()
+                },
+            }
+
+        directory = pack({
+            "courses": encode([course for course, _, _ in entries]) if entries else b"",
+            "ranges": ranges,
+            "tables": tables,
+        })
+        offset = file.tell()
+        file.write(directory)
+        file.seek(0)
+        file.write(_HEADER.pack(MAGIC, ARCHIVE_VERSION, offset, len(directory)))
+    os.replace(temporary, path)
+
+class CourseArchive:
+    """A read-only, memory-mapped archive of closed courses written by `write_archive`.
+
+    Opening an archive reads only its small directory: the courses, and where the rows
+    of each course and the arrays of each column are. Queries turn only the requested
+    columns of the requested courses into Python values, and the operating system only
+    loads the pages of the file that they touch.
+
+    Example:
+        >>> with CourseArchive("archive.acba") as archive:
+        ...     courses = archive.find(semester=Semester.from_code("24F"))
+        ...     points = archive.column("grades", "points", courses)
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Opens an archive.
+
+        Args:
+            path (Path | str): The archive file.
+
+        Raises:
+            FileNotFoundError: If there is no archive file.
+            ValueError: If the file is not an archive or has an unsupported version.
+        """
+        self.path = Path(path)
+        with self.path.open("rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{self.path} is not a course archive.")
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        try:
+            magic, version, offset, length = _HEADER.unpack_from(self._map)
+            if magic != MAGIC:
+                raise ValueError(f"{self.path} is not a course archive.")
+            if version != ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported archive version in {self.path}: {version}")
+            directory = unpack(self._view[offset:offset + length])
+            self.courses: list[Course] = decode(directory["courses"]) if directory["courses"] else []
+            """The archived courses, by semester and then by code."""
+            self._ranges: dict[str, list[list[int]]] = directory["ranges"]
+            self._tables: dict[str, Any] = directory["tables"]
+        except Exception:
+            self.close()
+            raise
+
+        self._positions = {course.org_unit_id: position for position, course in enumerate(self.courses)}
+        self._semesters: dict[Semester, list[int]] = {}
+        for position, course in enumerate(self.courses):
+            self._semesters.setdefault(course.semester, []).append(position)
+
+    def __enter__(self) -> "CourseArchive":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmaps the file. Values returned by queries stay valid."""
+        self._view.release()
+        self._map.close()
+
+    @property
+    def semesters(self) -> list[Semester]:
+        """Returns the semesters of the archived courses, oldest first."""
+        return list(self._semesters)
+
+    def course(self, org_unit_id: int) -> Course:
+        """Returns an archived course.
+
+        Raises:
+            KeyError: If the course is not in the archive.
+        """
+        return self.courses[self._positions[org_unit_id]]
+
+    def __contains__(self, org_unit_id: object) -> bool:
+        return org_unit_id in self._positions
+
+    def find(self, semester: Semester | None = None, code_prefix: str | None = None) -> list[Course]:
+        """Returns the archived courses of a semester and with a code prefix, using the semester index.
+
+        Args:
+            semester (Semester | None): Only return courses of this semester.
+            code_prefix (str | None): Only return courses whose full code or course code starts with this.
+
+        Returns:
+            list[Course]: The courses, in archive order.
+        """
+        positions = self._semesters.get(semester, []) if semester is not None else range(len(self.courses))
+        course_filter = CourseFilter(code_prefix=code_prefix)
+        return [self.courses[position] for position in positions if course_filter.matches(self.courses[position])]
+
+    def column(self, table: str, name: str, courses: Iterable[Course | int] | None = None) -> list[Any]:
+        """Reads one column of a table, without building the other fields or the objects.
+
+        Args:
+            table (str): "grades" or "assignments".
+            name (str): A field of `GradeItem` or `Assignment`, such as "points" or "due_at".
+            courses (Iterable[Course | int] | None): The courses, or their org unit IDs, to read
+                the rows of, in this order. Every course if None.
+
+        Returns:
+            list[Any]: The values of the column, course by course.
+
+        Raises:
+            KeyError: If the table, column or a course is not in the archive.
+        """
+        if table not in self._tables:
+            raise KeyError(f"No table {table!r} in the archive; expected one of {', '.join(self._tables)}")
+        columns = self._tables[table]["columns"]
+        if name not in columns:
+            raise KeyError(f"No column {name!r} in {table}; expected one of {', '.join(columns)}")
+        kind, segments = columns[name]
+        arrays = [self._view[offset:offset + length] for offset, length in segments]
+        values: list[Any] = []
+        for start, stop in self._row_ranges(table, courses):
+            values += _KINDS[kind].decode(arrays, start, stop)
+        return values
+
+    def _row_ranges(self, table: str, courses: Iterable[Course | int] | None) -> list[tuple[int, int]]:
+        if courses is None:
+            return [(0, self._tables[table]["rows"])]
+        ranges: list[tuple[int, int]] = []
+        for course in courses:
+            start, stop = self._ranges[table][self._positions[course.org_unit_id if isinstance(course, Course) else course]]
+            # Neighbouring courses, such as those of one semester, are read in one go
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], stop)
+            else:
+                ranges.append((start, stop))
+        return ranges
+
+    def _rows(self, table: str, org_unit_id: int) -> list[Any]:
+        model, fields = _TABLES[table]
+        # Fields added after the archive was written keep their defaults
+        stored = self._tables[table]["columns"]
+        columns = {name: self.column(table, name, [org_unit_id]) for name in fields if name in stored}
+        return [model(**{name: values[index] for name, values in columns.items()}) for index in range(len(columns["name"]))]
+
+    def grades(self, org_unit_id: int) -> list[GradeItem]:
+        """Returns the grades of an archived course.
+
+        Raises:
+            KeyError: If the course is not in the archive.
+        """
+        return self._rows("grades", org_unit_id)
+
+    def assignments(self, org_unit_id: int) -> list[Assignment]:
+        """Returns the assignments of an archived course.
+
+        Raises:
+            KeyError: If the course is not in the archive.
+        """
+        return self._rows("assignments", org_unit_id)
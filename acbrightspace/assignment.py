@@ -1,8 +1,15 @@
 from datetime import datetime
 from dataclasses import dataclass
+from typing import Any
 
 from acbrightspace.fraction import Fraction
 
+def _optional_datetime(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+def _parse_optional_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
+
 @dataclass
 class Assignment:
     """Represents an assignment in Brightspace."""
@@ -26,4 +33,53 @@ class Assignment:
     """Completion status of the assignment."""
 
     evaluation_status: str | None
-    """Evaluation status of the assignment."""
\ No newline at end of file
+    """Evaluation status of the assignment."""
+
+    folder_id: int | None = None
+    """ID of the assignment's dropbox folder, needed to submit to it."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the assignment as JSON compatible data, with dates in ISO 8601 format.
+
+        Returns:
+            dict[str, Any]: A dictionary that `from_dict` turns back into an equal assignment.
+        """
+        return {
+            "name": self.name,
+            "starts_at": _optional_datetime(self.starts_at),
+            "ends_at": _optional_datetime(self.ends_at),
+            "due_at": _optional_datetime(self.due_at),
+            "score": self.score.to_dict() if self.score is not None else None,
+            "completion_status": self.completion_status,
+            "evaluation_status": self.evaluation_status,
+            "folder_id": self.folder_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], version: int = 1) -> "Assignment":
+        """Creates an assignment from the data returned by `to_dict`.
+
+        Args:
+            data (dict[str, Any]): The data.
+            version (int): Version of the data format the data was written with.
+
+        Returns:
+            Assignment: The assignment.
+
+        Raises:
+            ValueError: If the version is not supported.
+        """
+        if version != 1:
+            raise ValueError(f"Unsupported Assignment data version: {version}")
+
+        return cls(
+            name=data["name"],
+            starts_at=_parse_optional_datetime(data.get("starts_at")),
+            ends_at=_parse_optional_datetime(data.get("ends_at")),
+            due_at=_parse_optional_datetime(data.get("due_at")),
+            score=Fraction.from_dict(data["score"], version) if data.get("score") is not None else None,
+            completion_status=data.get("completion_status"),
+            evaluation_status=data.get("evaluation_status"),
+            folder_id=data.get("folder_id"),
+        )
+
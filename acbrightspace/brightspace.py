@@ -1,6 +1,10 @@
+from contextlib import contextmanager
 from datetime import datetime
+import functools
+import os
 from os import name
-from typing import Any, List
+from typing import Any, Callable, Concatenate, Iterable, Iterator, List, ParamSpec, TypeVar
+from urllib.parse import parse_qs, urlsplit
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -12,22 +16,232 @@ from selenium.webdriver.remote.shadowroot import ShadowRoot
 from selenium.webdriver.remote.webelement import WebElement
 import pyotp
 import logging
+import re
+import threading
+import time
+from acbrightspace.announcement import Announcement, fetch_announcements
 from acbrightspace.assignment import Assignment
-from acbrightspace.course import Course
-from acbrightspace.fraction import Fraction
+from acbrightspace.content import ContentDownloader, ContentModule, DownloadResult, fetch_content
+from acbrightspace.course import Course, CourseFilter
+from acbrightspace.drivers import HtmlDriver, HttpDriver
+from acbrightspace.dropbox import Submission, SubmissionReceipt, SubmissionResult, check_open, submit_files, submit_many
+from acbrightspace.errors import AuthenticationError, BrightspaceError, HttpStatusError, TableNotFoundError
 from acbrightspace.grade_item import GradeItem
-from acbrightspace.table import Table
+from acbrightspace.metrics import MetricsCollector, MetricsSink, NavigationMetrics
+from acbrightspace.pager import MAX_PAGE_WORKERS, Pager, fetch_pages, page_url
+from acbrightspace.prefetch import TabPrefetcher
+from acbrightspace.profile import ChromeProfile
+from acbrightspace.ratelimit import LOGIN, PAGE, RateLimiter
+from acbrightspace.resilience import Resilience
+from acbrightspace.quiz import Quiz, QuizAttempt, QuizQuestion
+from acbrightspace.schema import DROPBOX_SCHEMA, GRADES_SCHEMA, QUIZ_ATTEMPTS_SCHEMA, QUIZ_QUESTIONS_SCHEMA, QUIZZES_SCHEMA, DatedText, TableSchema
+from acbrightspace.semester import Semester
+from acbrightspace.session import BASE_URL, HttpSession
+from acbrightspace.table import Row, Table, TableState, snapshot_table
 
 logger = logging.getLogger(__name__)
 
-class BrightspaceError(Exception):
-    """Exception for Brightspace-related errors."""
+LOGIN_URL_MARKERS = ("login.microsoftonline.com", "/d2l/login")
+"""Parts of a URL that show the browser was sent to a login page."""
+
+SERVER_ERROR_TITLE = re.compile(r"\b(5\d\d)\b|Internal Server Error|Service Unavailable|Bad Gateway|Gateway Time-?out", re.IGNORECASE)
+"""Matches the title of a Brightspace (or proxy) error page."""
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+def _operation(method: Callable[Concatenate["Brightspace", P], R]) -> Callable[Concatenate["Brightspace", P], R]:
+    """Marks a method as an operation that uses the driver.
+
+    The operation holds the client's driver lock from start to end, so operations
+    called from several threads run one after another instead of interleaving their
+    navigations. The metrics of its page loads are labelled with its name.
+    """
+    @functools.wraps(method)
+    def wrapper(self: "Brightspace", *args: P.args, **kwargs: P.kwargs) -> R:
+        with self._driver_lock:
+            previous, self._operation = self._operation, method.__name__
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._operation = previous
+    return wrapper
+
+def _link_parameter(element: Any, name: str) -> int | None:
+    """Returns a numeric query parameter of the first link in an element that has it, such as the quiz ID "qi"."""
+    for link in element.find_elements(By.TAG_NAME, "a"):
+        values = parse_qs(urlsplit(link.get_attribute("href") or "").query).get(name)
+        if values and values[0].isdigit():
+            return int(values[0])
+    return None
+
+def _username_field_or_url(url: str) -> Callable[[Any], Any]:
+    """Waits for the username field of the login form, or for the browser to reach a URL without it.
+
+    The condition returns the field, or True if the current URL contains `url`.
+    """
+    def condition(driver: Any) -> Any:
+        current_url = str(driver.current_url)
+        if url in current_url and not any(marker in current_url for marker in LOGIN_URL_MARKERS):
+            return True
+        fields = driver.find_elements(By.NAME, "loginfmt")
+        return fields[0] if fields else False
+    return condition
 
 class Brightspace:
-    """Interface for interacting with Algonquin College Brightspace."""
+    """Interface for interacting with Algonquin College Brightspace.
+
+    A client drives one browser (or static driver), which can only show one page at a
+    time. Methods can be called from any thread: each one checks the driver out for its
+    whole duration, so concurrent calls on the same client wait for each other instead of
+    interleaving navigations. To load pages in parallel, use one client per worker, for
+    example through a `ClientPool` from `acbrightspace.pool`.
+    """
     
-    def __init__(self):
-        self.driver = webdriver.Chrome()
+    def __init__(self, base_url: str = BASE_URL, resilience: Resilience | None = None, driver: Any = None, profile: ChromeProfile | None = None, remote_url: str | None = None, metrics: MetricsSink | None = None, rate_limiter: RateLimiter | None = None, prefetch_tabs: int = 0):
+        """Starts a new browser for interacting with Brightspace.
+
+        Args:
+            base_url (str): Root URL of the Brightspace website.
+            resilience (Resilience | None): Retry and circuit breaker policy for page loads.
+                Share one instance between workers so they all back off together.
+            driver (Any): WebDriver to use instead of starting Chrome, such as an
+                `HttpDriver` or `ReplayDriver` from `acbrightspace.drivers`.
+            profile (ChromeProfile | None): Persistent Chrome profile to start Chrome with, so
+                cached D2L scripts survive between runs. It is locked until `close` is called.
+            remote_url (str | None): URL of a remote WebDriver endpoint, such as a Selenium Grid,
+                to start Chrome on instead of this machine. See `acbrightspace.grid` for spreading
+                jobs across several endpoints.
+            metrics (MetricsSink | None): Receives performance data of every page load, such as
+                a `MetricsLog` or `JsonLinesSink` from `acbrightspace.metrics`.
+            rate_limiter (RateLimiter | None): Limits how fast pages are loaded and logins attempted.
+                Share one instance between workers so the limit covers all of them. The session
+                of an `HttpDriver` without a limiter of its own is given this one.
+            prefetch_tabs (int): Maximum number of background tabs `prefetch` keeps loaded pages in.
+                0 disables prefetching. Only browsers have tabs, so static drivers ignore it.
+        """
+        if remote_url is not None and profile is not None:
+            raise ValueError("A local Chrome profile cannot be used with a remote WebDriver.")
+        self.base_url = base_url.rstrip("/")
+        self.resilience = resilience or Resilience()
+        self.profile = profile
+        # How long the first page load after logging in took, which is much shorter with a warm profile
+        self.first_navigation_seconds: float | None = None
+        self._metrics_sinks: list[MetricsSink] = [metrics] if metrics is not None else []
+        # Held while replacing the list of sinks, which navigations on other threads read
+        self._metrics_lock = threading.Lock()
+        self._metrics_collector = MetricsCollector()
+        self._operation: str | None = None
+        # Held by every method that uses the driver; reentrant since operations call each other
+        self._driver_lock = threading.RLock()
+        self.rate_limiter = rate_limiter
+        # Account of the last login, for the rate limiter's per account budget
+        self.account: str | None = None
+
+        if driver is not None:
+            self.driver = driver
+        elif remote_url is not None:
+            self.driver = webdriver.Remote(command_executor=remote_url, options=webdriver.ChromeOptions())
+        elif profile is not None:
+            profile.acquire()
+            try:
+                self.driver = webdriver.Chrome(options=profile.options())
+            except BaseException:
+                profile.release()
+                raise
+        else:
+            self.driver = webdriver.Chrome()
+
+        if rate_limiter is not None and isinstance(self.driver, HttpDriver) and self.driver.session.rate_limiter is None:
+            self.driver.session.rate_limiter = rate_limiter
+
+        self.prefetcher: TabPrefetcher | None = None
+        if prefetch_tabs > 0 and not isinstance(self.driver, HtmlDriver):
+            self.prefetcher = TabPrefetcher(self.driver, max_tabs=prefetch_tabs)
+
+    def _get(self, url: str) -> None:
+        """Loads a page, recording how long the first page load took and sending metrics to the sinks.
+
+        A page that was prefetched is shown by switching to its tab instead.
+        """
+        queue_delay = 0.0
+        started_at = datetime.now()
+        start = time.perf_counter()
+        if self.prefetcher is None or not self.prefetcher.take(url):
+            # Static drivers are limited by their HTTP session, if at all
+            if self.rate_limiter is not None and not isinstance(self.driver, HtmlDriver):
+                category = LOGIN if self._operation == "login" else PAGE
+                queue_delay = self.rate_limiter.acquire(url, category, self.account)
+                started_at = datetime.now()
+                start = time.perf_counter()
+            self.driver.get(url)
+        duration = time.perf_counter() - start
+
+        # Login pages do not load the D2L web components that a warm profile caches
+        if self.first_navigation_seconds is None and self._operation != "login":
+            self.first_navigation_seconds = duration
+            warmth = "" if self.profile is None else " (warm profile)" if self.profile.was_warm else " (cold profile)"
+            logger.info("First page load took %.2fs%s.", self.first_navigation_seconds, warmth)
+
+        # Sinks are added and removed by replacing the list, so this one stays as it is
+        sinks = self._metrics_sinks
+        if sinks:
+            try:
+                metrics = self._metrics_collector.collect(self.driver, url, self._operation, started_at, duration)
+                metrics.queue_delay = queue_delay
+            except Exception:
+                logger.warning("Failed to collect metrics of %s.", url, exc_info=True)
+                return
+            for sink in sinks:
+                try:
+                    sink(metrics)
+                except Exception:
+                    # Metrics must not fail the navigation they describe
+                    logger.warning("Metrics sink %r failed for %s.", sink, url, exc_info=True)
+
+    @contextmanager
+    def capture_metrics(self) -> Iterator[list[NavigationMetrics]]:
+        """Collects the performance data of the page loads made inside the block.
+
+        Example:
+            >>> with brightspace.capture_metrics() as metrics:
+            ...     grades = brightspace.get_grades("683274")
+            >>> metrics[0].network.request_count
+
+        Yields:
+            list[NavigationMetrics]: The metrics, filled in as pages load.
+        """
+        navigations: list[NavigationMetrics] = []
+        sink = navigations.append
+        with self._metrics_lock:
+            self._metrics_sinks = [*self._metrics_sinks, sink]
+        try:
+            yield navigations
+        finally:
+            with self._metrics_lock:
+                self._metrics_sinks = [other for other in self._metrics_sinks if other is not sink]
+
+    def _navigate(self, url: str) -> None:
+        """Navigates to a page and checks that Brightspace served it.
+
+        Args:
+            url (str): The URL of the page.
+
+        Raises:
+            AuthenticationError: If Brightspace redirected to the login page.
+            HttpStatusError: If Brightspace served an error page.
+        """
+        self._get(url)
+
+        current_url = str(self.driver.current_url)
+        if any(marker in current_url for marker in LOGIN_URL_MARKERS):
+            raise AuthenticationError(f"Redirected to the login page while loading {url}. Call login first.")
+
+        title = str(self.driver.title)
+        match = SERVER_ERROR_TITLE.search(title)
+        if match:
+            status = int(match.group(1)) if match.group(1) else 503
+            raise HttpStatusError(f"Brightspace served an error page for {url}: {title}", status)
 
     def _get_nested_shadow_root(self, locators: list[tuple[str, str]], root: Any = None) -> ShadowRoot:
         """Helper method to traverse nested shadow DOMs.
@@ -53,9 +267,88 @@ class Brightspace:
             root = element.shadow_root
         return root
 
+    def _get_table_rows(self, url: str, table_id: str, schema: TableSchema | None = None) -> list[Row]:
+        """Navigates to a page with a table and parses every page of the table.
+
+        If the table is paged, the largest page size is requested first so that most
+        tables fit on one page. Any remaining pages are fetched in parallel over HTTP.
+
+        Args:
+            url (str): The URL of the page with the table.
+            table_id (str): The ID of the table element.
+            schema (TableSchema | None): The schema to parse the table with.
+
+        Returns:
+            list[Row]: The parsed rows of every page of the table.
+
+        Raises:
+            SchemaMismatchError: If the table does not match the schema.
+            TableNotFoundError: If the page does not have the table.
+            CircuitOpenError: If requests to Brightspace are paused after repeated failures.
+        """
+        return self.resilience.call(lambda: self._load_table_rows(url, table_id, schema), f"loading table {table_id}")
+
+    def _wait_for_table(self, url: str, table_id: str) -> Any:
+        """Waits for a table on the page that was loaded.
+
+        Raises:
+            TableNotFoundError: If the page does not have the table. The page loaded, so
+                this is not treated as a timeout to retry.
+        """
+        try:
+            return WebDriverWait(self.driver, 10).until(
+                expected_conditions.presence_of_element_located((By.ID, table_id))
+            )
+        except TimeoutException as error:
+            raise TableNotFoundError(f"Table {table_id} not found on {url}; it may be hidden in this course.") from error
+
+    def _load_table_rows(self, url: str, table_id: str, schema: TableSchema | None) -> list[Row]:
+        self._navigate(url)
+        table_element = self._wait_for_table(url, table_id)
+
+        pager = Pager.find(self.driver)
+        if pager is not None and pager.can_grow:
+            logger.debug("Table %s has %d pages, requesting page size %d.", table_id, pager.page_count, pager.largest_page_size)
+            url = page_url(url, page_size=pager.largest_page_size)
+            self._navigate(url)
+            table_element = self._wait_for_table(url, table_id)
+            pager = Pager.find(self.driver)
+
+        if not isinstance(self.driver, HtmlDriver):
+            # Copy the table out of the browser in one script call instead of a round trip per cell
+            table_element = snapshot_table(self.driver, table_element) or table_element
+
+        table = Table(schema)
+        # The header and the last category carry over to the remaining pages
+        state = TableState()
+        # Parse the first page before anything else can make its elements stale
+        rows = table.parse(table_element, state)
+
+        if pager is not None and pager.page_count > 1:
+            logger.debug("Fetching %d remaining pages of table %s.", pager.page_count - 1, table_id)
+            urls = [page_url(url, page=page, page_size=pager.page_size) for page in range(2, pager.page_count + 1)]
+            for page in self._fetch_tables(urls, table_id):
+                rows += table.parse(page, state)
+
+        return rows
+
+    def _fetch_tables(self, urls: list[str], table_id: str) -> list[Any]:
+        """Fetches server-rendered pages in parallel without navigating, and returns the table from each one."""
+        if isinstance(self.driver, HtmlDriver):
+            return self.driver.fetch_pages(urls, table_id)
+        session = self.session(max_connections=MAX_PAGE_WORKERS)
+        try:
+            return fetch_pages(session, urls, table_id)
+        finally:
+            session.close()
+
+    @_operation
     def login(self, username: str, password: str, totp_secret: str) -> None:
         """Logs into Brightspace with the provided credentials.
 
+        If the browser still has a valid session, such as from the cookies of a warm
+        `ChromeProfile`, Brightspace skips the login form and so does this method.
+
         Args:
             username (str): The Algonquin College email address for the student.
             password (str): The password for the Algonquin College student.
@@ -68,22 +361,25 @@ class Brightspace:
             BrightspaceError: If any error occurs during the login process.
         """
 
+        self.account = username
         try:
             # Wait up to 10 seconds for elements to load
             wait = WebDriverWait(self.driver, 10)
 
             # Navigate to the Brightspace login page
-            self.driver.get("https://brightspace.algonquincollege.com/")
+            self.resilience.call(lambda: self._get(f"{self.base_url}/"), "loading the login page")
 
-            # Enter username
+            # Enter username, unless the session in a warm profile is still valid
+            home_url = f"{urlsplit(self.base_url).netloc}/d2l/home"
             try:
                 logger.debug("Waiting for username field to be present.")
-                username_field = wait.until(
-                    expected_conditions.presence_of_element_located((By.NAME, "loginfmt"))
-                )
+                username_field = wait.until(_username_field_or_url(home_url))
             except TimeoutException as error:
                 # Username field not found, likely due to page load issues
                 raise BrightspaceError("Email/username entry field not found.") from error
+            if username_field is True:
+                logger.info("Already logged in, skipping the login form.")
+                return
             logger.debug("Username field found, entering username.")
             username_field.send_keys(username)
             username_field.send_keys(Keys.RETURN)
@@ -123,7 +419,7 @@ class Brightspace:
             try:
                 logger.debug("Waiting for successful login redirect.")
                 wait.until(
-                    expected_conditions.url_contains("brightspace.algonquincollege.com/d2l/home")
+                    expected_conditions.url_contains(home_url)
                 )
             except TimeoutException as error:
                 raise BrightspaceError("Login failed.") from error
@@ -133,14 +429,63 @@ class Brightspace:
         except Exception as error:
             raise BrightspaceError("Failed to log in to Brightspace.") from error
     
-    def get_courses(self) -> list[Course]:
+    @_operation
+    def is_logged_in(self) -> bool:
+        """Checks whether the session is logged in, by loading the home page.
+
+        Returns:
+            bool: False if Brightspace sent the browser to the login page or refused the session.
+        """
+        try:
+            self._navigate(f"{self.base_url}/d2l/home")
+        except AuthenticationError:
+            return False
+        except HttpStatusError as error:
+            if error.status in (401, 403):
+                return False
+            raise
+        return True
+
+    def add_cookies(self, cookies: list[dict]) -> None:
+        """Adds the login cookies of another session, so this browser does not have to log in.
+
+        Args:
+            cookies (list[dict]): Cookies from `driver.get_cookies()` of a logged in session.
+        """
+        with self._driver_lock:
+            if not isinstance(self.driver, HtmlDriver):
+                # WebDriver only sets cookies for the site of the current page
+                self.driver.get(f"{self.base_url}/robots.txt")
+            for cookie in cookies:
+                self.driver.add_cookie({key: value for key, value in cookie.items() if key in ("name", "value", "path", "secure", "httpOnly", "expiry")})
+
+    @_operation
+    def get_courses(self, semester: Semester | str | None = None, is_active: bool | None = None, code_prefix: str | None = None) -> list[Course]:
         """Fetches the list of courses for the logged-in student.
 
+        Filters are applied as early as possible: tabs of other semesters are not
+        opened, and cards are rejected from their text before they are parsed.
+
+        Args:
+            semester (Semester | str | None): Only include courses of this semester, given as a
+                `Semester`, a name such as "2026 Winter" or a code such as "26W".
+            is_active (bool | None): Only include active (True) or closed (False) courses.
+            code_prefix (str | None): Only include courses whose full code (such as "26W_CST8514_300")
+                or course code (such as "CST8514") starts with this prefix.
+
         Returns:
             list[Course]: A list of Course objects representing the student's courses.
+
+        Raises:
+            ValueError: If the semester is not valid.
+            CircuitOpenError: If requests to Brightspace are paused after repeated failures.
         """
+        course_filter = CourseFilter(semester=Semester.parse(semester) if semester is not None else None, is_active=is_active, code_prefix=code_prefix)
+        return self.resilience.call(lambda: self._load_courses(course_filter), "loading courses")
+
+    def _load_courses(self, course_filter: CourseFilter) -> list[Course]:
         # Navigate to the Brightspace home page
-        self.driver.get("https://brightspace.algonquincollege.com/d2l/home")
+        self._navigate(f"{self.base_url}/d2l/home")
 
         root = self._get_nested_shadow_root([
             (By.CSS_SELECTOR, "d2l-my-courses"),
@@ -150,8 +495,10 @@ class Brightspace:
         tabs = WebDriverWait(root, 10).until(
             expected_conditions.presence_of_all_elements_located((By.CSS_SELECTOR, "d2l-tab-panel"))
         )
+        tabs = course_filter.tabs(tabs)
 
         courses = []
+        codes = set()
 
         for tab in tabs:
             self.driver.execute_script(
@@ -171,16 +518,20 @@ class Brightspace:
                 card = WebDriverWait(card.shadow_root, 10).until(
                     expected_conditions.presence_of_element_located((By.CSS_SELECTOR, "d2l-card"))
                 )
-                
-                print(card.get_attribute("text"))
-                course = Course.from_string(card.get_attribute("text"), org_unit_id=int(card.get_attribute("href").split('/')[-1]))
-                if course is not None:
-                    # Avoid duplicate course codes
-                    if all(existing_course.full_code != course.full_code for existing_course in courses):
-                        courses.append(course)
+
+                text = card.get_attribute("text")
+                logger.debug("Found course card: %s", text)
+                if not course_filter.may_match(text):
+                    continue
+                course = Course.from_string(text, org_unit_id=int(card.get_attribute("href").split('/')[-1]))
+                # Avoid duplicate course codes
+                if course_filter.matches(course) and course.full_code not in codes:
+                    codes.add(course.full_code)
+                    courses.append(course)
 
         return courses
 
+    @_operation
     def get_grades(self, org_unit_id: str) -> list[GradeItem]:
         """Fetches the grades for a specific course.
 
@@ -192,53 +543,31 @@ class Brightspace:
         
         """
 
-        # Navigate to the course grades page
-        self.driver.get(f"https://brightspace.algonquincollege.com/d2l/lms/grades/my_grades/main.d2l?ou={org_unit_id}")
-
-        # Wait for the grades table to load
-        grades_table = WebDriverWait(self.driver, 10).until(
-            expected_conditions.presence_of_element_located((By.ID, "z_f"))  # Replace with actual table ID
+        # Fetch every page of the grades table
+        parsed_table = self._get_table_rows(
+            self.grades_url(org_unit_id),
+            "z_f",
+            GRADES_SCHEMA,
         )
 
-        table = Table()
-        parsed_table = table.parse(grades_table)
-
         grades = []
         for index, row in enumerate(parsed_table):
-            try:
-                row = row.cells
+            name = row.values.get("name")
 
-                # Skip rows that don't have enough columns
-                if len(row) < 5:
-                    logger.warning("Skipping row with insufficient columns: %s", row)
-                    continue
-
-                # Parse grade item details
-                name = row[0]
-                points = row[1] or None
-                weight = row[2] or None
-                comments = row[4] or None
-
-                # Assert correct types
-                assert isinstance(name, str)
-                assert isinstance(points, Fraction) or points is None
-                assert isinstance(weight, Fraction) or weight is None
-                assert isinstance(comments, str) or comments is None
-
-                grade_item = GradeItem(
-                    name=name,
-                    points=points,
-                    weight=weight,
-                    comments=comments
-                )
-
-                grades.append(grade_item)
-
-            except Exception as error:
-                logger.error("Error processing row %d: %s", index, row, exc_info=error)
+            # Skip rows without a grade item, such as totals
+            if not isinstance(name, str):
+                logger.warning("Skipping row %d without a grade item name: %s", index, row.cells)
                 continue
+
+            grades.append(GradeItem(
+                name=name,
+                points=row.values.get("points"),
+                weight=row.values.get("weight"),
+                comments=row.values.get("comments"),
+            ))
         return grades
     
+    @_operation
     def get_assignments(self, org_unit_id: str) -> list[Assignment]:
         """Fetches the assignments for a specific course.
 
@@ -249,72 +578,310 @@ class Brightspace:
             list[Any]: A list of Assignment objects representing the assignments for the course.
         """
 
-        # Navigate to the course assignments page
-        self.driver.get(f"https://brightspace.algonquincollege.com/d2l/lms/dropbox/user/folders_list.d2l?ou={org_unit_id}&isprv=0")
-
-        # Wait for the assignments table to load
-        assignments_table = WebDriverWait(self.driver, 10).until(
-            expected_conditions.presence_of_element_located((By.ID, "z_a"))  # Replace with actual table ID
+        # Fetch every page of the assignments table
+        parsed_table = self._get_table_rows(
+            self.assignments_url(org_unit_id),
+            "z_a",
+            DROPBOX_SCHEMA,
         )
 
-        table = Table()
-        parsed_table = table.parse(assignments_table)
-
         assignments = []
         for index, row in enumerate(parsed_table):
-            try:
-                # Skip rows that don't have enough columns
-                if len(row.cells) < 4:
-                    logger.warning("Skipping row with insufficient columns: %s", row)
-                    continue
+            # First column contains name, due date, and availability start and end dates
+            folder = row.values.get("folder")
+            if not isinstance(folder, DatedText):
+                logger.warning("Skipping row %d without an assignment name: %s", index, row.cells)
+                continue
 
-                # Parse assignment details
-
-                # First column contains name, due date, and availability start and end dates
-                column_1 = row.cells[0]
-                assert isinstance(column_1, list)
-                assert len(column_1) == 3
-
-                # Split into individual variables
-                name = column_1[0]
-                due_at_str = column_1[1]
-
-                # Get availability start and date strings
-                # Handle cases where start date may be missing
-                starts_at = None
-                ends_at = None
-                if len(column_1) == 4:
-                    starts_at_str = row.element.find_elements(By.TAG_NAME, "li")[0].text 
-                    starts_at = datetime.strptime(starts_at_str.replace("Available on ", "").replace("Access restricted before availability starts.", "").strip(), "%b %d, %Y %I:%M %p") if "Available on " in starts_at_str else None
-
-                if len(column_1) >= 2:
-                    ends_at_str = row.element.find_elements(By.TAG_NAME, "li")[1].text
-                    ends_at = datetime.strptime(ends_at_str.replace("Available until ", "").replace("Access restricted after availability ends.", "").strip(), "%b %d, %Y %I:%M %p") if "Available until " in ends_at_str else None
-                # Due on Jan 23, 2026 11:59 PM
-                due_at = datetime.strptime(due_at_str.replace("Due on ", "").strip(), "%b %d, %Y %I:%M %p") if "Due on " in due_at_str else None
-
-                completion_status = row.cells[1] or None
-                score = row.cells[2] or None
-                evaluation_status = row.cells[3] or None
-
-                # Assert correct types
-                #assert isinstance(name, str)
-                #assert (isinstance(completion_status, str) or completion_status is None)
-                #assert (isinstance(evaluation_status, str) or evaluation_status is None)
-
-                assignment = Assignment(
-                    name=name,
-                    starts_at=starts_at,
-                    ends_at=ends_at,
-                    due_at=due_at,
-                    score=score,
-                    completion_status=completion_status,
-                    evaluation_status=evaluation_status
-                )
+            assignments.append(Assignment(
+                name=folder.text,
+                starts_at=folder.dates.get("starts"),
+                ends_at=folder.dates.get("ends"),
+                due_at=folder.dates.get("due"),
+                score=row.values.get("score"),
+                completion_status=row.values.get("completion_status"),
+                evaluation_status=row.values.get("evaluation_status"),
+                folder_id=_link_parameter(row.element, "db"),
+            ))
+        return assignments
+
+    @_operation
+    def get_quizzes(self, org_unit_id: str, attempt_details: bool = True) -> list[Quiz]:
+        """Fetches the quizzes of a course with the student's attempts.
+
+        The quiz list and the attempts table of each attempted quiz are loaded like the
+        other tables. The detail pages of the attempts, with the points of each question,
+        are then fetched in parallel without navigating.
 
-                assignments.append(assignment)
+        Args:
+            org_unit_id (str): The organizational unit ID for the course for which to fetch quizzes.
+            attempt_details (bool): Whether to fetch the questions of each attempt.
+
+        Returns:
+            list[Quiz]: A list of Quiz objects representing the quizzes of the course.
 
-            except Exception as error:
-                logger.error("Error processing row %d: %s", index, row, exc_info=error)
+        Raises:
+            SchemaMismatchError: If a table does not match its schema.
+            CircuitOpenError: If requests to Brightspace are paused after repeated failures.
+        """
+        quizzes = []
+        attempted = []
+        for index, row in enumerate(self._get_table_rows(self.quizzes_url(org_unit_id), "z_b", QUIZZES_SCHEMA)):
+            listing = row.values.get("quiz")
+            quiz_id = _link_parameter(row.element, "qi")
+            if not isinstance(listing, DatedText) or quiz_id is None:
+                logger.warning("Skipping row %d without a quiz link: %s", index, row.cells)
                 continue
-        return assignments
\ No newline at end of file
+
+            quiz = Quiz(
+                id=quiz_id,
+                name=listing.text,
+                starts_at=listing.dates.get("starts"),
+                ends_at=listing.dates.get("ends"),
+                due_at=listing.dates.get("due"),
+                evaluation_status=row.values.get("evaluation_status"),
+            )
+            quizzes.append(quiz)
+            # Skip the attempts page of quizzes listed with "0 / 3" attempts
+            attempts = row.values.get("attempts")
+            if not (isinstance(attempts, str) and attempts.split("/")[0].strip() == "0"):
+                attempted.append(quiz)
+
+        details: list[tuple[QuizAttempt, str]] = []
+        for quiz in attempted:
+            submissions = self._get_table_rows(self.quiz_submissions_url(org_unit_id, quiz.id), "z_c", QUIZ_ATTEMPTS_SCHEMA)
+            for index, row in enumerate(submissions):
+                name = row.values.get("attempt")
+                if not isinstance(name, str):
+                    logger.warning("Skipping row %d of quiz %s without an attempt: %s", index, quiz.name, row.cells)
+                    continue
+                number = re.search(r"\d+", name)
+                attempt = QuizAttempt(
+                    number=int(number.group()) if number else len(quiz.attempts) + 1,
+                    score=row.values.get("score"),
+                    submitted_at=row.values.get("submitted"),
+                )
+                quiz.attempts.append(attempt)
+                attempt_id = _link_parameter(row.element, "ai")
+                if attempt_details and attempt_id is not None:
+                    details.append((attempt, self.quiz_attempt_url(org_unit_id, quiz.id, attempt_id)))
+
+        if details:
+            tables = self.resilience.call(lambda: self._fetch_tables([url for _, url in details], "z_d"), "loading quiz attempts")
+            for (attempt, _), table in zip(details, tables):
+                for row in Table(QUIZ_QUESTIONS_SCHEMA).parse(table):
+                    name = row.values.get("question")
+                    if isinstance(name, str):
+                        attempt.questions.append(QuizQuestion(name=name, points=row.values.get("points"), feedback=row.values.get("feedback")))
+        return quizzes
+
+    @_operation
+    def get_announcements(self, org_unit_id: str | int, since: datetime | None = None) -> list[Announcement]:
+        """Fetches the announcements of a course from the Brightspace API, newest first.
+
+        Unlike the other pages, announcements are read as JSON, one request per course.
+        Pass the publication time of the newest announcement already seen as `since`
+        to only fetch newer ones; `AnnouncementFeed` keeps track of it across courses.
+
+        Args:
+            org_unit_id (str | int): The organizational unit ID of the course.
+            since (datetime | None): Only return announcements published after this time.
+
+        Returns:
+            list[Announcement]: The announcements, newest first.
+
+        Raises:
+            BrightspaceError: If the driver cannot send requests, such as when replaying recorded pages.
+            CircuitOpenError: If requests to Brightspace are paused after repeated failures.
+        """
+        with self._api_session("Announcements can only be fetched by a browser or over HTTP.") as session:
+            return self.resilience.call(lambda: fetch_announcements(session, org_unit_id, since), "loading announcements")
+
+    @contextmanager
+    def _api_session(self, unsupported: str, max_connections: int = 1) -> Iterator[HttpSession]:
+        """Yields an HTTP session for API requests: the HTTP driver's own, or a temporary one sharing the browser's cookies.
+
+        Raises:
+            BrightspaceError: With the given message, if the driver cannot send requests, such as when replaying recorded pages.
+        """
+        if isinstance(self.driver, HttpDriver):
+            # Reuse the driver's pooled connections
+            yield self.driver.session
+            return
+        if isinstance(self.driver, HtmlDriver):
+            raise BrightspaceError(unsupported)
+        session = self.session(max_connections=max_connections)
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def submit(self, org_unit_id: str | int, folder: Assignment, files: Iterable[str | os.PathLike], comment: str = "") -> SubmissionReceipt:
+        """Submits files to an assignment's dropbox folder.
+
+        The files are uploaded as one submission, streamed from disk, and the submission is
+        read back to check that Brightspace received every file.
+
+        Example:
+            >>> lab = next(assignment for assignment in brightspace.get_assignments("683274") if assignment.name == "Lab 3")
+            >>> receipt = brightspace.submit("683274", lab, ["lab3.zip", "report.pdf"])
+
+        Args:
+            org_unit_id (str | int): The organizational unit ID of the course.
+            folder (Assignment): The assignment, as returned by `get_assignments`.
+            files (Iterable[str | os.PathLike]): Paths of the files to upload.
+            comment (str): Comment sent with the files.
+
+        Returns:
+            SubmissionReceipt: Brightspace's record of the submission.
+
+        Raises:
+            SubmissionClosedError: If availability of the assignment has not started or has ended. Nothing is uploaded.
+            SubmissionError: If the folder is not known or the submission is not confirmed.
+            HttpStatusError: If Brightspace rejects the upload.
+            BrightspaceError: If the driver cannot send requests, such as when replaying recorded pages.
+        """
+        folder_id = check_open(folder)
+        with self._api_session("Files can only be submitted by a browser or over HTTP.") as session:
+            return submit_files(session, org_unit_id, folder_id, list(files), comment)
+
+    def submit_many(self, submissions: Iterable[Submission], max_workers: int = 4) -> list[SubmissionResult]:
+        """Makes several dropbox submissions in parallel, over one pool of connections.
+
+        Submissions to the same folder are made one after another. Submissions to folders
+        that are not available are not uploaded, and a failed submission does not stop the
+        others; check the status of each result.
+
+        Args:
+            submissions (Iterable[Submission]): The submissions, each with its course, assignment and files.
+            max_workers (int): Maximum number of uploads at the same time.
+
+        Returns:
+            list[SubmissionResult]: The result of each submission, in the same order.
+
+        Raises:
+            BrightspaceError: If the driver cannot send requests, such as when replaying recorded pages.
+        """
+        with self._api_session("Files can only be submitted by a browser or over HTTP.", max_connections=max_workers) as session:
+            return submit_many(session, list(submissions), max_workers=max_workers)
+
+    def grades_url(self, org_unit_id: str | int) -> str:
+        """Returns the URL of a course's grades page."""
+        return f"{self.base_url}/d2l/lms/grades/my_grades/main.d2l?ou={org_unit_id}"
+
+    def assignments_url(self, org_unit_id: str | int) -> str:
+        """Returns the URL of a course's assignments (dropbox) page."""
+        return f"{self.base_url}/d2l/lms/dropbox/user/folders_list.d2l?ou={org_unit_id}&isprv=0"
+
+    def quizzes_url(self, org_unit_id: str | int) -> str:
+        """Returns the URL of a course's quizzes page."""
+        return f"{self.base_url}/d2l/lms/quizzing/user/quizzes_list.d2l?ou={org_unit_id}"
+
+    def quiz_submissions_url(self, org_unit_id: str | int, quiz_id: int) -> str:
+        """Returns the URL of the page listing a quiz's submitted attempts."""
+        return f"{self.base_url}/d2l/lms/quizzing/user/quiz_submissions.d2l?qi={quiz_id}&ou={org_unit_id}"
+
+    def quiz_attempt_url(self, org_unit_id: str | int, quiz_id: int, attempt_id: int) -> str:
+        """Returns the URL of a quiz attempt's detail page."""
+        return f"{self.base_url}/d2l/lms/quizzing/user/quiz_submissions_attempt.d2l?qi={quiz_id}&ai={attempt_id}&ou={org_unit_id}"
+
+    def prefetch(self, org_unit_ids: Iterable[str | int], grades: bool = True, assignments: bool = True) -> int:
+        """Starts loading the grades and assignments pages of courses in background tabs.
+
+        Later calls to `get_grades` and `get_assignments` for these courses switch to the
+        loaded tab instead of navigating. Does nothing unless the client was created with
+        `prefetch_tabs`. Pages beyond the tab limit replace the least recently prefetched.
+
+        Example:
+            >>> brightspace = Brightspace(prefetch_tabs=4)
+            >>> courses = [course for course in brightspace.get_courses() if course.is_active]
+            >>> brightspace.prefetch(course.org_unit_id for course in courses[:2])
+            >>> grades = brightspace.get_grades(str(courses[0].org_unit_id))
+
+        Args:
+            org_unit_ids (Iterable[str | int]): Organizational unit IDs of the courses, most urgent first.
+            grades (bool): Whether to prefetch the grades pages.
+            assignments (bool): Whether to prefetch the assignments pages.
+
+        Returns:
+            int: The number of tabs opened.
+        """
+        if self.prefetcher is None:
+            return 0
+        urls = []
+        for org_unit_id in org_unit_ids:
+            urls += ([self.grades_url(org_unit_id)] if grades else []) + ([self.assignments_url(org_unit_id)] if assignments else [])
+        # Pages that do not fit would only push out the more urgent ones
+        urls = urls[:self.prefetcher.max_tabs]
+
+        opened = 0
+        with self._driver_lock:
+            for url in urls:
+                if self.rate_limiter is not None and url not in self.prefetcher:
+                    self.rate_limiter.acquire(url, PAGE, self.account)
+                opened += self.prefetcher.prefetch(url)
+        return opened
+
+    def session(self, max_connections: int = 8) -> HttpSession:
+        """Creates a pooled HTTP session that shares the browser's login cookies.
+
+        Must be called after `login`.
+
+        Args:
+            max_connections (int): Maximum number of pooled connections.
+
+        Returns:
+            HttpSession: The authenticated HTTP session.
+        """
+        with self._driver_lock:
+            return HttpSession.from_driver(self.driver, base_url=self.base_url, max_connections=max_connections, rate_limiter=self.rate_limiter, account=self.account)
+
+    @_operation
+    def get_content(self, org_unit_id: str) -> ContentModule:
+        """Fetches the content tree (modules and topics) for a specific course.
+
+        Args:
+            org_unit_id (str): The organizational unit ID for the course for which to fetch content.
+
+        Returns:
+            ContentModule: A root module containing the course's modules and topics.
+
+        Raises:
+            BrightspaceError: If the driver cannot send requests, such as when replaying recorded pages.
+            CircuitOpenError: If requests to Brightspace are paused after repeated failures.
+        """
+        with self._api_session("Content can only be fetched by a browser or over HTTP.") as session:
+            return self.resilience.call(lambda: fetch_content(session, org_unit_id), "loading content")
+
+    @_operation
+    def download_content(self, org_unit_id: str, destination: str, max_workers: int = 4) -> list[DownloadResult]:
+        """Downloads every file in a course's content to a local directory.
+
+        Files that were already downloaded and have not changed are skipped, and
+        interrupted downloads are resumed.
+
+        Args:
+            org_unit_id (str): The organizational unit ID for the course for which to download content.
+            destination (str): Directory to download into. The course's module tree is mirrored inside it.
+            max_workers (int): Maximum number of files downloaded at the same time.
+
+        Returns:
+            list[DownloadResult]: The result of each file download.
+
+        Raises:
+            BrightspaceError: If the driver cannot send requests, such as when replaying recorded pages.
+            CircuitOpenError: If requests to Brightspace are paused after repeated failures.
+        """
+        with self._api_session("Content can only be downloaded by a browser or over HTTP.", max_connections=max_workers) as session:
+            content = self.resilience.call(lambda: fetch_content(session, org_unit_id), "loading content")
+            downloader = ContentDownloader(session, org_unit_id, destination, max_workers=max_workers)
+            return downloader.download(list(content.walk()))
+
+    def close(self) -> None:
+        """Closes the browser and unlocks its profile, after any running operation finishes."""
+        with self._driver_lock:
+            try:
+                self.driver.quit()
+            finally:
+                if self.profile is not None:
+                    self.profile.release()
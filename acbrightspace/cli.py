@@ -0,0 +1,756 @@
+import argparse
+from contextlib import contextmanager, nullcontext
+import csv
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import io
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import sys
+import threading
+import time
+from typing import Any, Callable, Iterator, Sequence, TypeVar
+
+from dotenv import load_dotenv
+
+from acbrightspace.announcement import Announcement, AnnouncementFeed
+from acbrightspace.archive import CourseArchive, write_archive
+from acbrightspace.assignment import Assignment
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.course import Course
+from acbrightspace.deadlines import DeadlineCalendar
+from acbrightspace.drivers import HttpDriver, ReplayDriver
+from acbrightspace.errors import BrightspaceError
+from acbrightspace.fraction import Fraction
+from acbrightspace.grade_item import GradeItem
+from acbrightspace.metrics import JsonLinesSink, MetricsSink
+from acbrightspace.pool import ClientPool
+from acbrightspace.profile import ChromeProfile
+from acbrightspace.profiler import Profiler
+from acbrightspace.ratelimit import PAGE, FileBuckets, RateLimit, RateLimiter
+from acbrightspace.resilience import Resilience
+from acbrightspace.semester import Semester
+from acbrightspace.serialization import FORMAT_VERSION
+from acbrightspace.session import BASE_URL, HttpSession
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "acbrightspace"
+"""Directory for cookies, recorded pages and synced data, unless `--cache-dir` is given."""
+
+SNAPSHOT_NAME = "snapshot.json"
+"""File in the cache directory that `sync` writes and `export` reads."""
+
+SNAPSHOT_VERSION = 2
+"""Version of the snapshot layout. Version 1 stored semesters as codes and fractions as pairs."""
+
+COOKIES_NAME = "cookies.json"
+"""File in the cache directory with the login cookies used by the HTTP backend."""
+
+PAGES_DIR_NAME = "pages"
+"""Directory in the cache directory with recorded pages for the replay backend."""
+
+PROFILE_DIR_NAME = "chrome-profile"
+"""Directory in the cache directory with the persistent Chrome profile."""
+
+RATE_LIMIT_NAME = "ratelimit.json"
+"""File in the cache directory with the rate limiter state shared between processes."""
+
+ANNOUNCEMENTS_NAME = "announcements.json"
+"""File in the cache directory with the announcement cursors of `announcements --new`."""
+
+ARCHIVE_NAME = "archive.acba"
+"""File in the cache directory with the closed courses frozen by `archive`."""
+
+DEFAULT_CONCURRENCY = 4
+"""Number of courses fetched at the same time by the HTTP and replay backends."""
+
+class Timings:
+    """Collects how long each phase of a command took."""
+
+    def __init__(self, profiler: Profiler | None = None) -> None:
+        """Creates empty timings.
+
+        Args:
+            profiler (Profiler | None): Profiler whose samples are tagged with the phases, if profiling.
+        """
+        self.profiler = profiler
+        self._lock = threading.Lock()
+        self._phases: dict[str, list[float]] = {}
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Measures the time spent in the block as one run of a phase."""
+        start = time.perf_counter()
+        try:
+            with self.profiler.phase(phase) if self.profiler is not None else nullcontext():
+                yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._phases.setdefault(phase, []).append(elapsed)
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Records one run of a phase that was measured elsewhere."""
+        with self._lock:
+            self._phases.setdefault(phase, []).append(seconds)
+
+    def summary(self) -> str:
+        """Returns a table of the count, total, mean and maximum time of each phase."""
+        lines = [f"{'phase':<16} {'count':>5} {'total':>9} {'mean':>9} {'max':>9}"]
+        with self._lock:
+            for phase, times in self._phases.items():
+                lines.append(f"{phase:<16} {len(times):>5} {sum(times):>8.3f}s {sum(times) / len(times):>8.3f}s {max(times):>8.3f}s")
+        return "\n".join(lines)
+
+@dataclass
+class CourseResult:
+    """Data fetched for one course."""
+
+    course: Course
+    """The course."""
+
+    grades: list[GradeItem] | None = None
+    """Grades of the course, if they were fetched successfully."""
+
+    assignments: list[Assignment] | None = None
+    """Assignments of the course, if they were fetched successfully."""
+
+    error: Exception | None = None
+    """Error that stopped the course from being fetched, if any."""
+
+def parse_duration(text: str) -> timedelta:
+    """Parses a duration such as "7d", "12h", "30m" or "2w". A plain number is a number of days.
+
+    Args:
+        text (str): The duration.
+
+    Returns:
+        timedelta: The parsed duration.
+
+    Raises:
+        argparse.ArgumentTypeError: If the duration is not valid.
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([wdhm]?)\s*", text)
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid duration: {text!r} (expected e.g. 7d, 12h, 30m)")
+    value = float(match.group(1))
+    unit = {"w": "weeks", "d": "days", "": "days", "h": "hours", "m": "minutes"}[match.group(2)]
+    return timedelta(**{unit: value})
+
+def parse_semester(text: str) -> Semester:
+    """Parses a semester name such as "2026 Winter" or code such as "26W".
+
+    Raises:
+        argparse.ArgumentTypeError: If the semester is not valid.
+    """
+    try:
+        return Semester.parse(text)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid semester: {text!r} (expected e.g. \"2026 Winter\" or 26W)") from error
+
+def _datetime(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+def write_snapshot(path: Path, results: list[CourseResult]) -> None:
+    """Writes the courses, grades and assignments fetched by `sync` to a JSON file.
+
+    The file is replaced atomically, so an interrupted sync keeps the previous snapshot.
+    Grades and assignments that could not be fetched are written as null.
+    """
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "data_version": FORMAT_VERSION,
+        "synced_at": datetime.now().isoformat(),
+        "courses": [
+            {
+                **result.course.to_dict(),
+                "grades": [grade.to_dict() for grade in result.grades] if result.grades is not None else None,
+                "assignments": [assignment.to_dict() for assignment in result.assignments] if result.assignments is not None else None,
+            }
+            for result in results
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(json.dumps(snapshot, indent=1), encoding="utf-8")
+    os.replace(temporary, path)
+
+def read_snapshot(path: Path) -> list[CourseResult]:
+    """Reads a snapshot written by `write_snapshot`.
+
+    Raises:
+        BrightspaceError: If there is no snapshot or it has an unknown version.
+    """
+    try:
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise BrightspaceError(f"No synced data in {path.parent}. Run `acbrightspace sync` first.") from None
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise BrightspaceError(f"Unsupported snapshot version in {path}: {snapshot.get('version')}. Run `acbrightspace sync` again.")
+    version = snapshot["data_version"]
+    return [
+        CourseResult(
+            course=Course.from_dict(data, version),
+            grades=[GradeItem.from_dict(grade, version) for grade in data["grades"]] if data["grades"] is not None else None,
+            assignments=[Assignment.from_dict(assignment, version) for assignment in data["assignments"]] if data["assignments"] is not None else None,
+        )
+        for data in snapshot["courses"]
+    ]
+
+def read_archive(path: Path) -> list[CourseResult]:
+    """Reads every course of the archive written by `archive`, or nothing if there is none."""
+    try:
+        archive = CourseArchive(path)
+    except FileNotFoundError:
+        return []
+    except ValueError as error:
+        raise BrightspaceError(f"Unreadable archive {path}: {error}") from error
+    with archive:
+        return [
+            CourseResult(course, archive.grades(course.org_unit_id), archive.assignments(course.org_unit_id))
+            for course in archive.courses
+        ]
+
+def read_feed(path: Path) -> AnnouncementFeed:
+    """Reads the announcement cursors saved by `write_feed`, or starts an empty feed."""
+    try:
+        return AnnouncementFeed.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except FileNotFoundError:
+        return AnnouncementFeed()
+    except ValueError as error:
+        logger.warning("Ignoring unreadable announcement cursors in %s: %s", path, error)
+        return AnnouncementFeed()
+
+def write_feed(path: Path, feed: AnnouncementFeed) -> None:
+    """Saves the announcement cursors of a feed, replacing the file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(json.dumps(feed.to_dict()), encoding="utf-8")
+    os.replace(temporary, path)
+
+def _load_cookies(path: Path) -> dict[str, str] | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+def _save_cookies(path: Path, cookies: dict[str, str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Cookies are as good as a password, so only the owner may read them
+    descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+        json.dump(cookies, file)
+
+def _login(brightspace: Brightspace, timings: Timings) -> None:
+    """Logs in with the credentials in the environment (or a .env file)."""
+    try:
+        with timings.measure("login"):
+            brightspace.login(
+                username=os.environ["BRIGHTSPACE_USERNAME"],
+                password=os.environ["BRIGHTSPACE_PASSWORD"],
+                totp_secret=os.environ["BRIGHTSPACE_TOTP_SECRET"],
+            )
+    except KeyError as error:
+        raise BrightspaceError(f"Set {error.args[0]} in the environment or a .env file to log in.") from None
+
+def _browser(args: argparse.Namespace, resilience: Resilience, metrics: MetricsSink | None, rate_limiter: RateLimiter | None) -> Brightspace:
+    profile = None
+    if args.chrome_profile:
+        profile = ChromeProfile(Path(args.cache_dir) / PROFILE_DIR_NAME, slots=args.chrome_profile_slots)
+    return Brightspace(base_url=args.base_url, resilience=resilience, profile=profile, metrics=metrics, rate_limiter=rate_limiter, prefetch_tabs=args.prefetch_tabs)
+
+def _rate_limiter(args: argparse.Namespace, timings: Timings) -> RateLimiter | None:
+    """Creates a rate limiter shared with every other process that uses the same cache directory."""
+    if args.rate_limit is None:
+        return None
+    return RateLimiter(
+        limits={PAGE: RateLimit(rate=args.rate_limit, burst=max(1.0, 2 * args.rate_limit))},
+        store=FileBuckets(Path(args.cache_dir) / RATE_LIMIT_NAME),
+        on_acquire=lambda category, delay: timings.add(f"{category} queue", delay),
+    )
+
+def open_clients(args: argparse.Namespace, timings: Timings) -> list[Brightspace]:
+    """Creates logged in Brightspace clients for the selected backend, one per worker.
+
+    The HTTP backend reuses the cookies of the last login, and logs in with the
+    browser again when there are none or they have expired.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+        timings (Timings): Where to record how long logging in took.
+
+    Returns:
+        list[Brightspace]: The clients. The browser backend always returns one.
+    """
+    resilience = Resilience()
+    metrics = JsonLinesSink(args.metrics) if args.metrics else None
+    rate_limiter = _rate_limiter(args, timings)
+    cache_dir = Path(args.cache_dir)
+    replay_dir = Path(args.replay_dir) if args.replay_dir else cache_dir / PAGES_DIR_NAME
+
+    if args.backend == "replay":
+        return [Brightspace(base_url=args.base_url, resilience=resilience, driver=ReplayDriver(replay_dir), metrics=metrics) for _ in range(args.concurrency)]
+
+    if args.backend == "browser":
+        if args.concurrency > 1:
+            logger.warning("The browser backend drives a single browser; ignoring --concurrency %d.", args.concurrency)
+        brightspace = _browser(args, resilience, metrics, rate_limiter)
+        _login(brightspace, timings)
+        _save_cookies(cache_dir / COOKIES_NAME, {cookie["name"]: cookie["value"] for cookie in brightspace.driver.get_cookies()})
+        return [brightspace]
+
+    cookies_path = cache_dir / COOKIES_NAME
+    record_dir = replay_dir if args.record else None
+
+    def http_clients(cookies: dict[str, str]) -> list[Brightspace]:
+        return [
+            Brightspace(
+                base_url=args.base_url,
+                resilience=resilience,
+                driver=HttpDriver(
+                    HttpSession(cookies, base_url=args.base_url, rate_limiter=rate_limiter, account=os.environ.get("BRIGHTSPACE_USERNAME")),
+                    record_dir=record_dir,
+                ),
+                metrics=metrics,
+            )
+            for _ in range(args.concurrency)
+        ]
+
+    cookies = _load_cookies(cookies_path)
+    if cookies is None:
+        logger.info("No saved login in %s, logging in with the browser.", cache_dir)
+    else:
+        clients = http_clients(cookies)
+        try:
+            if clients[0].is_logged_in():
+                return clients
+        except BaseException:
+            _close(clients, timings)
+            raise
+        for client in clients:
+            client.close()
+        logger.warning("The saved login in %s has expired, logging in with the browser again.", cookies_path)
+        cookies_path.unlink(missing_ok=True)
+
+    # Brightspace only lets browsers log in, so borrow one for the cookies
+    browser = _browser(args, resilience, metrics, rate_limiter)
+    try:
+        _login(browser, timings)
+        cookies = {cookie["name"]: cookie["value"] for cookie in browser.driver.get_cookies()}
+    finally:
+        browser.close()
+    _save_cookies(cookies_path, cookies)
+    return http_clients(cookies)
+
+def map_clients(clients: list[Brightspace], items: Sequence[T], function: Callable[[Brightspace, T], Any]) -> list[Any]:
+    """Runs a function for each item, spreading the items across the clients.
+
+    Each client is used by one worker at a time.
+
+    Returns:
+        list[Any]: The result of each call, in the same order as the items.
+    """
+    return ClientPool(clients).map(function, items)
+
+def fetch_courses(clients: list[Brightspace], timings: Timings, include_closed: bool, semester: Semester | None = None, code_prefix: str | None = None) -> list[Course]:
+    """Fetches the courses, leaving out closed ones unless asked for."""
+    with timings.measure("courses"):
+        return clients[0].get_courses(semester=semester, is_active=None if include_closed else True, code_prefix=code_prefix)
+
+def fetch_course_data(clients: list[Brightspace], timings: Timings, courses: list[Course], grades: bool, assignments: bool) -> list[CourseResult]:
+    """Fetches the grades and/or assignments of each course in parallel.
+
+    A course that fails is logged and returned with its error, so one broken
+    course does not stop the others.
+    """
+    def fetch(client: Brightspace, index: int) -> CourseResult:
+        course = courses[index]
+        # Let the browser load the next courses in background tabs while this one is parsed
+        client.prefetch([upcoming.org_unit_id for upcoming in courses[index + 1:]], grades=grades, assignments=assignments)
+        result = CourseResult(course)
+        try:
+            if grades:
+                with timings.measure("grades"):
+                    result.grades = client.get_grades(str(course.org_unit_id))
+            if assignments:
+                with timings.measure("assignments"):
+                    result.assignments = client.get_assignments(str(course.org_unit_id))
+        except Exception as error:
+            logger.error("Failed to fetch %s: %s", course.full_code, error)
+            result.error = error
+        return result
+
+    return map_clients(clients, range(len(courses)), fetch)
+
+def _format_fraction(value: Fraction | None) -> str | None:
+    return str(value) if value is not None else None
+
+def course_records(courses: list[Course]) -> list[dict[str, Any]]:
+    return [
+        {
+            "org_unit_id": course.org_unit_id,
+            "code": course.full_code,
+            "name": course.name,
+            "semester": course.semester.name,
+            "ends_at": _datetime(course.ends_at),
+            "active": course.is_active,
+        }
+        for course in courses
+    ]
+
+def grade_records(results: list[CourseResult]) -> list[dict[str, Any]]:
+    return [
+        {
+            "course": result.course.full_code,
+            "item": grade.name,
+            "points": _format_fraction(grade.points),
+            "weight": _format_fraction(grade.weight),
+            "percent": round(grade.points.to_decimal() * 100, 2) if grade.points is not None and grade.points.denominator else None,
+            "comments": grade.comments,
+        }
+        for result in results
+        for grade in result.grades or []
+    ]
+
+def assignment_records(items: list[tuple[Course, Assignment]]) -> list[dict[str, Any]]:
+    return [
+        {
+            "course": course.full_code,
+            "assignment": assignment.name,
+            "due_at": _datetime(assignment.due_at),
+            "starts_at": _datetime(assignment.starts_at),
+            "ends_at": _datetime(assignment.ends_at),
+            "status": assignment.completion_status,
+            "score": _format_fraction(assignment.score),
+        }
+        for course, assignment in items
+    ]
+
+def announcement_records(courses: list[Course], announcements: list[Announcement]) -> list[dict[str, Any]]:
+    codes = {course.org_unit_id: course.full_code for course in courses}
+    return [
+        {
+            "course": codes.get(announcement.org_unit_id, str(announcement.org_unit_id)),
+            "published_at": _datetime(announcement.published_at.astimezone()),
+            "title": announcement.title,
+            "body": announcement.body,
+        }
+        for announcement in announcements
+    ]
+
+def format_records(records: list[dict[str, Any]], output_format: str) -> str:
+    """Formats records as an aligned text table, JSON or CSV.
+
+    Args:
+        records (list[dict[str, Any]]): Records that all have the same keys.
+        output_format (str): "table", "json" or "csv".
+
+    Returns:
+        str: The formatted records.
+    """
+    if output_format == "json":
+        return json.dumps(records, indent=2) + "\n"
+
+    columns = list(records[0]) if records else []
+    if output_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(records)
+        return buffer.getvalue()
+
+    if not records:
+        return "No results.\n"
+    cells = [columns] + [["" if record[column] is None else str(record[column]).replace("\n", " ") for column in columns] for record in records]
+    widths = [max(len(row[index]) for row in cells) for index in range(len(columns))]
+    return "".join("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() + "\n" for row in cells)
+
+def _write(args: argparse.Namespace, text: str) -> None:
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as file:
+            file.write(text)
+    else:
+        sys.stdout.write(text)
+
+def _check_errors(results: list[CourseResult]) -> int:
+    failed = [result.course.full_code for result in results if result.error is not None]
+    if failed:
+        logger.error("Failed to fetch %d of %d courses: %s", len(failed), len(results), ", ".join(failed))
+        return 1
+    return 0
+
+def command_courses(args: argparse.Namespace, timings: Timings) -> int:
+    clients = open_clients(args, timings)
+    try:
+        courses = fetch_courses(clients, timings, include_closed=not args.active, semester=args.semester, code_prefix=args.code)
+    finally:
+        _close(clients, timings)
+    _write(args, format_records(course_records(courses), args.format))
+    return 0
+
+def command_grades(args: argparse.Namespace, timings: Timings) -> int:
+    clients = open_clients(args, timings)
+    try:
+        courses = fetch_courses(clients, timings, include_closed=args.all, semester=args.semester, code_prefix=args.code)
+        results = fetch_course_data(clients, timings, courses, grades=True, assignments=False)
+    finally:
+        _close(clients, timings)
+    _write(args, format_records(grade_records(results), args.format))
+    return _check_errors(results)
+
+def command_assignments(args: argparse.Namespace, timings: Timings) -> int:
+    clients = open_clients(args, timings)
+    try:
+        courses = fetch_courses(clients, timings, include_closed=args.all, semester=args.semester, code_prefix=args.code)
+        results = fetch_course_data(clients, timings, courses, grades=False, assignments=True)
+    finally:
+        _close(clients, timings)
+
+    if args.due_within is not None:
+        calendar = DeadlineCalendar()
+        for result in results:
+            calendar.update(result.course, result.assignments or [])
+        now = datetime.now()
+        items = [(deadline.course, deadline.assignment) for deadline in calendar.due_between(now, now + args.due_within)]
+    else:
+        items = [(result.course, assignment) for result in results for assignment in result.assignments or []]
+
+    _write(args, format_records(assignment_records(items), args.format))
+    return _check_errors(results)
+
+def command_announcements(args: argparse.Namespace, timings: Timings) -> int:
+    path = Path(args.cache_dir) / ANNOUNCEMENTS_NAME
+    feed = read_feed(path) if args.new else AnnouncementFeed()
+    clients = open_clients(args, timings)
+    try:
+        courses = fetch_courses(clients, timings, include_closed=args.all, semester=args.semester, code_prefix=args.code)
+
+        def fetch(client: Brightspace, course: Course) -> list[Announcement] | None:
+            try:
+                with timings.measure("announcements"):
+                    return client.get_announcements(course.org_unit_id, since=feed.since(course.org_unit_id))
+            except Exception as error:
+                logger.error("Failed to fetch announcements of %s: %s", course.full_code, error)
+                return None
+
+        fetched = map_clients(clients, courses, fetch)
+    finally:
+        _close(clients, timings)
+
+    # Courses that failed keep their cursor, so their announcements are listed next time
+    announcements = feed.update(announcement for batch in fetched for announcement in batch or [])
+    if args.new:
+        write_feed(path, feed)
+    _write(args, format_records(announcement_records(courses, announcements), args.format))
+    failed = sum(batch is None for batch in fetched)
+    if failed:
+        logger.error("Failed to fetch announcements of %d of %d courses.", failed, len(courses))
+        return 1
+    return 0
+
+def command_sync(args: argparse.Namespace, timings: Timings) -> int:
+    archive_path = Path(args.cache_dir) / ARCHIVE_NAME
+    archived = set()
+    if args.all and archive_path.exists():
+        with CourseArchive(archive_path) as archive:
+            archived = {course.org_unit_id for course in archive.courses}
+
+    clients = open_clients(args, timings)
+    try:
+        # Archived courses are closed and never change, so they are not fetched again
+        courses = [course for course in fetch_courses(clients, timings, include_closed=args.all) if course.org_unit_id not in archived]
+        results = fetch_course_data(clients, timings, courses, grades=True, assignments=True)
+    finally:
+        _close(clients, timings)
+
+    status = _check_errors(results)
+    path = Path(args.cache_dir) / SNAPSHOT_NAME
+    if status and path.exists():
+        # Keep the data of courses that failed this time
+        previous = {result.course.org_unit_id: result for result in read_snapshot(path)}
+        results = [previous.get(result.course.org_unit_id, result) if result.error else result for result in results]
+    with timings.measure("write"):
+        write_snapshot(path, results)
+
+    records = [
+        {
+            "course": result.course.full_code,
+            "grades": len(result.grades) if result.grades is not None else None,
+            "assignments": len(result.assignments) if result.assignments is not None else None,
+            "error": str(result.error) if result.error is not None else None,
+        }
+        for result in results
+    ]
+    _write(args, format_records(records, args.format))
+    return status
+
+def command_archive(args: argparse.Namespace, timings: Timings) -> int:
+    path = Path(args.cache_dir) / ARCHIVE_NAME
+    with timings.measure("read"):
+        results = read_snapshot(Path(args.cache_dir) / SNAPSHOT_NAME)
+        archived = read_archive(path)
+
+    known = {result.course.org_unit_id for result in archived}
+    new = [
+        result for result in results
+        if not result.course.is_active and result.grades is not None and result.assignments is not None and result.course.org_unit_id not in known
+    ]
+    new_ids = {result.course.org_unit_id for result in new}
+    if new:
+        with timings.measure("write"):
+            write_archive(path, [(result.course, result.grades or [], result.assignments or []) for result in archived + new])
+
+    records = [
+        {
+            "course": result.course.full_code,
+            "semester": result.course.semester.code,
+            "grades": len(result.grades or []),
+            "assignments": len(result.assignments or []),
+            "new": result.course.org_unit_id in new_ids,
+        }
+        for result in archived + new
+    ]
+    _write(args, format_records(records, args.format))
+    return 0
+
+def command_export(args: argparse.Namespace, timings: Timings) -> int:
+    with timings.measure("read"):
+        results = read_snapshot(Path(args.cache_dir) / SNAPSHOT_NAME)
+        synced = {result.course.org_unit_id for result in results}
+        results += [result for result in read_archive(Path(args.cache_dir) / ARCHIVE_NAME) if result.course.org_unit_id not in synced]
+
+    if args.dataset == "calendar":
+        calendar = DeadlineCalendar()
+        for result in results:
+            calendar.update(result.course, result.assignments or [])
+        text = calendar.to_ics()
+    elif args.dataset == "courses":
+        text = format_records(course_records([result.course for result in results]), args.format)
+    elif args.dataset == "grades":
+        text = format_records(grade_records(results), args.format)
+    else:
+        items = [(result.course, assignment) for result in results for assignment in result.assignments or []]
+        text = format_records(assignment_records(items), args.format)
+
+    _write(args, text)
+    return 0
+
+def _close(clients: list[Brightspace], timings: Timings) -> None:
+    for client in clients:
+        if client.first_navigation_seconds is not None:
+            timings.add("first navigation", client.first_navigation_seconds)
+        try:
+            client.close()
+        except Exception:
+            logger.debug("Failed to close client.", exc_info=True)
+
+def _add_course_filters(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--semester", type=parse_semester, metavar="SEMESTER", help='only include courses of a semester, such as "2026 Winter" or 26W')
+    parser.add_argument("--code", metavar="PREFIX", help="only include courses whose code starts with a prefix, such as CST81")
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the command line argument parser."""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--backend", choices=["browser", "http", "replay"], default="browser",
+        help="how pages are loaded: a Chrome browser, plain HTTP with saved login cookies, or pages recorded earlier (default: browser)")
+    common.add_argument("--base-url", default=BASE_URL, help="root URL of the Brightspace website")
+    common.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help=f"directory for cookies, recorded pages and synced data (default: {DEFAULT_CACHE_DIR})")
+    common.add_argument("--replay-dir", help=f"directory of recorded pages (default: CACHE_DIR/{PAGES_DIR_NAME})")
+    common.add_argument("--record", action="store_true", help="save every page loaded by the http backend for replaying later")
+    common.add_argument("--chrome-profile", action="store_true",
+        help=f"reuse a Chrome profile in CACHE_DIR/{PROFILE_DIR_NAME} so cached Brightspace scripts survive between runs")
+    common.add_argument("--chrome-profile-slots", type=int, default=2, metavar="N",
+        help="number of processes that can use the Chrome profile at the same time (default: 2)")
+    common.add_argument("--prefetch-tabs", type=int, default=0, metavar="N",
+                        help="browser backend: load up to N upcoming pages in background tabs (default: 0)")
+    common.add_argument("--concurrency", type=int, default=None, metavar="N",
+        help=f"number of courses fetched at the same time (default: {DEFAULT_CONCURRENCY}, or 1 for the browser backend)")
+    common.add_argument("--format", choices=["table", "json", "csv"], default="table", help="output format (default: table)")
+    common.add_argument("--output", "-o", help="write the output to a file instead of standard output")
+    common.add_argument("--timings", action="store_true", help="print how long each phase took to standard error")
+    common.add_argument("--rate-limit", type=float, metavar="PAGES_PER_SECOND",
+                        help="limit page loads across every acbrightspace process sharing the cache directory")
+    common.add_argument("--metrics", metavar="FILE", help="append performance data of every page load to a JSON Lines file")
+    common.add_argument("--profile", metavar="DIR",
+        help="profile the run and write a report (profile.txt) and flame graph stacks (profile.folded) to a directory; "
+             "use with --backend replay for repeatable results")
+    common.add_argument("--verbose", "-v", action="count", default=0, help="log more details; repeat for debug output")
+
+    parser = argparse.ArgumentParser(prog="acbrightspace", description="Query and export Algonquin College Brightspace data.")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+
+    courses = commands.add_parser("courses", parents=[common], help="list courses")
+    courses.add_argument("--active", action="store_true", help="only list active courses")
+    _add_course_filters(courses)
+    courses.set_defaults(handler=command_courses)
+
+    grades = commands.add_parser("grades", parents=[common], help="list grades of active courses")
+    grades.add_argument("--all", action="store_true", help="include closed courses")
+    _add_course_filters(grades)
+    grades.set_defaults(handler=command_grades)
+
+    assignments = commands.add_parser("assignments", parents=[common], help="list assignments of active courses")
+    assignments.add_argument("--all", action="store_true", help="include closed courses")
+    _add_course_filters(assignments)
+    assignments.add_argument("--due-within", type=parse_duration, metavar="DURATION", help="only list assignments due within a duration from now, such as 7d or 12h")
+    assignments.set_defaults(handler=command_assignments)
+
+    announcements = commands.add_parser("announcements", parents=[common], help="list announcements of active courses, newest first")
+    announcements.add_argument("--all", action="store_true", help="include closed courses")
+    _add_course_filters(announcements)
+    announcements.add_argument("--new", action="store_true",
+        help=f"only list announcements published since the last run with --new, remembered in CACHE_DIR/{ANNOUNCEMENTS_NAME}")
+    announcements.set_defaults(handler=command_announcements)
+
+    sync = commands.add_parser("sync", parents=[common], help="fetch grades and assignments into the cache directory")
+    sync.add_argument("--all", action="store_true", help="include closed courses")
+    sync.set_defaults(handler=command_sync)
+
+    archive = commands.add_parser("archive", parents=[common],
+        help=f"freeze the synced closed courses into CACHE_DIR/{ARCHIVE_NAME}; sync --all then skips them and export still includes them")
+    archive.set_defaults(handler=command_archive)
+
+    export = commands.add_parser("export", parents=[common], help="export synced and archived data without contacting Brightspace")
+    export.add_argument("dataset", choices=["courses", "grades", "assignments", "calendar"], help="what to export; calendar is always iCalendar (ICS)")
+    export.set_defaults(handler=command_export)
+
+    return parser
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the command line interface.
+
+    Args:
+        argv (Sequence[str] | None): Command line arguments, without the program name.
+
+    Returns:
+        int: The exit status.
+    """
+    args = build_parser().parse_args(argv)
+    if args.concurrency is None:
+        args.concurrency = 1 if args.backend == "browser" else DEFAULT_CONCURRENCY
+    if args.concurrency < 1:
+        build_parser().error("--concurrency must be at least 1")
+
+    logging.basicConfig(level=[logging.WARNING, logging.INFO, logging.DEBUG][min(args.verbose, 2)], format="%(levelname)s %(name)s: %(message)s")
+    load_dotenv()
+
+    profiler = Profiler() if args.profile else None
+    timings = Timings(profiler)
+    try:
+        with profiler if profiler is not None else nullcontext(), timings.measure("total"):
+            return args.handler(args, timings)
+    except BrightspaceError as error:
+        logger.error("%s", error)
+        return 1
+    finally:
+        if args.timings:
+            print(timings.summary(), file=sys.stderr)
+        if profiler is not None:
+            report, folded = profiler.write(args.profile)
+            print(f"Wrote the profile to {report} and {folded}", file=sys.stderr)
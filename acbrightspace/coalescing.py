@@ -0,0 +1,229 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+from acbrightspace.assignment import Assignment
+from acbrightspace.course import Course
+from acbrightspace.grade_item import GradeItem
+from acbrightspace.semester import Semester
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+class SingleFlight(Generic[K, V]):
+    """Runs at most one call per key at a time, sharing its result with every concurrent caller.
+
+    The first caller for a key runs the function; callers that arrive while it is
+    running wait for it and get the same result, or the same error. Once the call
+    finishes, the next caller for the key runs the function again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[K, Future[V]] = {}
+
+    def do(self, key: K, function: Callable[[], V]) -> tuple[V, bool]:
+        """Runs a function, or waits for the call already running for the same key.
+
+        Args:
+            key (K): Identifies the call. Calls with equal keys are shared.
+            function (Callable[[], V]): The function to run.
+
+        Returns:
+            tuple[V, bool]: The result, and whether it came from another caller's call.
+
+        Raises:
+            Exception: The error of the function, for every caller that shared the call.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            shared = future is not None
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+
+        if shared:
+            return future.result(), True
+
+        try:
+            result = function()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+class TtlCache(Generic[K, V]):
+    """Thread safe cache whose entries expire after a fixed time, evicting the least recently used entry when full."""
+
+    def __init__(self, ttl: float, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic) -> None:
+        """Creates an empty cache.
+
+        Args:
+            ttl (float): Seconds an entry stays valid.
+            max_entries (int): Maximum number of entries.
+            clock (Callable[[], float]): Monotonic clock, replaceable for testing.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: K) -> tuple[bool, V | None]:
+        """Looks up an entry.
+
+        Returns:
+            tuple[bool, V | None]: Whether a valid entry was found, and its value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def put(self, key: K, value: V) -> None:
+        """Adds or replaces an entry."""
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, predicate: Callable[[K], bool]) -> int:
+        """Removes every entry whose key matches a predicate.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+@dataclass
+class CoalescingStats:
+    """Counts how requests to a `CoalescingBrightspace` were served."""
+
+    hits: int = 0
+    """Requests answered from the cache."""
+
+    shared: int = 0
+    """Requests that waited for an identical request already in flight."""
+
+    fetches: int = 0
+    """Requests that loaded pages from Brightspace."""
+
+class CoalescingBrightspace:
+    """Front for a `Brightspace` that shares identical concurrent requests and caches their results.
+
+    Requests for the same method and org unit ID that arrive while one is in flight
+    wait for it instead of navigating again, and successful results are cached for
+    `ttl` seconds. Errors are shared with the waiting callers but not cached. Load
+    on Brightspace then grows with the number of distinct pages rather than the
+    number of callers.
+
+    A `Brightspace` drives a single browser, so fetches of different pages run one
+    at a time. Results are shared between callers: lists are copied, but the items
+    in them are the same objects and must not be modified.
+
+    Example:
+        >>> client = CoalescingBrightspace(brightspace, ttl=300)
+        >>> # Safe to call from many request handlers at once
+        >>> grades = client.get_grades("683274")
+    """
+
+    def __init__(self, brightspace: Any, ttl: float = 300.0, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic) -> None:
+        """Creates a coalescing front.
+
+        Args:
+            brightspace (Brightspace): The logged in client to fetch with.
+            ttl (float): Seconds results are cached for. 0 shares in-flight requests without caching.
+            max_entries (int): Maximum number of cached results.
+            clock (Callable[[], float]): Monotonic clock, replaceable for testing.
+        """
+        self.brightspace = brightspace
+        self.stats = CoalescingStats()
+        self._cache: TtlCache[tuple[str, str | None], Any] = TtlCache(ttl, max_entries, clock)
+        self._flights: SingleFlight[tuple[str, str | None], Any] = SingleFlight()
+        self._fetch_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def _request(self, method: str, org_unit_id: str | None, fetch: Callable[[], list]) -> list:
+        key = (method, org_unit_id)
+        found, value = self._cache.get(key)
+        if found:
+            self._count("hits")
+            return list(value)
+
+        def load() -> list:
+            # Another flight may have filled the cache while this one was being set up
+            found, value = self._cache.get(key)
+            if found:
+                return value
+            with self._fetch_lock:
+                self._count("fetches")
+                value = fetch()
+            if self._cache.ttl > 0:
+                self._cache.put(key, value)
+            return value
+
+        value, shared = self._flights.do(key, load)
+        if shared:
+            self._count("shared")
+        return list(value)
+
+    def get_courses(self, semester: Semester | str | None = None, is_active: bool | None = None, code_prefix: str | None = None) -> list[Course]:
+        """Fetches the courses, sharing and caching the result. See `Brightspace.get_courses`."""
+        if semester is None and is_active is None and code_prefix is None:
+            return self._request("get_courses", None, self.brightspace.get_courses)
+        # Filtered listings are cached separately, keyed by their filters as they are
+        # compared, so the name and code of a semester or the case of a prefix do not matter
+        semester_key = Semester.parse(semester).name if semester is not None else None
+        prefix_key = code_prefix.upper() if code_prefix is not None else None
+        key = repr((semester_key, is_active, prefix_key))
+        return self._request("get_courses", key, lambda: self.brightspace.get_courses(semester=semester, is_active=is_active, code_prefix=code_prefix))
+
+    def get_grades(self, org_unit_id: str) -> list[GradeItem]:
+        """Fetches a course's grades, sharing and caching the result. See `Brightspace.get_grades`."""
+        return self._request("get_grades", str(org_unit_id), lambda: self.brightspace.get_grades(str(org_unit_id)))
+
+    def get_assignments(self, org_unit_id: str) -> list[Assignment]:
+        """Fetches a course's assignments, sharing and caching the result. See `Brightspace.get_assignments`."""
+        return self._request("get_assignments", str(org_unit_id), lambda: self.brightspace.get_assignments(str(org_unit_id)))
+
+    def invalidate(self, method: str | None = None, org_unit_id: str | None = None) -> int:
+        """Removes cached results, so the next request fetches again.
+
+        Args:
+            method (str | None): Only remove results of this method, such as "get_grades".
+            org_unit_id (str | None): Only remove results for this course.
+
+        Returns:
+            int: The number of results removed.
+        """
+        return self._cache.discard(lambda key: (method is None or key[0] == method) and (org_unit_id is None or key[1] == str(org_unit_id)))
@@ -0,0 +1,344 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import threading
+from typing import Iterator
+
+from acbrightspace.errors import HttpStatusError
+from acbrightspace.session import HttpSession
+
+logger = logging.getLogger(__name__)
+
+LE_API_VERSION = "1.74"
+"""Version of the Brightspace Learning Environment API used for content requests."""
+
+MANIFEST_NAME = ".acbrightspace-manifest.json"
+"""Name of the file that records what has already been downloaded to a destination."""
+
+@dataclass
+class ContentTopic:
+    """Represents a topic (usually a file) in a course's content tree."""
+
+    id: int
+    """Topic ID of the topic."""
+
+    title: str
+    """Title of the topic as shown in Brightspace."""
+
+    url: str | None
+    """URL of the topic's file, if any."""
+
+    type: str
+    """Type of the topic (e.g., "File" or "Link")."""
+
+    path: list[str] = field(default_factory=list)
+    """Titles of the modules containing the topic, from the root down."""
+
+    @property
+    def filename(self) -> str:
+        """Returns a safe file name for the topic, keeping the extension of its URL."""
+        extension = os.path.splitext(self.url or "")[1]
+        name = _safe_name(self.title)
+        if extension and not name.lower().endswith(extension.lower()):
+            name += extension
+        return name
+
+@dataclass
+class ContentModule:
+    """Represents a module (folder) in a course's content tree."""
+
+    id: int
+    """Module ID of the module."""
+
+    title: str
+    """Title of the module as shown in Brightspace."""
+
+    modules: list["ContentModule"] = field(default_factory=list)
+    """Child modules of the module."""
+
+    topics: list[ContentTopic] = field(default_factory=list)
+    """Topics directly inside the module."""
+
+    def walk(self) -> Iterator[ContentTopic]:
+        """Yields every topic in the module and its child modules, depth first."""
+        yield from self.topics
+        for module in self.modules:
+            yield from module.walk()
+
+class DownloadStatus(Enum):
+    """Outcome of downloading a single topic."""
+
+    DOWNLOADED = "downloaded"
+    RESUMED = "resumed"
+    UNCHANGED = "unchanged"
+    FAILED = "failed"
+
+@dataclass
+class DownloadResult:
+    """Result of downloading a single topic."""
+
+    topic: ContentTopic
+    """The topic that was downloaded."""
+
+    path: Path
+    """Where the topic's file is stored."""
+
+    status: DownloadStatus
+    """What happened to the file."""
+
+    bytes_transferred: int = 0
+    """Number of bytes received over the network."""
+
+    error: Exception | None = None
+    """The error that caused the download to fail, if any."""
+
+def _safe_name(name: str) -> str:
+    """Replaces characters that are not allowed in file names."""
+    return re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", name).strip(" .") or "_"
+
+def _parse_module(data: dict, path: list[str]) -> ContentModule:
+    module = ContentModule(id=data["ModuleId"], title=data["Title"])
+    module_path = path + [module.title]
+    for topic in data.get("Topics", []):
+        module.topics.append(ContentTopic(
+            id=topic["TopicId"],
+            title=topic["Title"],
+            url=topic.get("Url"),
+            type=topic.get("TypeIdentifier", "File"),
+            path=module_path,
+        ))
+    for child in data.get("Modules", []):
+        module.modules.append(_parse_module(child, module_path))
+    return module
+
+def fetch_content(session: HttpSession, org_unit_id: int | str) -> ContentModule:
+    """Fetches the content tree (table of contents) of a course.
+
+    Args:
+        session (HttpSession): An authenticated HTTP session.
+        org_unit_id (int | str): The organizational unit ID of the course.
+
+    Returns:
+        ContentModule: A root module containing the course's top level modules.
+    """
+    toc = session.get_json(f"/d2l/api/le/{LE_API_VERSION}/{org_unit_id}/content/toc")
+    root = ContentModule(id=0, title="")
+    for module in toc.get("Modules", []):
+        root.modules.append(_parse_module(module, []))
+    return root
+
+class ContentDownloader:
+    """Downloads course content files in parallel.
+
+    Files are streamed to disk in chunks through a `.part` file, so an interrupted
+    download is resumed with a range request the next time, if the server sent an ETag
+    or Last-Modified date to check that the file has not changed in between. A manifest
+    in the destination directory records the path, size, ETag and SHA-256 hash of every
+    finished file by topic ID, which lets unchanged files be skipped without downloading
+    them again.
+    """
+
+    def __init__(self, session: HttpSession, org_unit_id: int | str, destination: str | os.PathLike, max_workers: int = 4, chunk_size: int = 1024 * 1024) -> None:
+        """Creates a new downloader.
+
+        Args:
+            session (HttpSession): An authenticated HTTP session.
+            org_unit_id (int | str): The organizational unit ID of the course.
+            destination (str | os.PathLike): Directory to download into.
+            max_workers (int): Maximum number of files downloaded at the same time.
+            chunk_size (int): Number of bytes read from the network at a time.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got: {max_workers}")
+
+        self.session = session
+        self.org_unit_id = org_unit_id
+        self.destination = Path(destination)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._manifest_lock = threading.Lock()
+        self._manifest: dict[str, dict] = {}
+
+    def topic_url(self, topic: ContentTopic) -> str:
+        """Returns the URL to download a topic's file from."""
+        return f"/d2l/api/le/{LE_API_VERSION}/{self.org_unit_id}/content/topics/{topic.id}/file?stream=true"
+
+    def topic_path(self, topic: ContentTopic, unique: bool = False) -> Path:
+        """Returns where a topic's file is stored, mirroring the module tree.
+
+        Args:
+            topic (ContentTopic): The topic.
+            unique (bool): Whether to add the topic ID to the file name, for topics
+                whose title and extension are the same as another topic's in the module.
+        """
+        filename = topic.filename
+        if unique:
+            stem, extension = os.path.splitext(filename)
+            filename = f"{stem} ({topic.id}){extension}"
+        return self.destination.joinpath(*(_safe_name(part) for part in topic.path), filename)
+
+    def topic_paths(self, topics: list[ContentTopic]) -> dict[int, Path]:
+        """Returns where each topic's file is stored, by topic ID.
+
+        Topics that would share a file keep it apart by the topic ID in their file name,
+        except the one with the lowest ID. Names that differ only in case count as the
+        same, since they are on some file systems.
+        """
+        by_path: dict[str, list[ContentTopic]] = {}
+        for topic in topics:
+            by_path.setdefault(str(self.topic_path(topic)).casefold(), []).append(topic)
+        paths = {}
+        for same in by_path.values():
+            same.sort(key=lambda topic: topic.id)
+            for position, topic in enumerate(same):
+                paths[topic.id] = self.topic_path(topic, unique=position > 0)
+        return paths
+
+    def download(self, topics: list[ContentTopic]) -> list[DownloadResult]:
+        """Downloads the given topics.
+
+        Only topics of type "File" are downloaded; other topics are ignored.
+
+        Args:
+            topics (list[ContentTopic]): The topics to download.
+
+        Returns:
+            list[DownloadResult]: One result per downloaded topic, in the same order.
+        """
+        files = [topic for topic in topics if topic.type == "File"]
+        paths = self.topic_paths(files)
+        self.destination.mkdir(parents=True, exist_ok=True)
+        self._manifest = self._load_manifest()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                return list(executor.map(lambda topic: self._download_topic(topic, paths[topic.id]), files))
+        finally:
+            self._save_manifest()
+
+    def _load_manifest(self) -> dict[str, dict]:
+        manifest_path = self.destination / MANIFEST_NAME
+        try:
+            return json.loads(manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning("Ignoring corrupt download manifest: %s", manifest_path)
+            return {}
+
+    def _save_manifest(self) -> None:
+        manifest_path = self.destination / MANIFEST_NAME
+        temporary_path = manifest_path.with_suffix(".tmp")
+        with self._manifest_lock:
+            temporary_path.write_text(json.dumps(self._manifest, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(temporary_path, manifest_path)
+
+    def _is_unchanged(self, path: Path, key: str, size: int | None, etag: str | None) -> bool:
+        """Checks whether a local file still matches the remote file, cheapest check first."""
+        with self._manifest_lock:
+            entry = self._manifest.get(key)
+        if entry is None or entry.get("path") != path.relative_to(self.destination).as_posix() or not path.exists():
+            return False
+
+        local_size = path.stat().st_size
+        if local_size != entry["size"] or (size is not None and size != local_size):
+            return False
+        if etag is not None and entry.get("etag") is not None:
+            return etag == entry["etag"]
+
+        # Without an ETag, make sure the local file has not been modified since it was downloaded
+        return _hash_file(path) == entry["sha256"]
+
+    def _download_topic(self, topic: ContentTopic, path: Path) -> DownloadResult:
+        # Titles are not unique, so files are recorded by topic
+        key = str(topic.id)
+        relative_path = path.relative_to(self.destination).as_posix()
+        url = self.topic_url(topic)
+
+        try:
+            head = self.session.request("HEAD", url)
+            if head.status != 200:
+                raise HttpStatusError(f"HEAD {url} failed with status {head.status}", head.status)
+            etag = head.headers.get("ETag")
+            length = head.headers.get("Content-Length")
+            size = int(length) if length is not None else None
+            # Checks that a partial download is of the same version of the file
+            validator = etag or head.headers.get("Last-Modified")
+
+            if self._is_unchanged(path, key, size, etag):
+                logger.debug("Skipping unchanged file: %s", relative_path)
+                return DownloadResult(topic, path, DownloadStatus.UNCHANGED)
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            part_path = path.with_name(path.name + ".part")
+            if validator is None:
+                # Without a validator, the new bytes could belong to another version of the file
+                part_path.unlink(missing_ok=True)
+
+            while True:
+                offset = part_path.stat().st_size if part_path.exists() else 0
+                headers = {}
+                if offset:
+                    headers["Range"] = f"bytes={offset}-"
+                    # Only resume if the file has not changed since the partial download
+                    headers["If-Range"] = validator
+
+                response = self.session.request("GET", url, headers=headers, preload_content=False)
+                try:
+                    if response.status == 416 and offset:
+                        # The partial download is as long as the file or longer, so it is stale
+                        logger.debug("Discarding stale partial download: %s", relative_path)
+                        part_path.unlink()
+                        continue
+                    if response.status == 206:
+                        status = DownloadStatus.RESUMED
+                        mode = "ab"
+                    elif response.status == 200:
+                        status = DownloadStatus.DOWNLOADED
+                        mode = "wb"
+                        offset = 0
+                    else:
+                        raise HttpStatusError(f"GET {url} failed with status {response.status}", response.status)
+
+                    digest = _update_digest(hashlib.sha256(), part_path) if mode == "ab" else hashlib.sha256()
+                    transferred = 0
+                    with open(part_path, mode) as file:
+                        for chunk in response.stream(self.chunk_size):
+                            file.write(chunk)
+                            digest.update(chunk)
+                            transferred += len(chunk)
+                finally:
+                    response.release_conn()
+                break
+
+            os.replace(part_path, path)
+            with self._manifest_lock:
+                self._manifest[key] = {
+                    "path": relative_path,
+                    "etag": etag,
+                    "size": offset + transferred,
+                    "sha256": digest.hexdigest(),
+                }
+            logger.debug("Downloaded %s (%d bytes, %s)", relative_path, transferred, status.value)
+            return DownloadResult(topic, path, status, transferred)
+
+        except Exception as error:
+            logger.error("Failed to download topic %d: %s", topic.id, topic.title, exc_info=error)
+            return DownloadResult(topic, path, DownloadStatus.FAILED, error=error)
+
+def _update_digest(digest: "hashlib._Hash", path: Path) -> "hashlib._Hash":
+    """Feeds the contents of a file into a hash object."""
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest
+
+def _hash_file(path: Path) -> str:
+    """Returns the SHA-256 hex digest of a file."""
+    return _update_digest(hashlib.sha256(), path).hexdigest()
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 import re
+from typing import Any
 
 from acbrightspace.semester import Semester
 
@@ -58,4 +59,116 @@ class Course:
             ends_at=ends_at,
             is_active=is_active,
             org_unit_id=org_unit_id,
-        )
\ No newline at end of file
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the course as JSON compatible data, with dates in ISO 8601 format.
+
+        Returns:
+            dict[str, Any]: A dictionary that `from_dict` turns back into an equal course.
+        """
+        return {
+            "full_code": self.full_code,
+            "full_name": self.full_name,
+            "name": self.name,
+            "semester": self.semester.to_dict(),
+            "ends_at": self.ends_at.isoformat(),
+            "is_active": self.is_active,
+            "org_unit_id": self.org_unit_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], version: int = 1) -> "Course":
+        """Creates a course from the data returned by `to_dict`.
+
+        Args:
+            data (dict[str, Any]): The data.
+            version (int): Version of the data format the data was written with.
+
+        Returns:
+            Course: The course.
+
+        Raises:
+            ValueError: If the version is not supported.
+        """
+        if version != 1:
+            raise ValueError(f"Unsupported Course data version: {version}")
+        return cls(
+            full_code=data["full_code"],
+            full_name=data["full_name"],
+            name=data["name"],
+            semester=Semester.from_dict(data["semester"], version),
+            ends_at=datetime.fromisoformat(data["ends_at"]),
+            is_active=data["is_active"],
+            org_unit_id=data["org_unit_id"],
+        )
+
+def _is_semester_name(text: str) -> bool:
+    try:
+        Semester.from_name(text)
+    except ValueError:
+        return False
+    return True
+
+@dataclass
+class CourseFilter:
+    """Selects courses by semester, status and code, checking as early as possible.
+
+    Besides `matches` for parsed courses, it can reject whole tabs of the course
+    listing and course cards from their raw text, before the text is parsed.
+    """
+
+    semester: Semester | None = None
+    """Only match courses of this semester."""
+
+    is_active: bool | None = None
+    """Only match active (True) or closed (False) courses."""
+
+    code_prefix: str | None = None
+    """Only match courses whose full code or course code starts with this, ignoring case."""
+
+    def tabs(self, tabs: list[Any]) -> list[Any]:
+        """Returns the tabs of the course listing that may contain matching courses.
+
+        Tabs are labelled by their "text" attribute. If one is labelled with the semester,
+        only it is kept; otherwise tabs labelled with other semesters are left out.
+
+        Args:
+            tabs (list[Any]): The `d2l-tab-panel` elements.
+
+        Returns:
+            list[Any]: The tabs to look in.
+        """
+        if self.semester is None:
+            return tabs
+        labels = [(tab.get_attribute("text") or "").strip() for tab in tabs]
+        exact = [tab for tab, label in zip(tabs, labels) if label == self.semester.name]
+        if exact:
+            return exact
+        return [tab for tab, label in zip(tabs, labels) if not _is_semester_name(label)]
+
+    def may_match(self, text: str) -> bool:
+        """Returns False if the text of a course card shows that the course does not match.
+
+        Cheap enough to run before `Course.from_string`; a True result still needs `matches`.
+        """
+        if self.is_active is not None and text.startswith("Closed, ") == self.is_active:
+            return False
+        if self.semester is not None and f", {self.semester.name}, " not in text:
+            return False
+        if self.code_prefix is not None and self.code_prefix.upper() not in text.upper():
+            return False
+        return True
+
+    def matches(self, course: Course) -> bool:
+        """Returns whether a course matches every filter."""
+        if self.is_active is not None and course.is_active != self.is_active:
+            return False
+        if self.semester is not None and course.semester != self.semester:
+            return False
+        if self.code_prefix is not None:
+            prefix = self.code_prefix.upper()
+            codes = course.full_code.upper().split("_")
+            if not course.full_code.upper().startswith(prefix) and not (len(codes) > 1 and codes[1].startswith(prefix)):
+                return False
+        return True
@@ -0,0 +1,221 @@
+from bisect import bisect_left, insort
+import difflib
+import re
+import threading
+from typing import Iterable, Iterator
+
+from acbrightspace.course import Course
+from acbrightspace.semester import Semester
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+PREFIX_SCORE = 0.8
+"""Score of a query word that starts a word of the course, where an exact word scores 1."""
+
+FUZZY_CUTOFF = 0.75
+"""Minimum similarity (0 to 1) of a misspelled query word to a word of a course."""
+
+def _tokens(text: str) -> set[str]:
+    return set(_TOKEN.findall(text.lower()))
+
+def _codes(course: Course) -> list[str]:
+    """Returns the keys a code prefix is matched against: the full code and the course code."""
+    full_code = course.full_code.upper()
+    parts = full_code.split("_")
+    return [full_code, parts[1]] if len(parts) > 1 else [full_code]
+
+class CourseIndex:
+    """Finds courses by ID, code, semester and name without scanning the course list.
+
+    Lookups by org unit ID and full code are dictionary lookups, prefix searches are
+    binary searches over the sorted codes, and name searches go through an index of the
+    words in course names. The index is updated course by course, so keeping it in step
+    with `Brightspace.get_courses` only touches the courses that changed.
+
+    A course enrolled in from several accounts is indexed once. The index is thread safe.
+
+    Example:
+        >>> index = CourseIndex(brightspace.get_courses())
+        >>> index.by_code("26W_CST8109_010")
+        >>> index.with_code_prefix("CST81")
+        >>> index.search("netwrk programing")
+    """
+
+    def __init__(self, courses: Iterable[Course] = ()) -> None:
+        """Creates an index.
+
+        Args:
+            courses (Iterable[Course]): The courses to index.
+        """
+        self._lock = threading.RLock()
+        self._courses: dict[int, Course] = {}
+        self._by_code: dict[str, int] = {}
+        self._by_semester: dict[Semester, dict[int, None]] = {}
+        self._codes: list[tuple[str, int]] = []
+        self._words: dict[str, set[int]] = {}
+        self._vocabulary: list[str] = []
+        for course in courses:
+            self.add(course)
+
+    def __len__(self) -> int:
+        return len(self._courses)
+
+    def __iter__(self) -> Iterator[Course]:
+        with self._lock:
+            return iter(list(self._courses.values()))
+
+    def __contains__(self, org_unit_id: object) -> bool:
+        return org_unit_id in self._courses
+
+    def add(self, course: Course) -> None:
+        """Adds a course, replacing the indexed course with the same org unit ID."""
+        with self._lock:
+            previous = self._courses.get(course.org_unit_id)
+            if previous == course:
+                return
+            if previous is not None:
+                self._unindex(previous)
+            self._courses[course.org_unit_id] = course
+            self._by_code[course.full_code.upper()] = course.org_unit_id
+            self._by_semester.setdefault(course.semester, {})[course.org_unit_id] = None
+            for code in _codes(course):
+                insort(self._codes, (code, course.org_unit_id))
+            for word in _tokens(course.name) | _tokens(course.full_code.replace("_", " ")):
+                ids = self._words.setdefault(word, set())
+                if not ids:
+                    insort(self._vocabulary, word)
+                ids.add(course.org_unit_id)
+
+    def remove(self, org_unit_id: int) -> Course:
+        """Removes a course.
+
+        Returns:
+            Course: The removed course.
+
+        Raises:
+            KeyError: If the course is not indexed.
+        """
+        with self._lock:
+            course = self._courses[org_unit_id]
+            self._unindex(course)
+            return course
+
+    def _unindex(self, course: Course) -> None:
+        del self._courses[course.org_unit_id]
+        if self._by_code.get(course.full_code.upper()) == course.org_unit_id:
+            del self._by_code[course.full_code.upper()]
+        semester = self._by_semester[course.semester]
+        del semester[course.org_unit_id]
+        if not semester:
+            del self._by_semester[course.semester]
+        for code in _codes(course):
+            del self._codes[bisect_left(self._codes, (code, course.org_unit_id))]
+        for word in _tokens(course.name) | _tokens(course.full_code.replace("_", " ")):
+            ids = self._words[word]
+            ids.discard(course.org_unit_id)
+            if not ids:
+                del self._words[word]
+                del self._vocabulary[bisect_left(self._vocabulary, word)]
+
+    def sync(self, courses: Iterable[Course]) -> tuple[list[Course], list[Course]]:
+        """Makes the index hold exactly the given courses, touching only the ones that changed.
+
+        Args:
+            courses (Iterable[Course]): The current course list, such as from `get_courses`.
+
+        Returns:
+            tuple[list[Course], list[Course]]: The courses that were added or changed, and the ones that were removed.
+        """
+        current = {course.org_unit_id: course for course in courses}
+        with self._lock:
+            removed = [self.remove(org_unit_id) for org_unit_id in list(self._courses) if org_unit_id not in current]
+            changed = [course for course in current.values() if self._courses.get(course.org_unit_id) != course]
+            for course in changed:
+                self.add(course)
+        return changed, removed
+
+    def get(self, org_unit_id: int) -> Course | None:
+        """Returns the course with an org unit ID, if indexed."""
+        return self._courses.get(org_unit_id)
+
+    def by_code(self, full_code: str) -> Course | None:
+        """Returns the course with a full code such as "26W_CST8109_010", ignoring case."""
+        with self._lock:
+            org_unit_id = self._by_code.get(full_code.strip().upper())
+            return self._courses.get(org_unit_id) if org_unit_id is not None else None
+
+    @property
+    def semesters(self) -> list[Semester]:
+        """Returns the semesters of the indexed courses."""
+        with self._lock:
+            return list(self._by_semester)
+
+    def in_semester(self, semester: Semester) -> list[Course]:
+        """Returns the courses of a semester, in the order they were added."""
+        with self._lock:
+            return [self._courses[org_unit_id] for org_unit_id in self._by_semester.get(semester, {})]
+
+    def by_semester(self) -> dict[Semester, list[Course]]:
+        """Returns the indexed courses grouped by semester."""
+        with self._lock:
+            return {semester: self.in_semester(semester) for semester in self._by_semester}
+
+    def with_code_prefix(self, prefix: str) -> list[Course]:
+        """Returns the courses whose full code or course code starts with a prefix, ignoring case.
+
+        Args:
+            prefix (str): The prefix, such as "CST81" or "26W_CST".
+
+        Returns:
+            list[Course]: The courses, ordered by the matching code.
+        """
+        prefix = prefix.strip().upper()
+        with self._lock:
+            seen: dict[int, None] = {}
+            for code, org_unit_id in self._codes[bisect_left(self._codes, (prefix,)):]:
+                if not code.startswith(prefix):
+                    break
+                seen[org_unit_id] = None
+            return [self._courses[org_unit_id] for org_unit_id in seen]
+
+    def search(self, query: str, limit: int = 10) -> list[Course]:
+        """Finds courses by the words of their name or code, tolerating partial and misspelled words.
+
+        Each query word scores 1 for a course with that word, `PREFIX_SCORE` for a course with
+        a word that starts with it, and less for a course with a similar word. Courses are ranked
+        by the total score of the query words.
+
+        Args:
+            query (str): The words to look for, such as "network prog".
+            limit (int): Maximum number of courses to return.
+
+        Returns:
+            list[Course]: The best matching courses first.
+        """
+        scores: dict[int, float] = {}
+        with self._lock:
+            for word in _tokens(query):
+                best: dict[int, float] = {}
+                for match, score in self._matches(word):
+                    for org_unit_id in self._words[match]:
+                        best[org_unit_id] = max(best.get(org_unit_id, 0.0), score)
+                for org_unit_id, score in best.items():
+                    scores[org_unit_id] = scores.get(org_unit_id, 0.0) + score
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], self._courses[item[0]].full_code))
+            return [self._courses[org_unit_id] for org_unit_id, _ in ranked[:limit]]
+
+    def _matches(self, word: str) -> list[tuple[str, float]]:
+        """Returns the indexed words a query word matches, with their scores."""
+        matches = [(word, 1.0)] if word in self._words else []
+        for candidate in self._vocabulary[bisect_left(self._vocabulary, word):]:
+            if not candidate.startswith(word):
+                break
+            if candidate != word:
+                matches.append((candidate, PREFIX_SCORE))
+        if matches:
+            return matches
+        # Only misspelled words are compared with the whole vocabulary
+        return [
+            (candidate, PREFIX_SCORE * difflib.SequenceMatcher(None, word, candidate).ratio())
+            for candidate in difflib.get_close_matches(word, self._vocabulary, n=3, cutoff=FUZZY_CUTOFF)
+        ]
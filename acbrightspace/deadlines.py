@@ -0,0 +1,304 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import hashlib
+import logging
+from typing import Any, Generic, Iterable, TypeVar
+
+from acbrightspace.assignment import Assignment
+from acbrightspace.course import Course
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class _Node(Generic[T]):
+    """Node of a centered interval tree."""
+
+    def __init__(self, intervals: list[tuple[datetime, datetime, T]]) -> None:
+        # Use the median endpoint as the center so the tree stays balanced
+        endpoints = sorted(point for start, end, _ in intervals for point in (start, end))
+        self.center = endpoints[len(endpoints) // 2]
+
+        left = [interval for interval in intervals if interval[1] < self.center]
+        right = [interval for interval in intervals if interval[0] > self.center]
+        here = [interval for interval in intervals if interval[0] <= self.center <= interval[1]]
+
+        self.by_start = sorted(here, key=lambda interval: interval[0])
+        self.by_end = sorted(here, key=lambda interval: interval[1], reverse=True)
+        self.left = _Node(left) if left else None
+        self.right = _Node(right) if right else None
+
+class IntervalIndex(Generic[T]):
+    """Immutable index of closed intervals that answers overlap queries in O(log n + k)."""
+
+    def __init__(self, intervals: Iterable[tuple[datetime, datetime, T]] = ()) -> None:
+        """Builds the index.
+
+        Args:
+            intervals (Iterable[tuple[datetime, datetime, T]]): (start, end, item) tuples, with start <= end.
+        """
+        intervals = list(intervals)
+        for start, end, _ in intervals:
+            if start > end:
+                raise ValueError(f"Interval start must not be after its end, got: {start} > {end}")
+        self._root = _Node(intervals) if intervals else None
+        self._size = len(intervals)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def overlapping(self, start: datetime, end: datetime) -> list[T]:
+        """Returns the items whose interval overlaps [start, end]."""
+        items: list[T] = []
+        node = self._root
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            if end < node.center:
+                # Only intervals that start before the query ends can overlap
+                for interval in node.by_start:
+                    if interval[0] > end:
+                        break
+                    items.append(interval[2])
+                if node.left:
+                    stack.append(node.left)
+            elif start > node.center:
+                # Only intervals that end after the query starts can overlap
+                for interval in node.by_end:
+                    if interval[1] < start:
+                        break
+                    items.append(interval[2])
+                if node.right:
+                    stack.append(node.right)
+            else:
+                # Every interval at this node contains the center, which is inside the query
+                items.extend(interval[2] for interval in node.by_start)
+                if node.left:
+                    stack.append(node.left)
+                if node.right:
+                    stack.append(node.right)
+        return items
+
+@dataclass
+class Deadline:
+    """An assignment together with the course it belongs to."""
+
+    course: Course
+    """Course the assignment belongs to."""
+
+    assignment: Assignment
+    """The assignment."""
+
+    @property
+    def window(self) -> tuple[datetime, datetime] | None:
+        """Returns the period during which the assignment can be worked on, if it has any dates.
+
+        A missing start date is open ended, so an assignment with only a due date is
+        available from any time until it is due. A missing end date falls back to the
+        due date, or is open ended too. A start after the end, which Brightspace allows,
+        is moved back to the end.
+        """
+        assignment = self.assignment
+        end = assignment.ends_at or assignment.due_at
+        start = assignment.starts_at
+        if start is None and end is None:
+            return None
+        if start is not None and end is not None and start > end:
+            start = end
+        return (start or datetime.min, end or datetime.max)
+
+def _escape(text: str) -> str:
+    """Escapes text for use in an iCalendar property value."""
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+def _fold(line: str) -> str:
+    """Folds an iCalendar content line so no physical line is longer than 75 octets."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Do not split a multi-byte character
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74 # Continuation lines start with a space
+    return "\r\n ".join(parts)
+
+def _format(value: datetime) -> str:
+    return value.strftime("%Y%m%dT%H%M%S")
+
+def _fingerprint(assignments: list[Assignment]) -> str:
+    """Returns a hash of the fields of the assignments that end up in the calendar."""
+    digest = hashlib.sha256()
+    for assignment in assignments:
+        digest.update(repr((assignment.name, assignment.starts_at, assignment.ends_at, assignment.due_at, assignment.folder_id)).encode("utf-8"))
+    return digest.hexdigest()
+
+@dataclass
+class _CourseEntry:
+    course: Course
+    fingerprint: str
+    deadlines: list[Deadline]
+    events: str
+    """Rendered VEVENT blocks for the course, reused until its assignments change."""
+
+class DeadlineCalendar:
+    """Calendar of assignment deadlines across all courses.
+
+    Call `update` (or `sync`) with each course's assignments. Only courses whose
+    assignment dates changed are re-indexed and have their iCalendar events rendered
+    again; unchanged courses are skipped.
+
+    Example:
+        >>> calendar = DeadlineCalendar()
+        >>> calendar.sync(brightspace, brightspace.get_courses())
+        >>> calendar.due_between(datetime(2026, 1, 1), datetime(2026, 1, 31))
+        >>> calendar.write_ics("deadlines.ics")
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, _CourseEntry] = {}
+        self._due: list[Deadline] | None = None
+        self._due_keys: list[datetime] = []
+        self._windows: IntervalIndex[Deadline] | None = None
+
+    def __len__(self) -> int:
+        return sum(len(entry.deadlines) for entry in self._entries.values())
+
+    def update(self, course: Course, assignments: list[Assignment]) -> bool:
+        """Replaces the assignments of a course.
+
+        Args:
+            course (Course): The course.
+            assignments (list[Assignment]): All assignments of the course.
+
+        Returns:
+            bool: True if the course's assignments changed.
+        """
+        fingerprint = _fingerprint(assignments)
+        entry = self._entries.get(course.org_unit_id)
+        if entry is not None and entry.fingerprint == fingerprint:
+            return False
+
+        deadlines = [Deadline(course, assignment) for assignment in assignments]
+        for assignment in assignments:
+            end = assignment.ends_at or assignment.due_at
+            if assignment.starts_at is not None and end is not None and assignment.starts_at > end:
+                logger.warning("%s: %r starts on %s, after it ends on %s; using the end as its start.", course.full_code, assignment.name, assignment.starts_at, end)
+        self._entries[course.org_unit_id] = _CourseEntry(
+            course=course,
+            fingerprint=fingerprint,
+            deadlines=deadlines,
+            events=self._render_events(course, deadlines),
+        )
+        self._invalidate()
+        return True
+
+    def remove(self, org_unit_id: int) -> None:
+        """Removes a course and its assignments from the calendar."""
+        if self._entries.pop(org_unit_id, None) is not None:
+            self._invalidate()
+
+    def sync(self, brightspace: Any, courses: list[Course]) -> list[Course]:
+        """Fetches the assignments of each course and updates the calendar.
+
+        Courses that are no longer in the list are removed.
+
+        Args:
+            brightspace (Brightspace): A logged in Brightspace instance.
+            courses (list[Course]): The courses to include.
+
+        Returns:
+            list[Course]: The courses whose assignments changed.
+        """
+        changed = []
+        for course in courses:
+            if self.update(course, brightspace.get_assignments(str(course.org_unit_id))):
+                changed.append(course)
+
+        current = {course.org_unit_id for course in courses}
+        for org_unit_id in list(self._entries):
+            if org_unit_id not in current:
+                self.remove(org_unit_id)
+        return changed
+
+    def _invalidate(self) -> None:
+        self._due = None
+        self._windows = None
+
+    def _build(self) -> None:
+        deadlines = [deadline for entry in self._entries.values() for deadline in entry.deadlines]
+        self._due = sorted(
+            (deadline for deadline in deadlines if deadline.assignment.due_at is not None),
+            key=lambda deadline: deadline.assignment.due_at,
+        )
+        self._due_keys = [deadline.assignment.due_at for deadline in self._due]
+        self._windows = IntervalIndex(
+            (*window, deadline) for deadline in deadlines if (window := deadline.window) is not None
+        )
+
+    def due_between(self, start: datetime, end: datetime) -> list[Deadline]:
+        """Returns the deadlines due between two times (inclusive), earliest first."""
+        if self._due is None:
+            self._build()
+        low = bisect_left(self._due_keys, start)
+        high = bisect_right(self._due_keys, end)
+        return self._due[low:high]
+
+    def available_between(self, start: datetime, end: datetime) -> list[Deadline]:
+        """Returns the deadlines whose availability window overlaps the period between two times."""
+        if self._windows is None:
+            self._build()
+        return self._windows.overlapping(start, end)
+
+    def _render_events(self, course: Course, deadlines: list[Deadline]) -> str:
+        stamp = _format(datetime.now(timezone.utc)) + "Z"
+        lines = []
+        occurrences: dict[str, int] = {}
+        for deadline in deadlines:
+            assignment = deadline.assignment
+            # Names are not unique, so they are told apart by their dropbox folder, or else by their order
+            occurrence = occurrences[assignment.name] = occurrences.get(assignment.name, 0) + 1
+            at = assignment.due_at or assignment.ends_at
+            if at is None:
+                continue
+
+            if assignment.folder_id is not None:
+                uid = f"folder-{assignment.folder_id}"
+            else:
+                key = assignment.name if occurrence == 1 else f"{assignment.name}\n{occurrence}"
+                uid = hashlib.sha1(key.encode("utf-8")).hexdigest()
+            description = []
+            if assignment.starts_at is not None:
+                description.append(f"Available from {assignment.starts_at:%b %d, %Y %I:%M %p}")
+            if assignment.ends_at is not None:
+                description.append(f"Available until {assignment.ends_at:%b %d, %Y %I:%M %p}")
+
+            lines += [
+                "BEGIN:VEVENT",
+                f"UID:{course.org_unit_id}-{uid}@acbrightspace",
+                f"DTSTAMP:{stamp}",
+                f"DTSTART:{_format(at)}",
+                f"DTEND:{_format(at)}",
+                f"SUMMARY:{_escape(f'{course.full_code}: {assignment.name}')}",
+            ]
+            if description:
+                lines.append(f"DESCRIPTION:{_escape(chr(10).join(description))}")
+            lines.append("END:VEVENT")
+        return "".join(_fold(line) + "\r\n" for line in lines)
+
+    def to_ics(self) -> str:
+        """Returns the calendar as an iCalendar (RFC 5545) document."""
+        header = "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//acbrightspace//Deadlines//EN\r\nCALSCALE:GREGORIAN\r\n"
+        events = "".join(self._entries[org_unit_id].events for org_unit_id in sorted(self._entries))
+        return header + events + "END:VCALENDAR\r\n"
+
+    def write_ics(self, path: str) -> None:
+        """Writes the calendar to an iCalendar file."""
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write(self.to_ics())
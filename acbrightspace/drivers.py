@@ -0,0 +1,160 @@
+from abc import ABC, abstractmethod
+import hashlib
+import os
+from pathlib import Path
+import re
+from typing import Any
+from urllib.parse import urlsplit
+
+from selenium.webdriver.common.by import By
+
+from acbrightspace.errors import HttpStatusError
+from acbrightspace.html import HtmlDocument, HtmlElement
+from acbrightspace.pager import fetch_pages
+from acbrightspace.session import HttpSession
+
+def page_filename(url: str) -> str:
+    """Returns the file name a page is recorded under.
+
+    Args:
+        url (str): The URL of the page. The scheme and host are ignored.
+
+    Returns:
+        str: A file name made of the URL's path and query.
+    """
+    parts = urlsplit(url)
+    key = parts.path.strip("/") + ("?" + parts.query if parts.query else "")
+    name = re.sub(r"[^A-Za-z0-9.=-]+", "_", key).strip("_") or "index"
+    if len(name) > 150:
+        # Keep long names unique without hitting file system limits
+        name = name[:100] + "_" + hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return name + ".html"
+
+class HtmlDriver(ABC):
+    """Stands in for a Selenium WebDriver by loading static HTML pages instead of running a browser.
+
+    Only the parts of the WebDriver API that `Brightspace` uses are provided. Pages are
+    not rendered and scripts do not run, so it only works for pages that Brightspace
+    renders on the server, or pages that use declarative shadow DOM.
+    """
+
+    def __init__(self) -> None:
+        self.document = HtmlDocument()
+        self.page_source = ""
+
+    @abstractmethod
+    def load(self, url: str) -> tuple[str, str]:
+        """Returns the HTML of a page and its URL after any redirects."""
+
+    def get(self, url: str) -> None:
+        """Loads a page."""
+        self.page_source, final_url = self.load(url)
+        self.document = HtmlDocument.parse(self.page_source, url=final_url)
+
+    @property
+    def current_url(self) -> str:
+        """Returns the URL of the current page."""
+        return self.document.url or "about:blank"
+
+    @property
+    def title(self) -> str:
+        """Returns the title of the current page."""
+        return self.document.title
+
+    def find_element(self, by: str, value: str) -> HtmlElement:
+        """Finds the first element on the current page matching a locator."""
+        return self.document.find_element(by, value)
+
+    def find_elements(self, by: str, value: str) -> list[HtmlElement]:
+        """Finds all elements on the current page matching a locator."""
+        return self.document.find_elements(by, value)
+
+    def fetch_pages(self, urls: list[str], table_id: str) -> list[HtmlElement]:
+        """Loads several pages without changing the current page and returns the table from each one.
+
+        Args:
+            urls (list[str]): The URLs of the pages.
+            table_id (str): The ID of the table element on each page.
+
+        Returns:
+            list[HtmlElement]: The table of each page, in the same order as the URLs.
+        """
+        return [HtmlDocument.parse(*self.load(url)).find_element(By.ID, table_id) for url in urls]
+
+    def execute_script(self, script: str, *args: Any) -> None:
+        """Does nothing, since scripts cannot run on static pages."""
+        return None
+
+    def get_cookies(self) -> list[dict]:
+        """Returns the cookies sent with each request."""
+        return []
+
+    def add_cookie(self, cookie: dict) -> None:
+        """Adds a cookie to send with each request. Ignored by drivers that do not send requests."""
+
+    def quit(self) -> None:
+        """Releases any resources held by the driver."""
+
+class HttpDriver(HtmlDriver):
+    """Loads pages over HTTP with the cookies of an authenticated session."""
+
+    def __init__(self, session: HttpSession, record_dir: str | os.PathLike | None = None) -> None:
+        """Creates a new HTTP driver.
+
+        Args:
+            session (HttpSession): An authenticated HTTP session.
+            record_dir (str | os.PathLike | None): Directory to save every loaded page to, for replaying later.
+        """
+        super().__init__()
+        self.session = session
+        self.record_dir = Path(record_dir) if record_dir is not None else None
+
+    def load(self, url: str) -> tuple[str, str]:
+        response = self.session.request("GET", url)
+        if response.status >= 400:
+            raise HttpStatusError(f"GET {url} failed with status {response.status}", response.status)
+        html = response.data.decode("utf-8", errors="replace")
+        if self.record_dir is not None:
+            self.record_dir.mkdir(parents=True, exist_ok=True)
+            (self.record_dir / page_filename(url)).write_text(html, encoding="utf-8")
+        # urllib3 follows redirects, such as to the login page, and reports where it ended up
+        return html, self.session.url(response.url or url)
+
+    def fetch_pages(self, urls: list[str], table_id: str) -> list[HtmlElement]:
+        if self.record_dir is not None:
+            # Go through load so every page is recorded
+            return super().fetch_pages(urls, table_id)
+        return fetch_pages(self.session, urls, table_id)
+
+    def get_cookies(self) -> list[dict]:
+        return [{"name": name, "value": value} for name, value in self.session.cookies.items()]
+
+    def add_cookie(self, cookie: dict) -> None:
+        self.session.cookies[cookie["name"]] = cookie["value"]
+
+    def quit(self) -> None:
+        self.session.close()
+
+class ReplayDriver(HtmlDriver):
+    """Loads pages recorded earlier from a directory, for repeatable offline runs."""
+
+    def __init__(self, directory: str | os.PathLike) -> None:
+        """Creates a new replay driver.
+
+        Args:
+            directory (str | os.PathLike): Directory of pages saved with `record` or by `HttpDriver`.
+        """
+        super().__init__()
+        self.directory = Path(directory)
+
+    def record(self, url: str, html: str) -> None:
+        """Saves a page so it can be replayed."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / page_filename(url)).write_text(html, encoding="utf-8")
+
+    def load(self, url: str) -> tuple[str, str]:
+        path = self.directory / page_filename(url)
+        try:
+            return path.read_text(encoding="utf-8"), url
+        except FileNotFoundError:
+            raise HttpStatusError(f"No recorded page for {url} (expected {path})", 404) from None
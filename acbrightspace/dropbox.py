@@ -0,0 +1,298 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterator, Sequence
+import uuid
+
+from acbrightspace.assignment import Assignment
+from acbrightspace.content import LE_API_VERSION
+from acbrightspace.errors import HttpStatusError, SubmissionClosedError, SubmissionError
+from acbrightspace.session import HttpSession
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class SubmittedFile:
+    """A file of a dropbox submission, as listed by Brightspace."""
+
+    name: str
+    """Name of the file."""
+
+    size: int
+    """Size of the file in bytes."""
+
+@dataclass
+class SubmissionReceipt:
+    """Brightspace's record of a dropbox submission, read back after uploading it."""
+
+    org_unit_id: int
+    """Organizational unit ID of the course."""
+
+    folder_id: int
+    """ID of the dropbox folder."""
+
+    submission_id: int
+    """ID of the submission."""
+
+    submitted_at: datetime | None
+    """When Brightspace received the submission, in UTC."""
+
+    files: list[SubmittedFile] = field(default_factory=list)
+    """The files of the submission."""
+
+@dataclass
+class Submission:
+    """Files to submit to an assignment's dropbox folder."""
+
+    org_unit_id: int | str
+    """Organizational unit ID of the course."""
+
+    assignment: Assignment
+    """The assignment, as returned by `Brightspace.get_assignments`."""
+
+    files: Sequence[str | os.PathLike]
+    """Paths of the files to upload."""
+
+    comment: str = ""
+    """Comment sent with the files."""
+
+class SubmissionStatus(Enum):
+    """Outcome of one submission of a bulk upload."""
+
+    SUBMITTED = "submitted"
+    CLOSED = "closed"
+    FAILED = "failed"
+
+@dataclass
+class SubmissionResult:
+    """Result of one submission of a bulk upload."""
+
+    submission: Submission
+    """What was submitted."""
+
+    status: SubmissionStatus
+    """What happened to the submission."""
+
+    receipt: SubmissionReceipt | None = None
+    """Brightspace's record of the submission, if it was submitted."""
+
+    error: Exception | None = None
+    """The error that stopped the submission, if any."""
+
+def submissions_path(org_unit_id: int | str, folder_id: int) -> str:
+    """Returns the API path listing the submissions of a dropbox folder."""
+    return f"/d2l/api/le/{LE_API_VERSION}/{org_unit_id}/dropbox/folders/{folder_id}/submissions/"
+
+def check_open(assignment: Assignment, now: datetime | None = None) -> int:
+    """Checks that an assignment's dropbox folder accepts submissions.
+
+    Args:
+        assignment (Assignment): The assignment.
+        now (datetime | None): The current local time. Defaults to now.
+
+    Returns:
+        int: The folder ID of the assignment.
+
+    Raises:
+        SubmissionError: If the folder ID of the assignment is not known.
+        SubmissionClosedError: If availability of the assignment has not started yet or has ended.
+    """
+    if assignment.folder_id is None:
+        raise SubmissionError(f"The dropbox folder of {assignment.name!r} is not known; get the assignment from get_assignments.")
+    # Dates on Brightspace pages are naive local times
+    now = now if now is not None else datetime.now()
+    if assignment.starts_at is not None and now < assignment.starts_at:
+        raise SubmissionClosedError(f"{assignment.name!r} accepts submissions from {assignment.starts_at:%Y-%m-%d %H:%M}.")
+    if assignment.ends_at is not None and now >= assignment.ends_at:
+        raise SubmissionClosedError(f"{assignment.name!r} stopped accepting submissions on {assignment.ends_at:%Y-%m-%d %H:%M}.")
+    return assignment.folder_id
+
+class _MultipartBody:
+    """A multipart/mixed request body of a JSON comment and files, read from disk chunk by chunk.
+
+    Its length is known up front, so it is sent with a Content-Length header while the
+    files are streamed, without reading them into memory.
+    """
+
+    def __init__(self, comment: str, paths: list[Path], chunk_size: int) -> None:
+        self.boundary = uuid.uuid4().hex
+        self.paths = paths
+        self.chunk_size = chunk_size
+        comment_part = json.dumps({"Text": comment, "Html": None}).encode("utf-8")
+        self._head = self._part_header("Content-Type: application/json") + comment_part
+        self._file_headers = [
+            self._part_header(
+                f'Content-Disposition: form-data; name=""; filename="{_quote(path.name)}"',
+                "Content-Type: application/octet-stream",
+            )
+            for path in paths
+        ]
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+        self.length = (
+            len(self._head)
+            + sum(len(header) + path.stat().st_size for header, path in zip(self._file_headers, paths))
+            + len(self._tail)
+        )
+
+    def _part_header(self, *lines: str) -> bytes:
+        return (f"\r\n--{self.boundary}\r\n" + "".join(f"{line}\r\n" for line in lines) + "\r\n").encode("utf-8")
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/mixed; boundary={self.boundary}"
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        for header, path in zip(self._file_headers, self.paths):
+            yield header
+            with open(path, "rb") as file:
+                yield from iter(lambda: file.read(self.chunk_size), b"")
+        yield self._tail
+
+def _quote(name: str) -> str:
+    return name.replace("\\", "\\\\").replace('"', '\\"')
+
+def _parse_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    return parsed.replace(tzinfo=timezone.utc) if parsed.tzinfo is None else parsed.astimezone(timezone.utc)
+
+def read_submissions(session: HttpSession, org_unit_id: int | str, folder_id: int) -> list[SubmissionReceipt]:
+    """Reads the submissions of a dropbox folder.
+
+    Args:
+        session (HttpSession): An authenticated HTTP session.
+        org_unit_id (int | str): The organizational unit ID of the course.
+        folder_id (int): The ID of the dropbox folder.
+
+    Returns:
+        list[SubmissionReceipt]: The submissions, as listed by Brightspace.
+
+    Raises:
+        HttpStatusError: If the submissions cannot be read.
+    """
+    receipts = []
+    for entity in session.get_json(submissions_path(org_unit_id, folder_id)):
+        for submission in entity.get("Submissions") or []:
+            receipts.append(SubmissionReceipt(
+                org_unit_id=int(org_unit_id),
+                folder_id=folder_id,
+                submission_id=submission["Id"],
+                submitted_at=_parse_date(submission.get("SubmissionDate")),
+                files=[SubmittedFile(name=item["FileName"], size=item["Size"]) for item in submission.get("Files") or []],
+            ))
+    return receipts
+
+def _confirm(receipts: list[SubmissionReceipt], known: set[int], files: list[SubmittedFile], folder_id: int) -> SubmissionReceipt:
+    """Returns the new submission that has every uploaded file with its size."""
+    expected = {(file.name, file.size) for file in files}
+    matching = [
+        receipt for receipt in receipts
+        if receipt.submission_id not in known and expected <= {(file.name, file.size) for file in receipt.files}
+    ]
+    if not matching:
+        names = ", ".join(sorted(name for name, _ in expected))
+        raise SubmissionError(f"Brightspace did not confirm the submission of {names} to folder {folder_id}.")
+    return max(matching, key=lambda receipt: receipt.submission_id)
+
+def submit_files(session: HttpSession, org_unit_id: int | str, folder_id: int, files: Sequence[str | os.PathLike], comment: str = "", chunk_size: int = 1024 * 1024) -> SubmissionReceipt:
+    """Uploads files to a dropbox folder as one submission, then checks Brightspace's receipt.
+
+    The receipt is a submission that was not listed before the upload and has every
+    file with its size.
+
+    The files are streamed from disk in chunks. Uploads are not retried, since a
+    submission that timed out may still have been received.
+
+    Args:
+        session (HttpSession): An authenticated HTTP session.
+        org_unit_id (int | str): The organizational unit ID of the course.
+        folder_id (int): The ID of the dropbox folder.
+        files (Sequence[str | os.PathLike]): Paths of the files to upload.
+        comment (str): Comment sent with the files.
+        chunk_size (int): Number of bytes read from a file at a time.
+
+    Returns:
+        SubmissionReceipt: Brightspace's record of the submission.
+
+    Raises:
+        ValueError: If there are no files.
+        FileNotFoundError: If a file does not exist.
+        HttpStatusError: If Brightspace rejects the upload.
+        SubmissionError: If the submission does not show up with every file afterwards.
+    """
+    paths = [Path(file) for file in files]
+    if not paths:
+        raise ValueError("A submission needs at least one file.")
+    body = _MultipartBody(comment, paths, chunk_size)
+    path = submissions_path(org_unit_id, folder_id) + "mysubmissions/"
+    # Earlier submissions of the same files must not pass for this one
+    known = {receipt.submission_id for receipt in read_submissions(session, org_unit_id, folder_id)}
+
+    response = session.request(
+        "POST",
+        path,
+        headers={"Content-Type": body.content_type, "Content-Length": str(body.length), "Accept": "application/json"},
+        body=iter(body),
+    )
+    if response.status not in (200, 201, 204):
+        raise HttpStatusError(f"POST {path} failed with status {response.status}", response.status)
+    logger.debug("Uploaded %d files (%d bytes) to folder %d", len(paths), body.length, folder_id)
+
+    uploaded = [SubmittedFile(path.name, path.stat().st_size) for path in paths]
+    return _confirm(read_submissions(session, org_unit_id, folder_id), known, uploaded, folder_id)
+
+def submit_many(session: HttpSession, submissions: Sequence[Submission], max_workers: int = 4, now: datetime | None = None) -> list[SubmissionResult]:
+    """Makes several submissions in parallel, one folder per worker.
+
+    Submissions to the same folder are made one after another, so each one's receipt is
+    told apart from the others'. Submissions to folders that do not accept them are not
+    uploaded. A failed submission is logged and returned with its error, so it does not
+    stop the others.
+
+    Args:
+        session (HttpSession): An authenticated HTTP session, with at least `max_workers` connections.
+        submissions (Sequence[Submission]): The submissions.
+        max_workers (int): Maximum number of uploads at the same time.
+        now (datetime | None): The current local time, to check availability against. Defaults to now.
+
+    Returns:
+        list[SubmissionResult]: The result of each submission, in the same order.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got: {max_workers}")
+
+    def submit(submission: Submission) -> SubmissionResult:
+        try:
+            folder_id = check_open(submission.assignment, now)
+            receipt = submit_files(session, submission.org_unit_id, folder_id, submission.files, submission.comment)
+        except SubmissionClosedError as error:
+            logger.warning("Not submitting to %s: %s", submission.assignment.name, error)
+            return SubmissionResult(submission, SubmissionStatus.CLOSED, error=error)
+        except Exception as error:
+            logger.error("Failed to submit to %s: %s", submission.assignment.name, error)
+            return SubmissionResult(submission, SubmissionStatus.FAILED, error=error)
+        return SubmissionResult(submission, SubmissionStatus.SUBMITTED, receipt)
+
+    groups: dict[tuple[str, int] | int, list[int]] = {}
+    for index, submission in enumerate(submissions):
+        folder_id = submission.assignment.folder_id
+        # Submissions without a folder fail on their own
+        key = (str(submission.org_unit_id), folder_id) if folder_id is not None else index
+        groups.setdefault(key, []).append(index)
+
+    results: dict[int, SubmissionResult] = {}
+
+    def submit_group(indexes: list[int]) -> None:
+        for index in indexes:
+            results[index] = submit(submissions[index])
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(groups)))) as executor:
+        list(executor.map(submit_group, groups.values()))
+    return [results[index] for index in range(len(submissions))]
@@ -0,0 +1,24 @@
+class BrightspaceError(Exception):
+    """Exception for Brightspace-related errors."""
+
+class HttpStatusError(BrightspaceError):
+    """Exception for when Brightspace responds with an HTTP error status."""
+
+    def __init__(self, message: str, status: int) -> None:
+        super().__init__(message)
+        self.status = status
+
+class AuthenticationError(BrightspaceError):
+    """Exception for when the session is not (or no longer) logged in."""
+
+class TableNotFoundError(BrightspaceError):
+    """Exception for when a page loaded but does not have the expected table, such as a course with hidden grades."""
+
+class CircuitOpenError(BrightspaceError):
+    """Exception for when requests to Brightspace are paused after repeated failures."""
+
+class SubmissionError(BrightspaceError):
+    """Exception for when a dropbox submission cannot be made or is not confirmed by Brightspace."""
+
+class SubmissionClosedError(SubmissionError):
+    """Exception for when a dropbox folder no longer accepts submissions."""
@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+import time
+from typing import IO
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+class FileLock:
+    """Exclusive lock on a file, shared between processes.
+
+    The lock is held through an open file handle, so the operating system releases
+    it if the process dies. It is not reentrant: acquiring it twice, even from the
+    same process, blocks.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Creates a lock. The lock file is created when the lock is first acquired.
+
+        Args:
+            path (str | os.PathLike): Path of the lock file.
+        """
+        self.path = Path(path)
+        self._file: IO[bytes] | None = None
+
+    @property
+    def locked(self) -> bool:
+        """Returns whether this instance holds the lock."""
+        return self._file is not None
+
+    def _try_lock(self) -> bool:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file = open(self.path, "a+b")
+        try:
+            if os.name == "nt":
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            file.close()
+            return False
+        self._file = file
+        return True
+
+    def acquire(self, blocking: bool = True, timeout: float | None = None, poll_interval: float = 0.05) -> bool:
+        """Acquires the lock.
+
+        Args:
+            blocking (bool): Whether to wait for the lock if another holder has it.
+            timeout (float | None): Longest time to wait in seconds, or None to wait forever.
+            poll_interval (float): Seconds between attempts while waiting.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        if self._file is not None:
+            raise RuntimeError(f"Lock {self.path} is already held by this instance.")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._try_lock():
+            if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                return False
+            time.sleep(poll_interval)
+        return True
+
+    def release(self) -> None:
+        """Releases the lock, if it is held."""
+        if self._file is None:
+            return
+        try:
+            if os.name == "nt":
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
@@ -1,3 +1,5 @@
+from typing import Any
+
 class Fraction:
     """Represents a fraction (numerator/denominator)."""
 
@@ -48,4 +50,45 @@ class Fraction:
         Returns:
             A string in the format "numerator/denominator".
         """
-        return f"{self.numerator}/{self.denominator}"
\ No newline at end of file
+        return f"{self.numerator}/{self.denominator}"
+
+    def __repr__(self) -> str:
+        return f"Fraction(numerator={self.numerator!r}, denominator={self.denominator!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Returns whether two fractions have the same numerator and denominator.
+
+        8/10 and 4/5 are not equal, since a grade out of 10 is not the same as one out of 5.
+        """
+        if not isinstance(other, Fraction):
+            return NotImplemented
+        return self.numerator == other.numerator and self.denominator == other.denominator
+
+    def __hash__(self) -> int:
+        return hash((self.numerator, self.denominator))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the fraction as JSON compatible data.
+
+        Returns:
+            A dictionary that `from_dict` turns back into an equal fraction.
+        """
+        return {"numerator": self.numerator, "denominator": self.denominator}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], version: int = 1) -> "Fraction":
+        """Creates a Fraction object from the data returned by `to_dict`.
+
+        Args:
+            data: The data.
+            version: Version of the data format the data was written with.
+
+        Returns:
+            A Fraction object.
+
+        Raises:
+            ValueError: If the version is not supported.
+        """
+        if version != 1:
+            raise ValueError(f"Unsupported Fraction data version: {version}")
+        return cls(numerator=data["numerator"], denominator=data["denominator"])
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any
 
 from acbrightspace.fraction import Fraction
 
@@ -17,4 +18,41 @@ class GradeItem:
     """Weight of the assignment in the overall course grade."""
 
     comments: str | None
-    """Comments provided for the assignment."""
\ No newline at end of file
+    """Comments provided for the assignment."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the grade item as JSON compatible data.
+
+        Returns:
+            dict[str, Any]: A dictionary that `from_dict` turns back into an equal grade item.
+        """
+        return {
+            "name": self.name,
+            "points": self.points.to_dict() if self.points is not None else None,
+            "weight": self.weight.to_dict() if self.weight is not None else None,
+            "comments": self.comments,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], version: int = 1) -> "GradeItem":
+        """Creates a grade item from the data returned by `to_dict`.
+
+        Args:
+            data (dict[str, Any]): The data.
+            version (int): Version of the data format the data was written with.
+
+        Returns:
+            GradeItem: The grade item.
+
+        Raises:
+            ValueError: If the version is not supported.
+        """
+        if version != 1:
+            raise ValueError(f"Unsupported GradeItem data version: {version}")
+        return cls(
+            name=data["name"],
+            points=Fraction.from_dict(data["points"], version) if data.get("points") is not None else None,
+            weight=Fraction.from_dict(data["weight"], version) if data.get("weight") is not None else None,
+            comments=data.get("comments"),
+        )
+
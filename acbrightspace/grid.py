@@ -0,0 +1,274 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Sequence, TypeVar
+
+import urllib3
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.errors import BrightspaceError
+from acbrightspace.resilience import ErrorKind, Resilience, classify
+from acbrightspace.session import BASE_URL
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+@dataclass
+class GridNode:
+    """A remote WebDriver endpoint, such as a Selenium Grid hub or a standalone Chrome node."""
+
+    url: str
+    """URL of the WebDriver endpoint, for example "http://grid:4444"."""
+
+    capacity: int | None = None
+    """Maximum number of browsers to run on the node at once. If None, it is read from the node's /status."""
+
+    healthy: bool = field(default=True, init=False)
+    """Whether jobs are sent to the node."""
+
+    down_until: float = field(default=0.0, init=False, repr=False)
+    """When an unhealthy node is tried again, on the grid's clock."""
+
+    active: int = field(default=0, init=False)
+    """Number of browsers on the node that are running a job."""
+
+    idle: list[Brightspace] = field(default_factory=list, init=False, repr=False)
+    """Browsers on the node that are waiting for a job."""
+
+def node_capacity(url: str, timeout: float = 5.0) -> int:
+    """Asks a WebDriver endpoint how many Chrome sessions it can run.
+
+    Selenium Grid 4 and standalone containers list their slots in /status. Endpoints
+    that do not, such as a plain chromedriver, are assumed to run one session.
+
+    Args:
+        url (str): URL of the WebDriver endpoint.
+        timeout (float): Connect and read timeout in seconds.
+
+    Returns:
+        int: The number of Chrome slots, or 0 if the endpoint is not ready.
+
+    Raises:
+        urllib3.exceptions.HTTPError: If the endpoint cannot be reached.
+    """
+    response = urllib3.request("GET", url.rstrip("/") + "/status", timeout=timeout, retries=False)
+    status = json.loads(response.data).get("value", {})
+    if not status.get("ready", True):
+        return 0
+    nodes = status.get("nodes")
+    if not nodes:
+        return 1
+    slots = [slot for node in nodes if node.get("availability", "UP") == "UP" for slot in node.get("slots", [])]
+    chrome = [slot for slot in slots if slot.get("stereotype", {}).get("browserName") == "chrome"]
+    return len(chrome)
+
+def is_node_failure(error: BaseException) -> bool:
+    """Returns whether an error means the browser's node went away, rather than the job failing."""
+    if isinstance(error, InvalidSessionIdException):
+        return True
+    if isinstance(error, WebDriverException) and "session deleted" in (error.msg or ""):
+        return True
+    return classify(error) is ErrorKind.CONNECTION and not isinstance(error, WebDriverException)
+
+class Grid:
+    """Spreads Brightspace jobs across the browsers of several remote WebDriver nodes.
+
+    Each node runs up to its capacity of browsers. A job goes to the healthy node with
+    the lowest share of its capacity in use, and browsers are reused between jobs. If a
+    node stops responding, its browsers are dropped, the node is left out for
+    `recheck_after` seconds, and the job is retried on another node.
+
+    Example:
+        >>> grid = Grid(
+        ...     [GridNode("http://grid-a:4444"), GridNode("http://grid-b:4444", capacity=4)],
+        ...     setup=lambda brightspace: brightspace.login(username, password, totp_secret),
+        ... )
+        >>> with grid:
+        ...     grades = grid.map(lambda brightspace, course: brightspace.get_grades(str(course.org_unit_id)), courses)
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[GridNode | str],
+        base_url: str = BASE_URL,
+        resilience: Resilience | None = None,
+        setup: Callable[[Brightspace], None] | None = None,
+        driver_factory: Callable[[GridNode], Any] | None = None,
+        max_attempts: int = 3,
+        recheck_after: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Creates a grid. Nodes without a capacity are asked for it right away.
+
+        Args:
+            nodes (Sequence[GridNode | str]): The nodes, or their URLs.
+            base_url (str): Root URL of the Brightspace website.
+            resilience (Resilience | None): Retry and circuit breaker policy shared by every browser.
+            setup (Callable[[Brightspace], None] | None): Called once for each new browser, usually to log in.
+            driver_factory (Callable[[GridNode], Any] | None): Creates a WebDriver on a node.
+                Defaults to a remote Chrome driver.
+            max_attempts (int): Maximum number of nodes a job is tried on.
+            recheck_after (float): Seconds before a node that failed is tried again.
+            clock (Callable[[], float]): Monotonic clock, replaceable for testing.
+        """
+        self.nodes = [node if isinstance(node, GridNode) else GridNode(node) for node in nodes]
+        if not self.nodes:
+            raise ValueError("A grid needs at least one node.")
+        self.base_url = base_url
+        self.resilience = resilience or Resilience()
+        self.setup = setup
+        self.driver_factory = driver_factory
+        self.max_attempts = max_attempts
+        self.recheck_after = recheck_after
+        self._clock = clock
+        self._condition = threading.Condition()
+
+        for node in self.nodes:
+            if node.capacity is None:
+                try:
+                    node.capacity = node_capacity(node.url)
+                except Exception as error:
+                    logger.warning("Grid node %s did not report its capacity: %s", node.url, error)
+                    node.capacity = 1
+                    self._mark_down(node)
+                logger.info("Grid node %s has capacity %d.", node.url, node.capacity)
+
+    @property
+    def capacity(self) -> int:
+        """Returns the total capacity of the healthy nodes."""
+        with self._condition:
+            return sum(node.capacity or 0 for node in self.nodes if node.healthy)
+
+    def _create(self, node: GridNode) -> Brightspace:
+        if self.driver_factory is not None:
+            brightspace = Brightspace(base_url=self.base_url, resilience=self.resilience, driver=self.driver_factory(node))
+        else:
+            brightspace = Brightspace(base_url=self.base_url, resilience=self.resilience, remote_url=node.url)
+        try:
+            if self.setup is not None:
+                self.setup(brightspace)
+        except BaseException:
+            _quit(brightspace)
+            raise
+        return brightspace
+
+    def _mark_down(self, node: GridNode) -> list[Brightspace]:
+        """Stops sending jobs to a node for a while. Must hold the lock or be called during construction.
+
+        Returns:
+            list[Brightspace]: The node's idle browsers, to quit once the lock is released.
+        """
+        node.healthy = False
+        node.down_until = self._clock() + self.recheck_after
+        idle, node.idle = node.idle, []
+        return idle
+
+    def _checkout(self) -> tuple[GridNode, Brightspace | None]:
+        with self._condition:
+            while True:
+                now = self._clock()
+                for node in self.nodes:
+                    if not node.healthy and now >= node.down_until:
+                        logger.info("Trying grid node %s again.", node.url)
+                        node.healthy = True
+
+                healthy = [node for node in self.nodes if node.healthy and node.capacity]
+                if not healthy:
+                    raise BrightspaceError("No grid nodes are available.")
+                free = [node for node in healthy if node.active < node.capacity]
+                if free:
+                    node = min(free, key=lambda node: node.active / node.capacity)
+                    node.active += 1
+                    return node, node.idle.pop() if node.idle else None
+                self._condition.wait(timeout=1.0)
+
+    def _checkin(self, node: GridNode, brightspace: Brightspace | None, failed: bool = False) -> None:
+        stale = []
+        with self._condition:
+            node.active -= 1
+            if failed:
+                logger.warning("Grid node %s stopped responding; leaving it out for %.0fs.", node.url, self.recheck_after)
+                stale = self._mark_down(node)
+                if brightspace is not None:
+                    stale.append(brightspace)
+            elif brightspace is not None:
+                node.idle.append(brightspace)
+            self._condition.notify_all()
+        # Quitting a browser on a node that stopped responding can take until the
+        # request times out, so it must not hold up the other workers
+        for client in stale:
+            _quit(client)
+
+    def run(self, function: Callable[[Brightspace], R]) -> R:
+        """Runs one job on a browser of the least busy node.
+
+        Args:
+            function (Callable[[Brightspace], R]): The job. It must be safe to run again on another node.
+
+        Returns:
+            R: The result of the job.
+
+        Raises:
+            BrightspaceError: If no nodes are available.
+            Exception: The job's error, or the last node failure if every attempt failed.
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            node, brightspace = self._checkout()
+            try:
+                if brightspace is None:
+                    brightspace = self._create(node)
+                result = function(brightspace)
+            except Exception as error:
+                if not is_node_failure(error):
+                    self._checkin(node, brightspace)
+                    raise
+                self._checkin(node, brightspace, failed=True)
+                if attempt == self.max_attempts:
+                    raise
+            else:
+                self._checkin(node, brightspace)
+                return result
+        raise AssertionError("unreachable")
+
+    def map(self, function: Callable[[Brightspace, T], R], items: Sequence[T]) -> list[R]:
+        """Runs a job for each item in parallel, across every node.
+
+        Args:
+            function (Callable[[Brightspace, T], R]): The job, called with a browser and an item.
+            items (Sequence[T]): The items.
+
+        Returns:
+            list[R]: The result of each job, in the same order as the items.
+        """
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(self.capacity, len(items)))) as executor:
+            return list(executor.map(lambda item: self.run(lambda brightspace: function(brightspace, item)), items))
+
+    def close(self) -> None:
+        """Quits every idle browser."""
+        idle = []
+        with self._condition:
+            for node in self.nodes:
+                idle += node.idle
+                node.idle = []
+        for brightspace in idle:
+            _quit(brightspace)
+
+    def __enter__(self) -> "Grid":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+def _quit(brightspace: Brightspace) -> None:
+    try:
+        brightspace.close()
+    except Exception:
+        logger.debug("Failed to quit a browser on a grid node.", exc_info=True)
@@ -0,0 +1,571 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import os
+from pathlib import Path
+import struct
+import threading
+from typing import BinaryIO, Iterable
+
+from acbrightspace.assignment import Assignment
+from acbrightspace.errors import BrightspaceError
+from acbrightspace.filelock import FileLock
+from acbrightspace.fraction import Fraction
+from acbrightspace.grade_item import GradeItem
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"ACBH"
+"""First bytes of every segment and checkpoint file."""
+
+VERSION = 1
+"""Version of the file format."""
+
+POINTS = "points"
+"""Field name of `GradeItem.points` in the history."""
+
+EVALUATION_STATUS = "evaluation_status"
+"""Field name of `Assignment.evaluation_status` in the history."""
+
+class _Removed:
+    """Value of an item after it disappeared from Brightspace."""
+
+    def __repr__(self) -> str:
+        return "REMOVED"
+
+REMOVED = _Removed()
+"""Value recorded when an item is no longer listed."""
+
+type Value = Fraction | str | None | _Removed
+"""A recorded value: points, an evaluation status, None, or REMOVED."""
+
+@dataclass(frozen=True)
+class SeriesKey:
+    """Identifies one tracked value: a field of a named item in a course."""
+
+    org_unit_id: int
+    """Organizational unit ID of the course."""
+
+    name: str
+    """Name of the grade item or assignment. Items that share a name with an earlier one
+    in the course are numbered in listing order, e.g. "Quiz (2)"."""
+
+    field: str
+    """Which value is tracked, `POINTS` or `EVALUATION_STATUS`."""
+
+@dataclass(frozen=True)
+class Change:
+    """A value that changed at some time."""
+
+    at: datetime
+    """When the change was recorded."""
+
+    key: SeriesKey
+    """Which value changed."""
+
+    value: Value
+    """The new value."""
+
+# Record tags
+_DEFINE = 0
+_CHANGE = 1
+
+# Value tags
+_NONE = 0
+_REMOVED = 1
+_FRACTION_HUNDREDTHS = 2
+_FRACTION_FLOAT = 3
+_TEXT = 4
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    """Appends an unsigned LEB128 integer."""
+    if value < 0:
+        raise ValueError(f"varint must not be negative, got: {value}")
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+def _unzigzag(value: int) -> int:
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+def _write_text(buffer: bytearray, text: str) -> None:
+    encoded = text.encode("utf-8")
+    _write_varint(buffer, len(encoded))
+    buffer += encoded
+
+def _encode_value(value: Value) -> bytes:
+    """Encodes a value. Equal values have equal encodings, which is how changes are detected."""
+    buffer = bytearray()
+    if value is None:
+        buffer.append(_NONE)
+    elif value is REMOVED:
+        buffer.append(_REMOVED)
+    elif isinstance(value, Fraction):
+        numerator = round(value.numerator * 100)
+        denominator = round(value.denominator * 100)
+        # Grades almost always have at most two decimals, which fit in a few bytes
+        if numerator / 100 == value.numerator and denominator / 100 == value.denominator:
+            buffer.append(_FRACTION_HUNDREDTHS)
+            _write_varint(buffer, _zigzag(numerator))
+            _write_varint(buffer, _zigzag(denominator))
+        else:
+            buffer.append(_FRACTION_FLOAT)
+            buffer += struct.pack("<dd", value.numerator, value.denominator)
+    elif isinstance(value, str):
+        buffer.append(_TEXT)
+        _write_text(buffer, value)
+    else:
+        raise TypeError(f"Cannot record a value of type {type(value).__name__}")
+    return bytes(buffer)
+
+class _Reader:
+    """Reads the primitives of the file format from a byte string."""
+
+    def __init__(self, data: bytes, position: int = 0) -> None:
+        self.data = data
+        self.position = position
+
+    @property
+    def at_end(self) -> bool:
+        return self.position >= len(self.data)
+
+    def byte(self) -> int:
+        if self.position >= len(self.data):
+            raise EOFError("unexpected end of data")
+        value = self.data[self.position]
+        self.position += 1
+        return value
+
+    def varint(self) -> int:
+        result = 0
+        shift = 0
+        while True:
+            byte = self.byte()
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def raw(self, length: int) -> bytes:
+        if self.position + length > len(self.data):
+            raise EOFError("unexpected end of data")
+        value = self.data[self.position:self.position + length]
+        self.position += length
+        return value
+
+    def text(self) -> str:
+        return self.raw(self.varint()).decode("utf-8")
+
+    def value(self) -> Value:
+        tag = self.byte()
+        if tag == _NONE:
+            return None
+        if tag == _REMOVED:
+            return REMOVED
+        if tag == _FRACTION_HUNDREDTHS:
+            return Fraction(_unzigzag(self.varint()) / 100, _unzigzag(self.varint()) / 100)
+        if tag == _FRACTION_FLOAT:
+            return Fraction(*struct.unpack("<dd", self.raw(16)))
+        if tag == _TEXT:
+            return self.text()
+        raise ValueError(f"unknown value tag {tag}")
+
+    def header(self, path: Path) -> None:
+        if self.raw(len(MAGIC)) != MAGIC:
+            raise BrightspaceError(f"{path} is not a history file.")
+        version = self.byte()
+        if version != VERSION:
+            raise BrightspaceError(f"{path} has unsupported history format version {version}.")
+
+class _SegmentWriter:
+    """Appends change records to a new segment file.
+
+    Each segment starts with a base time and defines the series keys it uses the
+    first time they appear, so records hold a small key ID and the time since the
+    previous record instead of full names and timestamps.
+    """
+
+    def __init__(self, path: Path, base_time: int) -> None:
+        self.path = path
+        self._keys: dict[SeriesKey, int] = {}
+        self._last_time = base_time
+        header = bytearray(MAGIC)
+        header.append(VERSION)
+        _write_varint(header, base_time)
+        self._file: BinaryIO = open(path, "xb")
+        self._file.write(header)
+        self._file.flush()
+        self.size = len(header)
+
+    def append(self, at: int, key: SeriesKey, value: bytes) -> None:
+        record = bytearray()
+        key_id = self._keys.get(key)
+        if key_id is None:
+            key_id = self._keys[key] = len(self._keys)
+            record.append(_DEFINE)
+            _write_varint(record, key.org_unit_id)
+            _write_text(record, key.name)
+            _write_text(record, key.field)
+        record.append(_CHANGE)
+        _write_varint(record, at - self._last_time)
+        _write_varint(record, key_id)
+        record += value
+        self._last_time = at
+        self._file.write(record)
+        self.size += len(record)
+
+    def flush(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+def _by_name(items: Iterable[tuple[str, Value]]) -> dict[str, Value]:
+    """Maps item names to values, numbering names that were already used, e.g. "Quiz (2)".
+
+    Numbers skip the names of other items, so an item that is really called "Quiz (2)"
+    keeps its name.
+    """
+    items = list(items)
+    taken = {name for name, _ in items}
+    values: dict[str, Value] = {}
+    counts: dict[str, int] = {}
+    for name, value in items:
+        unique = name
+        if unique in values:
+            while unique in taken:
+                counts[name] = counts.get(name, 1) + 1
+                unique = f"{name} ({counts[name]})"
+            taken.add(unique)
+        values[unique] = value
+    return values
+
+def _read_segment(path: Path) -> list[tuple[int, SeriesKey, Value]]:
+    """Reads the changes in a segment, ignoring a partly written record at the end."""
+    reader = _Reader(path.read_bytes())
+    reader.header(path)
+    last_time = reader.varint()
+    keys: list[SeriesKey] = []
+    changes = []
+    while not reader.at_end:
+        start = reader.position
+        try:
+            tag = reader.byte()
+            if tag == _DEFINE:
+                keys.append(SeriesKey(reader.varint(), reader.text(), reader.text()))
+                continue
+            if tag != _CHANGE:
+                raise ValueError(f"unknown record tag {tag}")
+            at = last_time + reader.varint()
+            key = keys[reader.varint()]
+            value = reader.value()
+        except (EOFError, IndexError, ValueError, UnicodeDecodeError) as error:
+            # A crash while appending leaves the last record incomplete
+            logger.warning("Ignoring %d damaged bytes at the end of %s: %s", len(reader.data) - start, path, error)
+            break
+        last_time = at
+        changes.append((at, key, value))
+    return changes
+
+def _write_checkpoint(path: Path, at: int, state: dict[SeriesKey, Value]) -> None:
+    buffer = bytearray(MAGIC)
+    buffer.append(VERSION)
+    _write_varint(buffer, at)
+    _write_varint(buffer, len(state))
+    for key, value in state.items():
+        _write_varint(buffer, key.org_unit_id)
+        _write_text(buffer, key.name)
+        _write_text(buffer, key.field)
+        buffer += _encode_value(value)
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, "wb") as file:
+        file.write(buffer)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+def _read_checkpoint(path: Path) -> tuple[int, dict[SeriesKey, Value]]:
+    reader = _Reader(path.read_bytes())
+    reader.header(path)
+    at = reader.varint()
+    state = {}
+    for _ in range(reader.varint()):
+        key = SeriesKey(reader.varint(), reader.text(), reader.text())
+        state[key] = reader.value()
+    return at, state
+
+def _sequence(path: Path) -> int:
+    return int(path.stem.split("-")[1])
+
+class HistoryStore:
+    """Records how grade points and assignment evaluation statuses change over time.
+
+    Only changes are stored. They are appended to segment files in a compact binary
+    format: varint times relative to the previous record, and series keys written once
+    per segment. A new segment is started when the current one reaches
+    `segment_size` bytes or the store is reopened.
+
+    Compaction merges the segments into one and writes a checkpoint with the full state
+    at a point in time. Changes from before `retention` are dropped at that point, and
+    the checkpoint keeps the state they led to. Compaction runs automatically once there
+    are `max_segments` segments.
+
+    The whole history is indexed in memory when the store is opened, so "state as of"
+    queries take O(items * log changes) and "changes between" queries O(log n + k).
+    The directory is locked while the store is open.
+
+    Example:
+        >>> with HistoryStore("history") as history:
+        ...     history.record_grades(683274, brightspace.get_grades("683274"))
+        ...     history.state_at(datetime(2026, 2, 1), org_unit_id=683274)
+    """
+
+    def __init__(self, directory: str | os.PathLike, segment_size: int = 1024 * 1024, max_segments: int = 16, retention: timedelta | None = None) -> None:
+        """Opens a history store, creating the directory if needed.
+
+        Args:
+            directory (str | os.PathLike): Directory of the segment and checkpoint files.
+            segment_size (int): Size in bytes at which a new segment is started.
+            max_segments (int): Number of segments that triggers compaction.
+            retention (timedelta | None): How long individual changes are kept by compaction.
+                None keeps every change.
+
+        Raises:
+            BrightspaceError: If another process has the store open.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self.retention = retention
+
+        self._file_lock = FileLock(self.directory / ".lock")
+        if not self._file_lock.acquire(blocking=False):
+            raise BrightspaceError(f"History store {self.directory} is open in another process.")
+
+        self._lock = threading.RLock()
+        self._writer: _SegmentWriter | None = None
+        self._load()
+
+    def _segments(self) -> list[Path]:
+        return sorted(self.directory.glob("segment-*.seg"), key=_sequence)
+
+    def _checkpoints(self) -> list[Path]:
+        return sorted(self.directory.glob("checkpoint-*.ckpt"), key=_sequence)
+
+    def _load(self) -> None:
+        # Changes of each series, in time order, including checkpoint baselines
+        self._series: dict[SeriesKey, tuple[list[int], list[Value]]] = {}
+        # Every recorded change in time order, for range queries
+        self._changes: list[tuple[int, SeriesKey, Value]] = []
+        self._times: list[int] = []
+        self._last_time = 0
+
+        checkpoints = self._checkpoints()
+        baseline_time, baseline = _read_checkpoint(checkpoints[-1]) if checkpoints else (0, {})
+        for key, value in baseline.items():
+            self._series[key] = ([baseline_time], [value])
+
+        records = [change for path in self._segments() for change in _read_segment(path)]
+        # Sorting is stable, so records with the same time keep their order
+        records.sort(key=lambda change: change[0])
+        for at, key, value in records:
+            self._apply(at, key, value)
+
+        segments = self._segments()
+        self._next_sequence = max([_sequence(path) for path in segments + checkpoints], default=0) + 1
+
+    def _apply(self, at: int, key: SeriesKey, value: Value) -> bool:
+        """Adds a change to the in-memory index, unless it does not change the value."""
+        times, values = self._series.setdefault(key, ([], []))
+        index = bisect_right(times, at)
+        if index and _encode_value(values[index - 1]) == _encode_value(value):
+            return False
+        times.insert(index, at)
+        values.insert(index, value)
+        position = bisect_right(self._times, at)
+        self._times.insert(position, at)
+        self._changes.insert(position, (at, key, value))
+        self._last_time = max(self._last_time, at)
+        return True
+
+    def _latest(self, key: SeriesKey) -> Value:
+        series = self._series.get(key)
+        return series[1][-1] if series else REMOVED
+
+    def _append(self, at: int, key: SeriesKey, value: Value) -> None:
+        if self._writer is None:
+            path = self.directory / f"segment-{self._next_sequence:08d}.seg"
+            self._next_sequence += 1
+            self._writer = _SegmentWriter(path, at)
+        self._writer.append(at, key, _encode_value(value))
+
+    def _record(self, org_unit_id: int, field: str, values: dict[str, Value], at: datetime | None) -> list[Change]:
+        moment = at or datetime.now()
+        seconds = int(moment.timestamp())
+        with self._lock:
+            if seconds < self._last_time:
+                raise ValueError(f"History must be recorded in time order; {moment} is before the last change.")
+
+            # Items that are no longer listed are marked as removed
+            for key in list(self._series):
+                if key.org_unit_id == org_unit_id and key.field == field and key.name not in values and self._latest(key) is not REMOVED:
+                    values[key.name] = REMOVED
+
+            changes = []
+            for name, value in values.items():
+                key = SeriesKey(org_unit_id, name, field)
+                if self._apply(seconds, key, value):
+                    self._append(seconds, key, value)
+                    changes.append(Change(datetime.fromtimestamp(seconds), key, value))
+
+            if self._writer is not None:
+                self._writer.flush()
+                if self._writer.size >= self.segment_size:
+                    self._writer.close()
+                    self._writer = None
+                    if len(self._segments()) >= self.max_segments:
+                        self.compact()
+            return changes
+
+    def record_grades(self, org_unit_id: int, grades: Iterable[GradeItem], at: datetime | None = None) -> list[Change]:
+        """Records the points of a course's grade items, storing only those that changed.
+
+        Args:
+            org_unit_id (int): Organizational unit ID of the course.
+            grades (Iterable[GradeItem]): Every grade item of the course, in the order
+                listed. Items recorded before that are missing are marked as `REMOVED`.
+            at (datetime | None): When the grades were fetched. Defaults to now.
+
+        Returns:
+            list[Change]: The changes that were recorded.
+
+        Raises:
+            ValueError: If `at` is before the last recorded change.
+        """
+        return self._record(int(org_unit_id), POINTS, _by_name((grade.name, grade.points) for grade in grades), at)
+
+    def record_assignments(self, org_unit_id: int, assignments: Iterable[Assignment], at: datetime | None = None) -> list[Change]:
+        """Records the evaluation status of a course's assignments, storing only those that changed.
+
+        Args:
+            org_unit_id (int): Organizational unit ID of the course.
+            assignments (Iterable[Assignment]): Every assignment of the course, in the
+                order listed. Assignments recorded before that are missing are marked as `REMOVED`.
+            at (datetime | None): When the assignments were fetched. Defaults to now.
+
+        Returns:
+            list[Change]: The changes that were recorded.
+
+        Raises:
+            ValueError: If `at` is before the last recorded change.
+        """
+        return self._record(int(org_unit_id), EVALUATION_STATUS, _by_name((assignment.name, assignment.evaluation_status) for assignment in assignments), at)
+
+    def state_at(self, at: datetime, org_unit_id: int | None = None) -> dict[SeriesKey, Value]:
+        """Returns every tracked value as it was at a point in time.
+
+        Args:
+            at (datetime): The point in time.
+            org_unit_id (int | None): Only include this course.
+
+        Returns:
+            dict[SeriesKey, Value]: The value of each item that existed at that time.
+        """
+        seconds = int(at.timestamp())
+        state = {}
+        with self._lock:
+            for key, (times, values) in self._series.items():
+                if org_unit_id is not None and key.org_unit_id != org_unit_id:
+                    continue
+                index = bisect_right(times, seconds)
+                if index and values[index - 1] is not REMOVED:
+                    state[key] = values[index - 1]
+        return state
+
+    def changes_between(self, start: datetime, end: datetime, org_unit_id: int | None = None) -> list[Change]:
+        """Returns the changes recorded between two times (inclusive), oldest first.
+
+        Args:
+            start (datetime): Start of the period.
+            end (datetime): End of the period.
+            org_unit_id (int | None): Only include this course.
+
+        Returns:
+            list[Change]: The changes.
+        """
+        with self._lock:
+            low = bisect_left(self._times, int(start.timestamp()))
+            high = bisect_right(self._times, int(end.timestamp()))
+            selected = self._changes[low:high]
+        return [
+            Change(datetime.fromtimestamp(at), key, value)
+            for at, key, value in selected
+            if org_unit_id is None or key.org_unit_id == org_unit_id
+        ]
+
+    def compact(self, now: datetime | None = None) -> None:
+        """Merges all segments into one and writes a checkpoint.
+
+        With a `retention`, changes older than `now - retention` are dropped, and the
+        checkpoint holds the state they led to.
+
+        Args:
+            now (datetime | None): Current time the retention is counted back from. Defaults to now.
+        """
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+            old_segments = self._segments()
+            old_checkpoints = self._checkpoints()
+            cutoff = 0
+            if self.retention is not None:
+                cutoff = int(((now or datetime.now()) - self.retention).timestamp())
+            cutoff = min(cutoff, self._last_time)
+
+            # The state just before the cutoff replaces the changes that are dropped
+            baseline = {}
+            for key, (times, values) in self._series.items():
+                index = bisect_left(times, cutoff)
+                if index and values[index - 1] is not REMOVED:
+                    baseline[key] = values[index - 1]
+            kept = [change for change in self._changes if change[0] >= cutoff]
+
+            sequence = self._next_sequence
+            self._next_sequence += 1
+            segment = self.directory / f"segment-{sequence:08d}.seg"
+            temporary = self.directory / f"segment-{sequence:08d}.tmp"
+            writer = _SegmentWriter(temporary, kept[0][0] if kept else cutoff)
+            for at, key, value in kept:
+                writer.append(at, key, _encode_value(value))
+            writer.flush()
+            writer.close()
+            _write_checkpoint(self.directory / f"checkpoint-{sequence:08d}.ckpt", cutoff, baseline)
+            os.replace(temporary, segment)
+
+            for path in old_segments + old_checkpoints:
+                path.unlink()
+            logger.info("Compacted %d history segments into %s, keeping %d changes.", len(old_segments), segment.name, len(kept))
+            self._load()
+
+    def close(self) -> None:
+        """Closes the current segment and unlocks the directory."""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._file_lock.release()
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
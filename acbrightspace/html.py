@@ -0,0 +1,350 @@
+from html.parser import HTMLParser
+import re
+from typing import Callable, Iterator
+
+from selenium.common.exceptions import InvalidSelectorException, NoSuchElementException, NoSuchShadowRootException
+from selenium.webdriver.common.by import By
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+"""Tags that never have content or an end tag."""
+
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "caption", "dd", "div", "dl", "dt", "fieldset", "figure",
+    "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre",
+    "option", "section", "table", "tbody", "tfoot", "thead", "tr", "ul",
+}
+"""Tags whose text is rendered on its own lines."""
+
+HIDDEN_TAGS = {"head", "script", "style", "template", "noscript", "title"}
+"""Tags whose text is never rendered."""
+
+# Start tags that implicitly close an open element of one of the given tags
+_IMPLICIT_CLOSE = {
+    "li": {"li"},
+    "option": {"option"},
+    "p": {"p"},
+    "td": {"td", "th"},
+    "th": {"td", "th"},
+    "tr": {"tr"},
+}
+
+class HtmlElement:
+    """Element of a static HTML document, with the subset of the Selenium `WebElement` API used by this library.
+
+    This lets the same parsing code work on pages rendered by the browser and on pages
+    fetched over plain HTTP (or loaded from disk), which are much faster to get.
+    """
+
+    def __init__(self, tag_name: str, attributes: dict[str, str] | None = None, parent: "HtmlElement | None" = None) -> None:
+        self.tag_name = tag_name
+        self.attributes = attributes or {}
+        self.parent = parent
+        self.children: list["HtmlElement | str"] = []
+        self._shadow_root: "HtmlElement | None" = None
+
+    def __repr__(self) -> str:
+        return f"<HtmlElement {self.tag_name} {self.attributes}>"
+
+    @property
+    def text(self) -> str:
+        """Returns the rendered text of the element, like `WebElement.text`."""
+        parts: list[str] = []
+        self._render(parts)
+        lines = (re.sub(r"[ \t\r\f\v]+", " ", line).strip() for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def _render(self, parts: list[str]) -> None:
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(re.sub(r"\s+", " ", child))
+                continue
+            if child.tag_name in HIDDEN_TAGS or not child.is_displayed():
+                continue
+            if child.tag_name in BLOCK_TAGS:
+                parts.append("\n")
+                child._render(parts)
+                parts.append("\n")
+            else:
+                if child.tag_name in ("td", "th"):
+                    parts.append(" ")
+                child._render(parts)
+
+    def get_attribute(self, name: str) -> str | None:
+        """Returns the value of an attribute, or None if it is not set."""
+        if name in ("textContent", "innerText"):
+            return self.text
+        if name == "selected":
+            return "true" if "selected" in self.attributes else None
+        return self.attributes.get(name)
+
+    def get_dom_attribute(self, name: str) -> str | None:
+        """Returns the value of an attribute as written in the HTML."""
+        return self.attributes.get(name)
+
+    def is_displayed(self) -> bool:
+        """Returns whether the element is visible, based on its `hidden` attribute and inline style."""
+        style = self.attributes.get("style", "").replace(" ", "").lower()
+        return "hidden" not in self.attributes and "display:none" not in style
+
+    def is_selected(self) -> bool:
+        """Returns whether an option, checkbox or radio button is selected."""
+        return "selected" in self.attributes or "checked" in self.attributes
+
+    @property
+    def shadow_root(self) -> "HtmlElement":
+        """Returns the element's declarative shadow root (`<template shadowrootmode="open">`)."""
+        if self._shadow_root is None:
+            raise NoSuchShadowRootException(f"Element has no shadow root: {self!r}")
+        return self._shadow_root
+
+    def iter(self) -> Iterator["HtmlElement"]:
+        """Yields every descendant element in document order, without entering shadow roots."""
+        stack = [child for child in reversed(self.children) if isinstance(child, HtmlElement)]
+        while stack:
+            element = stack.pop()
+            yield element
+            stack.extend(child for child in reversed(element.children) if isinstance(child, HtmlElement))
+
+    def find_elements(self, by: str = By.ID, value: str | None = None) -> list["HtmlElement"]:
+        """Finds all descendant elements matching a locator, like `WebElement.find_elements`."""
+        matcher = _matcher(by, value or "")
+        return [element for element in self.iter() if matcher(element)]
+
+    def find_element(self, by: str = By.ID, value: str | None = None) -> "HtmlElement":
+        """Finds the first descendant element matching a locator, like `WebElement.find_element`.
+
+        Raises:
+            NoSuchElementException: If no element matches.
+        """
+        matcher = _matcher(by, value or "")
+        for element in self.iter():
+            if matcher(element):
+                return element
+        raise NoSuchElementException(f"No element found for {by}={value!r}")
+
+class HtmlDocument(HtmlElement):
+    """Root of a parsed static HTML document."""
+
+    def __init__(self, url: str | None = None) -> None:
+        super().__init__("#document")
+        self.url = url
+
+    @property
+    def title(self) -> str:
+        """Returns the text of the document's `<title>` element."""
+        for element in self.iter():
+            if element.tag_name == "title":
+                return " ".join("".join(child for child in element.children if isinstance(child, str)).split())
+        return ""
+
+    @classmethod
+    def parse(cls, html: str, url: str | None = None) -> "HtmlDocument":
+        """Parses an HTML document.
+
+        Args:
+            html (str): The HTML source.
+            url (str | None): The URL the document was loaded from.
+
+        Returns:
+            HtmlDocument: The parsed document.
+        """
+        document = cls(url)
+        builder = _TreeBuilder(document)
+        builder.feed(html)
+        builder.close()
+        return document
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self, document: HtmlDocument) -> None:
+        super().__init__(convert_charrefs=True)
+        self._stack: list[HtmlElement] = [document]
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        closes = _IMPLICIT_CLOSE.get(tag)
+        if closes:
+            # Close elements like an open <td> when the next <td> starts, but not across tables
+            for index in range(len(self._stack) - 1, 0, -1):
+                open_tag = self._stack[index].tag_name
+                if open_tag in closes:
+                    del self._stack[index:]
+                    break
+                if open_tag in ("table", "ul", "ol", "select", "#shadow-root"):
+                    break
+
+        parent = self._stack[-1]
+        attributes = {name: value if value is not None else "" for name, value in attrs}
+
+        if tag == "template" and attributes.get("shadowrootmode") in ("open", "closed"):
+            # Declarative shadow DOM: the template's content becomes the parent's shadow root
+            root = HtmlElement("#shadow-root", parent=None)
+            parent._shadow_root = root
+            self._stack.append(root)
+            return
+
+        element = HtmlElement(tag, attributes, parent)
+        parent.children.append(element)
+        if tag not in VOID_TAGS:
+            self._stack.append(element)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and self._stack[-1].tag_name == tag:
+            self._stack.pop()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "template" and self._stack[-1].tag_name == "#shadow-root":
+            self._stack.pop()
+            return
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag_name == tag:
+                del self._stack[index:]
+                return
+            if self._stack[index].tag_name == "#shadow-root":
+                return # Unmatched end tag inside a shadow root
+
+    def handle_data(self, data: str) -> None:
+        self._stack[-1].children.append(data)
+
+def _matcher(by: str, value: str) -> Callable[[HtmlElement], bool]:
+    """Creates a predicate for a Selenium locator."""
+    if by == By.ID:
+        return lambda element: element.attributes.get("id") == value
+    if by == By.NAME:
+        return lambda element: element.attributes.get("name") == value
+    if by == By.TAG_NAME:
+        return lambda element: element.tag_name == value.lower()
+    if by == By.CLASS_NAME:
+        return lambda element: value in element.attributes.get("class", "").split()
+    if by == By.CSS_SELECTOR:
+        return _css_matcher(value)
+    if by == By.XPATH:
+        return _xpath_matcher(value)
+    raise InvalidSelectorException(f"Unsupported locator strategy: {by}")
+
+def _xpath_matcher(xpath: str) -> Callable[[HtmlElement], bool]:
+    """Supports unions of descendant tag paths, e.g. ".//td | .//th"."""
+    tags = set()
+    for part in xpath.split("|"):
+        match = re.fullmatch(r"\s*\.?//([\w-]+|\*)\s*", part)
+        if not match:
+            raise InvalidSelectorException(f"Unsupported XPath expression: {xpath}")
+        tags.add(match.group(1).lower())
+    return lambda element: "*" in tags or element.tag_name in tags
+
+_COMPOUND = re.compile(r"([\w-]+|\*)?((?:#[\w-]+|\.[\w-]+|\[[^\]]+\])*)$")
+_ATTRIBUTE = re.compile(r"\[\s*([\w-]+)\s*(?:([~^$*]?=)\s*(?:\"([^\"]*)\"|'([^']*)'|([^\]\s]*)))?\s*\]")
+
+def _compound_matcher(compound: str) -> Callable[[HtmlElement], bool]:
+    match = _COMPOUND.match(compound)
+    if not match or not compound:
+        raise InvalidSelectorException(f"Unsupported CSS selector: {compound}")
+    tag = match.group(1)
+    conditions: list[Callable[[HtmlElement], bool]] = []
+    if tag and tag != "*":
+        conditions.append(lambda element, tag=tag.lower(): element.tag_name == tag)
+
+    for part in re.findall(r"#[\w-]+|\.[\w-]+|\[[^\]]+\]", match.group(2)):
+        if part[0] == "#":
+            conditions.append(lambda element, id=part[1:]: element.attributes.get("id") == id)
+        elif part[0] == ".":
+            conditions.append(lambda element, name=part[1:]: name in element.attributes.get("class", "").split())
+        else:
+            attribute = _ATTRIBUTE.fullmatch(part)
+            if not attribute:
+                raise InvalidSelectorException(f"Unsupported CSS attribute selector: {part}")
+            name, operator = attribute.group(1), attribute.group(2)
+            expected = next((group for group in attribute.group(3, 4, 5) if group is not None), "")
+            conditions.append(lambda element, name=name, operator=operator, expected=expected: _match_attribute(element.attributes.get(name), operator, expected))
+
+    return lambda element: all(condition(element) for condition in conditions)
+
+def _match_attribute(actual: str | None, operator: str | None, expected: str) -> bool:
+    if actual is None:
+        return False
+    if operator is None:
+        return True
+    if operator == "=":
+        return actual == expected
+    if operator == "~=":
+        return expected in actual.split()
+    if operator == "^=":
+        return actual.startswith(expected)
+    if operator == "$=":
+        return actual.endswith(expected)
+    return expected in actual # *=
+
+def _split_selector(selector: str) -> list[list[str]]:
+    """Splits a selector list into groups of compounds and combinators, respecting brackets and quotes."""
+    groups: list[list[str]] = [[]]
+    token = ""
+    quote = None
+    depth = 0
+
+    def flush() -> None:
+        nonlocal token
+        if token:
+            groups[-1].append(token)
+            token = ""
+
+    for character in selector:
+        if quote:
+            token += character
+            if character == quote:
+                quote = None
+        elif character in "'\"" and depth:
+            token += character
+            quote = character
+        elif character == "[":
+            depth += 1
+            token += character
+        elif character == "]":
+            depth -= 1
+            token += character
+        elif depth:
+            token += character
+        elif character == ",":
+            flush()
+            groups.append([])
+        elif character == ">":
+            flush()
+            groups[-1].append(">")
+        elif character.isspace():
+            flush()
+        else:
+            token += character
+    flush()
+    return groups
+
+def _css_matcher(selector: str) -> Callable[[HtmlElement], bool]:
+    """Supports type, id, class and attribute selectors with descendant and child combinators."""
+    alternatives = []
+    for tokens in _split_selector(selector):
+        # Pair each compound with the combinator that links it to the one before it
+        steps: list[tuple[str, Callable[[HtmlElement], bool]]] = []
+        combinator = " "
+        for token in tokens:
+            if token == ">":
+                combinator = ">"
+                continue
+            steps.append((combinator, _compound_matcher(token)))
+            combinator = " "
+        if not steps:
+            raise InvalidSelectorException(f"Unsupported CSS selector: {selector}")
+        alternatives.append(steps)
+
+    def matches(element: HtmlElement, steps: list[tuple[str, Callable[[HtmlElement], bool]]]) -> bool:
+        combinator, matcher = steps[-1]
+        if not matcher(element):
+            return False
+        if len(steps) == 1:
+            return True
+        ancestor = element.parent
+        while ancestor is not None and ancestor.tag_name != "#document":
+            if matches(ancestor, steps[:-1]):
+                return True
+            if combinator == ">":
+                return False
+            ancestor = ancestor.parent
+        return False
+
+    return lambda element: any(matches(element, steps) for steps in alternatives)
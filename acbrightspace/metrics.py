@@ -0,0 +1,240 @@
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+NAVIGATION_TIMING_SCRIPT = """
+const entry = performance.getEntriesByType('navigation')[0];
+return entry ? entry.toJSON() : null;
+"""
+"""Returns the Navigation Timing entry of the current page."""
+
+RESOURCE_TIMING_SCRIPT = """
+return performance.getEntriesByType('resource').map(
+    entry => [entry.name, entry.initiatorType, entry.transferSize, entry.duration]
+);
+"""
+"""Returns the URL, initiator, transfer size and duration of every resource the current page loaded."""
+
+SLOWEST_COUNT = 5
+"""Number of slowest requests kept in a network summary."""
+
+@dataclass
+class ResourceTiming:
+    """A request made while loading a page."""
+
+    url: str
+    """URL of the request."""
+
+    initiator: str
+    """What made the request, such as "script", "link" or "fetch"."""
+
+    transfer_bytes: int
+    """Bytes transferred over the network, including headers. 0 if served from the cache."""
+
+    duration_ms: float
+    """Time from the start of the request to the end of the response, in milliseconds."""
+
+@dataclass
+class NetworkSummary:
+    """Summary of the requests made while loading a page."""
+
+    request_count: int = 0
+    """Number of requests, including the page itself."""
+
+    transfer_bytes: int = 0
+    """Bytes transferred over the network."""
+
+    bytes_by_host: dict[str, int] = field(default_factory=dict)
+    """Bytes transferred per host, to spot heavy third-party scripts."""
+
+    slowest: list[ResourceTiming] = field(default_factory=list)
+    """The slowest requests, slowest first."""
+
+    @classmethod
+    def from_resources(cls, document: ResourceTiming | None, resources: list[ResourceTiming]) -> "NetworkSummary":
+        """Summarizes the requests of a page.
+
+        Args:
+            document (ResourceTiming | None): The request for the page itself, if known.
+            resources (list[ResourceTiming]): The requests the page made.
+        """
+        requests = ([document] if document is not None else []) + resources
+        summary = cls(request_count=len(requests))
+        for request in requests:
+            summary.transfer_bytes += request.transfer_bytes
+            host = urlsplit(request.url).netloc
+            summary.bytes_by_host[host] = summary.bytes_by_host.get(host, 0) + request.transfer_bytes
+        summary.slowest = sorted(requests, key=lambda request: request.duration_ms, reverse=True)[:SLOWEST_COUNT]
+        return summary
+
+@dataclass
+class NavigationMetrics:
+    """Performance data of one page load."""
+
+    url: str
+    """URL that was requested."""
+
+    operation: str | None
+    """Brightspace method that made the navigation, such as "get_grades"."""
+
+    started_at: datetime
+    """When the navigation started."""
+
+    duration: float
+    """Seconds until the browser reported the page as loaded."""
+
+    queue_delay: float = 0.0
+    """Seconds the navigation waited for the rate limiter before it started."""
+
+    performance: dict[str, float] = field(default_factory=dict)
+    """Chrome DevTools `Performance.getMetrics`, such as "ScriptDuration" and "JSHeapUsedSize"."""
+
+    timing: dict[str, float] = field(default_factory=dict)
+    """Phases of the page load from Navigation Timing, in milliseconds."""
+
+    network: NetworkSummary = field(default_factory=NetworkSummary)
+    """Summary of the requests made while loading the page."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the metrics as JSON compatible data."""
+        data = asdict(self)
+        data["started_at"] = self.started_at.isoformat()
+        return data
+
+MetricsSink = Callable[[NavigationMetrics], None]
+"""Receives the metrics of every navigation."""
+
+def _timing(entry: dict[str, Any]) -> dict[str, float]:
+    """Turns a Navigation Timing entry into the duration of each phase."""
+    def between(start: str, end: str) -> float | None:
+        if entry.get(start) is None or entry.get(end) is None:
+            return None
+        return round(entry[end] - entry[start], 3)
+
+    phases = {
+        "redirect": between("redirectStart", "redirectEnd"),
+        "dns": between("domainLookupStart", "domainLookupEnd"),
+        "connect": between("connectStart", "connectEnd"),
+        "time_to_first_byte": between("startTime", "responseStart"),
+        "response": between("responseStart", "responseEnd"),
+        "dom_interactive": between("startTime", "domInteractive"),
+        "dom_content_loaded": between("startTime", "domContentLoadedEventEnd"),
+        "load": between("startTime", "loadEventEnd"),
+    }
+    return {name: value for name, value in phases.items() if value is not None}
+
+class MetricsCollector:
+    """Reads performance data from a browser after each navigation.
+
+    DevTools metrics need a Chromium driver; other drivers only report the
+    duration, and static drivers such as `HttpDriver` report nothing more.
+    Collection never fails a navigation: errors are logged and the metrics are
+    left incomplete.
+    """
+
+    def __init__(self) -> None:
+        self._performance_enabled = False
+
+    def collect(self, driver: Any, url: str, operation: str | None, started_at: datetime, duration: float) -> NavigationMetrics:
+        """Collects the metrics of the page the driver just loaded.
+
+        Args:
+            driver (Any): The WebDriver.
+            url (str): URL that was requested.
+            operation (str | None): Brightspace method that made the navigation.
+            started_at (datetime): When the navigation started.
+            duration (float): Seconds the navigation took.
+
+        Returns:
+            NavigationMetrics: The metrics.
+        """
+        metrics = NavigationMetrics(url=url, operation=operation, started_at=started_at, duration=duration)
+
+        if hasattr(driver, "execute_cdp_cmd"):
+            try:
+                if not self._performance_enabled:
+                    driver.execute_cdp_cmd("Performance.enable", {})
+                    self._performance_enabled = True
+                response = driver.execute_cdp_cmd("Performance.getMetrics", {})
+                metrics.performance = {metric["name"]: metric["value"] for metric in response.get("metrics", [])}
+            except WebDriverException as error:
+                logger.debug("Could not read DevTools metrics for %s: %s", url, error)
+            except Exception:
+                logger.warning("Could not read DevTools metrics for %s.", url, exc_info=True)
+
+        try:
+            entry = driver.execute_script(NAVIGATION_TIMING_SCRIPT)
+            resources = driver.execute_script(RESOURCE_TIMING_SCRIPT) or []
+        except WebDriverException as error:
+            logger.debug("Could not read timing of %s: %s", url, error)
+            return metrics
+
+        try:
+            document = None
+            if entry:
+                metrics.timing = _timing(entry)
+                document = ResourceTiming(entry.get("name", url), "navigation", int(entry.get("transferSize") or 0), float(entry.get("duration") or 0))
+            metrics.network = NetworkSummary.from_resources(document, [
+                ResourceTiming(name, initiator, int(size or 0), float(duration or 0)) for name, initiator, size, duration in resources
+            ])
+        except Exception:
+            # Browsers and extensions can report entries with missing or odd fields
+            logger.warning("Could not read timing of %s.", url, exc_info=True)
+        return metrics
+
+class MetricsLog:
+    """Metrics sink that keeps every navigation in memory.
+
+    Example:
+        >>> log = MetricsLog()
+        >>> brightspace = Brightspace(metrics=log)
+        >>> brightspace.get_grades("683274")
+        >>> print(log.summary())
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.navigations: list[NavigationMetrics] = []
+
+    def __call__(self, metrics: NavigationMetrics) -> None:
+        with self._lock:
+            self.navigations.append(metrics)
+
+    def by_page(self) -> dict[str, list[NavigationMetrics]]:
+        """Groups the navigations by URL path, ignoring the query."""
+        pages: dict[str, list[NavigationMetrics]] = {}
+        with self._lock:
+            for metrics in self.navigations:
+                pages.setdefault(urlsplit(metrics.url).path, []).append(metrics)
+        return pages
+
+    def summary(self) -> str:
+        """Returns a table of the count, total and mean time and total bytes of each page, slowest total first."""
+        rows = []
+        for path, navigations in self.by_page().items():
+            total = sum(metrics.duration for metrics in navigations)
+            transferred = sum(metrics.network.transfer_bytes for metrics in navigations)
+            rows.append((total, f"{path:<48} {len(navigations):>5} {total:>8.2f}s {total / len(navigations):>8.2f}s {transferred / 1024:>9.0f}KiB"))
+        header = f"{'page':<48} {'count':>5} {'total':>9} {'mean':>9} {'bytes':>12}"
+        return "\n".join([header] + [row for _, row in sorted(rows, reverse=True)])
+
+class JsonLinesSink:
+    """Metrics sink that appends each navigation to a JSON Lines file."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics: NavigationMetrics) -> None:
+        line = json.dumps(metrics.to_dict()) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            file.write(line)
@@ -0,0 +1,700 @@
+import argparse
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from typing import Sequence
+from urllib.parse import parse_qs, urlsplit
+
+import pyotp
+
+from acbrightspace.announcement import Announcement
+from acbrightspace.assignment import Assignment
+from acbrightspace.course import Course
+from acbrightspace.fraction import Fraction
+from acbrightspace.grade_item import GradeItem
+from acbrightspace.pager import PAGE_NUMBER_SELECTOR, PAGE_PARAMETER, PAGE_SIZE_PARAMETER, PAGE_SIZE_SELECTOR
+from acbrightspace.quiz import Quiz, QuizAttempt, QuizQuestion
+from acbrightspace.schema import DATE_FORMAT
+from acbrightspace.semester import Semester
+
+logger = logging.getLogger(__name__)
+
+SUBJECTS = [
+    "Network Programming", "Database Systems", "Web Development", "Operating Systems",
+    "Computer Essentials", "Data Structures", "Business and Information Technology",
+    "Software Testing", "Linux Administration", "Mobile Application Development",
+    "Cloud Computing", "Communications I", "Mathematics for Programmers", "Object Oriented Programming",
+]
+"""Course names the synthetic dataset picks from."""
+
+ANNOUNCEMENT_TITLES = [
+    "Welcome to the course", "Lab schedule update", "Midterm review session", "Office hours moved",
+    "Assignment clarification", "Reminder: quiz this week", "Final exam information", "Class cancelled",
+]
+"""Announcement titles the synthetic dataset picks from."""
+
+NEWS_PATH = re.compile(r"^/d2l/api/le/[\d.]+/(\d+)/news/?$")
+"""Matches the API path of a course's announcements, capturing its org unit ID."""
+
+GRADE_CATEGORIES = {"Labs": "Lab", "Quizzes": "Quiz", "Exams": "Exam"}
+"""Categories that grade items and assignment folders are grouped into, with the name of one item."""
+
+QUIZ_ATTEMPT_LIMIT = 2
+"""Number of attempts allowed on every quiz of the synthetic dataset."""
+
+PAGE_SIZES = (10, 20, 50, 100, 200)
+"""Page sizes offered by the pager of every table."""
+
+DEFAULT_PAGE_SIZE = 20
+"""Page size of a table when none is requested."""
+
+SESSION_COOKIE = "d2lSessionVal"
+"""Name of the cookie that holds the session of a logged in student."""
+
+def _semester_of(day: datetime) -> Semester:
+    term = "Winter" if day.month <= 4 else "Spring" if day.month <= 8 else "Fall"
+    return Semester(day.year, term)
+
+def _previous(semester: Semester) -> Semester:
+    if semester.term == "Winter":
+        return Semester(semester.year - 1, "Fall")
+    return Semester(semester.year, "Winter" if semester.term == "Spring" else "Spring")
+
+def _semester_end(semester: Semester) -> datetime:
+    month = {"Winter": 4, "Spring": 8, "Fall": 12}[semester.term]
+    return datetime(semester.year, month, 27)
+
+@dataclass
+class MockCourse:
+    """A course of the synthetic dataset, with its grades and assignments grouped by category."""
+
+    course: Course
+    """The course, as `get_courses` should return it."""
+
+    grades: list[tuple[str, GradeItem]] = field(default_factory=list)
+    """(category, grade item) pairs, as `get_grades` should return them."""
+
+    assignments: list[tuple[str, Assignment]] = field(default_factory=list)
+    """(category, assignment) pairs, as `get_assignments` should return them."""
+
+    announcements: list[Announcement] = field(default_factory=list)
+    """The course's announcements, newest first, as `get_announcements` should return them."""
+
+    quizzes: list[Quiz] = field(default_factory=list)
+    """The course's quizzes with their attempts, as `get_quizzes` should return them."""
+
+    def find_quiz(self, quiz_id: int) -> Quiz | None:
+        """Returns the quiz with a quiz ID, if there is one."""
+        return next((quiz for quiz in self.quizzes if quiz.id == quiz_id), None)
+
+@dataclass
+class Dataset:
+    """Synthetic courses, grades and assignments served by `MockBrightspaceServer`."""
+
+    courses: list[MockCourse]
+    """The courses, with the active ones first."""
+
+    def __post_init__(self) -> None:
+        self._by_id = {mock.course.org_unit_id: mock for mock in self.courses}
+
+    def find(self, org_unit_id: int) -> MockCourse | None:
+        """Returns the course with an org unit ID, if there is one."""
+        return self._by_id.get(org_unit_id)
+
+    @classmethod
+    def generate(cls, seed: int = 0, course_count: int = 6, grade_count: int = 12, assignment_count: int = 8, announcement_count: int = 4, quiz_count: int = 3, now: datetime | None = None) -> "Dataset":
+        """Generates a reproducible dataset.
+
+        Half of the courses (rounded up) are active in the current semester, the rest
+        are closed courses of earlier semesters. Assignment dates are spread around `now`.
+
+        Args:
+            seed (int): Seed of the random number generator. The same seed and `now` give the same dataset.
+            course_count (int): Number of courses.
+            grade_count (int): Number of grade items per course.
+            assignment_count (int): Number of assignments per course.
+            announcement_count (int): Number of announcements per course.
+            quiz_count (int): Number of quizzes per course.
+            now (datetime | None): Current time the dates are based on. Defaults to the start of today.
+
+        Returns:
+            Dataset: The generated dataset.
+        """
+        generator = random.Random(seed)
+        # Separate, so adding announcements does not change the rest of the dataset
+        news_generator = random.Random(f"announcements-{seed}")
+        quiz_generator = random.Random(f"quizzes-{seed}")
+        now = now or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        current = _semester_of(now)
+        active_count = (course_count + 1) // 2
+
+        courses = []
+        for index in range(course_count):
+            semester = current
+            for _ in range(0 if index < active_count else 1 + (index - active_count) % 4):
+                semester = _previous(semester)
+            is_active = index < active_count
+            code = f"{semester.code}_CST{8100 + index % 900:04d}_{10 * (1 + index // 900 % 99):03d}"
+            name = SUBJECTS[generator.randrange(len(SUBJECTS))]
+            ends_at = _semester_end(semester)
+            ended = "Ends" if is_active else "Ended"
+            full_name = f"{'' if is_active else 'Closed, '}{code} {name}, {code}, {semester.name}, {ended} {ends_at:%B %d, %Y at %I:%M %p}"
+            course = Course(
+                full_code=code,
+                full_name=full_name,
+                name=name,
+                semester=semester,
+                ends_at=ends_at,
+                is_active=is_active,
+                org_unit_id=100000 + index,
+            )
+
+            # Items are grouped by category, since each category's items are listed together
+            grades = []
+            for item in range(grade_count):
+                category = list(GRADE_CATEGORIES)[item * len(GRADE_CATEGORIES) // grade_count]
+                out_of = generator.choice([10, 20, 50, 100])
+                graded = not is_active or generator.random() < 0.7
+                weight = generator.choice([2, 5, 10, 20])
+                achieved = round(generator.uniform(0.4, 1.0) * out_of, 1) if graded else None
+                grades.append((category, GradeItem(
+                    name=f"{GRADE_CATEGORIES[category]} {item + 1}",
+                    points=Fraction(achieved, out_of) if achieved is not None else None,
+                    weight=Fraction(round(achieved / out_of * weight, 2), weight) if achieved is not None else None,
+                    comments=generator.choice([None, None, "Good work.", "See the rubric for details."]) if graded else None,
+                )))
+
+            assignments = []
+            for item in range(assignment_count):
+                category = list(GRADE_CATEGORIES)[item * len(GRADE_CATEGORIES) // assignment_count]
+                if is_active:
+                    due_at = now + timedelta(days=generator.randint(-60, 30))
+                else:
+                    due_at = ends_at - timedelta(days=generator.randint(1, 90))
+                due_at = due_at.replace(hour=23, minute=59)
+                submitted = due_at < now or generator.random() < 0.3
+                starts_at = (due_at - timedelta(days=14)).replace(hour=8, minute=0) if generator.random() < 0.5 else None
+                ends_at_item = due_at + timedelta(days=2) if generator.random() < 0.3 else None
+                score = Fraction(generator.randint(5, 10), 10) if submitted and due_at < now else None
+                assignments.append((category, Assignment(
+                    name=f"{GRADE_CATEGORIES[category]} {item + 1} Submission",
+                    starts_at=starts_at,
+                    ends_at=ends_at_item,
+                    due_at=due_at,
+                    score=score,
+                    completion_status="1 Submission, 1 File" if submitted else "Not Submitted",
+                    evaluation_status="Feedback: Unread" if score is not None else None,
+                    folder_id=course.org_unit_id * 1000 + item + 1,
+                )))
+
+            announcements = []
+            published_at = (ends_at if not is_active else now).replace(tzinfo=timezone.utc)
+            for item in range(announcement_count):
+                published_at -= timedelta(days=news_generator.randint(1, 14), minutes=news_generator.randint(0, 600))
+                title = ANNOUNCEMENT_TITLES[news_generator.randrange(len(ANNOUNCEMENT_TITLES))]
+                announcements.append(Announcement(
+                    id=course.org_unit_id * 100 + announcement_count - item,
+                    org_unit_id=course.org_unit_id,
+                    title=title,
+                    body=f"{title}. Please read this before the next class of {name}.",
+                    published_at=published_at,
+                    updated_at=published_at + timedelta(hours=2) if news_generator.random() < 0.2 else None,
+                ))
+
+            quizzes = []
+            for item in range(quiz_count):
+                due_at = (ends_at - timedelta(days=quiz_generator.randint(1, 90)) if not is_active else now + timedelta(days=quiz_generator.randint(-45, 20))).replace(hour=23, minute=59)
+                question_count = quiz_generator.randint(3, 5)
+                attempts = []
+                for number in range(1, (quiz_generator.randint(0, 2) if due_at > now else quiz_generator.randint(1, 2)) + 1):
+                    questions = [
+                        QuizQuestion(
+                            name=f"Question {question + 1}",
+                            points=Fraction(float(quiz_generator.randint(0, 2)), 2.0),
+                            feedback=quiz_generator.choice([None, None, "Review the lecture notes."]),
+                        )
+                        for question in range(question_count)
+                    ]
+                    attempts.append(QuizAttempt(
+                        number=number,
+                        score=Fraction(sum(question.points.numerator for question in questions), 2.0 * question_count),
+                        submitted_at=(due_at - timedelta(days=quiz_generator.randint(0, 6), minutes=quiz_generator.randint(1, 600))).replace(second=0),
+                        questions=questions,
+                    ))
+                quizzes.append(Quiz(
+                    id=1000 + item,
+                    name=f"Quiz {item + 1}",
+                    starts_at=None,
+                    ends_at=None,
+                    due_at=due_at,
+                    evaluation_status="Feedback: Unread" if attempts else None,
+                    attempts=attempts,
+                ))
+
+            courses.append(MockCourse(course, grades, assignments, announcements, quizzes))
+        return cls(courses)
+
+def _shadow(tag: str, content: str, **attributes: str) -> str:
+    """Renders an element with a declarative shadow root, so its content is parsed without JavaScript."""
+    rendered = "".join(f' {name}="{escape(value)}"' for name, value in attributes.items())
+    return f'<{tag}{rendered}><template shadowrootmode="open">{content}</template></{tag}>'
+
+def _page(title: str, body: str) -> str:
+    return f"<!DOCTYPE html><html><head><title>{escape(title)}</title></head><body>{body}</body></html>"
+
+def _fraction(value: Fraction | None) -> str:
+    return f"{value.numerator:g} / {value.denominator:g}" if value is not None else "- / -"
+
+def _paged_table(table_id: str, header: list[str], rows: list[tuple[str, list[str]]], page: int, page_size: int) -> str:
+    """Renders one page of a table whose rows are grouped under category header rows, with its pager.
+
+    Args:
+        table_id (str): The ID of the table element.
+        header (list[str]): The column headers, not counting the category column.
+        rows (list[tuple[str, list[str]]]): (category, rendered cells) of every row.
+        page (int): The page to render, starting at 1.
+        page_size (int): The number of rows per page.
+
+    Returns:
+        str: The table and its pager.
+    """
+    page_count = max(1, -(-len(rows) // page_size))
+    page = min(max(page, 1), page_count)
+    start = (page - 1) * page_size
+
+    html = ["<tr><th></th>", *(f'<th scope="col">{escape(text)}</th>' for text in header), "</tr>"]
+    # A category row only starts a page if the category starts there too, like Brightspace
+    category = rows[start - 1][0] if start else None
+    for row_category, cells in rows[start:start + page_size]:
+        if row_category != category:
+            category = row_category
+            html.append(f'<tr><th scope="row" colspan="2">{escape(category)}</th>{"<td></td>" * (len(header) - 1)}</tr>')
+        html.append(f'<tr><td></td>{"".join(cells)}</tr>')
+    table = f'<table id="{table_id}" class="d2l-table">{"".join(html)}</table>'
+
+    if len(rows) <= PAGE_SIZES[0]:
+        return table
+    size_options = "".join(f'<option value="{size}"{" selected" if size == page_size else ""}>{size} per page</option>' for size in PAGE_SIZES)
+    page_options = "".join(f'<option value="{number}"{" selected" if number == page else ""}>{number} of {page_count}</option>' for number in range(1, page_count + 1))
+    size_attribute = PAGE_SIZE_SELECTOR.split("'")[1]
+    page_attribute = PAGE_NUMBER_SELECTOR.split("'")[1]
+    return f'{table}<select title="{size_attribute}">{size_options}</select><select title="{page_attribute}">{page_options}</select>'
+
+def render_home(dataset: Dataset) -> str:
+    """Renders the home page, with one tab of course cards per semester."""
+    semesters: dict[str, list[Course]] = {}
+    for mock in dataset.courses:
+        semesters.setdefault(mock.course.semester.name, []).append(mock.course)
+
+    panels = []
+    for name, courses in semesters.items():
+        cards = "".join(
+            _shadow("d2l-enrollment-card", f'<d2l-card text="{escape(course.full_name)}" href="/d2l/home/{course.org_unit_id}"></d2l-card>')
+            for course in courses
+        )
+        content = _shadow("d2l-my-courses-content", _shadow("d2l-my-courses-card-grid", cards))
+        panels.append(f'<d2l-tab-panel text="{escape(name)}">{content}</d2l-tab-panel>')
+    return _page("Homepage - Brightspace", _shadow("d2l-my-courses", _shadow("d2l-my-courses-container", "".join(panels))))
+
+def render_grades(mock: MockCourse, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> str:
+    """Renders a page of a course's grades table."""
+    rows = []
+    for category, grade in mock.grades:
+        percent = f"{grade.points.to_decimal() * 100:.1f} %" if grade.points is not None else ""
+        rows.append((category, [
+            f'<th scope="row">{escape(grade.name)}</th>',
+            f"<td><label>{_fraction(grade.points)}</label></td>",
+            f"<td><label>{_fraction(grade.weight)}</label></td>",
+            f"<td>{percent}</td>",
+            f"<td>{escape(grade.comments or '')}</td>",
+        ]))
+    table = _paged_table("z_f", ["Grade Item", "Points", "Weight Achieved", "Grade", "Comments and Assessments"], rows, page, page_size)
+    return _page(f"Grades - {mock.course.full_code}", table)
+
+def render_folders(mock: MockCourse, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> str:
+    """Renders a page of a course's assignment folders table."""
+    rows = []
+    for category, assignment in mock.assignments:
+        link = f"/d2l/lms/dropbox/user/folder_submit_files.d2l?db={assignment.folder_id}&amp;grpid=0&amp;isprv=0&amp;bp=0&amp;ou={mock.course.org_unit_id}"
+        lines = [f'<a href="{link}">{escape(assignment.name)}</a>']
+        if assignment.due_at is not None:
+            lines.append(f"<div>Due on {assignment.due_at.strftime(DATE_FORMAT)}</div>")
+        if assignment.starts_at is not None:
+            lines.append(f"<div>Available on {assignment.starts_at.strftime(DATE_FORMAT)} Access restricted before availability starts.</div>")
+        if assignment.ends_at is not None:
+            lines.append(f"<div>Available until {assignment.ends_at.strftime(DATE_FORMAT)}</div>")
+        status = ",<br>".join(escape(part) for part in (assignment.completion_status or "").split(", "))
+        rows.append((category, [
+            f'<th scope="row">{"".join(lines)}</th>',
+            f"<td>{status}</td>",
+            f"<td>{_fraction(assignment.score) if assignment.score is not None else ''}</td>",
+            f"<td>{escape(assignment.evaluation_status or '')}</td>",
+        ]))
+    table = _paged_table("z_a", ["Folder", "Completion Status", "Score", "Evaluation Status"], rows, page, page_size)
+    return _page(f"Assignments - {mock.course.full_code}", table)
+
+def _plain_table(table_id: str, header: list[str], rows: list[list[str]]) -> str:
+    head = "".join(f'<th scope="col">{escape(text)}</th>' for text in header)
+    body = "".join(f"<tr>{''.join(cells)}</tr>" for cells in rows)
+    return f'<table id="{table_id}" class="d2l-table"><tr>{head}</tr>{body}</table>'
+
+def render_quizzes(mock: MockCourse, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> str:
+    """Renders a page of a course's quiz list table."""
+    rows = []
+    for quiz in mock.quizzes:
+        lines = [f'<a href="/d2l/lms/quizzing/user/quiz_summary.d2l?qi={quiz.id}&amp;ou={mock.course.org_unit_id}">{escape(quiz.name)}</a>']
+        if quiz.due_at is not None:
+            lines.append(f"<div>Due on {quiz.due_at.strftime(DATE_FORMAT)}</div>")
+        rows.append(("Quizzes", [
+            f'<th scope="row">{"".join(lines)}</th>',
+            f"<td>{escape(quiz.evaluation_status or '')}</td>",
+            f"<td>{len(quiz.attempts)} / {QUIZ_ATTEMPT_LIMIT}</td>",
+        ]))
+    table = _paged_table("z_b", ["Current Quizzes", "Evaluation Status", "Attempts"], rows, page, page_size)
+    return _page(f"Quizzes - {mock.course.full_code}", table)
+
+def render_quiz_submissions(mock: MockCourse, quiz: Quiz) -> str:
+    """Renders the table of a quiz's submitted attempts."""
+    rows = [
+        [
+            f'<th scope="row"><a href="/d2l/lms/quizzing/user/quiz_submissions_attempt.d2l?qi={quiz.id}&amp;ai={quiz.id * 10 + attempt.number}&amp;ou={mock.course.org_unit_id}">Attempt {attempt.number}</a></th>',
+            f"<td>{_fraction(attempt.score)}</td>",
+            f"<td>{attempt.submitted_at.strftime(DATE_FORMAT) if attempt.submitted_at is not None else ''}</td>",
+        ]
+        for attempt in quiz.attempts
+    ]
+    return _page(f"Submissions - {quiz.name}", _plain_table("z_c", ["Attempt", "Score", "Submitted"], rows))
+
+def render_quiz_attempt(mock: MockCourse, quiz: Quiz, attempt: QuizAttempt) -> str:
+    """Renders the detail page of a quiz attempt, with the points of each question."""
+    rows = [
+        [
+            f'<th scope="row">{escape(question.name)}</th>',
+            f"<td>{_fraction(question.points)}</td>",
+            f"<td>{escape(question.feedback or '')}</td>",
+        ]
+        for question in attempt.questions
+    ]
+    return _page(f"Attempt {attempt.number} - {quiz.name}", _plain_table("z_d", ["Question", "Points", "Feedback"], rows))
+
+def _render_quiz_page(mock: MockCourse, path: str, query: dict[str, str]) -> str | None:
+    """Renders the submissions or attempt page of a quiz, or returns None if there is no such page."""
+    quiz = mock.find_quiz(int(query["qi"])) if query.get("qi", "").isdigit() else None
+    if quiz is None:
+        return None
+    if path == "/d2l/lms/quizzing/user/quiz_submissions.d2l":
+        return render_quiz_submissions(mock, quiz)
+    if path == "/d2l/lms/quizzing/user/quiz_submissions_attempt.d2l" and query.get("ai", "").isdigit():
+        attempt = next((attempt for attempt in quiz.attempts if quiz.id * 10 + attempt.number == int(query["ai"])), None)
+        if attempt is not None:
+            return render_quiz_attempt(mock, quiz, attempt)
+    return None
+
+def _utc_text(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+def render_news(mock: MockCourse, since: datetime | None = None) -> str:
+    """Renders a course's announcements published after `since` as a JSON list of news items."""
+    return json.dumps([
+        {
+            "Id": announcement.id,
+            "IsHidden": False,
+            "Title": announcement.title,
+            "Body": {"Text": announcement.body, "Html": f"<p>{escape(announcement.body)}</p>"},
+            "CreatedDate": _utc_text(announcement.published_at),
+            "StartDate": _utc_text(announcement.published_at),
+            "LastModifiedDate": _utc_text(announcement.updated_at) if announcement.updated_at is not None else None,
+            "Attachments": [],
+        }
+        for announcement in mock.announcements
+        if since is None or announcement.published_at > since
+    ])
+
+def _login_page(title: str, action: str, field_html: str, hidden: dict[str, str]) -> str:
+    inputs = "".join(f'<input type="hidden" name="{name}" value="{escape(value)}">' for name, value in hidden.items())
+    return _page(title, f'<form method="post" action="{action}">{inputs}{field_html}<input type="submit" value="Next"></form>')
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def log_message(self, format: str, *args: object) -> None:
+        logger.debug("%s %s", self.address_string(), format % args)
+
+    def _send(self, status: int, body: str, headers: dict[str, str] | None = None, content_type: str = "text/html") -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _redirect(self, location: str, headers: dict[str, str] | None = None) -> None:
+        self._send(302, "", {"Location": location, **(headers or {})})
+
+    def _logged_in(self) -> bool:
+        cookies = dict(
+            part.strip().split("=", 1) for part in self.headers.get("Cookie", "").split(";") if "=" in part
+        )
+        return cookies.get(SESSION_COOKIE) == self.server.mock.session_token
+
+    def do_GET(self) -> None:
+        mock = self.server.mock
+        mock._record(self.path)
+        mock._delay()
+        status = mock._injected_error()
+        if status is not None:
+            self._send(status, _page(f"{status} Service Unavailable", "<h1>Service Unavailable</h1>"))
+            return
+
+        parts = urlsplit(self.path)
+        query = {name: values[0] for name, values in parse_qs(parts.query).items()}
+
+        if parts.path in ("", "/"):
+            self._redirect("/d2l/home" if self._logged_in() else "/d2l/login")
+            return
+        if parts.path == "/d2l/login":
+            self._send(200, _login_page("Sign in", "/d2l/login/password", '<input type="email" name="loginfmt">', {}))
+            return
+        if mock.require_login and not self._logged_in():
+            self._redirect(f"/d2l/login?target={self.path}")
+            return
+
+        if parts.path == "/d2l/home":
+            self._send(200, render_home(mock.dataset))
+            return
+
+        news = NEWS_PATH.match(parts.path)
+        if news is not None:
+            course = mock.dataset.find(int(news.group(1)))
+            if course is None:
+                self._send(404, json.dumps({"Errors": [{"Message": "Not Found"}]}), content_type="application/json")
+                return
+            since = datetime.fromisoformat(query["since"]) if "since" in query else None
+            self._send(200, render_news(course, since), content_type="application/json")
+            return
+
+        renderer = {
+            "/d2l/lms/grades/my_grades/main.d2l": render_grades,
+            "/d2l/lms/dropbox/user/folders_list.d2l": render_folders,
+            "/d2l/lms/quizzing/user/quizzes_list.d2l": render_quizzes,
+        }.get(parts.path)
+        course = mock.dataset.find(int(query["ou"])) if query.get("ou", "").isdigit() else None
+        if course is not None and parts.path.startswith("/d2l/lms/quizzing/user/quiz_submissions"):
+            page = _render_quiz_page(course, parts.path, query)
+            if page is None:
+                self._send(404, _page("404 Not Found", "<h1>Not Found</h1>"))
+            else:
+                self._send(200, page)
+            return
+        if renderer is None or course is None:
+            self._send(404, _page("404 Not Found", "<h1>Not Found</h1>"))
+            return
+        page = int(query.get(PAGE_PARAMETER, "1"))
+        page_size = int(query.get(PAGE_SIZE_PARAMETER, str(DEFAULT_PAGE_SIZE)))
+        self._send(200, renderer(course, page, page_size))
+
+    def do_POST(self) -> None:
+        mock = self.server.mock
+        mock._record(self.path)
+        length = int(self.headers.get("Content-Length", "0"))
+        form = {name: values[0] for name, values in parse_qs(self.rfile.read(length).decode("utf-8")).items()}
+
+        if self.path == "/d2l/login/password":
+            self._send(200, _login_page("Enter password", "/d2l/login/otc", '<input type="password" id="passwordInput" name="passwd">', form))
+        elif self.path == "/d2l/login/otc":
+            self._send(200, _login_page("Enter code", "/d2l/login/complete", '<input type="tel" name="otc">', form))
+        elif self.path == "/d2l/login/complete":
+            if not mock._check_credentials(form):
+                self._send(200, _login_page("Sign in", "/d2l/login/password", '<p>Incorrect credentials.</p><input type="email" name="loginfmt">', {}))
+                return
+            self._redirect("/d2l/home", {"Set-Cookie": f"{SESSION_COOKIE}={mock.session_token}; Path=/; HttpOnly"})
+        else:
+            self._send(404, _page("404 Not Found", "<h1>Not Found</h1>"))
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    mock: "MockBrightspaceServer"
+
+class MockBrightspaceServer:
+    """Local stand-in for Brightspace, serving a synthetic dataset for end-to-end and load tests.
+
+    It serves the home page with course cards in declarative shadow DOM, paged grades,
+    assignment folder and quiz tables with attempt pages, course announcements as JSON from the API, and a
+    three-step login form. Pages render without
+    JavaScript, so they work with Chrome as well as `HttpDriver`. Latency and errors
+    can be injected to exercise retries and timeouts.
+
+    Example:
+        >>> with MockBrightspaceServer(Dataset.generate(course_count=300), latency=0.05) as server:
+        ...     brightspace = Brightspace(base_url=server.base_url)
+        ...     brightspace.get_courses()
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        require_login: bool = False,
+        username: str | None = None,
+        password: str | None = None,
+        totp_secret: str | None = None,
+        seed: int = 0,
+    ) -> None:
+        """Creates a new server. Call `start`, or use it as a context manager.
+
+        Args:
+            dataset (Dataset | None): The data to serve. Defaults to `Dataset.generate(seed)`.
+            host (str): Address to listen on.
+            port (int): Port to listen on, or 0 to pick a free one.
+            latency (float): Seconds every GET request is delayed by.
+            latency_jitter (float): Up to this many extra seconds are added to each delay at random.
+            error_rate (float): Probability that a GET request fails with `error_status`.
+            error_status (int): HTTP status of injected errors.
+            require_login (bool): Whether pages redirect to the login form without a session cookie.
+            username (str | None): Username the login form accepts, or None to accept any.
+            password (str | None): Password the login form accepts, or None to accept any.
+            totp_secret (str | None): TOTP secret whose current code the login form accepts, or None to accept any code.
+            seed (int): Seed for the dataset and for injected latency and errors.
+        """
+        self.dataset = dataset or Dataset.generate(seed)
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.require_login = require_login
+        self.username = username
+        self.password = password
+        self.totp_secret = totp_secret
+        self.session_token = secrets.token_hex(16)
+        self.requests: list[str] = []
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._pending_errors: list[int] = []
+        self._server = _Server((host, port), _Handler)
+        self._server.mock = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Returns the root URL of the server, to pass to `Brightspace(base_url=...)`."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def session_cookies(self) -> dict[str, str]:
+        """Returns the cookies of a logged in session, for use with `HttpSession` without logging in."""
+        return {SESSION_COOKIE: self.session_token}
+
+    def inject_errors(self, count: int, status: int | None = None) -> None:
+        """Makes the next GET requests fail.
+
+        Args:
+            count (int): Number of requests that fail.
+            status (int | None): HTTP status of the errors. Defaults to `error_status`.
+        """
+        with self._lock:
+            self._pending_errors += [status or self.error_status] * count
+
+    def start(self) -> "MockBrightspaceServer":
+        """Starts serving in a background thread."""
+        # Poll often so that stop returns quickly
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), name="mock-brightspace", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and closes the listening socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "MockBrightspaceServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _record(self, path: str) -> None:
+        with self._lock:
+            self.requests.append(path)
+
+    def _delay(self) -> None:
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.latency_jitter) if self.latency_jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _injected_error(self) -> int | None:
+        with self._lock:
+            if self._pending_errors:
+                return self._pending_errors.pop(0)
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self.error_status
+        return None
+
+    def _check_credentials(self, form: dict[str, str]) -> bool:
+        if self.username is not None and form.get("loginfmt") != self.username:
+            return False
+        if self.password is not None and form.get("passwd") != self.password:
+            return False
+        if self.totp_secret is not None and not pyotp.TOTP(self.totp_secret).verify(form.get("otc", ""), valid_window=1):
+            return False
+        return True
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the mock server until interrupted."""
+    parser = argparse.ArgumentParser(prog="python -m acbrightspace.mock_server", description="Serve a synthetic Brightspace for testing.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--courses", type=int, default=6, help="number of courses (default: 6)")
+    parser.add_argument("--grades", type=int, default=12, help="grade items per course (default: 12)")
+    parser.add_argument("--assignments", type=int, default=8, help="assignments per course (default: 8)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds each request is delayed by")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="random extra delay of up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability that a request fails with 503")
+    parser.add_argument("--require-login", action="store_true", help="redirect to the login form without a session cookie")
+    args = parser.parse_args(argv)
+
+    dataset = Dataset.generate(args.seed, course_count=args.courses, grade_count=args.grades, assignment_count=args.assignments)
+    server = MockBrightspaceServer(
+        dataset,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        require_login=args.require_login,
+        seed=args.seed,
+    )
+    print(f"Serving {len(dataset.courses)} courses at {server.base_url}", file=sys.stderr)
+    print(f"Session cookie: {SESSION_COOKIE}={server.session_token}", file=sys.stderr)
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from selenium.webdriver.common.by import By
+
+from acbrightspace.errors import HttpStatusError
+from acbrightspace.html import HtmlDocument, HtmlElement
+from acbrightspace.session import HttpSession
+
+PAGE_SIZE_SELECTOR = "select[title='Results Per Page']"
+"""CSS selector of the page size drop-down of a paged Brightspace table."""
+
+PAGE_NUMBER_SELECTOR = "select[title='Page Number']"
+"""CSS selector of the page number drop-down of a paged Brightspace table."""
+
+PAGE_PARAMETER = "d2l_page"
+"""Query parameter that selects the page of a paged table."""
+
+PAGE_SIZE_PARAMETER = "d2l_pageSize"
+"""Query parameter that selects the number of rows per page of a paged table."""
+
+MAX_PAGE_WORKERS = 4
+"""Maximum number of remaining pages fetched at the same time."""
+
+def _selected_option(select: Any) -> Any | None:
+    options = select.find_elements(By.TAG_NAME, "option")
+    for option in options:
+        if option.is_selected():
+            return option
+    return options[0] if options else None
+
+@dataclass
+class Pager:
+    """The pager (page size and page number drop-downs) of a Brightspace table."""
+
+    page_sizes: list[int]
+    """Page sizes that can be chosen, smallest first."""
+
+    page_size: int | None
+    """Currently selected page size."""
+
+    page_count: int
+    """Number of pages at the current page size."""
+
+    page: int
+    """Currently shown page, starting at 1."""
+
+    @classmethod
+    def find(cls, root: Any) -> "Pager | None":
+        """Detects the pager on a page.
+
+        Args:
+            root (Any): The WebDriver, WebElement or HtmlElement to search in.
+
+        Returns:
+            Pager | None: The pager, or None if the table is not paged.
+        """
+        page_size_selects = root.find_elements(By.CSS_SELECTOR, PAGE_SIZE_SELECTOR)
+        page_number_selects = root.find_elements(By.CSS_SELECTOR, PAGE_NUMBER_SELECTOR)
+        if not page_size_selects and not page_number_selects:
+            return None
+
+        page_sizes: list[int] = []
+        page_size = None
+        if page_size_selects:
+            for option in page_size_selects[0].find_elements(By.TAG_NAME, "option"):
+                try:
+                    page_sizes.append(int(option.get_attribute("value")))
+                except (TypeError, ValueError):
+                    continue
+            selected = _selected_option(page_size_selects[0])
+            if selected is not None and (selected.get_attribute("value") or "").isdigit():
+                page_size = int(selected.get_attribute("value"))
+
+        page_count = 1
+        page = 1
+        if page_number_selects:
+            page_count = max(len(page_number_selects[0].find_elements(By.TAG_NAME, "option")), 1)
+            selected = _selected_option(page_number_selects[0])
+            if selected is not None and (selected.get_attribute("value") or "").isdigit():
+                page = int(selected.get_attribute("value"))
+
+        return cls(page_sizes=sorted(page_sizes), page_size=page_size, page_count=page_count, page=page)
+
+    @property
+    def largest_page_size(self) -> int | None:
+        """Returns the largest page size that can be chosen, if any."""
+        return self.page_sizes[-1] if self.page_sizes else None
+
+    @property
+    def can_grow(self) -> bool:
+        """Returns whether choosing a larger page size would reduce the number of pages."""
+        return self.page_count > 1 and self.largest_page_size is not None and (self.page_size is None or self.largest_page_size > self.page_size)
+
+def page_url(url: str, page: int | None = None, page_size: int | None = None) -> str:
+    """Returns the URL of a page of a paged table.
+
+    Args:
+        url (str): The URL of the table's first page.
+        page (int | None): Page number to select, starting at 1.
+        page_size (int | None): Number of rows per page to select.
+
+    Returns:
+        str: The URL with the page and page size query parameters set.
+    """
+    parts = urlsplit(url)
+    query = [(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if name not in (PAGE_PARAMETER, PAGE_SIZE_PARAMETER)]
+    if page_size is not None:
+        query.append((PAGE_SIZE_PARAMETER, str(page_size)))
+    if page is not None:
+        query.append((PAGE_PARAMETER, str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+def fetch_pages(session: HttpSession, urls: list[str], table_id: str, max_workers: int = MAX_PAGE_WORKERS) -> list[HtmlElement]:
+    """Fetches pages over HTTP in parallel and returns the table from each one.
+
+    Args:
+        session (HttpSession): An authenticated HTTP session.
+        urls (list[str]): The URLs of the pages.
+        table_id (str): The ID of the table element on each page.
+        max_workers (int): Maximum number of pages fetched at the same time.
+
+    Returns:
+        list[HtmlElement]: The table of each page, in the same order as the URLs.
+
+    Raises:
+        HttpStatusError: If a page cannot be fetched.
+        NoSuchElementException: If a page does not contain the table.
+    """
+    def fetch(url: str) -> HtmlElement:
+        response = session.request("GET", url)
+        if response.status != 200:
+            raise HttpStatusError(f"GET {url} failed with status {response.status}", response.status)
+        document = HtmlDocument.parse(response.data.decode("utf-8", errors="replace"), url=url)
+        return document.find_element(By.ID, table_id)
+
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+        return list(executor.map(fetch, urls))
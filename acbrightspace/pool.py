@@ -0,0 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import queue
+from typing import Callable, Generic, Iterator, Sequence, TypeVar
+
+C = TypeVar("C")
+T = TypeVar("T")
+R = TypeVar("R")
+
+class ClientPool(Generic[C]):
+    """Hands clients out to workers, one worker per client at a time.
+
+    A `Brightspace` client is safe to call from several threads, but its calls run one
+    after another since it has a single browser. A pool of clients lets that many calls
+    run in parallel: each worker checks a client out, uses it alone and returns it.
+
+    Example:
+        >>> pool = ClientPool([Brightspace(driver=HttpDriver(session)) for _ in range(4)])
+        >>> grades = pool.map(lambda client, course: client.get_grades(str(course.org_unit_id)), courses)
+    """
+
+    def __init__(self, clients: Sequence[C]) -> None:
+        """Creates a pool.
+
+        Args:
+            clients (Sequence[C]): The clients to hand out.
+        """
+        if not clients:
+            raise ValueError("A client pool needs at least one client.")
+        self.clients = list(clients)
+        self._idle: queue.Queue[C] = queue.Queue()
+        for client in self.clients:
+            self._idle.put(client)
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    @contextmanager
+    def checkout(self, timeout: float | None = None) -> Iterator[C]:
+        """Takes a client that no other worker is using, for the duration of the block.
+
+        Args:
+            timeout (float | None): Seconds to wait for a client to be returned. Waits forever if None.
+
+        Yields:
+            C: The client.
+
+        Raises:
+            TimeoutError: If no client was returned in time.
+        """
+        try:
+            client = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No client was free within {timeout} seconds.") from None
+        try:
+            yield client
+        finally:
+            self._idle.put(client)
+
+    def map(self, function: Callable[[C, T], R], items: Sequence[T]) -> list[R]:
+        """Runs a function for each item in parallel, each call with a checked out client.
+
+        Args:
+            function (Callable[[C, T], R]): Called with a client and an item.
+            items (Sequence[T]): The items.
+
+        Returns:
+            list[R]: The result of each call, in the same order as the items.
+        """
+        def run(item: T) -> R:
+            with self.checkout() as client:
+                return function(client, item)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(len(self.clients), len(items)))) as executor:
+            return list(executor.map(run, items))
@@ -0,0 +1,154 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+OPEN_TAB_SCRIPT = "window.open(arguments[0], '_blank');"
+"""Opens a URL in a new tab without switching to it."""
+
+READY_STATE_SCRIPT = "return document.readyState;"
+"""Returns whether the current page is still loading."""
+
+@dataclass
+class PrefetchStats:
+    """Counts how prefetched tabs were used."""
+
+    opened: int = 0
+    """Tabs opened in the background."""
+
+    hits: int = 0
+    """Page loads served by switching to a prefetched tab."""
+
+    misses: int = 0
+    """Page loads that had no prefetched tab."""
+
+    evicted: int = 0
+    """Prefetched tabs closed unused to stay within the tab limit."""
+
+class TabPrefetcher:
+    """Loads pages in background tabs of a browser, so later navigations only switch tabs.
+
+    `prefetch` opens a URL in a new tab while the current tab stays active. When the
+    same URL is navigated to later, `take` switches to its tab and closes the tab that
+    was in use, so the number of open tabs stays bounded. At most `max_tabs` prefetched
+    tabs are kept; opening another one closes the least recently prefetched tab.
+
+    The tabs share the browser's cookies, so they are logged in like the main tab.
+    Not thread safe: like the browser it drives, use it from one thread at a time.
+    """
+
+    def __init__(self, driver: Any, max_tabs: int = 4, load_timeout: float = 30.0) -> None:
+        """Creates a prefetcher.
+
+        Args:
+            driver (Any): The WebDriver to open tabs in.
+            max_tabs (int): Maximum number of prefetched tabs kept open.
+            load_timeout (float): Seconds to wait for a prefetched tab to finish loading when it is taken.
+        """
+        if max_tabs < 1:
+            raise ValueError(f"max_tabs must be at least 1, got: {max_tabs}")
+        self.driver = driver
+        self.max_tabs = max_tabs
+        self.load_timeout = load_timeout
+        self.stats = PrefetchStats()
+        # URL to window handle, least recently prefetched first
+        self._tabs: OrderedDict[str, str] = OrderedDict()
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._tabs
+
+    def __len__(self) -> int:
+        return len(self._tabs)
+
+    def prefetch(self, url: str) -> bool:
+        """Starts loading a URL in a background tab.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            bool: Whether a new tab was opened. False if the URL is already prefetched or the tab could not be opened.
+        """
+        if url in self._tabs:
+            self._tabs.move_to_end(url)
+            return False
+        while len(self._tabs) >= self.max_tabs:
+            old_url, handle = self._tabs.popitem(last=False)
+            logger.debug("Closing unused prefetched tab for %s.", old_url)
+            self._close(handle)
+            self.stats.evicted += 1
+
+        current = self.driver.current_window_handle
+        before = set(self.driver.window_handles)
+        try:
+            self.driver.execute_script(OPEN_TAB_SCRIPT, url)
+            opened = [handle for handle in self.driver.window_handles if handle not in before]
+            if self.driver.current_window_handle != current:
+                self.driver.switch_to.window(current)
+        except WebDriverException as error:
+            logger.warning("Could not open a tab to prefetch %s: %s", url, error)
+            return False
+        if not opened:
+            logger.warning("The browser did not open a tab to prefetch %s.", url)
+            return False
+
+        self._tabs[url] = opened[0]
+        self.stats.opened += 1
+        return True
+
+    def take(self, url: str) -> bool:
+        """Switches to the prefetched tab of a URL once it has loaded, closing the tab that was in use.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            bool: Whether the browser is now showing the URL. If False, the caller must load it.
+        """
+        handle = self._tabs.pop(url, None)
+        if handle is None:
+            self.stats.misses += 1
+            return False
+
+        current = self.driver.current_window_handle
+        try:
+            self.driver.switch_to.window(handle)
+            WebDriverWait(self.driver, self.load_timeout).until(
+                lambda driver: driver.execute_script(READY_STATE_SCRIPT) == "complete"
+            )
+        except (TimeoutException, WebDriverException) as error:
+            logger.warning("Prefetched tab for %s is not usable: %s", url, error)
+            # The unusable tab may be the active one, so return to the tab that was in use
+            self._close(handle, current)
+            self.stats.misses += 1
+            return False
+
+        # The prefetched tab replaces the one that was in use
+        self.driver.switch_to.window(current)
+        self.driver.close()
+        self.driver.switch_to.window(handle)
+        self.stats.hits += 1
+        return True
+
+    def _close(self, handle: str, return_to: str | None = None) -> None:
+        """Closes a tab, then switches to `return_to`, or to the tab that was active before."""
+        if return_to is None:
+            return_to = self.driver.current_window_handle
+        try:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        except WebDriverException as error:
+            logger.debug("Could not close prefetched tab %s: %s", handle, error)
+        finally:
+            self.driver.switch_to.window(return_to)
+
+    def close(self) -> None:
+        """Closes every prefetched tab."""
+        while self._tabs:
+            _, handle = self._tabs.popitem(last=False)
+            self._close(handle)
@@ -0,0 +1,154 @@
+import logging
+import os
+from pathlib import Path
+import shutil
+import time
+
+from selenium.webdriver import ChromeOptions
+
+from acbrightspace.errors import BrightspaceError
+from acbrightspace.filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRS = (
+    "Default/Cache",
+    "Default/Code Cache",
+    "Default/Service Worker/CacheStorage",
+    "Default/Service Worker/ScriptCache",
+    "GrShaderCache",
+    "ShaderCache",
+)
+"""Parts of a Chrome profile that can be deleted to save space, least valuable first.
+
+Cookies and local storage are kept, so pruning does not log the student out.
+"""
+
+LOCK_NAME = ".acbrightspace.lock"
+"""Name of the lock file in each profile slot."""
+
+def directory_size(path: Path) -> int:
+    """Returns the total size in bytes of the files in a directory tree."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                # Chrome may delete files while we look
+                pass
+    return total
+
+class ChromeProfile:
+    """Managed Chrome user data directory that keeps its HTTP cache and service workers between runs.
+
+    A fresh Chrome profile downloads every D2L web component bundle again. Reusing a
+    profile makes the first page load warm. Chrome cannot share a user data directory
+    between running browsers, so the profile is split into `slots` directories, each
+    locked by the process using it. A process takes the first free slot and waits if
+    all of them are taken.
+
+    Before a slot is used, it is pruned back under `max_size` bytes by deleting caches,
+    and rotated (deleted entirely) if that is not enough.
+
+    Example:
+        >>> profile = ChromeProfile("~/.cache/acbrightspace/chrome", slots=2)
+        >>> brightspace = Brightspace(profile=profile)
+    """
+
+    def __init__(self, directory: str | os.PathLike, slots: int = 1, max_size: int = 512 * 1024 * 1024, lock_timeout: float | None = 300.0) -> None:
+        """Creates a profile. Nothing is created on disk until `acquire` is called.
+
+        Args:
+            directory (str | os.PathLike): Directory that holds the profile slots.
+            slots (int): Number of browsers that can use the profile at the same time.
+            max_size (int): Size in bytes a slot is pruned back under before it is used.
+            lock_timeout (float | None): Seconds to wait for a free slot, or None to wait forever.
+        """
+        if slots < 1:
+            raise ValueError(f"slots must be at least 1, got: {slots}")
+        self.directory = Path(directory).expanduser()
+        self.slots = slots
+        self.max_size = max_size
+        self.lock_timeout = lock_timeout
+        self.path: Path | None = None
+        self.was_warm = False
+        self._lock: FileLock | None = None
+
+    def _slot(self, index: int) -> Path:
+        return self.directory / f"slot-{index}"
+
+    def acquire(self) -> Path:
+        """Locks a free slot and prepares it for use.
+
+        Returns:
+            Path: The user data directory to start Chrome with.
+
+        Raises:
+            BrightspaceError: If no slot became free within `lock_timeout`.
+        """
+        if self._lock is not None:
+            raise RuntimeError("Profile is already acquired.")
+
+        deadline = None if self.lock_timeout is None else time.monotonic() + self.lock_timeout
+        while True:
+            for index in range(self.slots):
+                lock = FileLock(self._slot(index) / LOCK_NAME)
+                if lock.acquire(blocking=False):
+                    self._lock = lock
+                    self.path = self._slot(index)
+                    try:
+                        self._prepare()
+                    except BaseException:
+                        # Do not keep a slot that cannot be used
+                        self.release()
+                        raise
+                    return self.path
+            if deadline is not None and time.monotonic() >= deadline:
+                raise BrightspaceError(f"All {self.slots} Chrome profile slots in {self.directory} are in use.")
+            time.sleep(0.1)
+
+    def _prepare(self) -> None:
+        assert self.path is not None
+        size = directory_size(self.path)
+        for cache in CACHE_DIRS:
+            if size <= self.max_size:
+                break
+            logger.info("Chrome profile %s is %d bytes, deleting %s.", self.path, size, cache)
+            shutil.rmtree(self.path / cache, ignore_errors=True)
+            size = directory_size(self.path)
+
+        if size > self.max_size:
+            logger.info("Chrome profile %s is still %d bytes, starting a new one.", self.path, size)
+            for child in self.path.iterdir():
+                if child.name == LOCK_NAME:
+                    continue
+                if child.is_dir() and not child.is_symlink():
+                    shutil.rmtree(child, ignore_errors=True)
+                else:
+                    child.unlink(missing_ok=True)
+
+        self.was_warm = (self.path / "Default").is_dir()
+
+    def release(self) -> None:
+        """Unlocks the slot. Call after the browser has quit."""
+        if self._lock is not None:
+            self._lock.release()
+            self._lock = None
+            self.path = None
+
+    def options(self, options: ChromeOptions | None = None) -> ChromeOptions:
+        """Returns Chrome options that use the acquired slot.
+
+        Args:
+            options (ChromeOptions | None): Options to add to. A new instance is created if None.
+
+        Returns:
+            ChromeOptions: The options.
+        """
+        if self.path is None:
+            raise RuntimeError("Acquire the profile before starting Chrome with it.")
+        options = options or ChromeOptions()
+        options.add_argument(f"--user-data-dir={self.path.resolve()}")
+        options.add_argument("--profile-directory=Default")
+        return options
@@ -0,0 +1,259 @@
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+import sys
+import threading
+import time
+from types import FrameType
+from typing import Iterator
+
+PARSING = "parsing"
+"""Category of samples in our own parsing code, including the HTML and date parsers it calls."""
+
+DRIVER = "driver"
+"""Category of samples waiting on the driver: the browser, the network or recorded pages."""
+
+OTHER = "other"
+"""Category of every other busy sample, such as navigation and bookkeeping."""
+
+CATEGORIES = (PARSING, DRIVER, OTHER)
+
+NO_PHASE = "(no phase)"
+"""Phase of samples taken outside of any `Profiler.phase` block."""
+
+PARSING_MODULES = (
+    "acbrightspace.table", "acbrightspace.schema", "acbrightspace.html", "acbrightspace.course",
+    "acbrightspace.fraction", "acbrightspace.semester", "acbrightspace.quiz", "_strptime", "html.parser", "_markupbase",
+)
+"""Modules whose code counts as parsing, such as `Table.parse_cell`, `Course.from_string` and `strptime`."""
+
+DRIVER_MODULES = ("selenium", "urllib3", "http.client", "socket", "ssl", "acbrightspace.session")
+"""Modules whose code counts as waiting on the driver."""
+
+IDLE_MODULES = ("threading", "concurrent.futures", "queue", "selectors")
+"""Modules a thread waits in when it has nothing to do. Such samples are left out."""
+
+type Frame = tuple[str, str]
+"""The module and qualified name of a function."""
+
+def _in(module: str, modules: tuple[str, ...]) -> bool:
+    return any(module == name or module.startswith(name + ".") for name in modules)
+
+def classify(stack: tuple[Frame, ...]) -> str | None:
+    """Returns the category of a sampled stack, or None if the thread was idle.
+
+    The innermost frame that belongs to a category decides, so parsing HTML that a
+    driver call loaded counts as parsing, and the socket reads under it as the driver.
+
+    Args:
+        stack (tuple[Frame, ...]): The frames of the stack, outermost first.
+
+    Returns:
+        str | None: `PARSING`, `DRIVER`, `OTHER`, or None for an idle thread.
+    """
+    if stack and _in(stack[-1][0], IDLE_MODULES):
+        return None
+    for module, _ in reversed(stack):
+        if _in(module, DRIVER_MODULES):
+            return DRIVER
+        if _in(module, PARSING_MODULES):
+            return PARSING
+    return OTHER
+
+def _stack(frame: FrameType | None) -> tuple[Frame, ...]:
+    frames = []
+    while frame is not None:
+        frames.append((frame.f_globals.get("__name__", "?"), frame.f_code.co_qualname))
+        frame = frame.f_back
+    return tuple(reversed(frames))
+
+class Profiler:
+    """Sampling profiler that splits the time of a run into phases and categories.
+
+    A background thread looks at the stack of every thread at a fixed interval, so work
+    done in worker threads is profiled too. Each sample is weighted by the time since the
+    previous one, tagged with the phase its thread is in (see `phase`) and sorted into
+    `PARSING`, `DRIVER` or `OTHER` by `classify`. Idle threads are left out.
+
+    Example:
+        >>> with Profiler() as profiler:
+        ...     with profiler.phase("grades"):
+        ...         brightspace.get_grades("683274")
+        >>> print(profiler.report())
+        >>> profiler.write_folded("profile.folded")
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        """Creates a profiler.
+
+        Args:
+            interval (float): Seconds between samples.
+        """
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._phases: dict[int, list[str]] = {}
+        self._samples: Counter[tuple[str, str, tuple[Frame, ...]]] = Counter()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at: float | None = None
+        self.duration = 0.0
+        """Seconds the profiler ran."""
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Starts sampling in a background thread."""
+        if self._thread is not None:
+            raise RuntimeError("The profiler is already running.")
+        self._stopped.clear()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="acbrightspace-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling. The samples taken so far are kept."""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.duration += time.perf_counter() - (self._started_at or 0.0)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Tags the samples of the calling thread with a phase for the duration of the block.
+
+        Phases nest; samples belong to the innermost one.
+        """
+        ident = threading.get_ident()
+        with self._lock:
+            self._phases.setdefault(ident, []).append(name)
+        try:
+            yield
+        finally:
+            with self._lock:
+                names = self._phases[ident]
+                names.pop()
+                if not names:
+                    del self._phases[ident]
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        previous = time.perf_counter()
+        while not self._stopped.wait(self.interval):
+            now = time.perf_counter()
+            elapsed, previous = now - previous, now
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = _stack(frame)
+                category = classify(stack)
+                if category is None:
+                    continue
+                with self._lock:
+                    names = self._phases.get(ident)
+                    phase = names[-1] if names else NO_PHASE
+                    self._samples[(phase, category, stack)] += elapsed
+
+    def seconds(self) -> dict[str, dict[str, float]]:
+        """Returns the sampled seconds of each category, by phase.
+
+        Threads working in parallel each add their own time, so the seconds of a
+        phase can add up to more than its wall clock time.
+        """
+        totals: dict[str, dict[str, float]] = {}
+        with self._lock:
+            for (phase, category, _), seconds in self._samples.items():
+                categories = totals.setdefault(phase, dict.fromkeys(CATEGORIES, 0.0))
+                categories[category] += seconds
+        return totals
+
+    def functions(self, category: str, count: int = 15) -> list[tuple[str, float]]:
+        """Returns the functions that the most time of a category was spent in, including their callees.
+
+        For `PARSING`, these are our parsing functions. For `DRIVER`, they are the innermost
+        functions of this package that were waiting on the driver, such as `HttpDriver.get`.
+
+        Args:
+            category (str): `PARSING`, `DRIVER` or `OTHER`.
+            count (int): Number of functions to return.
+
+        Returns:
+            list[tuple[str, float]]: The functions as "module:name", with their seconds, slowest first.
+        """
+        totals: Counter[str] = Counter()
+        with self._lock:
+            samples = list(self._samples.items())
+        for (_, sample_category, stack), seconds in samples:
+            if sample_category != category:
+                continue
+            if category == DRIVER:
+                # Whose call waited on the driver
+                ours = [frame for frame in stack if frame[0].startswith("acbrightspace") and not _in(frame[0], DRIVER_MODULES)]
+                names = {f"{ours[-1][0]}:{ours[-1][1]}"} if ours else set()
+            elif category == PARSING:
+                names = {f"{module}:{name}" for module, name in stack if _in(module, PARSING_MODULES)}
+            else:
+                names = {f"{module}:{name}" for module, name in stack if module.startswith("acbrightspace")}
+            for name in names:
+                totals[name] += seconds
+        return totals.most_common(count)
+
+    def report(self, count: int = 15) -> str:
+        """Returns a text report of the time of each phase and category, and the slowest functions."""
+        seconds = self.seconds()
+        total = dict.fromkeys(CATEGORIES, 0.0)
+        lines = [
+            f"Sampled every {self.interval * 1000:g} ms for {self.duration:.3f} s of wall clock time.",
+            "Seconds are summed over busy threads.",
+            "",
+            f"{'phase':<16} " + " ".join(f"{category:>10}" for category in CATEGORIES) + f" {'total':>10}",
+        ]
+        for phase, categories in seconds.items():
+            for category in CATEGORIES:
+                total[category] += categories[category]
+            lines.append(f"{phase:<16} " + " ".join(f"{categories[category]:>9.3f}s" for category in CATEGORIES) + f" {sum(categories.values()):>9.3f}s")
+        lines.append(f"{'total':<16} " + " ".join(f"{total[category]:>9.3f}s" for category in CATEGORIES) + f" {sum(total.values()):>9.3f}s")
+
+        for category, title in ((PARSING, "Parsing functions"), (DRIVER, "Calls waiting on the driver")):
+            functions = self.functions(category, count)
+            if not functions:
+                continue
+            lines += ["", f"{title} (including callees):"]
+            for name, function_seconds in functions:
+                share = function_seconds / total[category] * 100 if total[category] else 0.0
+                lines.append(f"{function_seconds:>9.3f}s {share:>5.1f}%  {name}")
+        return "\n".join(lines) + "\n"
+
+    def folded(self) -> str:
+        """Returns the samples as folded stacks, the input format of flamegraph.pl, speedscope and similar tools.
+
+        Each line is the phase, the category and the frames from the outermost in, separated
+        by semicolons, followed by the sampled time in microseconds.
+        """
+        lines: Counter[str] = Counter()
+        with self._lock:
+            samples = list(self._samples.items())
+        for (phase, category, stack), seconds in samples:
+            frames = ";".join(f"{module}:{name}".replace(";", ",").replace(" ", "_") for module, name in stack)
+            lines[f"{phase.replace(' ', '_')};{category};{frames}"] += round(seconds * 1_000_000)
+        return "".join(f"{line} {micros}\n" for line, micros in sorted(lines.items()) if micros)
+
+    def write(self, directory: Path | str) -> tuple[Path, Path]:
+        """Writes the report and the folded stacks to a directory.
+
+        Returns:
+            tuple[Path, Path]: The report ("profile.txt") and the folded stacks ("profile.folded").
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        report = directory / "profile.txt"
+        folded = directory / "profile.folded"
+        report.write_text(self.report(), encoding="utf-8")
+        folded.write_text(self.folded(), encoding="utf-8")
+        return report, folded
@@ -0,0 +1,157 @@
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Any
+
+from acbrightspace.assignment import _optional_datetime, _parse_optional_datetime
+from acbrightspace.fraction import Fraction
+
+def _check_version(model: str, version: int) -> None:
+    if version != 1:
+        raise ValueError(f"Unsupported {model} data version: {version}")
+
+@dataclass
+class QuizQuestion:
+    """Represents the result of one question in a quiz attempt."""
+
+    name: str
+    """Name of the question as listed in the attempt (e.g., "Question 1")."""
+
+    points: Fraction | None
+    """Points achieved for the question, if graded."""
+
+    feedback: str | None
+    """Feedback left on the question."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the question as JSON compatible data that `from_dict` reads."""
+        return {
+            "name": self.name,
+            "points": self.points.to_dict() if self.points is not None else None,
+            "feedback": self.feedback,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], version: int = 1) -> "QuizQuestion":
+        """Creates a question from the data returned by `to_dict`.
+
+        Raises:
+            ValueError: If the version is not supported.
+        """
+        _check_version("QuizQuestion", version)
+        return cls(
+            name=data["name"],
+            points=Fraction.from_dict(data["points"], version) if data.get("points") is not None else None,
+            feedback=data.get("feedback"),
+        )
+
+@dataclass
+class QuizAttempt:
+    """Represents a submitted attempt of a quiz."""
+
+    number: int
+    """Number of the attempt, starting at 1."""
+
+    score: Fraction | None
+    """Score of the attempt, if graded."""
+
+    submitted_at: datetime | None
+    """When the attempt was submitted."""
+
+    questions: list[QuizQuestion] = field(default_factory=list)
+    """Results of the attempt's questions, from its detail page."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the attempt as JSON compatible data, with dates in ISO 8601 format."""
+        return {
+            "number": self.number,
+            "score": self.score.to_dict() if self.score is not None else None,
+            "submitted_at": _optional_datetime(self.submitted_at),
+            "questions": [question.to_dict() for question in self.questions],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], version: int = 1) -> "QuizAttempt":
+        """Creates an attempt from the data returned by `to_dict`.
+
+        Raises:
+            ValueError: If the version is not supported.
+        """
+        _check_version("QuizAttempt", version)
+        return cls(
+            number=data["number"],
+            score=Fraction.from_dict(data["score"], version) if data.get("score") is not None else None,
+            submitted_at=_parse_optional_datetime(data.get("submitted_at")),
+            questions=[QuizQuestion.from_dict(question, version) for question in data.get("questions", [])],
+        )
+
+@dataclass
+class Quiz:
+    """Represents a quiz in Brightspace, with the student's attempts."""
+
+    id: int
+    """Quiz ID of the quiz."""
+
+    name: str
+    """Name of the quiz."""
+
+    starts_at: datetime | None
+    """When availability starts."""
+
+    ends_at: datetime | None
+    """When availability ends."""
+
+    due_at: datetime | None
+    """When the quiz is due."""
+
+    evaluation_status: str | None
+    """Evaluation status of the quiz."""
+
+    attempts: list[QuizAttempt] = field(default_factory=list)
+    """The student's submitted attempts, oldest first."""
+
+    @property
+    def best_score(self) -> Fraction | None:
+        """Returns the highest graded score of the attempts, if any."""
+        scores = [attempt.score for attempt in self.attempts if attempt.score is not None and attempt.score.denominator]
+        return max(scores, key=lambda score: score.to_decimal(), default=None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the quiz as JSON compatible data, with dates in ISO 8601 format.
+
+        Returns:
+            dict[str, Any]: A dictionary that `from_dict` turns back into an equal quiz.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "starts_at": _optional_datetime(self.starts_at),
+            "ends_at": _optional_datetime(self.ends_at),
+            "due_at": _optional_datetime(self.due_at),
+            "evaluation_status": self.evaluation_status,
+            "attempts": [attempt.to_dict() for attempt in self.attempts],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], version: int = 1) -> "Quiz":
+        """Creates a quiz from the data returned by `to_dict`.
+
+        Args:
+            data (dict[str, Any]): The data.
+            version (int): Version of the data format the data was written with.
+
+        Returns:
+            Quiz: The quiz.
+
+        Raises:
+            ValueError: If the version is not supported.
+        """
+        _check_version("Quiz", version)
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            starts_at=_parse_optional_datetime(data.get("starts_at")),
+            ends_at=_parse_optional_datetime(data.get("ends_at")),
+            due_at=_parse_optional_datetime(data.get("due_at")),
+            evaluation_status=data.get("evaluation_status"),
+            attempts=[QuizAttempt.from_dict(attempt, version) for attempt in data.get("attempts", [])],
+        )
@@ -0,0 +1,235 @@
+import asyncio
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Callable, Protocol
+from urllib.parse import urlsplit
+
+from acbrightspace.filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+LOGIN = "login"
+"""Budget for login attempts."""
+
+PAGE = "page"
+"""Budget for every other page and request."""
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A token bucket: `rate` requests per second on average, with bursts of up to `burst` requests."""
+
+    rate: float
+    """Tokens added per second."""
+
+    burst: float
+    """Maximum number of tokens, and so of requests sent back to back."""
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError(f"rate must be positive, got: {self.rate}")
+        if self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got: {self.burst}")
+
+DEFAULT_LIMITS = {
+    LOGIN: RateLimit(rate=1 / 60, burst=3),
+    PAGE: RateLimit(rate=4.0, burst=8),
+}
+"""At most 3 logins back to back and one a minute after that; 4 pages a second with bursts of 8."""
+
+def _reserve(state: tuple[float, float] | None, limit: RateLimit, now: float) -> tuple[tuple[float, float], float]:
+    """Takes a token from a bucket, going into debt if it is empty.
+
+    Debt is paid back by waiting, so requests that find the bucket empty queue
+    up in the order they reserved.
+
+    Args:
+        state (tuple[float, float] | None): Tokens in the bucket and when they were counted, or None for a full bucket.
+        limit (RateLimit): The bucket's limit.
+        now (float): The current time.
+
+    Returns:
+        tuple[tuple[float, float], float]: The new state, and the seconds to wait before sending the request.
+    """
+    tokens, updated = state if state is not None else (limit.burst, now)
+    tokens = min(limit.burst, tokens + max(0.0, now - updated) * limit.rate) - 1
+    return (tokens, now), max(0.0, -tokens / limit.rate)
+
+class BucketStore(Protocol):
+    """Where the state of the token buckets is kept."""
+
+    def reserve(self, buckets: list[tuple[str, RateLimit]], now: float) -> float:
+        """Takes a token from each bucket at once.
+
+        Returns:
+            float: Seconds to wait before sending the request.
+        """
+        ...
+
+class MemoryBuckets:
+    """Token buckets shared by the threads and asyncio tasks of one process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._state: dict[str, tuple[float, float]] = {}
+
+    def reserve(self, buckets: list[tuple[str, RateLimit]], now: float) -> float:
+        wait = 0.0
+        with self._lock:
+            for key, limit in buckets:
+                self._state[key], bucket_wait = _reserve(self._state.get(key), limit, now)
+                wait = max(wait, bucket_wait)
+        return wait
+
+class FileBuckets:
+    """Token buckets shared by every process on the machine, kept in a locked JSON file.
+
+    Use with a wall clock such as `time.time`, since processes do not share a monotonic clock.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Creates a store. The file is created on first use.
+
+        Args:
+            path (str | os.PathLike): The state file. A lock file is created next to it.
+        """
+        self.path = Path(path).expanduser()
+        self._thread_lock = threading.Lock()
+        self._file_lock = FileLock(self.path.with_name(self.path.name + ".lock"))
+
+    def reserve(self, buckets: list[tuple[str, RateLimit]], now: float) -> float:
+        wait = 0.0
+        # The file lock is not reentrant, so threads take turns holding it
+        with self._thread_lock, self._file_lock:
+            try:
+                state = json.loads(self.path.read_text(encoding="utf-8"))
+            except (FileNotFoundError, ValueError):
+                state = {}
+            for key, limit in buckets:
+                previous = state.get(key)
+                state[key], bucket_wait = _reserve(tuple(previous) if previous else None, limit, now)
+                wait = max(wait, bucket_wait)
+            temporary = self.path.with_name(self.path.name + ".tmp")
+            temporary.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(temporary, self.path)
+        return wait
+
+@dataclass
+class QueueStats:
+    """How long requests of one budget waited for the rate limiter."""
+
+    requests: int = 0
+    """Number of requests."""
+
+    delayed: int = 0
+    """Number of requests that had to wait."""
+
+    total_delay: float = 0.0
+    """Seconds spent waiting, summed over every request."""
+
+    max_delay: float = 0.0
+    """Longest wait in seconds."""
+
+    @property
+    def mean_delay(self) -> float:
+        """Returns the mean wait per request in seconds."""
+        return self.total_delay / self.requests if self.requests else 0.0
+
+class RateLimiter:
+    """Token bucket rate limiter for every request sent to Brightspace.
+
+    Each request takes a token from a bucket for its host and, once logged in, one
+    for the account, with separate budgets for logins and pages. A request that finds
+    a bucket empty waits until the bucket refills. One limiter can be shared by
+    threads and asyncio tasks; with a `FileBuckets` store it is also shared by every
+    process that uses the same file.
+
+    Example:
+        >>> limiter = RateLimiter(store=FileBuckets("~/.cache/acbrightspace/ratelimit.json"))
+        >>> brightspace = Brightspace(rate_limiter=limiter)
+        >>> print(limiter.stats()["page"].mean_delay)
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, RateLimit] | None = None,
+        store: BucketStore | None = None,
+        clock: Callable[[], float] | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        on_acquire: Callable[[str, float], None] | None = None,
+    ) -> None:
+        """Creates a rate limiter.
+
+        Args:
+            limits (dict[str, RateLimit] | None): Limit of each budget, such as `LOGIN` and `PAGE`.
+                Missing budgets use `DEFAULT_LIMITS`.
+            store (BucketStore | None): Where the buckets are kept. Defaults to `MemoryBuckets`.
+            clock (Callable[[], float] | None): Clock in seconds. Defaults to `time.time` for a
+                `FileBuckets` store and `time.monotonic` otherwise.
+            sleep (Callable[[float], None]): Waits for a number of seconds, replaceable for testing.
+            on_acquire (Callable[[str, float], None] | None): Called with the budget and the
+                seconds waited after every request is let through.
+        """
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.store = store or MemoryBuckets()
+        self._clock = clock or (time.time if isinstance(self.store, FileBuckets) else time.monotonic)
+        self._sleep = sleep
+        self._on_acquire = on_acquire
+        self._stats_lock = threading.Lock()
+        self._stats: dict[str, QueueStats] = {}
+
+    def _buckets(self, url: str, category: str, account: str | None) -> list[tuple[str, RateLimit]]:
+        limit = self.limits.get(category)
+        if limit is None:
+            raise ValueError(f"Unknown rate limit budget: {category}")
+        buckets = [(f"host:{urlsplit(url).netloc}:{category}", limit)]
+        if account:
+            buckets.append((f"account:{account.lower()}:{category}", limit))
+        return buckets
+
+    def _record(self, category: str, delay: float) -> None:
+        with self._stats_lock:
+            stats = self._stats.setdefault(category, QueueStats())
+            stats.requests += 1
+            stats.total_delay += delay
+            if delay > 0:
+                stats.delayed += 1
+                stats.max_delay = max(stats.max_delay, delay)
+        if delay >= 1:
+            logger.info("Waited %.1fs for the %s rate limit.", delay, category)
+        if self._on_acquire is not None:
+            self._on_acquire(category, delay)
+
+    def acquire(self, url: str, category: str = PAGE, account: str | None = None) -> float:
+        """Waits until a request may be sent.
+
+        Args:
+            url (str): URL of the request. Its host selects the host bucket.
+            category (str): Budget of the request, `PAGE` or `LOGIN`.
+            account (str | None): Account the request is sent as, if known.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        delay = self.store.reserve(self._buckets(url, category, account), self._clock())
+        if delay > 0:
+            self._sleep(delay)
+        self._record(category, delay)
+        return delay
+
+    async def acquire_async(self, url: str, category: str = PAGE, account: str | None = None) -> float:
+        """Waits until a request may be sent, without blocking the event loop. See `acquire`."""
+        delay = await asyncio.to_thread(self.store.reserve, self._buckets(url, category, account), self._clock())
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._record(category, delay)
+        return delay
+
+    def stats(self) -> dict[str, QueueStats]:
+        """Returns a copy of the queueing statistics of each budget used so far."""
+        with self._stats_lock:
+            return {category: QueueStats(**vars(stats)) for category, stats in self._stats.items()}
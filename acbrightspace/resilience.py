@@ -0,0 +1,254 @@
+from dataclasses import dataclass, field
+from enum import Enum
+import logging
+import random
+import threading
+import time
+from typing import Callable, TypeVar
+
+import urllib3
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+
+from acbrightspace.errors import AuthenticationError, CircuitOpenError, HttpStatusError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class ErrorKind(Enum):
+    """Category of an error, which decides whether an operation is retried."""
+
+    TIMEOUT = "timeout"
+    """A page or element took too long to load."""
+
+    STALE_ELEMENT = "stale element"
+    """The page changed while it was being read."""
+
+    SERVER_ERROR = "server error"
+    """Brightspace responded with an HTTP 5xx status."""
+
+    CONNECTION = "connection"
+    """The connection to Brightspace or the browser failed."""
+
+    AUTH = "auth"
+    """The session is not logged in or not allowed to see the page."""
+
+    UNKNOWN = "unknown"
+    """Anything else, such as a bug in parsing."""
+
+def classify(error: BaseException) -> ErrorKind:
+    """Returns the category of an error.
+
+    Args:
+        error (BaseException): The error to classify.
+
+    Returns:
+        ErrorKind: The category of the error.
+    """
+    if isinstance(error, AuthenticationError):
+        return ErrorKind.AUTH
+    if isinstance(error, HttpStatusError):
+        if error.status in (401, 403):
+            return ErrorKind.AUTH
+        if error.status >= 500 or error.status == 429:
+            return ErrorKind.SERVER_ERROR
+        return ErrorKind.UNKNOWN
+    if isinstance(error, (TimeoutException, TimeoutError, urllib3.exceptions.TimeoutError)):
+        return ErrorKind.TIMEOUT
+    if isinstance(error, StaleElementReferenceException):
+        return ErrorKind.STALE_ELEMENT
+    if isinstance(error, (ConnectionError, urllib3.exceptions.ProtocolError, urllib3.exceptions.NewConnectionError, urllib3.exceptions.MaxRetryError)):
+        return ErrorKind.CONNECTION
+    if isinstance(error, WebDriverException) and "net::ERR_" in (error.msg or ""):
+        return ErrorKind.CONNECTION
+    return ErrorKind.UNKNOWN
+
+TRANSIENT_ERRORS = frozenset({ErrorKind.TIMEOUT, ErrorKind.STALE_ELEMENT, ErrorKind.SERVER_ERROR, ErrorKind.CONNECTION})
+"""Error categories that are likely to go away if the operation is tried again."""
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how long to wait before retrying a failed operation."""
+
+    max_attempts: int = 3
+    """Maximum number of attempts, including the first one."""
+
+    base_delay: float = 0.5
+    """Delay before the first retry, in seconds."""
+
+    max_delay: float = 10.0
+    """Longest delay between attempts, in seconds."""
+
+    multiplier: float = 2.0
+    """Factor the delay grows by after each attempt."""
+
+    retry_on: frozenset[ErrorKind] = TRANSIENT_ERRORS
+    """Error categories that are retried."""
+
+    def delay(self, attempt: int, generator: random.Random | None = None) -> float:
+        """Returns how long to wait after a failed attempt, with full jitter.
+
+        Randomizing the whole delay keeps workers that failed at the same time
+        from retrying at the same time.
+
+        Args:
+            attempt (int): The number of the attempt that failed, starting at 1.
+            generator (random.Random | None): Random number generator to use.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return (generator or random).uniform(0, ceiling)
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    """Requests are allowed."""
+
+    OPEN = "open"
+    """Requests are refused until the reset timeout has passed."""
+
+    HALF_OPEN = "half open"
+    """One trial request is allowed to check whether Brightspace has recovered."""
+
+class CircuitBreaker:
+    """Stops sending requests to Brightspace for a while after repeated failures.
+
+    After `failure_threshold` consecutive transient failures the circuit opens and
+    every request fails immediately with `CircuitOpenError`. Once `reset_timeout`
+    seconds have passed, one trial request is let through: if it succeeds the circuit
+    closes again, otherwise it stays open for another `reset_timeout`.
+
+    The breaker is thread safe and is meant to be shared by all workers that talk
+    to the same Brightspace instance.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic) -> None:
+        """Creates a new circuit breaker.
+
+        Args:
+            failure_threshold (int): Number of consecutive failures that opens the circuit.
+            reset_timeout (float): Seconds to wait before letting a trial request through.
+            clock (Callable[[], float]): Monotonic clock, replaceable for testing.
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be at least 1, got: {failure_threshold}")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_progress = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Returns the current state of the circuit."""
+        with self._lock:
+            if self._state is CircuitState.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def before_call(self) -> bool:
+        """Checks whether a request may be sent.
+
+        Returns:
+            bool: Whether the request is the trial of a half-open circuit. Its outcome must
+                be recorded, or the trial ended with `end_trial`.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return False
+            remaining = self.reset_timeout - (self._clock() - self._opened_at)
+            if remaining > 0 or self._trial_in_progress:
+                raise CircuitOpenError(f"Brightspace requests are paused after {self._failures} consecutive failures; retry in {max(remaining, 0):.0f}s.")
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_progress = True
+            return True
+
+    def end_trial(self) -> None:
+        """Ends a trial request without an outcome, such as when it was interrupted, so another can be sent."""
+        with self._lock:
+            self._trial_in_progress = False
+
+    def record_success(self) -> None:
+        """Records a successful request, closing the circuit."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        """Records a failed request, opening the circuit if there were too many in a row."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_progress = False
+            if self._state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state is not CircuitState.OPEN:
+                    logger.warning("Opening circuit after %d consecutive failures.", self._failures)
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+
+@dataclass
+class Resilience:
+    """Retries transient failures with jittered exponential backoff, behind a circuit breaker."""
+
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    """When and how to retry."""
+
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    """Circuit breaker shared by every operation run with this policy."""
+
+    sleep: Callable[[float], None] = time.sleep
+    """Function used to wait between attempts, replaceable for testing."""
+
+    def call(self, operation: Callable[[], T], description: str = "operation") -> T:
+        """Runs an operation, retrying it on transient failures.
+
+        Args:
+            operation (Callable[[], T]): The operation to run. It must be safe to run again,
+                for example by navigating to its page from scratch.
+            description (str): Description of the operation for log messages.
+
+        Returns:
+            T: The result of the operation.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+            Exception: The last error of the operation, if it is not transient or no attempts are left.
+        """
+        attempt = 1
+        while True:
+            trial = self.breaker.before_call()
+            try:
+                result = operation()
+            except Exception as error:
+                kind = classify(error)
+                if kind in TRANSIENT_ERRORS:
+                    self.breaker.record_failure()
+                else:
+                    # Brightspace responded, so the error says nothing about an outage
+                    self.breaker.record_success()
+
+                if kind not in self.retry.retry_on or attempt >= self.retry.max_attempts:
+                    raise
+
+                delay = self.retry.delay(attempt)
+                logger.warning("Attempt %d of %s failed (%s), retrying in %.2fs.", attempt, description, kind.value, delay, exc_info=error)
+                self.sleep(delay)
+                attempt += 1
+            except BaseException:
+                # Interrupted, such as by KeyboardInterrupt, so a trial has no outcome and
+                # must not keep the circuit from ever trying again
+                if trial:
+                    self.breaker.end_trial()
+                raise
+            else:
+                self.breaker.record_success()
+                return result
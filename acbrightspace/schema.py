@@ -0,0 +1,212 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+import logging
+import re
+from typing import Callable
+
+from acbrightspace.errors import BrightspaceError
+from acbrightspace.fraction import Fraction
+
+logger = logging.getLogger(__name__)
+
+DATE_FORMAT = "%b %d, %Y %I:%M %p"
+"""Format of dates in Brightspace tables (e.g., "Jan 23, 2026 11:59 PM")."""
+
+DATE_LABELS = {
+    "Due on": "due",
+    "Available on": "starts",
+    "Available until": "ends",
+}
+"""Labels that introduce a date in a table cell, and the key the date is stored under."""
+
+_DATE_LINE = re.compile(r"^(" + "|".join(DATE_LABELS) + r") (\w{3} \d{1,2}, \d{4} \d{1,2}:\d{2} [AP]M)")
+
+class SchemaMismatchError(BrightspaceError):
+    """Exception for when a table's header does not match its schema, usually because Brightspace changed its layout."""
+
+@dataclass
+class DatedText:
+    """Text followed by labelled dates, like the name of a dropbox folder and its due and availability dates."""
+
+    text: str
+    """The first line of the cell."""
+
+    dates: dict[str, datetime] = field(default_factory=dict)
+    """Dates found in the other lines, keyed by the values of `DATE_LABELS`."""
+
+def _text(lines: list[str]) -> str | None:
+    return "\n".join(lines) or None
+
+def _status(lines: list[str]) -> str | None:
+    return " ".join(lines) or None
+
+def _fraction(lines: list[str]) -> Fraction | None:
+    if not lines or lines[0] == "- / -":
+        return None
+    try:
+        return Fraction.from_string(lines[0])
+    except ValueError:
+        logger.warning("Ignoring invalid fraction in table cell: %s", lines[0])
+        return None
+
+def _date(lines: list[str]) -> datetime | None:
+    if not lines:
+        return None
+    try:
+        return datetime.strptime(lines[0], DATE_FORMAT)
+    except ValueError:
+        logger.warning("Ignoring invalid date in table cell: %s", lines[0])
+        return None
+
+def _date_list(lines: list[str]) -> DatedText | None:
+    if not lines:
+        return None
+    dates = {}
+    for line in lines[1:]:
+        match = _DATE_LINE.match(line)
+        if match:
+            dates[DATE_LABELS[match.group(1)]] = datetime.strptime(match.group(2), DATE_FORMAT)
+    return DatedText(text=lines[0], dates=dates)
+
+class ColumnType(Enum):
+    """Type of the values in a table column, which decides how its cells are converted."""
+
+    TEXT = "text"
+    """Free text; lines are kept."""
+
+    FRACTION = "fraction"
+    """A `Fraction` such as "85 / 100"; "- / -" means no value."""
+
+    DATE = "date"
+    """A date such as "Jan 23, 2026 11:59 PM"."""
+
+    DATE_LIST = "date list"
+    """A `DatedText`: a title line followed by lines like "Due on Jan 23, 2026 11:59 PM"."""
+
+    STATUS = "status"
+    """A short status; lines are joined with spaces."""
+
+    def convert(self, lines: list[str]) -> "str | Fraction | datetime | DatedText | None":
+        """Converts the stripped, non-empty lines of a cell to a value of this type."""
+        return _CONVERTERS[self](lines)
+
+_CONVERTERS: dict[ColumnType, Callable[[list[str]], "str | Fraction | datetime | DatedText | None"]] = {
+    ColumnType.TEXT: _text,
+    ColumnType.FRACTION: _fraction,
+    ColumnType.DATE: _date,
+    ColumnType.DATE_LIST: _date_list,
+    ColumnType.STATUS: _status,
+}
+
+@dataclass(frozen=True)
+class Column:
+    """A column of a table schema."""
+
+    name: str
+    """Name the column's value is stored under in `Row.values`."""
+
+    headers: tuple[str, ...]
+    """Header texts that identify the column; matched case-insensitively by prefix."""
+
+    type: ColumnType
+    """Type of the column's values."""
+
+    required: bool = True
+    """Whether the table must have this column. Optional columns can be hidden by the instructor."""
+
+    def matches(self, header: str) -> bool:
+        """Returns whether a header text identifies this column."""
+        header = header.casefold()
+        return any(header.startswith(expected.casefold()) for expected in self.headers)
+
+@dataclass(frozen=True)
+class TableSchema:
+    """Declares the columns of a Brightspace table and the type of each one."""
+
+    name: str
+    """Name of the table, used in error messages."""
+
+    columns: tuple[Column, ...]
+    """The columns of the table."""
+
+    def bind(self, headers: list[str]) -> list[Column | None]:
+        """Matches the header row of a table against the schema.
+
+        Args:
+            headers (list[str]): The text of each header cell, in order.
+
+        Returns:
+            list[Column | None]: The column at each position, or None for columns not in the schema.
+
+        Raises:
+            SchemaMismatchError: If a required column is missing.
+        """
+        bound: list[Column | None] = []
+        for header in headers:
+            bound.append(next((column for column in self.columns if column.matches(header) and column not in bound), None))
+
+        missing = [column.headers[0] for column in self.columns if column.required and column not in bound]
+        if missing:
+            raise SchemaMismatchError(
+                f"The {self.name} table does not match its schema: missing {', '.join(repr(header) for header in missing)} "
+                f"column(s), found {headers}. Brightspace may have changed its layout."
+            )
+
+        for header, column in zip(headers, bound):
+            if column is None and header:
+                logger.debug("Ignoring unknown column %r in the %s table.", header, self.name)
+        return bound
+
+GRADES_SCHEMA = TableSchema(
+    name="grades",
+    columns=(
+        Column("name", ("Grade Item",), ColumnType.TEXT),
+        Column("points", ("Points",), ColumnType.FRACTION, required=False),
+        Column("weight", ("Weight Achieved",), ColumnType.FRACTION, required=False),
+        Column("grade", ("Grade",), ColumnType.TEXT, required=False),
+        Column("comments", ("Comments and Assessments", "Comments"), ColumnType.TEXT, required=False),
+    ),
+)
+"""Schema of the table on a course's grades page (`my_grades/main.d2l`)."""
+
+DROPBOX_SCHEMA = TableSchema(
+    name="dropbox",
+    columns=(
+        Column("folder", ("Assignment", "Folder"), ColumnType.DATE_LIST),
+        Column("completion_status", ("Completion Status",), ColumnType.STATUS),
+        Column("score", ("Score",), ColumnType.FRACTION, required=False),
+        Column("evaluation_status", ("Evaluation Status",), ColumnType.STATUS, required=False),
+    ),
+)
+"""Schema of the table on a course's assignments page (`folders_list.d2l`)."""
+
+QUIZZES_SCHEMA = TableSchema(
+    name="quizzes",
+    columns=(
+        Column("quiz", ("Current Quizzes", "Quiz"), ColumnType.DATE_LIST),
+        Column("evaluation_status", ("Evaluation Status",), ColumnType.STATUS, required=False),
+        Column("attempts", ("Attempts",), ColumnType.STATUS, required=False),
+    ),
+)
+"""Schema of the table on a course's quizzes page (`quizzes_list.d2l`)."""
+
+QUIZ_ATTEMPTS_SCHEMA = TableSchema(
+    name="quiz submissions",
+    columns=(
+        Column("attempt", ("Attempt",), ColumnType.TEXT),
+        Column("score", ("Score",), ColumnType.FRACTION, required=False),
+        Column("submitted", ("Submitted", "Date Submitted"), ColumnType.DATE, required=False),
+    ),
+)
+"""Schema of the table of a quiz's attempts (`quiz_submissions.d2l`)."""
+
+QUIZ_QUESTIONS_SCHEMA = TableSchema(
+    name="quiz attempt",
+    columns=(
+        Column("question", ("Question",), ColumnType.TEXT),
+        Column("points", ("Points", "Score"), ColumnType.FRACTION, required=False),
+        Column("feedback", ("Feedback",), ColumnType.TEXT, required=False),
+    ),
+)
+"""Schema of the table of an attempt's questions and their points (`quiz_submissions_attempt.d2l`)."""
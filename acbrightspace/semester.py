@@ -1,3 +1,5 @@
+from typing import Any
+
 TERMS = {
     "W": "Winter",
     "S": "Spring",
@@ -81,5 +83,51 @@ class Semester:
 
         return cls(year=year, term=term)
 
+    @classmethod
+    def parse(cls, value: "Semester | str") -> "Semester":
+        """Creates a Semester instance from its name (e.g., "2026 Winter") or code (e.g., "26W"), in any case.
+
+        Args:
+            value: Name or code of the semester. A Semester is returned as is.
+
+        Raises:
+            ValueError: If the value is not a valid semester name or code.
+        """
+        if isinstance(value, Semester):
+            return value
+        text = value.strip()
+        return cls.from_code(text.upper()) if len(text) == 3 else cls.from_name(text.title())
+
+    def __repr__(self) -> str:
+        return f"Semester(year={self.year!r}, term={self.term!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Semester):
+            return NotImplemented
+        return self.year == other.year and self.term == other.term
+
+    def __hash__(self) -> int:
+        return hash((self.year, self.term))
 
-        
\ No newline at end of file
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the semester as JSON compatible data.
+
+        Returns:
+            A dictionary that `from_dict` turns back into an equal semester.
+        """
+        return {"year": self.year, "term": self.term}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], version: int = 1) -> "Semester":
+        """Creates a Semester instance from the data returned by `to_dict`.
+
+        Args:
+            data: The data.
+            version: Version of the data format the data was written with.
+
+        Raises:
+            ValueError: If the version is not supported or the semester is not valid.
+        """
+        if version != 1:
+            raise ValueError(f"Unsupported Semester data version: {version}")
+        return cls(year=data["year"], term=data["term"])
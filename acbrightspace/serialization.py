@@ -0,0 +1,432 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import struct
+from typing import Any, Callable
+
+from acbrightspace.announcement import Announcement
+from acbrightspace.assignment import Assignment
+from acbrightspace.course import Course
+from acbrightspace.fraction import Fraction
+from acbrightspace.grade_item import GradeItem
+from acbrightspace.quiz import Quiz, QuizAttempt, QuizQuestion
+from acbrightspace.semester import TERMS, Semester
+
+MAGIC = b"ACBS"
+"""First bytes of every encoded value."""
+
+FORMAT_VERSION = 1
+"""Version of the binary layout and of the `to_dict` data of the models."""
+
+_NAIVE_DATETIME = 1
+"""MessagePack extension type of a naive datetime: microseconds since 1970-01-01 as a signed 64 bit integer."""
+
+_AWARE_DATETIME = 2
+"""MessagePack extension type of an aware datetime: UTC microseconds since the epoch and the UTC offset in seconds."""
+
+_EPOCH = datetime(1970, 1, 1)
+
+type Model = Course | Semester | GradeItem | Assignment | Announcement | Quiz | Fraction
+"""A value that can be serialized."""
+
+# MessagePack
+
+def _pack(value: Any, buffer: bytearray) -> None:
+    if value is None:
+        buffer.append(0xC0)
+    elif value is True:
+        buffer.append(0xC3)
+    elif value is False:
+        buffer.append(0xC2)
+    elif isinstance(value, int):
+        if 0 <= value < 0x80:
+            buffer.append(value)
+        elif -32 <= value < 0:
+            buffer.append(value & 0xFF)
+        elif 0 <= value <= 0xFF:
+            buffer += struct.pack(">BB", 0xCC, value)
+        elif 0 <= value <= 0xFFFF:
+            buffer += struct.pack(">BH", 0xCD, value)
+        elif 0 <= value <= 0xFFFFFFFF:
+            buffer += struct.pack(">BI", 0xCE, value)
+        elif 0 <= value <= 0xFFFFFFFFFFFFFFFF:
+            buffer += struct.pack(">BQ", 0xCF, value)
+        elif -0x80 <= value < 0:
+            buffer += struct.pack(">Bb", 0xD0, value)
+        elif -0x8000 <= value < 0:
+            buffer += struct.pack(">Bh", 0xD1, value)
+        elif -0x80000000 <= value < 0:
+            buffer += struct.pack(">Bi", 0xD2, value)
+        elif -0x8000000000000000 <= value < 0:
+            buffer += struct.pack(">Bq", 0xD3, value)
+        else:
+            raise OverflowError(f"Integer does not fit in 64 bits: {value}")
+    elif isinstance(value, float):
+        buffer += struct.pack(">Bd", 0xCB, value)
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        length = len(encoded)
+        if length < 32:
+            buffer.append(0xA0 | length)
+        elif length <= 0xFF:
+            buffer += struct.pack(">BB", 0xD9, length)
+        elif length <= 0xFFFF:
+            buffer += struct.pack(">BH", 0xDA, length)
+        else:
+            buffer += struct.pack(">BI", 0xDB, length)
+        buffer += encoded
+    elif isinstance(value, (bytes, bytearray)):
+        length = len(value)
+        if length <= 0xFF:
+            buffer += struct.pack(">BB", 0xC4, length)
+        elif length <= 0xFFFF:
+            buffer += struct.pack(">BH", 0xC5, length)
+        else:
+            buffer += struct.pack(">BI", 0xC6, length)
+        buffer += value
+    elif isinstance(value, (list, tuple)):
+        length = len(value)
+        if length < 16:
+            buffer.append(0x90 | length)
+        elif length <= 0xFFFF:
+            buffer += struct.pack(">BH", 0xDC, length)
+        else:
+            buffer += struct.pack(">BI", 0xDD, length)
+        for item in value:
+            _pack(item, buffer)
+    elif isinstance(value, dict):
+        length = len(value)
+        if length < 16:
+            buffer.append(0x80 | length)
+        elif length <= 0xFFFF:
+            buffer += struct.pack(">BH", 0xDE, length)
+        else:
+            buffer += struct.pack(">BI", 0xDF, length)
+        for key, item in value.items():
+            _pack(key, buffer)
+            _pack(item, buffer)
+    elif isinstance(value, datetime):
+        if value.tzinfo is None:
+            delta = value - _EPOCH
+            payload = struct.pack(">q", (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds)
+            buffer += struct.pack(">Bb", 0xD7, _NAIVE_DATETIME) + payload # fixext 8
+        else:
+            offset = value.utcoffset() or timedelta()
+            delta = value.astimezone(timezone.utc).replace(tzinfo=None) - _EPOCH
+            micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+            buffer += struct.pack(">BBb", 0xC7, 12, _AWARE_DATETIME) + struct.pack(">qi", micros, int(offset.total_seconds())) # ext 8
+    else:
+        raise TypeError(f"Cannot pack a value of type {type(value).__name__}")
+
+def pack(value: Any) -> bytes:
+    """Encodes a value in MessagePack.
+
+    Supports None, bool, int, float, str, bytes, lists, tuples, dicts and datetimes
+    (as extension types 1 and 2), so the output can be read by any MessagePack library.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        bytes: The encoded value.
+
+    Raises:
+        TypeError: If the value contains an unsupported type.
+    """
+    buffer = bytearray()
+    _pack(value, buffer)
+    return bytes(buffer)
+
+_STRUCTS = {format: struct.Struct(format) for format in (">B", ">H", ">I", ">Q", ">b", ">h", ">i", ">q", ">f", ">d")}
+
+class _Unpacker:
+    def __init__(self, data: bytes) -> None:
+        self.data = bytes(data)
+        self.position = 0
+
+    def _take(self, length: int) -> bytes:
+        end = self.position + length
+        if end > len(self.data):
+            raise ValueError("MessagePack data ends unexpectedly")
+        chunk = self.data[self.position:end]
+        self.position = end
+        return chunk
+
+    def _struct(self, format: str) -> Any:
+        packer = _STRUCTS[format]
+        if self.position + packer.size > len(self.data):
+            raise ValueError("MessagePack data ends unexpectedly")
+        value = packer.unpack_from(self.data, self.position)[0]
+        self.position += packer.size
+        return value
+
+    def _text(self, length: int) -> str:
+        return self._take(length).decode("utf-8")
+
+    def _array(self, length: int) -> list[Any]:
+        return [self.unpack() for _ in range(length)]
+
+    def _map(self, length: int) -> dict[Any, Any]:
+        result = {}
+        for _ in range(length):
+            key = self.unpack()
+            result[key] = self.unpack()
+        return result
+
+    def _ext(self, kind: int, payload: bytes) -> Any:
+        if kind == _NAIVE_DATETIME and len(payload) == 8:
+            return _EPOCH + timedelta(microseconds=struct.unpack(">q", payload)[0])
+        if kind == _AWARE_DATETIME and len(payload) == 12:
+            micros, offset = struct.unpack(">qi", payload)
+            utc = (_EPOCH + timedelta(microseconds=micros)).replace(tzinfo=timezone.utc)
+            return utc.astimezone(timezone(timedelta(seconds=offset)))
+        raise ValueError(f"Unsupported MessagePack extension type {kind}")
+
+    def unpack(self) -> Any:
+        if self.position >= len(self.data):
+            raise ValueError("MessagePack data ends unexpectedly")
+        tag = self.data[self.position]
+        self.position += 1
+        if tag < 0x80:
+            return tag
+        if tag >= 0xE0:
+            return tag - 0x100
+        if tag & 0xE0 == 0xA0:
+            return self._text(tag & 0x1F)
+        if tag & 0xF0 == 0x90:
+            return self._array(tag & 0x0F)
+        if tag & 0xF0 == 0x80:
+            return self._map(tag & 0x0F)
+        match tag:
+            case 0xC0:
+                return None
+            case 0xC2:
+                return False
+            case 0xC3:
+                return True
+            case 0xCC | 0xCD | 0xCE | 0xCF:
+                return self._struct(">" + "BHIQ"[tag - 0xCC])
+            case 0xD0 | 0xD1 | 0xD2 | 0xD3:
+                return self._struct(">" + "bhiq"[tag - 0xD0])
+            case 0xCA:
+                return self._struct(">f")
+            case 0xCB:
+                return self._struct(">d")
+            case 0xD9 | 0xDA | 0xDB:
+                return self._text(self._struct(">" + "BHI"[tag - 0xD9]))
+            case 0xC4 | 0xC5 | 0xC6:
+                return self._take(self._struct(">" + "BHI"[tag - 0xC4]))
+            case 0xDC | 0xDD:
+                return self._array(self._struct(">" + "HI"[tag - 0xDC]))
+            case 0xDE | 0xDF:
+                return self._map(self._struct(">" + "HI"[tag - 0xDE]))
+            case 0xD4 | 0xD5 | 0xD6 | 0xD7 | 0xD8:
+                kind = self._struct(">b")
+                return self._ext(kind, self._take(1 << (tag - 0xD4)))
+            case 0xC7 | 0xC8 | 0xC9:
+                length = self._struct(">" + "BHI"[tag - 0xC7])
+                kind = self._struct(">b")
+                return self._ext(kind, self._take(length))
+        raise ValueError(f"Invalid MessagePack type byte 0x{tag:02x}")
+
+def unpack(data: bytes) -> Any:
+    """Decodes a value encoded by `pack`.
+
+    Args:
+        data (bytes): The encoded value.
+
+    Returns:
+        Any: The value.
+
+    Raises:
+        ValueError: If the data is not valid MessagePack or has trailing bytes.
+    """
+    unpacker = _Unpacker(data)
+    value = unpacker.unpack()
+    if unpacker.position != len(data):
+        raise ValueError(f"{len(data) - unpacker.position} unexpected bytes after the MessagePack value")
+    return value
+
+# Models as compact rows: fields by position instead of by name
+
+def _number(value: float) -> float | int:
+    # Whole numbers take 1 to 3 bytes as integers instead of 9 as floats
+    return int(value) if value.is_integer() and abs(value) < 2**53 else value
+
+def _fraction_row(fraction: Fraction | None) -> list[float | int] | None:
+    return [_number(fraction.numerator), _number(fraction.denominator)] if fraction is not None else None
+
+def _fraction_from_row(row: list[float | int] | None) -> Fraction | None:
+    return Fraction(float(row[0]), float(row[1])) if row is not None else None
+
+_TERM_CODES = {term: code for code, term in TERMS.items()}
+
+def _semester_row(semester: Semester) -> list[Any]:
+    return [semester.year, _TERM_CODES[semester.term]]
+
+def _semester_from_row(row: list[Any]) -> Semester:
+    return Semester(year=row[0], term=TERMS[row[1]])
+
+def _attempt_row(attempt: QuizAttempt) -> list[Any]:
+    questions = [[question.name, _fraction_row(question.points), question.feedback] for question in attempt.questions]
+    return [attempt.number, _fraction_row(attempt.score), attempt.submitted_at, questions]
+
+def _attempt_from_row(row: list[Any]) -> QuizAttempt:
+    questions = [QuizQuestion(name=name, points=_fraction_from_row(points), feedback=feedback) for name, points, feedback in row[3]]
+    return QuizAttempt(number=row[0], score=_fraction_from_row(row[1]), submitted_at=row[2], questions=questions)
+
+@dataclass(frozen=True)
+class _Codec:
+    """How one model type is turned into a row and back."""
+
+    name: str
+    to_row: Callable[[Any], list[Any]]
+    from_row: Callable[[list[Any]], Any]
+
+_CODECS: dict[type, _Codec] = {
+    Fraction: _Codec("Fraction", _fraction_row, _fraction_from_row),
+    Semester: _Codec("Semester", _semester_row, _semester_from_row),
+    Course: _Codec(
+        "Course",
+        lambda course: [course.full_code, course.full_name, course.name, _semester_row(course.semester), course.ends_at, course.is_active, course.org_unit_id],
+        lambda row: Course(full_code=row[0], full_name=row[1], name=row[2], semester=_semester_from_row(row[3]), ends_at=row[4], is_active=row[5], org_unit_id=row[6]),
+    ),
+    GradeItem: _Codec(
+        "GradeItem",
+        lambda grade: [grade.name, _fraction_row(grade.points), _fraction_row(grade.weight), grade.comments],
+        lambda row: GradeItem(name=row[0], points=_fraction_from_row(row[1]), weight=_fraction_from_row(row[2]), comments=row[3]),
+    ),
+    Assignment: _Codec(
+        "Assignment",
+        lambda assignment: [
+            assignment.name, assignment.starts_at, assignment.ends_at, assignment.due_at,
+            _fraction_row(assignment.score), assignment.completion_status, assignment.evaluation_status, assignment.folder_id,
+        ],
+        lambda row: Assignment(
+            name=row[0], starts_at=row[1], ends_at=row[2], due_at=row[3],
+            score=_fraction_from_row(row[4]), completion_status=row[5], evaluation_status=row[6],
+            # Rows written before folder IDs were read have 7 fields
+            folder_id=row[7] if len(row) > 7 else None,
+        ),
+    ),
+    Announcement: _Codec(
+        "Announcement",
+        lambda announcement: [
+            announcement.id, announcement.org_unit_id, announcement.title, announcement.body,
+            announcement.published_at, announcement.updated_at,
+        ],
+        lambda row: Announcement(id=row[0], org_unit_id=row[1], title=row[2], body=row[3], published_at=row[4], updated_at=row[5]),
+    ),
+    Quiz: _Codec(
+        "Quiz",
+        lambda quiz: [
+            quiz.id, quiz.name, quiz.starts_at, quiz.ends_at, quiz.due_at, quiz.evaluation_status,
+            [_attempt_row(attempt) for attempt in quiz.attempts],
+        ],
+        lambda row: Quiz(
+            id=row[0], name=row[1], starts_at=row[2], ends_at=row[3], due_at=row[4], evaluation_status=row[5],
+            attempts=[_attempt_from_row(attempt) for attempt in row[6]],
+        ),
+    ),
+}
+
+_CODECS_BY_NAME = {codec.name: (model, codec) for model, codec in _CODECS.items()}
+
+def _codec(value: Model | list[Model]) -> tuple[_Codec, bool]:
+    """Returns the codec of a model or a list of models, and whether it is a list."""
+    is_list = isinstance(value, list)
+    items = value if is_list else [value]
+    if not items:
+        raise ValueError("Cannot tell the type of an empty list; encode a model or a non-empty list of models.")
+    codec = _CODECS.get(type(items[0]))
+    if codec is None:
+        raise TypeError(f"Cannot serialize a value of type {type(items[0]).__name__}")
+    if any(type(item) is not type(items[0]) for item in items):
+        raise TypeError("Every item of a list must have the same type.")
+    return codec, is_list
+
+def encode(value: Model | list[Model]) -> bytes:
+    """Encodes a model, or a list of models of one type, in a compact binary format.
+
+    The format is MessagePack after a 5 byte header. Each model is an array of its
+    fields in declaration order, so field names are not repeated for every item.
+
+    Example:
+        >>> data = encode(brightspace.get_grades("683274"))
+        >>> grades = decode(data)
+
+    Args:
+        value (Model | list[Model]): A `Course`, `Semester`, `GradeItem`, `Assignment`,
+            `Announcement`, `Quiz` or `Fraction`, or a non-empty list of one of them.
+
+    Returns:
+        bytes: The encoded value.
+
+    Raises:
+        TypeError: If the value is not a model or a list of models of one type.
+        ValueError: If the value is an empty list.
+    """
+    codec, is_list = _codec(value)
+    payload = [codec.to_row(item) for item in value] if is_list else codec.to_row(value)
+    buffer = bytearray(MAGIC)
+    buffer.append(FORMAT_VERSION)
+    _pack([codec.name, is_list, payload], buffer)
+    return bytes(buffer)
+
+def decode(data: bytes) -> Model | list[Model]:
+    """Decodes a value encoded by `encode`.
+
+    Args:
+        data (bytes): The encoded value.
+
+    Returns:
+        Model | list[Model]: The model, or list of models.
+
+    Raises:
+        ValueError: If the data was not written by `encode` or has an unsupported version.
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Data was not encoded by acbrightspace.serialization.")
+    version = data[len(MAGIC)] if len(data) > len(MAGIC) else None
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported serialization format version: {version}")
+    try:
+        name, is_list, payload = unpack(data[len(MAGIC) + 1:])
+        _, codec = _CODECS_BY_NAME[name]
+        return [codec.from_row(row) for row in payload] if is_list else codec.from_row(payload)
+    except (KeyError, IndexError, TypeError) as error:
+        raise ValueError(f"Encoded data is damaged: {error!r}") from error
+
+def to_dict(value: Model | list[Model]) -> dict[str, Any]:
+    """Wraps the `to_dict` data of a model, or a list of models of one type, with its type and version.
+
+    Args:
+        value (Model | list[Model]): The model, or a non-empty list of models.
+
+    Returns:
+        dict[str, Any]: JSON compatible data that `from_dict` turns back into the value.
+    """
+    codec, is_list = _codec(value)
+    data = [item.to_dict() for item in value] if is_list else value.to_dict()
+    return {"version": FORMAT_VERSION, "type": codec.name, "data": data}
+
+def from_dict(envelope: dict[str, Any]) -> Model | list[Model]:
+    """Reads data written by `to_dict`, upgrading it from older versions.
+
+    Args:
+        envelope (dict[str, Any]): The data.
+
+    Returns:
+        Model | list[Model]: The model, or list of models.
+
+    Raises:
+        ValueError: If the type or version is not supported.
+    """
+    entry = _CODECS_BY_NAME.get(envelope.get("type"))
+    if entry is None:
+        raise ValueError(f"Unsupported serialized type: {envelope.get('type')}")
+    model, _ = entry
+    version = envelope.get("version")
+    data = envelope["data"]
+    if isinstance(data, list):
+        return [model.from_dict(item, version) for item in data]
+    return model.from_dict(data, version)
@@ -0,0 +1,120 @@
+import json
+from typing import Any
+from urllib.parse import urljoin
+
+import urllib3
+
+from acbrightspace.errors import HttpStatusError
+from acbrightspace.ratelimit import PAGE, RateLimiter
+
+BASE_URL = "https://brightspace.algonquincollege.com"
+"""Root URL of the Algonquin College Brightspace website."""
+
+class HttpSession:
+    """Pooled HTTP client that reuses the cookies of an authenticated browser session.
+
+    Pages and files that do not need JavaScript can be fetched much faster over plain
+    HTTP than through the browser, as long as the session cookies from `login` are sent.
+    """
+
+    def __init__(self, cookies: dict[str, str] | None = None, base_url: str = BASE_URL, max_connections: int = 8, timeout: float = 30.0, rate_limiter: RateLimiter | None = None, account: str | None = None) -> None:
+        """Creates a new HTTP session.
+
+        Args:
+            cookies (dict[str, str] | None): Cookies to send with every request.
+            base_url (str): URL that relative paths are resolved against.
+            max_connections (int): Maximum number of pooled connections per host.
+            timeout (float): Connect and read timeout in seconds.
+            rate_limiter (RateLimiter | None): Limits how fast requests are sent.
+            account (str | None): Account the cookies belong to, for the rate limiter's per account budget.
+        """
+        self.base_url = base_url
+        self.cookies = dict(cookies or {})
+        self.max_connections = max_connections
+        self.rate_limiter = rate_limiter
+        self.account = account
+        self._pool = urllib3.PoolManager(
+            maxsize=max_connections,
+            block=True, # Wait for a free connection instead of opening extra ones
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            retries=urllib3.Retry(connect=3, read=0, redirect=5),
+        )
+
+    @classmethod
+    def from_driver(cls, driver: Any, **kwargs: Any) -> "HttpSession":
+        """Creates an HTTP session that shares the cookies of a WebDriver.
+
+        Args:
+            driver (Any): The authenticated WebDriver to copy cookies from.
+            **kwargs: Extra arguments passed to the constructor.
+
+        Returns:
+            HttpSession: The new session.
+        """
+        cookies = {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+        return cls(cookies=cookies, **kwargs)
+
+    def url(self, path: str) -> str:
+        """Resolves a path against the base URL.
+
+        Args:
+            path (str): Absolute URL or path relative to the base URL.
+
+        Returns:
+            str: The absolute URL.
+        """
+        return urljoin(self.base_url + "/", path)
+
+    def request(self, method: str, path: str, headers: dict[str, str] | None = None, body: Any = None, preload_content: bool = True, **kwargs: Any) -> urllib3.BaseHTTPResponse:
+        """Sends a request with the session cookies.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Absolute URL or path relative to the base URL.
+            headers (dict[str, str] | None): Extra request headers.
+            body (Any): Request body.
+            preload_content (bool): Whether to read the whole body before returning.
+                Pass False to stream the body with `response.stream()`; the caller must then
+                call `response.release_conn()` when done.
+            **kwargs: Extra arguments passed to `urllib3.PoolManager.request`.
+
+        Returns:
+            urllib3.BaseHTTPResponse: The response.
+        """
+        request_headers = {}
+        if self.cookies:
+            request_headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in self.cookies.items())
+        request_headers.update(headers or {})
+
+        url = self.url(path)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url, PAGE, self.account)
+        return self._pool.request(
+            method,
+            url,
+            headers=request_headers,
+            body=body,
+            preload_content=preload_content,
+            **kwargs,
+        )
+
+    def get_json(self, path: str) -> Any:
+        """Fetches and decodes a JSON document.
+
+        Args:
+            path (str): Absolute URL or path relative to the base URL.
+
+        Returns:
+            Any: The decoded JSON document.
+
+        Raises:
+            HttpStatusError: If the server does not respond with 200 OK.
+        """
+        response = self.request("GET", path, headers={"Accept": "application/json"})
+        if response.status != 200:
+            raise HttpStatusError(f"GET {path} failed with status {response.status}", response.status)
+        return json.loads(response.data)
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        self._pool.clear()
@@ -1,12 +1,69 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
-from typing import List
+from typing import Any, Iterable, Iterator, List
 
 from acbrightspace.fraction import Fraction
+from acbrightspace.html import HtmlElement
+from acbrightspace.schema import Column, DatedText, TableSchema
+
+logger = logging.getLogger(__name__)
+
+type Cell = str | List[str] | Fraction | datetime | DatedText | None
+"""A cell can be a string, a list of strings, a Fraction, a datetime, a DatedText, or None."""
+
+SNAPSHOT_SCRIPT = """
+return Array.from(arguments[0].querySelectorAll("tr"), row => Array.from(row.querySelectorAll("td, th"), cell => [
+    cell.tagName.toLowerCase(),
+    cell.innerText,
+    cell.getAttribute("scope"),
+    cell.getAttribute("colspan"),
+    Array.from(cell.querySelectorAll("a[href]"), link => link.href),
+]));
+"""
+"""Returns the tag, text, scope, colspan and link targets of every cell of a table, row by row."""
+
+def snapshot_table(driver: Any, table: Any) -> HtmlElement | None:
+    """Copies a table out of the browser with a single script call.
+
+    Reading a table element by element costs a round trip to the browser for every
+    row, cell and attribute. The copy is a static `HtmlElement` with the rows, cells,
+    their text and their links, so `Table` parses it without further round trips.
+
+    Args:
+        driver (Any): The WebDriver showing the table.
+        table (Any): The table element.
+
+    Returns:
+        HtmlElement | None: The copy, or None if the driver cannot run scripts.
+    """
+    try:
+        rows = driver.execute_script(SNAPSHOT_SCRIPT, table)
+    except WebDriverException as error:
+        logger.debug("Could not copy the table in one script call, reading it element by element: %s", error)
+        return None
+    if not isinstance(rows, list):
+        return None
 
-type Cell = str | List[str] | Fraction | None
-"""A cell can be a string, a list of strings, a Fraction, or None."""
+    copy = HtmlElement("table")
+    for cells in rows:
+        row = HtmlElement("tr", parent=copy)
+        copy.children.append(row)
+        for tag, text, scope, colspan, links in cells:
+            attributes = {name: value for name, value in (("scope", scope), ("colspan", colspan)) if value is not None}
+            cell = HtmlElement(tag, attributes, parent=row)
+            row.children.append(cell)
+            # One block per line, since the text of an element is rendered from its children
+            for line in (text or "").splitlines():
+                block = HtmlElement("div", parent=cell)
+                block.children.append(line)
+                cell.children.append(block)
+            for href in links:
+                cell.children.append(HtmlElement("a", {"href": href}, parent=cell))
+    return copy
 
 @dataclass
 class Row:
@@ -15,26 +72,58 @@ class Row:
     cells: List[Cell]
     """List of cells in the row."""
 
-    element: WebElement
-    """The original WebElement representing the row."""
+    element: WebElement | HtmlElement
+    """The original WebElement representing the row, or its static copy."""
+
+    values: dict[str, Cell] = field(default_factory=dict)
+    """Cells by column name, when the table was parsed with a schema."""
+
+@dataclass
+class TableState:
+    """What the rows parsed so far tell about the rest of a table.
+
+    A parse carries it from row to row and from page to page. It belongs to a single
+    parse, so several tables can be parsed at once with the same `Table`.
+    """
+
+    columns: list[Column | None] | None = None
+    """The schema column at each position, once the header row was checked."""
+
+    category: str | None = None
+    """The category of the last category header row, if any."""
 
 class Table:
-    """A class for parsing Brightspace tables."""
+    """A class for parsing Brightspace tables.
+
+    Without a schema, every cell is guessed: fractions become Fractions, single lines
+    become strings and multiple lines become lists of strings. With a schema, the header
+    row is checked against it once, and each cell is converted by its column's type.
+
+    A table only holds its schema. Everything learned while parsing is kept in a
+    `TableState` of that parse, so one instance can be shared between threads.
+    """
 
-    def __init__(self) -> None:
-        self._category: str | None = None
-    
-    def parse_cell(self, cell: WebElement) -> Cell:
+    def __init__(self, schema: TableSchema | None = None) -> None:
+        self.schema = schema
+
+    def parse_cell(self, cell: WebElement, column: Column | None = None) -> Cell:
         """Parses a table cell into a Cell type.
 
         Args:
             cell (WebElement): The WebElement representing the table cell.
-        
+            column (Column | None): The schema column of the cell, if known.
+
         Returns:
             Cell: The parsed cell content.
         """
+        # Read the text once, since every access to a WebElement's text is a round trip to the browser
+        text = cell.text
+
         # Split cell text into lines and strip whitespace
-        cell_texts = [line.strip() for line in cell.text.splitlines() if line.strip()]
+        cell_texts = [line.strip() for line in text.splitlines() if line.strip()]
+
+        if column is not None:
+            return column.type.convert(cell_texts)
 
         # If cell is empty, return None
         if not cell_texts:
@@ -42,62 +131,120 @@ class Table:
 
         # Attempt to parse as Fraction
         try:
-            return Fraction.from_string(cell.text)
+            return Fraction.from_string(text)
         except ValueError:
             pass
-        
+
         # Return single string if only one line
         if len(cell_texts) == 1:
             # If the string is "- / -", return None
             if cell_texts[0] == "- / -":
                 return None
             return cell_texts[0]
-        
+
         # Otherwise, return list of strings
         return cell_texts
-    
-    def parse_row(self, row: WebElement) -> Row | None:
+
+    def parse_header(self, row: WebElement) -> list[Column | None]:
+        """Checks a table's header row against the schema.
+
+        Args:
+            row (WebElement): The WebElement representing the header row.
+
+        Returns:
+            list[Column | None]: The schema column at each position.
+
+        Raises:
+            SchemaMismatchError: If the header does not match the schema.
+        """
+        if self.schema is None:
+            raise ValueError("Cannot check the header of a table without a schema.")
+        headers = [cell.text.strip() for cell in row.find_elements(By.XPATH, ".//td | .//th")]
+
+        # Drop the empty header above the category column
+        if headers and not headers[0]:
+            headers = headers[1:]
+
+        return self.schema.bind(headers)
+
+    def parse_row(self, row: WebElement, state: TableState | None = None) -> Row | None:
         """Parses a table row into a list of Cells.
 
         Args:
             row (WebElement): The WebElement representing the table row.
-        
+            state (TableState | None): State of the parse the row belongs to. A category
+                header row updates its category.
+
         Returns:
             List[Cell] | None: A list of parsed cells in the row, or None if the row is a category header.
         """
+        state = state if state is not None else TableState()
         cells = row.find_elements(By.XPATH, ".//td | .//th")
 
         # Check if first cell is a category header
-        if cells and cells[0].get_attribute("scope") == "row"  and cells[0].get_attribute("colspan") == "2":        
-            self._category = cells[0].text.strip()
-        else:            
+        if cells and cells[0].get_attribute("scope") == "row"  and cells[0].get_attribute("colspan") == "2":
+            state.category = cells[0].text.strip()
+        else:
             parsed_cells: List[Cell] = []
+            values: dict[str, Cell] = {}
+            columns = state.columns
 
             # Skip first cell if it's a category header, because it's a white space cell
-            if self._category is not None:
+            if state.category is not None:
                 cells = cells[1:]
-            for cell in cells:
-                parsed_cells.append(self.parse_cell(cell))
-
-            return Row(parsed_cells, row)
+            for index, cell in enumerate(cells):
+                column = columns[index] if columns is not None and index < len(columns) else None
+                parsed_cell = self.parse_cell(cell, column)
+                parsed_cells.append(parsed_cell)
+                if column is not None:
+                    values[column.name] = parsed_cell
+
+            return Row(parsed_cells, row, values)
         return None
 
-    def parse(self, table: WebElement) -> List[Row]:
+    def parse(self, table: WebElement, state: TableState | None = None) -> List[Row]:
         """Parses an entire table into a list of rows and cells.
 
         Args:
             table (WebElement): The WebElement representing the table.
+            state (TableState | None): State of a parse to continue, such as one of an earlier
+                page of the same table. A new parse starts if not given.
 
         Returns:
             List[Row]: A list of Row objects representing the parsed rows.
+
+        Raises:
+            SchemaMismatchError: If the table has a schema and its header does not match it.
         """
-    
+
+        state = state if state is not None else TableState()
         rows = table.find_elements(By.TAG_NAME, "tr")
         parsed_rows = []
+
+        # Check the header against the schema, once for all pages of the table
+        if rows and self.schema is not None and state.columns is None:
+            state.columns = self.parse_header(rows[0])
+
         # Skip header row
-        for row in rows[1:]:  
-            parsed_row = self.parse_row(row)
+        for row in rows[1:]:
+            parsed_row = self.parse_row(row, state)
             if parsed_row:  # Only add non-empty rows
                 parsed_rows.append(parsed_row)
 
-        return parsed_rows
\ No newline at end of file
+        return parsed_rows
+
+    def parse_pages(self, tables: Iterable[WebElement]) -> Iterator[Row]:
+        """Parses the pages of a paged table into a single stream of rows.
+
+        The category of the last category header on a page carries over to the
+        rows at the start of the next page.
+
+        Args:
+            tables (Iterable[WebElement]): The table element of each page, in page order.
+
+        Yields:
+            Row: The parsed rows of every page.
+        """
+        state = TableState()
+        for table in tables:
+            yield from self.parse(table, state)
@@ -0,0 +1,61 @@
+"""Compares the binary encoding of `acbrightspace.serialization` with JSON and pickle.
+
+Run from the repository root:
+
+    python benchmarks/serialization.py [--courses N] [--repeat N]
+
+For each model type it prints the encoded size and the encode and decode
+throughput, in items per second, of every format.
+"""
+import argparse
+import json
+import pickle
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from acbrightspace.mock_server import Dataset
+from acbrightspace.serialization import decode, encode, from_dict, to_dict
+
+FORMATS: dict[str, tuple[Callable[[list[Any]], bytes], Callable[[bytes], Any]]] = {
+    "binary": (encode, decode),
+    "json": (lambda models: json.dumps(to_dict(models)).encode("utf-8"), lambda data: from_dict(json.loads(data))),
+    "pickle": (lambda models: pickle.dumps(models, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+}
+"""Encoder and decoder of each format, for a list of models."""
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    """Returns the fastest time of one call in seconds."""
+    timer = timeit.Timer(function)
+    loops, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=loops)) / loops
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--courses", type=int, default=20, help="number of courses in the generated dataset")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timing runs; the fastest is reported")
+    args = parser.parse_args()
+
+    dataset = Dataset.generate(seed=1, course_count=args.courses)
+    samples = {
+        "Course": [mock.course for mock in dataset.courses],
+        "GradeItem": [grade for mock in dataset.courses for _, grade in mock.grades],
+        "Assignment": [assignment for mock in dataset.courses for _, assignment in mock.assignments],
+    }
+
+    print(f"{'model':<11} {'items':>6} {'format':<7} {'bytes':>9} {'bytes/item':>10} {'encode/s':>11} {'decode/s':>11}")
+    for name, models in samples.items():
+        for format_name, (encoder, decoder) in FORMATS.items():
+            data = encoder(models)
+            encode_seconds = measure(lambda: encoder(models), args.repeat)
+            decode_seconds = measure(lambda: decoder(data), args.repeat)
+            print(
+                f"{name:<11} {len(models):>6} {format_name:<7} {len(data):>9} {len(data) / len(models):>10.1f}"
+                f" {len(models) / encode_seconds:>11,.0f} {len(models) / decode_seconds:>11,.0f}"
+            )
+
+if __name__ == "__main__":
+    main()
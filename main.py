@@ -1,20 +1,6 @@
-import os
-from acbrightspace.brightspace import Brightspace
-import logging
-from dotenv import load_dotenv
+import sys
 
-logging.basicConfig(level=logging.INFO)
-load_dotenv()
+from acbrightspace.cli import main
 
-def main():
-    brightspace = Brightspace()
-    brightspace.login(
-        username=os.environ["BRIGHTSPACE_USERNAME"],
-        password=os.environ["BRIGHTSPACE_PASSWORD"],
-        totp_secret=os.environ["BRIGHTSPACE_TOTP_SECRET"]
-    )
-    #brightspace.get_courses()
-    print(brightspace.get_grades("683274"))
-    
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,30 @@
+import pytest
+
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.drivers import HttpDriver
+from acbrightspace.mock_server import Dataset, MockBrightspaceServer
+from acbrightspace.resilience import Resilience, RetryPolicy
+from acbrightspace.session import HttpSession
+
+@pytest.fixture
+def mock_dataset():
+    """The dataset served by `mock_server`. Test modules override it to serve their own."""
+    return Dataset.generate(seed=1, course_count=5, grade_count=45, assignment_count=230)
+
+@pytest.fixture
+def mock_server(mock_dataset):
+    """Runs a mock Brightspace server that requires logging in."""
+    with MockBrightspaceServer(mock_dataset, require_login=True) as server:
+        yield server
+
+@pytest.fixture
+def http_client(mock_server):
+    """Returns a function that creates clients of `mock_server` over HTTP, logged in unless given other cookies."""
+    def create(cookies=None):
+        session = HttpSession(mock_server.session_cookies if cookies is None else cookies, base_url=mock_server.base_url)
+        return Brightspace(
+            base_url=mock_server.base_url,
+            resilience=Resilience(retry=RetryPolicy(base_delay=0)),
+            driver=HttpDriver(session),
+        )
+    return create
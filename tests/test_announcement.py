@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta, timezone
+import json
+
+import pytest
+
+from acbrightspace.announcement import Announcement, AnnouncementFeed, fetch_announcements, format_since
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.cli import ANNOUNCEMENTS_NAME, COOKIES_NAME, main
+from acbrightspace.drivers import ReplayDriver
+from acbrightspace.errors import BrightspaceError
+from acbrightspace.mock_server import Dataset
+from acbrightspace.serialization import decode, encode
+
+@pytest.fixture
+def mock_dataset():
+    return Dataset.generate(seed=4, course_count=3, grade_count=4, assignment_count=4, announcement_count=5)
+
+def news_requests(server):
+    return [path for path in server.requests if "/news/" in path]
+
+def post(server, index, title, minutes=5):
+    """Adds an announcement to a course, published a few minutes after its newest one."""
+    mock = server.dataset.courses[index]
+    announcement = Announcement(
+        id=mock.course.org_unit_id * 100 + 99,
+        org_unit_id=mock.course.org_unit_id,
+        title=title,
+        body="New.",
+        published_at=mock.announcements[0].published_at + timedelta(minutes=minutes),
+        updated_at=None,
+    )
+    mock.announcements.insert(0, announcement)
+    return announcement
+
+class FixedSession:
+    """Session double that answers every request with the same news items, ignoring `since`."""
+
+    def __init__(self, items):
+        self.items = items
+        self.paths = []
+
+    def get_json(self, path):
+        self.paths.append(path)
+        return self.items
+
+def news_item(id, start_date, hidden=False):
+    return {"Id": id, "Title": f"News {id}", "Body": {"Text": "Text", "Html": "<p>Text</p>"}, "IsHidden": hidden, "StartDate": start_date, "LastModifiedDate": None}
+
+def test_get_announcements(mock_server, http_client):
+    mock = mock_server.dataset.courses[0]
+    assert http_client().get_announcements(mock.course.org_unit_id) == mock.announcements
+
+def test_get_announcements_since(mock_server, http_client):
+    mock = mock_server.dataset.courses[1]
+    since = mock.announcements[2].published_at
+
+    announcements = http_client().get_announcements(mock.course.org_unit_id, since=since)
+
+    assert announcements == mock.announcements[:2]
+    assert news_requests(mock_server) == [f"/d2l/api/le/1.74/{mock.course.org_unit_id}/news/?since={format_since(since).replace(':', '%3A')}"]
+
+def test_reading_stops_at_seen_announcements():
+    session = FixedSession([
+        news_item(1, "2026-01-05T10:00:00.000Z"),
+        news_item(3, "2026-01-20T10:00:00.000Z"),
+        news_item(2, "2026-01-12T10:00:00.000Z"),
+        news_item(4, "2026-01-25T10:00:00.000Z", hidden=True),
+    ])
+
+    assert [item.id for item in fetch_announcements(session, 7)] == [3, 2, 1]
+    assert [item.id for item in fetch_announcements(session, 7, since=datetime(2026, 1, 12, 10, tzinfo=timezone.utc))] == [3]
+    assert session.paths[-1].endswith("?since=2026-01-12T10%3A00%3A00.000Z")
+
+def test_naive_since_is_local_time():
+    since = datetime(2026, 1, 12, 9, 30)
+    assert format_since(since) == since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+def test_feed_only_returns_new_announcements(mock_server, http_client):
+    brightspace = http_client()
+    org_unit_ids = [mock.course.org_unit_id for mock in mock_server.dataset.courses]
+    feed = AnnouncementFeed()
+
+    first = feed.poll(brightspace.get_announcements, org_unit_ids)
+    assert len(first) == 15
+    assert first == sorted(first, key=lambda announcement: announcement.published_at, reverse=True)
+
+    mock_server.requests.clear()
+    assert feed.poll(brightspace.get_announcements, org_unit_ids) == []
+    # One request per course, each asking only for newer announcements
+    assert len(news_requests(mock_server)) == 3
+    assert all("since=" in path for path in news_requests(mock_server))
+
+    new = post(mock_server, 2, "Lab moved to room B")
+    assert feed.poll(brightspace.get_announcements, org_unit_ids) == [new]
+    assert feed.since(new.org_unit_id) == new.published_at
+
+def test_feed_cursors_round_trip():
+    feed = AnnouncementFeed({5: datetime(2026, 1, 12, 9, 30, tzinfo=timezone.utc)})
+    restored = AnnouncementFeed.from_dict(json.loads(json.dumps(feed.to_dict())))
+    assert restored.cursors == feed.cursors
+    with pytest.raises(ValueError, match="version"):
+        AnnouncementFeed.from_dict({"version": 99, "cursors": {}})
+
+def test_announcements_serialize(mock_server):
+    announcements = mock_server.dataset.courses[0].announcements
+    assert decode(encode(announcements)) == announcements
+    assert [Announcement.from_dict(announcement.to_dict()) for announcement in announcements] == announcements
+
+def test_replayed_pages_have_no_announcements(tmp_path):
+    brightspace = Brightspace(driver=ReplayDriver(tmp_path))
+    with pytest.raises(BrightspaceError):
+        brightspace.get_announcements(1)
+
+def test_cli_lists_new_announcements(mock_server, tmp_path, capsys):
+    (tmp_path / COOKIES_NAME).write_text(json.dumps(mock_server.session_cookies))
+    args = ["announcements", "--new", "--backend", "http", "--base-url", mock_server.base_url, "--cache-dir", str(tmp_path), "--format", "json"]
+    active = [mock for mock in mock_server.dataset.courses if mock.course.is_active]
+
+    assert main(args) == 0
+    assert len(json.loads(capsys.readouterr().out)) == sum(len(mock.announcements) for mock in active)
+    assert (tmp_path / ANNOUNCEMENTS_NAME).exists()
+
+    new = post(mock_server, 0, "Quiz postponed")
+    assert main(args) == 0
+    records = json.loads(capsys.readouterr().out)
+    assert [(record["course"], record["title"]) for record in records] == [(active[0].course.full_code, new.title)]
@@ -0,0 +1,93 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from acbrightspace.archive import CourseArchive, write_archive
+from acbrightspace.assignment import Assignment
+from acbrightspace.mock_server import Dataset
+from acbrightspace.semester import Semester
+
+@pytest.fixture
+def closed():
+    dataset = Dataset.generate(seed=2, course_count=10, grade_count=12, assignment_count=15)
+    return [
+        (mock.course, [grade for _, grade in mock.grades], [assignment for _, assignment in mock.assignments])
+        for mock in dataset.courses if not mock.course.is_active
+    ]
+
+@pytest.fixture
+def archive(closed, tmp_path):
+    write_archive(tmp_path / "archive.acba", closed)
+    with CourseArchive(tmp_path / "archive.acba") as archive:
+        yield archive
+
+def test_round_trip(closed, archive):
+    assert sorted(course.org_unit_id for course in archive.courses) == sorted(course.org_unit_id for course, _, _ in closed)
+    for course, grades, assignments in closed:
+        assert archive.course(course.org_unit_id) == course
+        assert archive.grades(course.org_unit_id) == grades
+        assert archive.assignments(course.org_unit_id) == assignments
+
+def test_courses_are_grouped_by_semester(closed, archive):
+    assert archive.semesters == sorted(set(course.semester for course, _, _ in closed), key=lambda semester: (semester.year, ["Winter", "Spring", "Fall"].index(semester.term)))
+    for semester in archive.semesters:
+        assert all(course.semester == semester for course in archive.find(semester=semester))
+
+def test_column_reads_only_the_selected_courses(closed, archive):
+    semester = archive.semesters[0]
+    courses = archive.find(semester=semester)
+
+    due_dates = archive.column("assignments", "due_at", courses)
+
+    expected = {course.org_unit_id: assignments for course, _, assignments in closed}
+    assert due_dates == [assignment.due_at for course in courses for assignment in expected[course.org_unit_id]]
+    assert len(archive.column("grades", "points")) == sum(len(grades) for _, grades, _ in closed)
+    # Courses can also be given by their org unit ID, in any order
+    last, first = archive.courses[-1], archive.courses[0]
+    assert archive.column("grades", "name", [last.org_unit_id, first]) == (
+        [grade.name for grade in archive.grades(last.org_unit_id)] + [grade.name for grade in archive.grades(first.org_unit_id)]
+    )
+
+def test_find_by_code(archive):
+    course = archive.courses[0]
+    code = course.full_code.split("_")[1]
+    assert course in archive.find(code_prefix=code)
+    assert all(found.full_code.split("_")[1].startswith(code) for found in archive.find(code_prefix=code))
+    assert archive.find(semester=Semester(1999, "Fall")) == []
+
+def test_unknown_columns_and_courses(archive):
+    with pytest.raises(KeyError):
+        archive.column("quizzes", "name")
+    with pytest.raises(KeyError):
+        archive.column("grades", "due_at")
+    with pytest.raises(KeyError):
+        archive.grades(-1)
+    assert -1 not in archive
+    assert archive.courses[0].org_unit_id in archive
+
+def test_only_closed_courses_are_archived(closed, tmp_path):
+    course, grades, assignments = closed[0]
+    course.is_active = True
+    with pytest.raises(ValueError, match="closed"):
+        write_archive(tmp_path / "archive.acba", closed)
+    course.is_active = False
+    with pytest.raises(ValueError, match="once"):
+        write_archive(tmp_path / "archive.acba", [closed[0], closed[0]])
+    assert not (tmp_path / "archive.acba").exists()
+
+def test_dates_with_time_zones_are_rejected(closed, tmp_path):
+    course, grades, _ = closed[0]
+    assignment = Assignment("Lab", None, None, datetime(2025, 12, 1, tzinfo=timezone.utc), None, None, None)
+    with pytest.raises(ValueError, match="naive"):
+        write_archive(tmp_path / "archive.acba", [(course, grades, [assignment])])
+
+def test_empty_archive(tmp_path):
+    write_archive(tmp_path / "archive.acba", [])
+    with CourseArchive(tmp_path / "archive.acba") as archive:
+        assert archive.courses == []
+        assert archive.column("grades", "points") == []
+
+def test_not_an_archive(tmp_path):
+    (tmp_path / "snapshot.json").write_text("{\"version\": 2, \"courses\": []}")
+    with pytest.raises(ValueError, match="not a course archive"):
+        CourseArchive(tmp_path / "snapshot.json")
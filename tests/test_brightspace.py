@@ -1,14 +1,19 @@
+from datetime import datetime
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
 from acbrightspace.brightspace import Brightspace, BrightspaceError
+from acbrightspace.html import HtmlDocument
+from acbrightspace.errors import AuthenticationError, CircuitOpenError, HttpStatusError, TableNotFoundError
+from acbrightspace.resilience import CircuitBreaker, Resilience, RetryPolicy
+from acbrightspace.schema import SchemaMismatchError
 
 @pytest.fixture
 def brightspace():
     """Fixture to create a Brightspace instance with mocked driver."""
     with patch('acbrightspace.brightspace.webdriver.Chrome'):
-        bs = Brightspace()
+        bs = Brightspace(resilience=Resilience(retry=RetryPolicy(base_delay=0)))
         bs.driver = MagicMock()
         return bs
 
@@ -119,195 +124,238 @@ def test_login_general_exception(brightspace):
         with pytest.raises(BrightspaceError, match="Failed to log in to Brightspace"):
             brightspace.login("test@algonquincollege.com", "password123", "secret")
 
+GRADES_HEADER = "<tr><th>Grade Item</th><th>Points</th><th>Weight Achieved</th><th>Grade</th><th>Comments and Assessments</th></tr>"
+
+def grades_page(*rows, header=GRADES_HEADER):
+    """Builds a grades page with the given table rows."""
+    return f"<html><body><table id='z_f'>{header}{''.join(rows)}</table></body></html>"
+
+def grade_row(name, points, weight, grade="", comments=""):
+    return f"<tr><th>{name}</th><td><label>{points}</label></td><td><label>{weight}</label></td><td>{grade}</td><td>{comments}</td></tr>"
+
+class HtmlPageDriver:
+    """Stands in for a WebDriver by serving the same static HTML page for every navigation."""
+
+    def __init__(self, html):
+        self.document = HtmlDocument.parse(html)
+        self.urls = []
+
+    @property
+    def current_url(self):
+        return self.urls[-1] if self.urls else "about:blank"
+
+    @property
+    def title(self):
+        return self.document.title
+
+    def get(self, url):
+        self.urls.append(url)
+
+    def execute_script(self, script, *args):
+        return None
+
+    def find_element(self, by, value):
+        return self.document.find_element(by, value)
+
+    def find_elements(self, by, value):
+        return self.document.find_elements(by, value)
+
+
 def test_get_grades_success(brightspace):
     """Test successful retrieval of grades."""
-    with patch('acbrightspace.brightspace.WebDriverWait') as mock_wait:
-        mock_wait_instance = MagicMock()
-        mock_wait.return_value = mock_wait_instance
-        
-        # Mock grade table and rows
-        mock_table = MagicMock()
-        mock_row1 = MagicMock()
-        mock_row2 = MagicMock()
-        
-        # Mock first row
-        mock_th1 = MagicMock()
-        mock_th1.text = "Assignment 1"
-        mock_td1_4 = MagicMock()
-        mock_td1_4.text = "Good work"
-        mock_span1_0 = MagicMock()
-        mock_span1_0.text = "85.0 / 100.0"
-        mock_span1_1 = MagicMock()
-        mock_span1_1.text = "8.5 / 10.0"
-        
-        mock_row1.find_element.return_value = mock_th1
-        mock_row1.find_elements.side_effect = [
-            [MagicMock(text=""), MagicMock(text=""), MagicMock(text=""), MagicMock(text=""), mock_td1_4],
-            [mock_span1_0, mock_span1_1]
-        ]
-        
-        # Mock second row
-        mock_th2 = MagicMock()
-        mock_th2.text = "Assignment 2"
-        mock_td2_4 = MagicMock()
-        mock_td2_4.text = "Excellent"
-        mock_span2_0 = MagicMock()
-        mock_span2_0.text = "95.0 / 100.0"
-        mock_span2_1 = MagicMock()
-        mock_span2_1.text = "9.5 / 10.0"
-        
-        mock_row2.find_element.return_value = mock_th2
-        mock_row2.find_elements.side_effect = [
-            [MagicMock(text=""), MagicMock(text=""), MagicMock(text=""), MagicMock(text=""), mock_td2_4],
-            [mock_span2_0, mock_span2_1]
-        ]
-        
-        mock_table.find_elements.return_value = [MagicMock(), mock_row1, mock_row2]
-        mock_wait_instance.until.return_value = mock_table
-        
-        grades = brightspace.get_grades("12345")
-        
-        assert len(grades) == 2
-        assert grades[0].name == "Assignment 1"
-        assert grades[0].points_achieved == 85.0
-        assert grades[0].max_points == 100.0
-        assert grades[0].grade == 85.0
-        assert grades[0].comments == "Good work"
-        assert grades[1].name == "Assignment 2"
-        assert grades[1].points_achieved == 95.0
-        assert grades[1].grade == 95.0
-
-def test_get_grades_insufficient_spans(brightspace):
-    """Test get_grades skips rows with insufficient spans."""
-    with patch('acbrightspace.brightspace.WebDriverWait') as mock_wait:
-        mock_wait_instance = MagicMock()
-        mock_wait.return_value = mock_wait_instance
-        
-        mock_table = MagicMock()
-        mock_row = MagicMock()
-        mock_th = MagicMock()
-        mock_th.text = "Assignment"
-        
-        mock_row.find_element.return_value = mock_th
-        mock_row.find_elements.return_value = [MagicMock()]  # Only 1 span, need 2
-        
-        mock_table.find_elements.return_value = [MagicMock(), mock_row]
-        mock_wait_instance.until.return_value = mock_table
-        
-        grades = brightspace.get_grades("12345")
-        
-        assert len(grades) == 0
+    brightspace.driver = HtmlPageDriver(grades_page(
+        grade_row("Assignment 1", "85.0 / 100.0", "8.5 / 10.0", "85 %", "Good work"),
+        grade_row("Assignment 2", "95.0 / 100.0", "9.5 / 10.0", "95 %", "Excellent"),
+    ))
+
+    grades = brightspace.get_grades("12345")
+
+    assert brightspace.driver.urls == [f"{brightspace.base_url}/d2l/lms/grades/my_grades/main.d2l?ou=12345"]
+    assert len(grades) == 2
+    assert grades[0].name == "Assignment 1"
+    assert grades[0].points.numerator == 85.0
+    assert grades[0].points.denominator == 100.0
+    assert grades[0].weight.to_decimal() == 0.85
+    assert grades[0].comments == "Good work"
+    assert grades[1].name == "Assignment 2"
+    assert grades[1].points.numerator == 95.0
+
+
+def test_get_grades_with_categories(brightspace):
+    """Test grade items under category headers are parsed like other rows."""
+    brightspace.driver = HtmlPageDriver(grades_page(
+        "<tr><th scope='row' colspan='2'>Labs</th><td></td><td></td><td></td><td></td></tr>",
+        "<tr><td></td>" + grade_row("Lab 1", "8 / 10", "4 / 5")[4:],
+    ))
+
+    grades = brightspace.get_grades("12345")
+
+    assert [grade.name for grade in grades] == ["Lab 1"]
+    assert grades[0].points.numerator == 8.0
+
+
+def test_get_grades_missing_name(brightspace):
+    """Test get_grades skips rows without a grade item name."""
+    brightspace.driver = HtmlPageDriver(grades_page(
+        grade_row("", "8 / 10", "4 / 5"),
+        grade_row("Lab 2", "9 / 10", "4.5 / 5"),
+    ))
+
+    grades = brightspace.get_grades("12345")
+
+    assert [grade.name for grade in grades] == ["Lab 2"]
 
 
 def test_get_grades_invalid_points_format(brightspace):
-    """Test get_grades handles invalid points format gracefully."""
-    with patch('acbrightspace.brightspace.WebDriverWait') as mock_wait:
-        mock_wait_instance = MagicMock()
-        mock_wait.return_value = mock_wait_instance
-        
-        mock_table = MagicMock()
-        mock_row = MagicMock()
-        mock_th = MagicMock()
-        mock_th.text = "Assignment"
-        mock_td = MagicMock()
-        mock_td.text = "No comment"
-        
-        mock_span0 = MagicMock()
-        mock_span0.text = "invalid"
-        mock_span1 = MagicMock()
-        mock_span1.text = "5.0 / 10.0"
-        
-        mock_row.find_element.return_value = mock_th
-        mock_row.find_elements.side_effect = [
-            [MagicMock(text=""), MagicMock(text=""), MagicMock(text=""), MagicMock(text=""), mock_td],
-            [mock_span0, mock_span1]
-        ]
-        
-        mock_table.find_elements.return_value = [MagicMock(), mock_row]
-        mock_wait_instance.until.return_value = mock_table
-        
-        grades = brightspace.get_grades("12345")
-        
-        assert len(grades) == 1
-        assert grades[0].points_achieved == 0.0
-        assert grades[0].max_points == 0.0
+    """Test get_grades keeps rows with invalid points, without the points."""
+    brightspace.driver = HtmlPageDriver(grades_page(grade_row("Assignment", "invalid", "5.0 / 10.0", comments="No comment")))
 
+    grades = brightspace.get_grades("12345")
 
-def test_get_grades_invalid_weight_format(brightspace):
-    """Test get_grades handles invalid weight format gracefully."""
-    with patch('acbrightspace.brightspace.WebDriverWait') as mock_wait:
-        mock_wait_instance = MagicMock()
-        mock_wait.return_value = mock_wait_instance
-        
-        mock_table = MagicMock()
-        mock_row = MagicMock()
-        mock_th = MagicMock()
-        mock_th.text = "Assignment"
-        mock_td = MagicMock()
-        mock_td.text = "Comment"
-        
-        mock_span0 = MagicMock()
-        mock_span0.text = "80.0 / 100.0"
-        mock_span1 = MagicMock()
-        mock_span1.text = "invalid"
-        
-        mock_row.find_element.return_value = mock_th
-        mock_row.find_elements.side_effect = [
-            [MagicMock(text=""), MagicMock(text=""), MagicMock(text=""), MagicMock(text=""), mock_td],
-            [mock_span0, mock_span1]
-        ]
-        
-        mock_table.find_elements.return_value = [MagicMock(), mock_row]
-        mock_wait_instance.until.return_value = mock_table
-        
-        grades = brightspace.get_grades("12345")
-        
-        assert len(grades) == 1
-        assert grades[0].weight_achieved == 0.0
-        assert grades[0].max_weight == 0.0
+    assert len(grades) == 1
+    assert grades[0].points is None
+    assert grades[0].weight.numerator == 5.0
 
 
-def test_get_grades_zero_max_points(brightspace):
-    """Test get_grades handles zero max points correctly."""
-    with patch('acbrightspace.brightspace.WebDriverWait') as mock_wait:
-        mock_wait_instance = MagicMock()
-        mock_wait.return_value = mock_wait_instance
-        
-        mock_table = MagicMock()
-        mock_row = MagicMock()
-        mock_th = MagicMock()
-        mock_th.text = "Assignment"
-        mock_td = MagicMock()
-        mock_td.text = "Comment"
-        
-        mock_span0 = MagicMock()
-        mock_span0.text = "0.0 / 0.0"
-        mock_span1 = MagicMock()
-        mock_span1.text = "0.0 / 0.0"
-        
-        mock_row.find_element.return_value = mock_th
-        mock_row.find_elements.side_effect = [
-            [MagicMock(text=""), MagicMock(text=""), MagicMock(text=""), MagicMock(text=""), mock_td],
-            [mock_span0, mock_span1]
-        ]
-        
-        mock_table.find_elements.return_value = [MagicMock(), mock_row]
-        mock_wait_instance.until.return_value = mock_table
-        
-        grades = brightspace.get_grades("12345")
-        
-        assert len(grades) == 1
-        assert grades[0].grade == 0.0
+def test_get_grades_ungraded(brightspace):
+    """Test get_grades treats "- / -" as no value."""
+    brightspace.driver = HtmlPageDriver(grades_page(grade_row("Assignment", "- / -", "- / -")))
+
+    grades = brightspace.get_grades("12345")
+
+    assert len(grades) == 1
+    assert grades[0].points is None
+    assert grades[0].weight is None
+    assert grades[0].comments is None
+
+
+def test_get_grades_hidden_optional_columns(brightspace):
+    """Test get_grades works when the instructor hides the weight and comments columns."""
+    brightspace.driver = HtmlPageDriver(grades_page(
+        "<tr><th>Test 1</th><td>40 / 50</td></tr>",
+        header="<tr><th>Grade Item</th><th>Points</th></tr>",
+    ))
+
+    grades = brightspace.get_grades("12345")
+
+    assert grades[0].points.numerator == 40.0
+    assert grades[0].weight is None
+
+
+def test_get_grades_layout_changed(brightspace):
+    """Test get_grades reports a clear error when the table no longer matches its schema."""
+    brightspace.driver = HtmlPageDriver(grades_page(
+        "<tr><th>Lab 1</th><td>8 / 10</td></tr>",
+        header="<tr><th>Item</th><th>Score</th></tr>",
+    ))
+
+    with pytest.raises(SchemaMismatchError, match="missing 'Grade Item'"):
+        brightspace.get_grades("12345")
+
+
+def test_get_assignments_success(brightspace):
+    """Test successful retrieval of assignments with due and availability dates."""
+    brightspace.driver = HtmlPageDriver("""<html><body><table id="z_a">
+        <tr><th>Assignment</th><th>Completion Status</th><th>Score</th><th>Evaluation Status</th></tr>
+        <tr><th scope="row" colspan="2">Labs</th></tr>
+        <tr>
+            <td></td>
+            <th>
+                <div>Lab 1</div>
+                <div>Due on Jan 23, 2026 11:59 PM</div>
+                <ul>
+                    <li>Available on Jan 5, 2026 12:00 AM Access restricted before availability starts.</li>
+                    <li>Available until Jan 30, 2026 11:59 PM Access restricted after availability ends.</li>
+                </ul>
+            </th>
+            <td>1 Submission, 1 File</td>
+            <td>8 / 10</td>
+            <td>Feedback: Read</td>
+        </tr>
+        <tr><td></td><th><div>Lab 2</div></th><td>Not Submitted</td><td>- / -</td><td></td></tr>
+    </table></body></html>""")
+
+    assignments = brightspace.get_assignments("12345")
+
+    assert len(assignments) == 2
+    assert assignments[0].name == "Lab 1"
+    assert assignments[0].due_at == datetime(2026, 1, 23, 23, 59)
+    assert assignments[0].starts_at == datetime(2026, 1, 5, 0, 0)
+    assert assignments[0].ends_at == datetime(2026, 1, 30, 23, 59)
+    assert assignments[0].score.numerator == 8.0
+    assert assignments[0].completion_status == "1 Submission, 1 File"
+    assert assignments[0].evaluation_status == "Feedback: Read"
+    assert assignments[1].name == "Lab 2"
+    assert assignments[1].due_at is None
+    assert assignments[1].score is None
+    assert assignments[1].evaluation_status is None
 
 
 def test_get_grades_table_not_found(brightspace):
-    """Test get_grades raises error when table is not found."""
+    """Test get_grades raises error when table is not found, without retrying or tripping the breaker."""
+    brightspace.driver.current_url = "https://brightspace.algonquincollege.com/d2l/lms/grades/my_grades/main.d2l?ou=12345"
+    brightspace.driver.title = "Grades"
     with patch('acbrightspace.brightspace.WebDriverWait') as mock_wait:
         mock_wait_instance = MagicMock()
         mock_wait.return_value = mock_wait_instance
         mock_wait_instance.until.side_effect = TimeoutException()
         
-        with pytest.raises(TimeoutException):
+        with pytest.raises(TableNotFoundError, match="z_f"):
             brightspace.get_grades("12345")
 
+    assert brightspace.driver.get.call_count == 1
+    assert brightspace.resilience.breaker._failures == 0
+
+
+
+
+class SequenceDriver(HtmlPageDriver):
+    """Serves a different static HTML page for each navigation."""
+
+    def __init__(self, *pages, redirect=None):
+        super().__init__(pages[0])
+        self.pages = list(pages)
+        self.redirect = redirect
 
+    @property
+    def current_url(self):
+        return self.redirect or super().current_url
+
+    def get(self, url):
+        super().get(url)
+        self.document = HtmlDocument.parse(self.pages[min(len(self.urls), len(self.pages)) - 1])
+
+
+def test_get_grades_retries_error_page(brightspace):
+    """Test get_grades retries when Brightspace serves an error page."""
+    brightspace.driver = SequenceDriver(
+        "<html><head><title>503 Service Unavailable</title></head><body></body></html>",
+        grades_page(grade_row("Lab 1", "8 / 10", "4 / 5")),
+    )
+
+    grades = brightspace.get_grades("12345")
+
+    assert len(brightspace.driver.urls) == 2
+    assert [grade.name for grade in grades] == ["Lab 1"]
+
+
+def test_get_grades_logged_out(brightspace):
+    """Test get_grades fails without retrying when redirected to the login page."""
+    brightspace.driver = SequenceDriver(grades_page(), redirect="https://login.microsoftonline.com/common/oauth2")
+
+    with pytest.raises(AuthenticationError, match="Call login first"):
+        brightspace.get_grades("12345")
+    assert len(brightspace.driver.urls) == 1
+
+
+def test_get_grades_circuit_open(brightspace):
+    """Test get_grades fails fast after repeated failures."""
+    brightspace.resilience = Resilience(retry=RetryPolicy(max_attempts=1), breaker=CircuitBreaker(failure_threshold=2))
+    brightspace.driver = SequenceDriver("<html><head><title>502 Bad Gateway</title></head></html>")
+
+    for _ in range(2):
+        with pytest.raises(HttpStatusError):
+            brightspace.get_grades("12345")
+    with pytest.raises(CircuitOpenError):
+        brightspace.get_grades("12345")
+    assert len(brightspace.driver.urls) == 2
@@ -0,0 +1,186 @@
+import csv
+from datetime import datetime, timedelta
+import io
+import json
+
+import pytest
+
+from acbrightspace.cli import ARCHIVE_NAME, SNAPSHOT_NAME, format_records, main, parse_duration
+from acbrightspace.drivers import ReplayDriver
+from acbrightspace.session import BASE_URL
+
+ACTIVE = "26W_CST8109_010 Network Programming, 26W_CST8109_010, 2026 Winter, Ends April 27, 2026 at 12:00 AM"
+CLOSED = "Closed, 25F_CST8101_020 Computer Essentials, 25F_CST8101_020, 2025 Fall, Ended December 16, 2025 at 12:00 AM"
+
+def shadow(tag, content, **attributes):
+    """Renders an element with a declarative shadow root."""
+    rendered = "".join(f' {name}="{value}"' for name, value in attributes.items())
+    return f'<{tag}{rendered}><template shadowrootmode="open">{content}</template></{tag}>'
+
+def course_card(text, org_unit_id):
+    return shadow("d2l-enrollment-card", f'<d2l-card text="{text}" href="/d2l/home/{org_unit_id}"></d2l-card>')
+
+def home_page(*tabs):
+    panels = "".join(
+        f"<d2l-tab-panel>{shadow('d2l-my-courses-content', shadow('d2l-my-courses-card-grid', ''.join(cards)))}</d2l-tab-panel>"
+        for cards in tabs
+    )
+    return "<html><head><title>Homepage</title></head><body>" + shadow("d2l-my-courses", shadow("d2l-my-courses-container", panels)) + "</body></html>"
+
+def grades_page(*rows):
+    header = "<tr><th>Grade Item</th><th>Points</th><th>Weight Achieved</th><th>Grade</th><th>Comments and Assessments</th></tr>"
+    body = "".join(f"<tr><th>{name}</th><td>{points}</td><td>{weight}</td><td></td><td></td></tr>" for name, points, weight in rows)
+    return f"<html><body><table id='z_f'>{header}{body}</table></body></html>"
+
+def folders_page(*rows):
+    header = "<tr><th>Folder</th><th>Completion Status</th></tr>"
+    body = "".join(f"<tr><th>{name}<br>Due on {due:%b %d, %Y %I:%M %p}</th><td>{status}</td></tr>" for name, due, status in rows)
+    return f"<html><body><table id='z_a'>{header}{body}</table></body></html>"
+
+SOON = (datetime.now() + timedelta(days=2)).replace(second=0, microsecond=0)
+LATER = (datetime.now() + timedelta(days=30)).replace(second=0, microsecond=0)
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    replay = ReplayDriver(tmp_path / "pages")
+    replay.record(f"{BASE_URL}/d2l/home", home_page([course_card(ACTIVE, 1001)], [course_card(CLOSED, 1002), course_card(ACTIVE, 1001)]))
+    for org_unit_id in (1001, 1002):
+        replay.record(f"{BASE_URL}/d2l/lms/grades/my_grades/main.d2l?ou={org_unit_id}", grades_page(
+            (f"Lab {org_unit_id}", "8 / 10", "4 / 5"),
+            ("Midterm", "30 / 40", "15 / 20"),
+        ))
+        replay.record(f"{BASE_URL}/d2l/lms/dropbox/user/folders_list.d2l?ou={org_unit_id}&isprv=0", folders_page(
+            ("Lab 1", SOON, "Not Submitted"),
+            ("Project", LATER, "1 Submission, 1 File"),
+        ))
+    return tmp_path
+
+def run(capsys, cache_dir, *args):
+    status = main([*args, "--backend", "replay", "--cache-dir", str(cache_dir)])
+    captured = capsys.readouterr()
+    return status, captured.out, captured.err
+
+@pytest.mark.parametrize("text,expected", [
+    ("7d", timedelta(days=7)),
+    ("12h", timedelta(hours=12)),
+    ("30m", timedelta(minutes=30)),
+    ("2w", timedelta(weeks=2)),
+    ("3", timedelta(days=3)),
+])
+def test_parse_duration(text, expected):
+    assert parse_duration(text) == expected
+
+def test_format_records_table():
+    text = format_records([{"course": "CST8109", "score": None}, {"course": "CST8101", "score": "8 / 10"}], "table")
+    assert text.splitlines() == [
+        "course   score",
+        "CST8109",
+        "CST8101  8 / 10",
+    ]
+
+def test_courses(capsys, cache_dir):
+    status, out, _ = run(capsys, cache_dir, "courses", "--format", "json")
+
+    assert status == 0
+    courses = json.loads(out)
+    assert [(course["org_unit_id"], course["active"]) for course in courses] == [(1001, True), (1002, False)]
+
+def test_grades_of_active_courses(capsys, cache_dir):
+    status, out, _ = run(capsys, cache_dir, "grades", "--format", "csv")
+
+    assert status == 0
+    rows = list(csv.DictReader(io.StringIO(out)))
+    assert [(row["course"], row["item"], row["percent"]) for row in rows] == [
+        ("26W_CST8109_010", "Lab 1001", "80.0"),
+        ("26W_CST8109_010", "Midterm", "75.0"),
+    ]
+
+def test_grades_all(capsys, cache_dir):
+    _, out, _ = run(capsys, cache_dir, "grades", "--all", "--format", "json", "--concurrency", "2")
+    assert {grade["course"] for grade in json.loads(out)} == {"26W_CST8109_010", "25F_CST8101_020"}
+
+def test_assignments_due_within(capsys, cache_dir):
+    status, out, _ = run(capsys, cache_dir, "assignments", "--due-within", "7d", "--format", "json")
+
+    assert status == 0
+    assert [(item["assignment"], item["due_at"]) for item in json.loads(out)] == [("Lab 1", SOON.isoformat())]
+
+def test_missing_page_fails_course(capsys, caplog, cache_dir):
+    (cache_dir / "pages" / "d2l_lms_grades_my_grades_main.d2l_ou=1001.html").unlink()
+
+    status, out, _ = run(capsys, cache_dir, "grades", "--format", "json")
+
+    assert status == 1
+    assert json.loads(out) == []
+    assert "Failed to fetch 1 of 1 courses: 26W_CST8109_010" in caplog.text
+
+def test_sync_then_export(capsys, cache_dir, tmp_path):
+    status, _, err = run(capsys, cache_dir, "sync", "--all", "--timings")
+
+    assert status == 0
+    assert (cache_dir / SNAPSHOT_NAME).exists()
+    for phase in ("courses", "grades", "assignments", "write", "total"):
+        assert phase in err
+
+    # Export works from the snapshot alone
+    (cache_dir / "pages" / "d2l_home.html").unlink()
+    output = tmp_path / "deadlines.ics"
+    status, _, _ = run(capsys, cache_dir, "export", "calendar", "--output", str(output))
+
+    assert status == 0
+    ics = output.read_text()
+    assert ics.count("BEGIN:VEVENT") == 4
+    assert "SUMMARY:25F_CST8101_020: Project" in ics
+
+    _, out, _ = run(capsys, cache_dir, "export", "grades", "--format", "json")
+    assert len(json.loads(out)) == 4
+
+def test_archive_closed_courses(capsys, cache_dir):
+    run(capsys, cache_dir, "sync", "--all")
+
+    status, out, _ = run(capsys, cache_dir, "archive", "--format", "json")
+
+    assert status == 0
+    assert json.loads(out) == [{"course": "25F_CST8101_020", "semester": "25F", "grades": 2, "assignments": 2, "new": True}]
+    assert (cache_dir / ARCHIVE_NAME).exists()
+
+    # The archived course is not fetched again, yet it is still exported
+    for page in (cache_dir / "pages").glob("*1002*"):
+        page.unlink()
+    status, out, _ = run(capsys, cache_dir, "sync", "--all", "--format", "json")
+    assert status == 0
+    assert [record["course"] for record in json.loads(out)] == ["26W_CST8109_010"]
+
+    _, out, _ = run(capsys, cache_dir, "export", "grades", "--format", "json")
+    assert sorted((record["course"], record["item"]) for record in json.loads(out)) == [
+        ("25F_CST8101_020", "Lab 1002"), ("25F_CST8101_020", "Midterm"), ("26W_CST8109_010", "Lab 1001"), ("26W_CST8109_010", "Midterm"),
+    ]
+
+    _, out, _ = run(capsys, cache_dir, "archive", "--format", "json")
+    assert [record["new"] for record in json.loads(out)] == [False]
+
+def test_failed_closed_course_is_not_archived(capsys, cache_dir):
+    (cache_dir / "pages" / "d2l_lms_grades_my_grades_main.d2l_ou=1002.html").unlink()
+    status, _, _ = run(capsys, cache_dir, "sync", "--all")
+    assert status == 1
+
+    status, out, _ = run(capsys, cache_dir, "archive", "--format", "json")
+
+    assert status == 0
+    assert json.loads(out) == []
+    assert not (cache_dir / ARCHIVE_NAME).exists()
+
+def test_profile_a_replayed_sync(capsys, cache_dir, tmp_path):
+    status, _, err = run(capsys, cache_dir, "sync", "--all", "--profile", str(tmp_path / "profile"))
+
+    assert status == 0
+    assert "Wrote the profile" in err
+    report = (tmp_path / "profile" / "profile.txt").read_text()
+    assert "parsing" in report and "driver" in report
+    assert (tmp_path / "profile" / "profile.folded").exists()
+
+def test_export_without_sync(capsys, caplog, cache_dir):
+    status, _, _ = run(capsys, cache_dir, "export", "grades")
+
+    assert status == 1
+    assert "Run `acbrightspace sync` first" in caplog.text
@@ -0,0 +1,195 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.coalescing import CoalescingBrightspace, SingleFlight, TtlCache
+from acbrightspace.drivers import HttpDriver
+from acbrightspace.errors import HttpStatusError
+from acbrightspace.mock_server import Dataset, MockBrightspaceServer
+from acbrightspace.resilience import Resilience, RetryPolicy
+from acbrightspace.session import HttpSession
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(flights.do, "key", slow) for _ in range(8)]
+            # Let every caller arrive before the call finishes
+            while sum(future.running() for future in futures) < 8:
+                time.sleep(0.01)
+            time.sleep(0.1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in results) == [False] + [True] * 7
+        assert all(value == "result" for value, _ in results)
+
+    def test_error_is_shared(self):
+        flights = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flights.do, "key", failing)
+            started.wait(5)
+            follower = executor.submit(flights.do, "key", lambda: "not called")
+            while not follower.running():
+                time.sleep(0.01)
+            time.sleep(0.1)
+            release.set()
+            for future in (leader, follower):
+                with pytest.raises(ValueError, match="boom"):
+                    future.result()
+
+    def test_runs_again_after_completion(self):
+        flights = SingleFlight()
+        assert flights.do("key", lambda: 1) == (1, False)
+        assert flights.do("key", lambda: 2) == (2, False)
+
+
+class TestTtlCache:
+    def test_expiry(self):
+        clock = FakeClock()
+        cache = TtlCache(ttl=10, clock=clock)
+        cache.put("key", "value")
+
+        clock.now = 9.9
+        assert cache.get("key") == (True, "value")
+        clock.now = 10
+        assert cache.get("key") == (False, None)
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TtlCache(ttl=10, max_entries=2, clock=FakeClock())
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.get("c") == (True, 3)
+
+
+@pytest.fixture
+def server():
+    dataset = Dataset.generate(seed=4, course_count=4, grade_count=5, assignment_count=5)
+    # Latency keeps the first request in flight while the others arrive
+    with MockBrightspaceServer(dataset, latency=0.05) as server:
+        yield server
+
+def make_client(server, clock=None):
+    brightspace = Brightspace(
+        base_url=server.base_url,
+        resilience=Resilience(retry=RetryPolicy(max_attempts=1)),
+        driver=HttpDriver(HttpSession(base_url=server.base_url)),
+    )
+    return CoalescingBrightspace(brightspace, ttl=60, clock=clock or FakeClock())
+
+def grade_requests(server):
+    return [path for path in server.requests if "my_grades" in path]
+
+
+class TestCoalescingBrightspace:
+    def test_identical_concurrent_requests_load_once(self, server):
+        client = make_client(server)
+        org_unit_id = str(server.dataset.courses[0].course.org_unit_id)
+
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            results = list(executor.map(lambda _: client.get_grades(org_unit_id), range(20)))
+
+        assert all(len(grades) == 5 for grades in results)
+        assert len(grade_requests(server)) == 1
+        assert client.stats.fetches == 1
+        assert client.stats.shared + client.stats.hits == 19
+
+    def test_load_grows_with_unique_pages(self, server):
+        client = make_client(server)
+        org_unit_ids = [str(mock.course.org_unit_id) for mock in server.dataset.courses]
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(lambda index: client.get_grades(org_unit_ids[index % 4]), range(40)))
+
+        assert len(grade_requests(server)) == 4
+
+    def test_results_expire(self, server):
+        clock = FakeClock()
+        client = make_client(server, clock)
+        org_unit_id = str(server.dataset.courses[0].course.org_unit_id)
+
+        client.get_assignments(org_unit_id)
+        client.get_assignments(org_unit_id)
+        clock.now = 60
+        client.get_assignments(org_unit_id)
+
+        assert client.stats.fetches == 2
+        assert client.stats.hits == 1
+
+    def test_invalidate(self, server):
+        client = make_client(server)
+        first, second = (str(mock.course.org_unit_id) for mock in server.dataset.courses[:2])
+        client.get_grades(first)
+        client.get_grades(second)
+
+        assert client.invalidate("get_grades", first) == 1
+        client.get_grades(first)
+        client.get_grades(second)
+        assert client.stats.fetches == 3
+
+    def test_errors_are_not_cached(self, server):
+        client = make_client(server)
+        org_unit_id = str(server.dataset.courses[0].course.org_unit_id)
+        server.inject_errors(1)
+
+        with pytest.raises(HttpStatusError):
+            client.get_grades(org_unit_id)
+        assert len(client.get_grades(org_unit_id)) == 5
+
+    def test_returned_lists_are_independent(self, server):
+        client = make_client(server)
+        courses = client.get_courses()
+        courses.clear()
+        assert len(client.get_courses()) == 4
+
+    def test_semester_name_and_code_share_an_entry(self, server):
+        client = make_client(server)
+        semester = server.dataset.courses[0].course.semester
+
+        courses = client.get_courses(semester=semester.code)
+        assert client.get_courses(semester=semester.code.lower()) == courses
+        assert client.get_courses(semester=semester.name) == courses
+        assert client.get_courses(semester=semester) == courses
+        assert client.stats.fetches == 1
+        assert client.stats.hits == 3
+
+    def test_code_prefix_is_case_insensitive(self, server):
+        client = make_client(server)
+        courses = client.get_courses(code_prefix="cst81")
+        assert len(courses) == 4
+        assert client.get_courses(code_prefix="CST81") == courses
+        assert client.stats.fetches == 1
@@ -0,0 +1,276 @@
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import pytest
+
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.content import (
+    LE_API_VERSION,
+    MANIFEST_NAME,
+    ContentDownloader,
+    ContentTopic,
+    DownloadStatus,
+    fetch_content,
+)
+from acbrightspace.drivers import HttpDriver, ReplayDriver
+from acbrightspace.errors import BrightspaceError
+from acbrightspace.session import HttpSession
+
+FILES = {
+    101: b"lecture one " * 5000,
+    102: b"lecture two " * 8000,
+    103: b"syllabus",
+}
+
+TOC = {
+    "Modules": [
+        {
+            "ModuleId": 1,
+            "Title": "Week 1",
+            "Modules": [
+                {
+                    "ModuleId": 2,
+                    "Title": "Slides",
+                    "Modules": [],
+                    "Topics": [
+                        {"TopicId": 101, "Title": "Lecture 1", "Url": "/content/enforced/lecture1.pdf", "TypeIdentifier": "File"},
+                        {"TopicId": 102, "Title": "Lecture 2", "Url": "/content/enforced/lecture2.pdf", "TypeIdentifier": "File"},
+                    ],
+                },
+            ],
+            "Topics": [
+                {"TopicId": 103, "Title": "Syllabus", "Url": "/content/enforced/syllabus.txt", "TypeIdentifier": "File"},
+                {"TopicId": 104, "Title": "Course Website", "Url": "https://example.com", "TypeIdentifier": "Link"},
+            ],
+        },
+    ],
+}
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves a course content tree and its files, like the Brightspace content API."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _file(self):
+        prefix = f"/d2l/api/le/{LE_API_VERSION}/1234/content/topics/"
+        if not self.path.startswith(prefix):
+            return None, None
+        topic_id = int(self.path[len(prefix):].split("/")[0])
+        data = FILES[topic_id]
+        return data, '"' + hashlib.md5(data).hexdigest() + '"' if self.server.etags else None
+
+    def do_HEAD(self):
+        self.server.requests.append(("HEAD", self.path, dict(self.headers)))
+        data, etag = self._file()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.end_headers()
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path, dict(self.headers)))
+        if self.headers.get("Cookie") != "d2lSessionVal=abc":
+            self.send_response(403)
+            self.end_headers()
+            return
+
+        if self.path == f"/d2l/api/le/{LE_API_VERSION}/1234/content/toc":
+            body = json.dumps(TOC).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        with self.server.lock:
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        try:
+            time.sleep(0.05)
+            data, etag = self._file()
+            range_header = self.headers.get("Range")
+            if range_header and self.headers.get("If-Range", etag) == etag:
+                start = int(range_header.removeprefix("bytes=").rstrip("-"))
+                if start >= len(data):
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{len(data)}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+                data = data[start:]
+            else:
+                self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            if etag is not None:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+@pytest.fixture
+def server():
+    """Runs a local stub Brightspace server in a background thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []
+    server.etags = True
+    server.lock = threading.Lock()
+    server.active = 0
+    server.max_active = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def session(server):
+    host, port = server.server_address
+    session = HttpSession(cookies={"d2lSessionVal": "abc"}, base_url=f"http://{host}:{port}")
+    yield session
+    session.close()
+
+
+class TestFetchContent:
+    def test_parses_content_tree(self, session):
+        content = fetch_content(session, 1234)
+
+        week = content.modules[0]
+        assert week.title == "Week 1"
+        assert [topic.title for topic in week.topics] == ["Syllabus", "Course Website"]
+        assert week.modules[0].title == "Slides"
+        assert week.modules[0].topics[0].path == ["Week 1", "Slides"]
+
+    def test_walk_yields_every_topic(self, session):
+        content = fetch_content(session, 1234)
+        assert [topic.id for topic in content.walk()] == [103, 104, 101, 102]
+
+
+class TestContentDownloader:
+    def test_downloads_files(self, session, tmp_path):
+        topics = list(fetch_content(session, 1234).walk())
+        results = ContentDownloader(session, 1234, tmp_path).download(topics)
+
+        # Links are not downloaded
+        assert len(results) == 3
+        assert all(result.status == DownloadStatus.DOWNLOADED for result in results)
+        assert (tmp_path / "Week 1" / "Syllabus.txt").read_bytes() == FILES[103]
+        assert (tmp_path / "Week 1" / "Slides" / "Lecture 1.pdf").read_bytes() == FILES[101]
+
+    def test_skips_unchanged_files(self, server, session, tmp_path):
+        topics = list(fetch_content(session, 1234).walk())
+        ContentDownloader(session, 1234, tmp_path).download(topics)
+
+        server.requests.clear()
+        results = ContentDownloader(session, 1234, tmp_path).download(topics)
+
+        assert all(result.status == DownloadStatus.UNCHANGED for result in results)
+        assert all(method == "HEAD" for method, _, _ in server.requests)
+
+    def test_redownloads_modified_local_file(self, session, tmp_path):
+        topics = list(fetch_content(session, 1234).walk())
+        ContentDownloader(session, 1234, tmp_path).download(topics)
+
+        (tmp_path / "Week 1" / "Syllabus.txt").write_bytes(b"edited")
+        results = ContentDownloader(session, 1234, tmp_path).download(topics)
+
+        statuses = {result.topic.id: result.status for result in results}
+        assert statuses[103] == DownloadStatus.DOWNLOADED
+        assert statuses[101] == DownloadStatus.UNCHANGED
+        assert (tmp_path / "Week 1" / "Syllabus.txt").read_bytes() == FILES[103]
+
+    def test_resumes_partial_download(self, server, session, tmp_path):
+        topics = [topic for topic in fetch_content(session, 1234).walk() if topic.id == 102]
+        partial = tmp_path / "Week 1" / "Slides" / "Lecture 2.pdf.part"
+        partial.parent.mkdir(parents=True)
+        partial.write_bytes(FILES[102][:1000])
+
+        results = ContentDownloader(session, 1234, tmp_path, chunk_size=4096).download(topics)
+
+        assert results[0].status == DownloadStatus.RESUMED
+        assert results[0].bytes_transferred == len(FILES[102]) - 1000
+        assert (tmp_path / "Week 1" / "Slides" / "Lecture 2.pdf").read_bytes() == FILES[102]
+        assert not partial.exists()
+        gets = [headers for method, path, headers in server.requests if method == "GET" and "/topics/" in path]
+        assert gets[0]["Range"] == "bytes=1000-"
+
+    def test_restarts_stale_partial_download(self, server, session, tmp_path):
+        topics = [topic for topic in fetch_content(session, 1234).walk() if topic.id == 103]
+        partial = tmp_path / "Week 1" / "Syllabus.txt.part"
+        partial.parent.mkdir(parents=True)
+        partial.write_bytes(b"an older, longer syllabus")
+
+        results = ContentDownloader(session, 1234, tmp_path).download(topics)
+
+        assert results[0].status == DownloadStatus.DOWNLOADED
+        assert (tmp_path / "Week 1" / "Syllabus.txt").read_bytes() == FILES[103]
+        assert not partial.exists()
+
+    def test_does_not_resume_without_validator(self, server, session, tmp_path):
+        server.etags = False
+        topics = [topic for topic in fetch_content(session, 1234).walk() if topic.id == 102]
+        partial = tmp_path / "Week 1" / "Slides" / "Lecture 2.pdf.part"
+        partial.parent.mkdir(parents=True)
+        partial.write_bytes(b"x" * 1000)
+
+        results = ContentDownloader(session, 1234, tmp_path).download(topics)
+
+        assert results[0].status == DownloadStatus.DOWNLOADED
+        assert (tmp_path / "Week 1" / "Slides" / "Lecture 2.pdf").read_bytes() == FILES[102]
+        gets = [headers for method, path, headers in server.requests if method == "GET" and "/topics/" in path]
+        assert "Range" not in gets[0]
+
+    def test_topics_with_the_same_title_get_their_own_files(self, server, session, tmp_path):
+        topics = [
+            ContentTopic(id=102, title="Lecture", url="/content/enforced/b.pdf", type="File", path=["Week 1"]),
+            ContentTopic(id=101, title="Lecture", url="/content/enforced/a.pdf", type="File", path=["Week 1"]),
+        ]
+        downloader = ContentDownloader(session, 1234, tmp_path)
+        results = downloader.download(topics)
+
+        assert [result.path.name for result in results] == ["Lecture (102).pdf", "Lecture.pdf"]
+        assert (tmp_path / "Week 1" / "Lecture.pdf").read_bytes() == FILES[101]
+        assert (tmp_path / "Week 1" / "Lecture (102).pdf").read_bytes() == FILES[102]
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        assert manifest["101"]["path"] == "Week 1/Lecture.pdf"
+        assert manifest["102"]["path"] == "Week 1/Lecture (102).pdf"
+
+        results = ContentDownloader(session, 1234, tmp_path).download(topics)
+        assert all(result.status == DownloadStatus.UNCHANGED for result in results)
+
+    def test_caps_concurrency(self, server, session, tmp_path):
+        topics = list(fetch_content(session, 1234).walk())
+        ContentDownloader(session, 1234, tmp_path, max_workers=1).download(topics)
+        assert server.max_active == 1
+
+    def test_failed_download_is_reported(self, tmp_path):
+        session = HttpSession(base_url="http://127.0.0.1:9")
+        topic = ContentTopic(id=1, title="Missing", url="/missing.pdf", type="File")
+        results = ContentDownloader(session, 1234, tmp_path).download([topic])
+        assert results[0].status == DownloadStatus.FAILED
+        assert results[0].error is not None
+
+
+class TestBrightspaceContent:
+    def test_uses_the_session_of_the_http_driver(self, server, session, tmp_path):
+        brightspace = Brightspace(base_url=session.base_url, driver=HttpDriver(session))
+
+        assert [topic.id for topic in brightspace.get_content("1234").walk()] == [103, 104, 101, 102]
+        results = brightspace.download_content("1234", str(tmp_path))
+        assert [result.status for result in results] == [DownloadStatus.DOWNLOADED] * 3
+
+    def test_replayed_pages_cannot_fetch_content(self, tmp_path):
+        brightspace = Brightspace(driver=ReplayDriver(tmp_path / "pages"))
+        with pytest.raises(BrightspaceError):
+            brightspace.get_content("1234")
+        with pytest.raises(BrightspaceError):
+            brightspace.download_content("1234", str(tmp_path / "content"))
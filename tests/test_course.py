@@ -1,6 +1,7 @@
 from datetime import datetime
 import pytest
-from acbrightspace.course import Course
+from acbrightspace.course import Course, CourseFilter
+from acbrightspace.semester import Semester
 
 valid_course_strings = [
     (
@@ -62,4 +63,47 @@ class TestCourseFromString:
         course_string = "Computer Programming and Analysis All Levels Homeroom, 26W_H_1561X_WO_01_F_A02, 2026 Winter, Ends April 26, 2026 at 12:00 AM"
         with pytest.raises(ValueError, match="Homeroom courses are not supported"):
             course = Course.from_string(course_string, org_unit_id=12345)
-        
\ No newline at end of file
+
+
+class Tab:
+    def __init__(self, text):
+        self.text = text
+
+    def get_attribute(self, name):
+        return self.text if name == "text" else None
+
+class TestCourseFilter:
+    closed = valid_course_strings[0][0]
+    active = valid_course_strings[1][0]
+
+    def test_empty_filter_matches_everything(self):
+        course_filter = CourseFilter()
+        assert course_filter.may_match(self.closed) and course_filter.may_match(self.active)
+        assert course_filter.matches(Course.from_string(self.closed, org_unit_id=1))
+
+    @pytest.mark.parametrize("course_filter,closed,active", [
+        (CourseFilter(is_active=True), False, True),
+        (CourseFilter(is_active=False), True, False),
+        (CourseFilter(semester=Semester(2024, "Fall")), True, False),
+        (CourseFilter(code_prefix="cst85"), False, True),
+        (CourseFilter(code_prefix="24F_"), True, False),
+    ])
+    def test_raw_text_and_parsed_course_agree(self, course_filter, closed, active):
+        assert course_filter.may_match(self.closed) == closed
+        assert course_filter.may_match(self.active) == active
+        assert course_filter.matches(Course.from_string(self.closed, org_unit_id=1)) == closed
+        assert course_filter.matches(Course.from_string(self.active, org_unit_id=2)) == active
+
+    def test_code_prefix_is_checked_against_codes_only(self):
+        # "Business" is in the card text but not in a code
+        course_filter = CourseFilter(code_prefix="Business")
+        assert course_filter.may_match(self.active)
+        assert not course_filter.matches(Course.from_string(self.active, org_unit_id=1))
+
+    def test_tabs_of_the_semester(self):
+        tabs = [Tab("2026 Winter"), Tab("2025 Fall"), Tab(None)]
+        assert CourseFilter().tabs(tabs) == tabs
+        assert CourseFilter(semester=Semester(2025, "Fall")).tabs(tabs) == [tabs[1]]
+        # Without a tab for the semester, only unlabelled tabs may hold its courses
+        assert CourseFilter(semester=Semester(2024, "Fall")).tabs(tabs) == [tabs[2]]
+
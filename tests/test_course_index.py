@@ -0,0 +1,103 @@
+from dataclasses import replace
+from datetime import datetime
+import time
+
+import pytest
+
+from acbrightspace.course import Course
+from acbrightspace.course_index import CourseIndex
+from acbrightspace.semester import Semester
+
+def course(full_code, name, org_unit_id, is_active=True):
+    semester = Semester.from_code(full_code[:3])
+    return Course(
+        full_code=full_code,
+        full_name=f"{full_code} {name}, {full_code}, {semester.name}, Ends April 27, 2026 at 12:00 AM",
+        name=name,
+        semester=semester,
+        ends_at=datetime(2026, 4, 27),
+        is_active=is_active,
+        org_unit_id=org_unit_id,
+    )
+
+NETWORK = course("26W_CST8109_010", "Network Programming", 1)
+BUSINESS = course("26W_CST8514_300", "Business and Information Technology", 2)
+ESSENTIALS = course("25F_CST8101_020", "Computer Essentials", 3, is_active=False)
+NETWORKING = course("25F_CST8371_010", "Enterprise Networking", 4, is_active=False)
+
+@pytest.fixture
+def index():
+    return CourseIndex([NETWORK, BUSINESS, ESSENTIALS, NETWORKING])
+
+def test_lookup(index):
+    assert len(index) == 4
+    assert index.get(3) == ESSENTIALS
+    assert index.get(99) is None
+    assert 1 in index
+    assert index.by_code("26w_cst8109_010") == NETWORK
+    assert index.by_code("26W_CST8109_011") is None
+
+def test_group_by_semester(index):
+    assert index.semesters == [Semester(2026, "Winter"), Semester(2025, "Fall")]
+    assert index.in_semester(Semester.from_code("25F")) == [ESSENTIALS, NETWORKING]
+    assert index.in_semester(Semester.from_code("24S")) == []
+    assert index.by_semester() == {Semester(2026, "Winter"): [NETWORK, BUSINESS], Semester(2025, "Fall"): [ESSENTIALS, NETWORKING]}
+
+def test_code_prefix(index):
+    assert index.with_code_prefix("cst81") == [ESSENTIALS, NETWORK]
+    assert index.with_code_prefix("26W_") == [NETWORK, BUSINESS]
+    assert index.with_code_prefix("CST8109") == [NETWORK]
+    assert index.with_code_prefix("MAT") == []
+
+def test_search(index):
+    assert index.search("network programming") == [NETWORK, NETWORKING]
+    # Equal scores are ordered by code
+    assert index.search("netw") == [NETWORKING, NETWORK]
+    # Misspelled words still match, below exact words
+    assert index.search("computr esentials") == [ESSENTIALS]
+    assert index.search("enterprise network")[0] == NETWORKING
+    assert index.search("CST8514") == [BUSINESS]
+    assert index.search("xyz") == []
+    assert len(index.search("c", limit=2)) == 2
+
+def test_incremental_updates(index):
+    renamed = replace(NETWORK, name="Network Security")
+    index.add(renamed)
+
+    assert len(index) == 4
+    assert index.search("programming") == []
+    assert index.search("security") == [renamed]
+
+    assert index.remove(2) == BUSINESS
+    assert index.by_code(BUSINESS.full_code) is None
+    assert index.with_code_prefix("CST85") == []
+    assert index.search("business") == []
+    assert index.in_semester(Semester(2026, "Winter")) == [renamed]
+    with pytest.raises(KeyError):
+        index.remove(2)
+
+def test_sync(index):
+    closed = replace(NETWORK, is_active=False)
+    added = course("26S_CST8110_010", "Introduction to Computer Programming", 5)
+
+    changed, removed = index.sync([closed, ESSENTIALS, NETWORKING, added])
+
+    assert changed == [closed, added]
+    assert removed == [BUSINESS]
+    assert sorted(course.org_unit_id for course in index) == [1, 3, 4, 5]
+    assert index.sync([closed, ESSENTIALS, NETWORKING, added]) == ([], [])
+
+def test_lookups_stay_fast_with_many_courses():
+    names = ["Network Programming", "Database Systems", "Web Development", "Operating Systems", "Mobile Applications"]
+    courses = [
+        course(f"25F_CST{8100 + number % 400}_{number:03d}", f"{names[number % len(names)]} {number}", number)
+        for number in range(1000)
+    ]
+    index = CourseIndex(courses)
+
+    start = time.perf_counter()
+    for number in range(0, 1000, 10):
+        assert index.by_code(courses[number].full_code) == courses[number]
+        assert courses[number] in index.with_code_prefix(courses[number].full_code.split("_")[1])
+        assert index.search(f"{names[number % len(names)]} {number}")[0] == courses[number]
+    assert time.perf_counter() - start < 2
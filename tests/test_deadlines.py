@@ -0,0 +1,165 @@
+from datetime import datetime, timedelta
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from acbrightspace.assignment import Assignment
+from acbrightspace.course import Course
+from acbrightspace.deadlines import DeadlineCalendar, IntervalIndex
+
+def make_course(org_unit_id: int, code: str) -> Course:
+    return Course.from_string(
+        f"26W_{code}_300 Course {code}, 26W_{code}_300, 2026 Winter, Ends April 27, 2026 at 12:00 AM",
+        org_unit_id=org_unit_id,
+    )
+
+def make_assignment(name: str, due_at: datetime | None, starts_at: datetime | None = None, ends_at: datetime | None = None, folder_id: int | None = None) -> Assignment:
+    return Assignment(
+        name=name,
+        starts_at=starts_at,
+        ends_at=ends_at,
+        due_at=due_at,
+        score=None,
+        completion_status=None,
+        evaluation_status=None,
+        folder_id=folder_id,
+    )
+
+
+class TestIntervalIndex:
+    def test_matches_linear_scan(self):
+        generator = random.Random(1)
+        base = datetime(2026, 1, 1)
+        intervals = []
+        for index in range(500):
+            start = base + timedelta(hours=generator.randint(0, 2000))
+            intervals.append((start, start + timedelta(hours=generator.randint(0, 300)), index))
+        index = IntervalIndex(intervals)
+
+        for _ in range(100):
+            start = base + timedelta(hours=generator.randint(0, 2300))
+            end = start + timedelta(hours=generator.randint(0, 100))
+            expected = {item for low, high, item in intervals if low <= end and high >= start}
+            assert set(index.overlapping(start, end)) == expected
+
+    def test_empty_index(self):
+        assert IntervalIndex().overlapping(datetime.min, datetime.max) == []
+
+    def test_rejects_reversed_interval(self):
+        with pytest.raises(ValueError, match="Interval start must not be after its end"):
+            IntervalIndex([(datetime(2026, 2, 1), datetime(2026, 1, 1), "x")])
+
+
+class TestDeadlineCalendar:
+    def test_due_between(self):
+        calendar = DeadlineCalendar()
+        calendar.update(make_course(1, "CST8109"), [
+            make_assignment("Lab 1", datetime(2026, 1, 10, 23, 59)),
+            make_assignment("Lab 2", datetime(2026, 1, 17, 23, 59)),
+            make_assignment("No Due Date", None),
+        ])
+        calendar.update(make_course(2, "CST8514"), [
+            make_assignment("Essay", datetime(2026, 1, 12, 12, 0)),
+        ])
+
+        deadlines = calendar.due_between(datetime(2026, 1, 10), datetime(2026, 1, 13))
+
+        assert [deadline.assignment.name for deadline in deadlines] == ["Lab 1", "Essay"]
+        assert deadlines[1].course.org_unit_id == 2
+
+    def test_available_between(self):
+        calendar = DeadlineCalendar()
+        calendar.update(make_course(1, "CST8109"), [
+            make_assignment("Quiz", None, starts_at=datetime(2026, 1, 5), ends_at=datetime(2026, 1, 6)),
+            make_assignment("Project", datetime(2026, 3, 1), starts_at=datetime(2026, 1, 1), ends_at=datetime(2026, 3, 2)),
+            make_assignment("Open", None, starts_at=datetime(2026, 2, 1)),
+        ])
+
+        names = {deadline.assignment.name for deadline in calendar.available_between(datetime(2026, 1, 5, 12), datetime(2026, 1, 7))}
+        assert names == {"Quiz", "Project"}
+
+    def test_available_until_due_date_without_start(self):
+        calendar = DeadlineCalendar()
+        calendar.update(make_course(1, "CST8109"), [make_assignment("Lab 1", datetime(2026, 2, 1))])
+
+        assert [deadline.assignment.name for deadline in calendar.available_between(datetime(2026, 1, 10), datetime(2026, 1, 20))] == ["Lab 1"]
+        assert calendar.available_between(datetime(2026, 2, 2), datetime(2026, 2, 3)) == []
+
+    def test_start_after_due_date(self, caplog):
+        calendar = DeadlineCalendar()
+        calendar.update(make_course(1, "CST8109"), [
+            make_assignment("Lab 1", datetime(2026, 2, 1), starts_at=datetime(2026, 2, 10)),
+            make_assignment("Lab 2", datetime(2026, 2, 5), starts_at=datetime(2026, 1, 20)),
+        ])
+
+        assert "Lab 1" in caplog.text
+        assert [deadline.assignment.name for deadline in calendar.due_between(datetime(2026, 1, 1), datetime(2026, 3, 1))] == ["Lab 1", "Lab 2"]
+        assert {deadline.assignment.name for deadline in calendar.available_between(datetime(2026, 2, 1), datetime(2026, 2, 1))} == {"Lab 1", "Lab 2"}
+        assert calendar.available_between(datetime(2026, 2, 6), datetime(2026, 2, 9)) == []
+
+    def test_update_unchanged_course(self):
+        calendar = DeadlineCalendar()
+        course = make_course(1, "CST8109")
+        assignments = [make_assignment("Lab 1", datetime(2026, 1, 10))]
+
+        assert calendar.update(course, assignments)
+        events = calendar.to_ics()
+        assert not calendar.update(course, [make_assignment("Lab 1", datetime(2026, 1, 10))])
+        # Unchanged courses keep their rendered events
+        assert calendar.to_ics() == events
+
+    def test_update_changed_course(self):
+        calendar = DeadlineCalendar()
+        course = make_course(1, "CST8109")
+        calendar.update(course, [make_assignment("Lab 1", datetime(2026, 1, 10))])
+        calendar.due_between(datetime.min, datetime.max)
+
+        assert calendar.update(course, [make_assignment("Lab 1", datetime(2026, 1, 11))])
+        assert calendar.due_between(datetime.min, datetime.max)[0].assignment.due_at == datetime(2026, 1, 11)
+
+    def test_sync_only_updates_changed_courses(self):
+        courses = [make_course(1, "CST8109"), make_course(2, "CST8514")]
+        brightspace = MagicMock()
+        brightspace.get_assignments.side_effect = lambda org_unit_id: [make_assignment(f"Lab {org_unit_id}", datetime(2026, 1, 10))]
+
+        calendar = DeadlineCalendar()
+        assert calendar.sync(brightspace, courses) == courses
+
+        brightspace.get_assignments.side_effect = lambda org_unit_id: [make_assignment(f"Lab {org_unit_id}", datetime(2026, 1, 10 + int(org_unit_id == "2")))]
+        assert calendar.sync(brightspace, courses) == [courses[1]]
+
+        # Courses missing from the list are removed
+        calendar.sync(brightspace, courses[:1])
+        assert len(calendar) == 1
+
+    def test_to_ics(self):
+        calendar = DeadlineCalendar()
+        calendar.update(make_course(1, "CST8109"), [
+            make_assignment("Lab 1, Part A; " + "x" * 80, datetime(2026, 1, 10, 23, 59), starts_at=datetime(2026, 1, 3, 8, 0)),
+            make_assignment("No Dates", None),
+        ])
+
+        ics = calendar.to_ics()
+
+        assert ics.startswith("BEGIN:VCALENDAR\r\n")
+        assert ics.endswith("END:VCALENDAR\r\n")
+        assert ics.count("BEGIN:VEVENT") == 1
+        assert "DTSTART:20260110T235900\r\n" in ics
+        assert "SUMMARY:26W_CST8109_300: Lab 1\\, Part A\\; x" in ics
+        assert "DESCRIPTION:Available from Jan 03\\, 2026 08:00 AM" in ics
+        assert all(len(line.encode("utf-8")) <= 75 for line in ics.split("\r\n"))
+
+    def test_ics_uids_of_assignments_with_the_same_name(self):
+        calendar = DeadlineCalendar()
+        calendar.update(make_course(1, "CST8109"), [
+            make_assignment("Quiz", datetime(2026, 1, 10)),
+            make_assignment("Quiz", datetime(2026, 1, 17)),
+            make_assignment("Lab", datetime(2026, 1, 12), folder_id=42),
+            make_assignment("Lab", datetime(2026, 1, 19), folder_id=43),
+        ])
+
+        uids = [line for line in calendar.to_ics().split("\r\n") if line.startswith("UID:")]
+
+        assert len(set(uids)) == 4
+        assert "UID:1-folder-42@acbrightspace" in uids
@@ -0,0 +1,37 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from acbrightspace.drivers import HtmlDriver, ReplayDriver, page_filename
+from acbrightspace.errors import HttpStatusError
+
+def test_page_filename():
+    assert page_filename("https://example.com/d2l/lms/dropbox/user/folders_list.d2l?ou=1&isprv=0") == "d2l_lms_dropbox_user_folders_list.d2l_ou=1_isprv=0.html"
+    assert page_filename("https://example.com/") == "index.html"
+
+def test_page_filename_is_short_and_unique():
+    first = page_filename("https://example.com/page?" + "a" * 300)
+    second = page_filename("https://example.com/page?" + "a" * 299 + "b")
+    assert len(first) < 160
+    assert first != second
+
+def test_replay(tmp_path):
+    driver = ReplayDriver(tmp_path)
+    driver.record("https://example.com/grades?ou=1", "<html><head><title>Grades</title></head><body><table id='z_f'></table></body></html>")
+
+    driver.get("https://other.example.com/grades?ou=1")
+
+    assert driver.title == "Grades"
+    assert driver.current_url == "https://other.example.com/grades?ou=1"
+    assert driver.find_element(By.ID, "z_f").tag_name == "table"
+
+def test_replay_missing_page(tmp_path):
+    with pytest.raises(HttpStatusError) as error:
+        ReplayDriver(tmp_path).get("https://example.com/missing")
+    assert error.value.status == 404
+
+def test_driver_without_load_cannot_be_created():
+    class Incomplete(HtmlDriver):
+        pass
+
+    with pytest.raises(TypeError, match="load"):
+        Incomplete()
@@ -0,0 +1,226 @@
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import re
+import threading
+import time
+
+import pytest
+
+from acbrightspace.assignment import Assignment
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.content import LE_API_VERSION
+from acbrightspace.drivers import HttpDriver, ReplayDriver
+from acbrightspace.dropbox import Submission, SubmissionStatus, check_open, submit_files, submit_many
+from acbrightspace.errors import BrightspaceError, HttpStatusError, SubmissionClosedError, SubmissionError
+from acbrightspace.mock_server import Dataset, MockBrightspaceServer
+from acbrightspace.session import HttpSession
+
+FOLDER_PATH = re.compile(rf"^/d2l/api/le/{re.escape(LE_API_VERSION)}/(\d+)/dropbox/folders/(\d+)/submissions/(mysubmissions/)?$")
+
+def parse_multipart(content_type, body):
+    """Splits a multipart body into (headers, content) parts."""
+    boundary = content_type.split("boundary=")[1].encode()
+    parts = []
+    for chunk in body.split(b"--" + boundary)[1:]:
+        if chunk.startswith(b"--"):
+            break
+        head, content = chunk[2:].split(b"\r\n\r\n", 1)
+        headers = dict(line.split(": ", 1) for line in head.decode().split("\r\n"))
+        parts.append((headers, content[:-2] if content.endswith(b"\r\n") else content))
+    return parts
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Accepts dropbox submissions and lists them, like the Brightspace dropbox API."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _folder(self):
+        match = FOLDER_PATH.match(self.path)
+        if match is None or int(match.group(2)) in self.server.missing:
+            self.send_error(404)
+            return None
+        return int(match.group(2))
+
+    def do_GET(self):
+        folder_id = self._folder()
+        if folder_id is None:
+            return
+        with self.server.lock:
+            submissions = list(self.server.submissions.get(folder_id, []))
+        body = json.dumps([{"Entity": {"EntityId": 1}, "Status": 1, "Submissions": submissions}]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        folder_id = self._folder()
+        if folder_id is None:
+            return
+        with self.server.lock:
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        try:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            time.sleep(self.server.delay)
+            parts = parse_multipart(self.headers["Content-Type"], body)
+            files = [
+                {"FileId": index, "FileName": re.search(r'filename="(.*)"', headers["Content-Disposition"]).group(1), "Size": len(content)}
+                for index, (headers, content) in enumerate(parts[1:])
+            ]
+            with self.server.lock:
+                self.server.uploads.append((folder_id, dict(self.headers), parts))
+                if folder_id not in self.server.ignored:
+                    if folder_id in self.server.lossy:
+                        files = files[:-1]
+                    self.server.next_id += 1
+                    self.server.submissions.setdefault(folder_id, []).append({
+                        "Id": self.server.next_id,
+                        "SubmissionDate": "2026-03-01T12:00:00.000Z",
+                        "Comment": json.loads(parts[0][1]),
+                        "Files": files,
+                    })
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.lock = threading.Lock()
+    server.submissions = {}
+    server.uploads = []
+    server.next_id = 0
+    server.missing = set()
+    server.ignored = set()
+    server.lossy = set()
+    server.delay = 0.0
+    server.active = 0
+    server.max_active = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def session(server):
+    host, port = server.server_address
+    session = HttpSession(cookies={"d2lSessionVal": "abc"}, base_url=f"http://{host}:{port}")
+    yield session
+    session.close()
+
+@pytest.fixture
+def files(tmp_path):
+    report = tmp_path / "report.pdf"
+    report.write_bytes(bytes(range(256)) * 10_000)
+    code = tmp_path / "lab3.zip"
+    code.write_bytes(b"PK" + b"\x00" * 5000)
+    return [report, code]
+
+def assignment(folder_id, ends_at=None, name=None, starts_at=None):
+    return Assignment(
+        name=name or f"Lab {folder_id}", starts_at=starts_at, ends_at=ends_at, due_at=None,
+        score=None, completion_status="Not Submitted", evaluation_status=None, folder_id=folder_id,
+    )
+
+def test_submit_files(server, session, files):
+    receipt = submit_files(session, 1234, 7, files, comment="Final version", chunk_size=4096)
+
+    assert receipt.folder_id == 7 and receipt.org_unit_id == 1234
+    assert [(file.name, file.size) for file in receipt.files] == [(path.name, path.stat().st_size) for path in files]
+    assert receipt.submitted_at == datetime.fromisoformat("2026-03-01T12:00:00+00:00")
+
+    _, headers, parts = server.uploads[0]
+    # Streamed with a known length rather than chunked transfer encoding
+    assert int(headers["Content-Length"]) > sum(path.stat().st_size for path in files)
+    assert "Transfer-Encoding" not in headers
+    assert headers["Content-Type"].startswith("multipart/mixed; boundary=")
+    assert json.loads(parts[0][1]) == {"Text": "Final version", "Html": None}
+    assert [content for _, content in parts[1:]] == [path.read_bytes() for path in files]
+
+def test_missing_file_in_receipt(server, session, files):
+    server.lossy.add(7)
+    with pytest.raises(SubmissionError, match="did not confirm"):
+        submit_files(session, 1234, 7, files)
+
+def test_earlier_submission_is_not_a_receipt(server, session, files):
+    submit_files(session, 1234, 7, files)
+    server.ignored.add(7)
+    with pytest.raises(SubmissionError, match="did not confirm"):
+        submit_files(session, 1234, 7, files)
+
+def test_rejected_upload(server, session, files):
+    server.missing.add(7)
+    with pytest.raises(HttpStatusError):
+        submit_files(session, 1234, 7, files)
+
+def test_check_open():
+    now = datetime(2026, 3, 1, 12, 0)
+    assert check_open(assignment(7, ends_at=now + timedelta(minutes=1)), now) == 7
+    assert check_open(assignment(7), now) == 7
+    with pytest.raises(SubmissionClosedError):
+        check_open(assignment(7, ends_at=now), now)
+    assert check_open(assignment(7, starts_at=now), now) == 7
+    with pytest.raises(SubmissionClosedError, match="from"):
+        check_open(assignment(7, starts_at=now + timedelta(minutes=1)), now)
+    with pytest.raises(SubmissionError, match="not known"):
+        check_open(assignment(None), now)
+
+def test_brightspace_submit(server, session, files):
+    brightspace = Brightspace(base_url=session.base_url, driver=HttpDriver(session))
+
+    receipt = brightspace.submit(1234, assignment(7), files)
+    assert len(receipt.files) == 2
+
+    with pytest.raises(SubmissionClosedError):
+        brightspace.submit(1234, assignment(8, ends_at=datetime.now() - timedelta(hours=1)), files)
+    assert [folder_id for folder_id, _, _ in server.uploads] == [7]
+
+def test_submit_many_in_parallel(server, session, files):
+    server.delay = 0.1
+    server.missing.add(13)
+    submissions = [Submission(1234, assignment(folder_id), files) for folder_id in (10, 11, 12)]
+    submissions.append(Submission(1234, assignment(13), files))
+    submissions.append(Submission(1234, assignment(14, ends_at=datetime.now() - timedelta(days=1)), files))
+
+    results = submit_many(session, submissions, max_workers=3)
+
+    assert [result.status for result in results] == [SubmissionStatus.SUBMITTED] * 3 + [SubmissionStatus.FAILED, SubmissionStatus.CLOSED]
+    assert [result.receipt.folder_id for result in results[:3]] == [10, 11, 12]
+    assert isinstance(results[3].error, HttpStatusError)
+    assert server.max_active > 1
+    assert 14 not in [folder_id for folder_id, _, _ in server.uploads]
+
+def test_submit_many_to_one_folder_in_turn(server, session, files):
+    server.delay = 0.1
+    # The same files twice, so only the order tells the receipts apart
+    submissions = [Submission(1234, assignment(10), files), Submission(1234, assignment(10), files), Submission(1234, assignment(11), files)]
+
+    results = submit_many(session, submissions, max_workers=3)
+
+    assert [result.status for result in results] == [SubmissionStatus.SUBMITTED] * 3
+    assert results[0].receipt.submission_id != results[1].receipt.submission_id
+    assert server.max_active <= 2
+
+def test_replayed_pages_cannot_submit(tmp_path, files):
+    brightspace = Brightspace(driver=ReplayDriver(tmp_path / "pages"))
+    with pytest.raises(BrightspaceError):
+        brightspace.submit(1234, assignment(7), files)
+
+def test_assignments_have_folder_ids():
+    dataset = Dataset.generate(seed=1, course_count=1, grade_count=2, assignment_count=30)
+    with MockBrightspaceServer(dataset) as mock:
+        brightspace = Brightspace(base_url=mock.base_url, driver=HttpDriver(HttpSession(mock.session_cookies, base_url=mock.base_url)))
+        org_unit_id = dataset.courses[0].course.org_unit_id
+
+        assignments = brightspace.get_assignments(str(org_unit_id))
+
+    assert [assignment.folder_id for assignment in assignments] == [assignment.folder_id for _, assignment in dataset.courses[0].assignments]
+    assert all(assignment.folder_id is not None for assignment in assignments)
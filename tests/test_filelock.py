@@ -0,0 +1,40 @@
+import subprocess
+import sys
+import time
+
+from acbrightspace.filelock import FileLock
+
+def test_lock_is_exclusive(tmp_path):
+    first = FileLock(tmp_path / "lock")
+    second = FileLock(tmp_path / "lock")
+
+    assert first.acquire()
+    assert not second.acquire(blocking=False)
+    assert not second.acquire(timeout=0.1)
+
+    first.release()
+    assert second.acquire(blocking=False)
+    second.release()
+
+def test_context_manager(tmp_path):
+    with FileLock(tmp_path / "lock") as lock:
+        assert lock.locked
+    assert not lock.locked
+
+def test_lock_is_shared_between_processes(tmp_path):
+    path = tmp_path / "lock"
+    holder = subprocess.Popen(
+        [sys.executable, "-c", f"from acbrightspace.filelock import FileLock; import sys, time; lock = FileLock({str(path)!r}); lock.acquire(); print('locked', flush=True); sys.stdin.read()"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+    )
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        assert not FileLock(path).acquire(blocking=False)
+    finally:
+        holder.stdin.close()
+        holder.wait()
+
+    # The lock is released when its process exits
+    start = time.monotonic()
+    assert FileLock(path).acquire(timeout=5)
+    assert time.monotonic() - start < 5
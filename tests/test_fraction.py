@@ -78,3 +78,23 @@ class TestFractionToDecimal:
         assert fraction.to_decimal() == -0.75
 
 
+
+
+class TestFractionEquality:
+    def test_equal_fractions(self):
+        assert Fraction(8.5, 10) == Fraction(8.5, 10)
+
+    def test_same_value_with_different_denominators_is_not_equal(self):
+        assert Fraction(8, 10) != Fraction(4, 5)
+
+    def test_hashable(self):
+        assert len({Fraction(8, 10), Fraction(8.0, 10.0), Fraction(4, 5)}) == 2
+        assert {Fraction(8, 10): "Lab 1"}[Fraction(8, 10)] == "Lab 1"
+
+    def test_round_trip_dict(self):
+        fraction = Fraction(8.5, 10)
+        assert Fraction.from_dict(fraction.to_dict()) == fraction
+
+    def test_unsupported_version(self):
+        with pytest.raises(ValueError, match="Unsupported Fraction data version"):
+            Fraction.from_dict({"numerator": 1, "denominator": 2}, version=99)
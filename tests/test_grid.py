@@ -0,0 +1,199 @@
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.drivers import HttpDriver
+from acbrightspace.errors import BrightspaceError
+from acbrightspace.grid import Grid, GridNode, node_capacity
+from acbrightspace.mock_server import Dataset, MockBrightspaceServer
+from acbrightspace.resilience import Resilience, RetryPolicy
+from acbrightspace.session import HttpSession
+
+GRID_STATUS = {"value": {"ready": True, "nodes": [
+    {"availability": "UP", "slots": [{"stereotype": {"browserName": "chrome"}}] * 3 + [{"stereotype": {"browserName": "firefox"}}]},
+    {"availability": "DOWN", "slots": [{"stereotype": {"browserName": "chrome"}}] * 5},
+]}}
+
+class StatusHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = json.dumps(self.server.status).encode()
+        self.send_response(200 if self.path == "/status" else 404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+@pytest.fixture
+def status_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+    server.status = GRID_STATUS
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def url_of(server):
+    host, port = server.server_address
+    return f"http://{host}:{port}"
+
+@pytest.fixture
+def mock_server():
+    with MockBrightspaceServer(Dataset.generate(seed=3, course_count=12, grade_count=5, assignment_count=3)) as server:
+        yield server
+
+class NodeDriver(HttpDriver):
+    """Loads pages from the mock server while pretending to run on a grid node."""
+
+    def __init__(self, server, node, tracker):
+        super().__init__(HttpSession(base_url=server.base_url))
+        self.node = node
+        self.tracker = tracker
+
+    def get(self, url):
+        if self.node.url in self.tracker.dead:
+            raise ConnectionRefusedError(f"{self.node.url} is gone")
+        with self.tracker.lock:
+            self.tracker.running[self.node.url] = self.tracker.running.get(self.node.url, 0) + 1
+            self.tracker.peak[self.node.url] = max(self.tracker.peak.get(self.node.url, 0), self.tracker.running[self.node.url])
+        try:
+            time.sleep(0.01)
+            super().get(url)
+        finally:
+            with self.tracker.lock:
+                self.tracker.running[self.node.url] -= 1
+
+    def quit(self):
+        if self.node.url in self.tracker.dead and self.tracker.hang is not None:
+            # A dead node keeps the request open until it times out
+            self.tracker.quitting.set()
+            self.tracker.hang.wait(5)
+        super().quit()
+
+class Tracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = {}
+        self.peak = {}
+        self.dead = set()
+        self.created = []
+        self.quitting = threading.Event()
+        self.hang = None
+
+def make_grid(mock_server, nodes, tracker, **kwargs):
+    def factory(node):
+        tracker.created.append(node.url)
+        return NodeDriver(mock_server, node, tracker)
+
+    return Grid(
+        nodes,
+        base_url=mock_server.base_url,
+        resilience=Resilience(retry=RetryPolicy(max_attempts=1)),
+        driver_factory=factory,
+        **kwargs,
+    )
+
+def grades(brightspace, course):
+    return len(brightspace.get_grades(str(course.org_unit_id)))
+
+
+def test_node_capacity(status_server):
+    assert node_capacity(url_of(status_server)) == 3
+
+    status_server.status = {"value": {"ready": False}}
+    assert node_capacity(url_of(status_server)) == 0
+
+    status_server.status = {"value": {"ready": True, "message": "ChromeDriver ready"}}
+    assert node_capacity(url_of(status_server)) == 1
+
+def test_grid_reads_capacity(status_server):
+    grid = Grid([url_of(status_server), GridNode("http://127.0.0.1:9", capacity=None)])
+    assert grid.nodes[0].capacity == 3
+    # The unreachable node is left out
+    assert not grid.nodes[1].healthy
+    assert grid.capacity == 3
+
+def test_map_spreads_jobs_within_capacity(mock_server):
+    tracker = Tracker()
+    courses = [mock.course for mock in mock_server.dataset.courses]
+    grid = make_grid(mock_server, [GridNode("node-a", capacity=2), GridNode("node-b", capacity=3)], tracker)
+
+    with grid:
+        assert grid.map(grades, courses) == [5] * len(courses)
+
+    assert set(tracker.peak) == {"node-a", "node-b"}
+    assert tracker.peak["node-a"] <= 2
+    assert tracker.peak["node-b"] <= 3
+    # Browsers are reused between jobs
+    assert tracker.created.count("node-a") <= 2
+    assert tracker.created.count("node-b") <= 3
+
+def test_setup_runs_once_per_browser(mock_server):
+    tracker = Tracker()
+    setups = []
+    grid = make_grid(mock_server, [GridNode("node-a", capacity=1)], tracker, setup=setups.append)
+
+    grid.map(grades, [mock.course for mock in mock_server.dataset.courses[:4]])
+
+    assert len(setups) == 1
+
+def test_jobs_move_off_a_node_that_disappears(mock_server):
+    tracker = Tracker()
+    tracker.dead.add("node-b")
+    courses = [mock.course for mock in mock_server.dataset.courses]
+    grid = make_grid(mock_server, [GridNode("node-a", capacity=2), GridNode("node-b", capacity=2)], tracker)
+
+    assert grid.map(grades, courses) == [5] * len(courses)
+    assert not grid.nodes[1].healthy
+    assert grid.capacity == 2
+
+def test_no_nodes_left(mock_server):
+    tracker = Tracker()
+    tracker.dead.add("node-a")
+    grid = make_grid(mock_server, [GridNode("node-a", capacity=1)], tracker, max_attempts=3)
+
+    with pytest.raises(BrightspaceError, match="No grid nodes are available"):
+        grid.map(grades, [mock_server.dataset.courses[0].course])
+
+def test_node_is_tried_again_later(mock_server):
+    tracker = Tracker()
+    tracker.dead.add("node-a")
+    now = [0.0]
+    grid = make_grid(mock_server, [GridNode("node-a", capacity=1)], tracker, max_attempts=1, recheck_after=30, clock=lambda: now[0])
+    course = mock_server.dataset.courses[0].course
+
+    with pytest.raises(ConnectionRefusedError):
+        grid.run(lambda brightspace: grades(brightspace, course))
+
+    tracker.dead.clear()
+    now[0] = 30
+    assert grid.run(lambda brightspace: grades(brightspace, course)) == 5
+
+def test_quitting_a_browser_on_a_dead_node_does_not_block_the_grid(mock_server):
+    tracker = Tracker()
+    tracker.dead.add("node-b")
+    tracker.hang = threading.Event()
+    grid = make_grid(mock_server, [GridNode("node-b", capacity=1), GridNode("node-a", capacity=1)], tracker, max_attempts=1)
+    course = mock_server.dataset.courses[0].course
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        failing = executor.submit(grid.run, lambda brightspace: grades(brightspace, course))
+        assert tracker.quitting.wait(5)
+        try:
+            assert executor.submit(grid.run, lambda brightspace: grades(brightspace, course)).result(timeout=2) == 5
+        finally:
+            tracker.hang.set()
+        with pytest.raises(ConnectionRefusedError):
+            failing.result()
+
+def test_brightspace_remote_url():
+    with patch("acbrightspace.brightspace.webdriver.Remote") as remote:
+        Brightspace(remote_url="http://grid:4444")
+    assert remote.call_args.kwargs["command_executor"] == "http://grid:4444"
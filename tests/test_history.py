@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from acbrightspace.assignment import Assignment
+from acbrightspace.errors import BrightspaceError
+from acbrightspace.fraction import Fraction
+from acbrightspace.grade_item import GradeItem
+from acbrightspace.history import EVALUATION_STATUS, POINTS, REMOVED, HistoryStore, SeriesKey, _encode_value, _Reader
+
+START = datetime(2026, 1, 12, 9, 0)
+
+def grade(name, points):
+    return GradeItem(name=name, points=Fraction(*points) if points else None, weight=None, comments=None)
+
+def assignment(name, status):
+    return Assignment(name=name, starts_at=None, ends_at=None, due_at=None, score=None, completion_status=None, evaluation_status=status)
+
+def points(value):
+    return (value.numerator, value.denominator) if isinstance(value, Fraction) else value
+
+def day(number):
+    return START + timedelta(days=number)
+
+@pytest.mark.parametrize("value", [None, REMOVED, Fraction(8.5, 10), Fraction(1 / 3, 7), Fraction(-2, 100), "Feedback: Published", ""])
+def test_values_round_trip(value):
+    decoded = _Reader(_encode_value(value)).value()
+    if isinstance(value, Fraction):
+        assert points(decoded) == points(value)
+    else:
+        assert decoded == value
+
+def test_only_changes_are_recorded(tmp_path):
+    with HistoryStore(tmp_path) as history:
+        assert len(history.record_grades(1, [grade("Lab 1", None), grade("Lab 2", None)], at=day(0))) == 2
+        assert history.record_grades(1, [grade("Lab 1", None), grade("Lab 2", None)], at=day(1)) == []
+
+        changes = history.record_grades(1, [grade("Lab 1", (8, 10)), grade("Lab 2", None)], at=day(2))
+        assert [(change.key.name, points(change.value)) for change in changes] == [("Lab 1", (8, 10))]
+        assert changes[0].at == day(2)
+
+def test_state_at(tmp_path):
+    with HistoryStore(tmp_path) as history:
+        history.record_grades(1, [grade("Lab 1", None)], at=day(0))
+        history.record_grades(1, [grade("Lab 1", (8, 10))], at=day(3))
+        history.record_assignments(1, [assignment("Lab 1", None)], at=day(3))
+        history.record_assignments(1, [assignment("Lab 1", "Feedback: Published")], at=day(4))
+
+        assert history.state_at(day(0) - timedelta(seconds=1)) == {}
+        assert history.state_at(day(2)) == {SeriesKey(1, "Lab 1", POINTS): None}
+        state = history.state_at(day(3))
+        assert points(state[SeriesKey(1, "Lab 1", POINTS)]) == (8, 10)
+        assert state[SeriesKey(1, "Lab 1", EVALUATION_STATUS)] is None
+        assert history.state_at(day(5))[SeriesKey(1, "Lab 1", EVALUATION_STATUS)] == "Feedback: Published"
+
+def test_changes_between(tmp_path):
+    with HistoryStore(tmp_path) as history:
+        for number in range(5):
+            history.record_grades(1, [grade("Quiz", (number, 10))], at=day(number))
+            history.record_grades(2, [grade("Quiz", (number, 5))], at=day(number))
+
+        changes = history.changes_between(day(1), day(3))
+        assert [(change.at, change.key.org_unit_id) for change in changes] == [(day(n), course) for n in (1, 2, 3) for course in (1, 2)]
+        assert [points(change.value) for change in history.changes_between(day(1), day(2), org_unit_id=2)] == [(1, 5), (2, 5)]
+
+def test_missing_items_are_marked_removed(tmp_path):
+    with HistoryStore(tmp_path) as history:
+        history.record_grades(1, [grade("Lab 1", (1, 2)), grade("Lab 2", (1, 2))], at=day(0))
+        changes = history.record_grades(1, [grade("Lab 1", (1, 2))], at=day(1))
+
+        assert [(change.key.name, change.value) for change in changes] == [("Lab 2", REMOVED)]
+        assert set(key.name for key in history.state_at(day(1))) == {"Lab 1"}
+        assert set(key.name for key in history.state_at(day(0))) == {"Lab 1", "Lab 2"}
+        # Other courses and fields are not affected
+        assert history.record_assignments(1, [], at=day(2)) == []
+
+def test_items_with_the_same_name_are_numbered(tmp_path):
+    with HistoryStore(tmp_path) as history:
+        history.record_grades(1, [grade("Quiz", (1, 2)), grade("Quiz", (2, 2)), grade("Quiz (2)", (0, 2))], at=day(0))
+        history.record_assignments(1, [assignment("Report", None), assignment("Report", "Feedback: Published")], at=day(0))
+
+        state = history.state_at(day(0))
+        assert {key.name: points(value) for key, value in state.items() if key.field == POINTS} == {"Quiz": (1, 2), "Quiz (2)": (0, 2), "Quiz (3)": (2, 2)}
+        assert {key.name: value for key, value in state.items() if key.field == EVALUATION_STATUS} == {"Report": None, "Report (2)": "Feedback: Published"}
+
+def test_history_must_be_recorded_in_order(tmp_path):
+    with HistoryStore(tmp_path) as history:
+        history.record_grades(1, [grade("Lab 1", None)], at=day(1))
+        with pytest.raises(ValueError):
+            history.record_grades(1, [grade("Lab 1", (1, 2))], at=day(0))
+
+def test_history_is_persisted(tmp_path):
+    with HistoryStore(tmp_path) as history:
+        history.record_grades(1, [grade("Lab 1", None)], at=day(0))
+    with HistoryStore(tmp_path) as history:
+        history.record_grades(1, [grade("Lab 1", (8, 10))], at=day(1))
+    with HistoryStore(tmp_path) as history:
+        assert [points(change.value) for change in history.changes_between(day(0), day(1))] == [None, (8, 10)]
+        # An unchanged value is not recorded again after reopening
+        assert history.record_grades(1, [grade("Lab 1", (8, 10))], at=day(2)) == []
+
+def test_records_are_compact(tmp_path):
+    with HistoryStore(tmp_path) as history:
+        names = [f"Lab {number}" for number in range(20)]
+        for number in range(50):
+            history.record_grades(1, [grade(name, (number, 10)) for name in names], at=day(0) + timedelta(hours=number))
+
+    size = sum(path.stat().st_size for path in tmp_path.glob("segment-*.seg"))
+    # 1000 changes, each well under the size of a timestamp in text
+    assert size < 1000 * 10
+
+def test_damaged_tail_is_ignored(tmp_path):
+    with HistoryStore(tmp_path) as history:
+        history.record_grades(1, [grade("Lab 1", (1, 10))], at=day(0))
+        history.record_grades(1, [grade("Lab 1", (2, 10))], at=day(1))
+    segment = next(tmp_path.glob("segment-*.seg"))
+    segment.write_bytes(segment.read_bytes()[:-1])
+
+    with HistoryStore(tmp_path) as history:
+        assert [points(change.value) for change in history.changes_between(day(0), day(1))] == [(1, 10)]
+
+def test_store_is_locked(tmp_path):
+    with HistoryStore(tmp_path):
+        with pytest.raises(BrightspaceError):
+            HistoryStore(tmp_path)
+
+def test_segments_roll_over_and_compact(tmp_path):
+    with HistoryStore(tmp_path, segment_size=64, max_segments=4) as history:
+        for number in range(40):
+            history.record_grades(1, [grade("Lab 1", (number, 10))], at=day(number))
+        assert len(list(tmp_path.glob("segment-*.seg"))) < 4
+        assert len(list(tmp_path.glob("checkpoint-*.ckpt"))) == 1
+        assert len(history.changes_between(day(0), day(40))) == 40
+
+    with HistoryStore(tmp_path) as history:
+        assert len(history.changes_between(day(0), day(40))) == 40
+        assert points(history.state_at(day(17))[SeriesKey(1, "Lab 1", POINTS)]) == (17, 10)
+
+def test_compaction_drops_old_changes_but_keeps_their_state(tmp_path):
+    with HistoryStore(tmp_path, retention=timedelta(days=5)) as history:
+        history.record_grades(1, [grade("Lab 1", (1, 10)), grade("Lab 2", (5, 10))], at=day(0))
+        history.record_grades(1, [grade("Lab 1", (2, 10)), grade("Lab 2", (5, 10))], at=day(8))
+        history.compact(now=day(10))
+
+    with HistoryStore(tmp_path) as history:
+        assert [points(change.value) for change in history.changes_between(day(0), day(10))] == [(2, 10)]
+        state = history.state_at(day(6))
+        assert points(state[SeriesKey(1, "Lab 1", POINTS)]) == (1, 10)
+        assert points(state[SeriesKey(1, "Lab 2", POINTS)]) == (5, 10)
+        assert points(history.state_at(day(9))[SeriesKey(1, "Lab 1", POINTS)]) == (2, 10)
+        assert len(list(tmp_path.glob("segment-*.seg"))) == 1
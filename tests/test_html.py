@@ -0,0 +1,100 @@
+import pytest
+from selenium.common.exceptions import InvalidSelectorException, NoSuchElementException, NoSuchShadowRootException
+from selenium.webdriver.common.by import By
+
+from acbrightspace.html import HtmlDocument
+from acbrightspace.table import Table
+
+PAGE = """
+<html>
+<head><title>Grades</title><script>var x = "<td>";</script></head>
+<body>
+    <d2l-my-courses>
+        <template shadowrootmode="open">
+            <d2l-enrollment-card href="/d2l/home/123"><span class="name">Shadow</span></d2l-enrollment-card>
+        </template>
+    </d2l-my-courses>
+    <form name="grades">
+        <table id="z_f" class="d_g d_gl">
+            <tr><th>Grade Item</th><th>Points</th></tr>
+            <tr><th scope="row" colspan="2">Labs</th></tr>
+            <tr><td></td><th>Lab 1</th><td><label>8 / 10</label></td></tr>
+            <tr><td></td><th>Lab 2<br>Resubmitted</th><td>- / -
+            <tr><td></td><th>Lab &amp; Quiz</th><td style="display: none">hidden</td><td>9 / 10</td>
+        </table>
+    </form>
+    <select title="Results Per Page"><option value="10">10<option value="20" selected>20</select>
+    <input type="text" name="search">
+</body>
+</html>
+"""
+
+@pytest.fixture
+def document():
+    return HtmlDocument.parse(PAGE)
+
+
+class TestHtmlDocument:
+    def test_find_by_id(self, document):
+        assert document.find_element(By.ID, "z_f").tag_name == "table"
+
+    def test_find_missing_element(self, document):
+        with pytest.raises(NoSuchElementException):
+            document.find_element(By.ID, "missing")
+
+    def test_find_by_name_and_tag(self, document):
+        assert document.find_element(By.NAME, "search").get_attribute("type") == "text"
+        assert len(document.find_elements(By.TAG_NAME, "tr")) == 5
+
+    def test_implicitly_closed_cells(self, document):
+        rows = document.find_element(By.ID, "z_f").find_elements(By.TAG_NAME, "tr")
+        cells = rows[3].find_elements(By.XPATH, ".//td | .//th")
+        assert [cell.tag_name for cell in cells] == ["td", "th", "td"]
+
+    def test_text(self, document):
+        rows = document.find_element(By.ID, "z_f").find_elements(By.TAG_NAME, "tr")
+        cells = rows[3].find_elements(By.XPATH, ".//td | .//th")
+        assert cells[1].text == "Lab 2\nResubmitted"
+        assert rows[4].text == "Lab & Quiz 9 / 10"
+
+    def test_script_text_is_ignored(self, document):
+        assert "var x" not in document.text
+
+    @pytest.mark.parametrize("selector,count", [
+        ("table#z_f", 1),
+        ("table.d_g.d_gl", 1),
+        ("form > table tr", 5),
+        ("body > table", 0),
+        ("th[scope='row'][colspan=\"2\"]", 1),
+        ("select[title='Results Per Page'] option", 2),
+        ("td, th", 13),
+        ("d2l-enrollment-card", 0),
+    ])
+    def test_css_selectors(self, document, selector, count):
+        assert len(document.find_elements(By.CSS_SELECTOR, selector)) == count
+
+    def test_invalid_selector(self, document):
+        with pytest.raises(InvalidSelectorException):
+            document.find_elements(By.XPATH, "//tr[1]")
+
+    def test_shadow_root(self, document):
+        host = document.find_element(By.CSS_SELECTOR, "d2l-my-courses")
+        card = host.shadow_root.find_element(By.CSS_SELECTOR, "d2l-enrollment-card")
+        assert card.get_attribute("href") == "/d2l/home/123"
+        assert card.text == "Shadow"
+
+    def test_missing_shadow_root(self, document):
+        with pytest.raises(NoSuchShadowRootException):
+            document.find_element(By.ID, "z_f").shadow_root
+
+    def test_selected_option(self, document):
+        options = document.find_elements(By.TAG_NAME, "option")
+        assert [option.is_selected() for option in options] == [False, True]
+        assert options[1].get_attribute("selected") == "true"
+
+    def test_table_parser(self, document):
+        rows = Table().parse(document.find_element(By.ID, "z_f"))
+
+        assert [row.cells[0] for row in rows] == ["Lab 1", ["Lab 2", "Resubmitted"], "Lab & Quiz"]
+        assert rows[0].cells[1].numerator == 8.0
+        assert rows[1].cells[1] is None
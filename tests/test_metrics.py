@@ -0,0 +1,144 @@
+from datetime import datetime
+import json
+
+from selenium.common.exceptions import WebDriverException
+
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.drivers import ReplayDriver
+from acbrightspace.metrics import (
+    NAVIGATION_TIMING_SCRIPT, RESOURCE_TIMING_SCRIPT, JsonLinesSink, MetricsCollector, MetricsLog, NetworkSummary, ResourceTiming,
+)
+from acbrightspace.resilience import Resilience, RetryPolicy
+
+NAVIGATION_ENTRY = {
+    "name": "https://brightspace.example.com/d2l/lms/grades/my_grades/main.d2l?ou=1",
+    "startTime": 0, "redirectStart": 0, "redirectEnd": 0,
+    "domainLookupStart": 5, "domainLookupEnd": 15, "connectStart": 15, "connectEnd": 40,
+    "responseStart": 120, "responseEnd": 150, "domInteractive": 400,
+    "domContentLoadedEventEnd": 450, "loadEventEnd": 900,
+    "transferSize": 20000, "duration": 900,
+}
+
+RESOURCES = [
+    ["https://s.brightspace.com/lib/bsi/app.js", "script", 300000, 450.5],
+    ["https://brightspace.example.com/d2l/api/lp/1.0/users/whoami", "fetch", 800, 60.0],
+    ["https://www.google-analytics.com/analytics.js", "script", 50000, 700.0],
+    ["https://s.brightspace.com/lib/fonts/lato.woff2", "css", 0, 2.0],
+]
+
+class InstrumentedDriver(ReplayDriver):
+    """Replays pages and answers the performance calls a Chrome driver would."""
+
+    def __init__(self, directory, fail_cdp=False):
+        super().__init__(directory)
+        self.fail_cdp = fail_cdp
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, command, arguments):
+        self.cdp_commands.append(command)
+        if self.fail_cdp:
+            raise WebDriverException("DevTools is not available")
+        if command == "Performance.getMetrics":
+            return {"metrics": [{"name": "ScriptDuration", "value": 0.25}, {"name": "JSHeapUsedSize", "value": 4e6}]}
+        return {}
+
+    def execute_script(self, script, *args):
+        if script == NAVIGATION_TIMING_SCRIPT:
+            return NAVIGATION_ENTRY
+        if script == RESOURCE_TIMING_SCRIPT:
+            return RESOURCES
+        return None
+
+GRADES_PAGE = (
+    "<html><body><table id='z_f'><tr><th>Grade Item</th><th>Points</th><th>Weight Achieved</th><th>Grade</th><th>Comments and Assessments</th></tr>"
+    "<tr><th>Lab 1</th><td>8 / 10</td><td>4 / 5</td><td></td><td></td></tr></table></body></html>"
+)
+
+def test_network_summary():
+    document = ResourceTiming("https://brightspace.example.com/page", "navigation", 1000, 100.0)
+    summary = NetworkSummary.from_resources(document, [ResourceTiming(*resource) for resource in RESOURCES])
+
+    assert summary.request_count == 5
+    assert summary.transfer_bytes == 351800
+    assert summary.bytes_by_host == {"brightspace.example.com": 1800, "s.brightspace.com": 300000, "www.google-analytics.com": 50000}
+    assert [request.url for request in summary.slowest[:2]] == [
+        "https://www.google-analytics.com/analytics.js",
+        "https://s.brightspace.com/lib/bsi/app.js",
+    ]
+
+def test_collect(tmp_path):
+    driver = InstrumentedDriver(tmp_path)
+    collector = MetricsCollector()
+
+    metrics = collector.collect(driver, "https://brightspace.example.com/d2l/home", "get_courses", datetime(2026, 1, 5), 0.9)
+    collector.collect(driver, "https://brightspace.example.com/d2l/home", "get_courses", datetime(2026, 1, 5), 0.9)
+
+    assert driver.cdp_commands == ["Performance.enable", "Performance.getMetrics", "Performance.getMetrics"]
+    assert metrics.performance == {"ScriptDuration": 0.25, "JSHeapUsedSize": 4e6}
+    assert metrics.timing == {
+        "redirect": 0, "dns": 10, "connect": 25, "time_to_first_byte": 120, "response": 30,
+        "dom_interactive": 400, "dom_content_loaded": 450, "load": 900,
+    }
+    assert metrics.network.request_count == 5
+
+def test_collect_without_devtools(tmp_path):
+    metrics = MetricsCollector().collect(InstrumentedDriver(tmp_path, fail_cdp=True), "https://example.com/", None, datetime(2026, 1, 5), 0.1)
+
+    assert metrics.performance == {}
+    assert metrics.network.request_count == 5
+
+def test_static_driver_reports_duration_only(tmp_path):
+    metrics = MetricsCollector().collect(ReplayDriver(tmp_path), "https://example.com/", None, datetime(2026, 1, 5), 0.1)
+
+    assert metrics.duration == 0.1
+    assert metrics.timing == {}
+    assert metrics.network.request_count == 0
+
+def test_operations_are_labelled_and_sent_to_sinks(tmp_path):
+    driver = InstrumentedDriver(tmp_path / "pages")
+    driver.record("https://brightspace.example.com/d2l/lms/grades/my_grades/main.d2l?ou=1", GRADES_PAGE)
+    log = MetricsLog()
+    brightspace = Brightspace(base_url="https://brightspace.example.com", resilience=Resilience(retry=RetryPolicy(base_delay=0)), driver=driver, metrics=log)
+
+    with brightspace.capture_metrics() as captured:
+        brightspace.get_grades("1")
+    brightspace.get_grades("1")
+
+    assert [metrics.operation for metrics in log.navigations] == ["get_grades", "get_grades"]
+    assert len(captured) == 1
+    assert captured[0].network.transfer_bytes == 370800
+    assert "/d2l/lms/grades/my_grades/main.d2l" in log.summary()
+
+def test_json_lines_sink(tmp_path):
+    sink = JsonLinesSink(tmp_path / "metrics.jsonl")
+    metrics = MetricsCollector().collect(InstrumentedDriver(tmp_path), "https://example.com/", "login", datetime(2026, 1, 5, 8, 30), 0.5)
+
+    sink(metrics)
+    sink(metrics)
+
+    lines = (tmp_path / "metrics.jsonl").read_text().splitlines()
+    assert len(lines) == 2
+    data = json.loads(lines[0])
+    assert data["started_at"] == "2026-01-05T08:30:00"
+    assert [request["initiator"] for request in data["network"]["slowest"][:2]] == ["navigation", "script"]
+
+def test_malformed_timing_entry_is_ignored(tmp_path):
+    driver = InstrumentedDriver(tmp_path)
+    driver.execute_script = lambda script, *args: [["https://example.com/app.js", "script", "lots", None]] if script == RESOURCE_TIMING_SCRIPT else None
+
+    metrics = MetricsCollector().collect(driver, "https://example.com/", None, datetime(2026, 1, 5), 0.1)
+
+    assert metrics.duration == 0.1
+    assert metrics.network.request_count == 0
+
+def test_failing_sink_does_not_fail_navigation(tmp_path):
+    driver = InstrumentedDriver(tmp_path / "pages")
+    driver.record("https://brightspace.example.com/d2l/lms/grades/my_grades/main.d2l?ou=1", GRADES_PAGE)
+    # A directory cannot be appended to
+    brightspace = Brightspace(base_url="https://brightspace.example.com", resilience=Resilience(retry=RetryPolicy(base_delay=0)), driver=driver, metrics=JsonLinesSink(tmp_path))
+
+    with brightspace.capture_metrics() as captured:
+        grades = brightspace.get_grades("1")
+
+    assert [grade.name for grade in grades] == ["Lab 1"]
+    assert len(captured) == 1
@@ -0,0 +1,134 @@
+import json
+from unittest.mock import patch
+
+import pyotp
+import pytest
+import urllib3
+
+from acbrightspace.cli import COOKIES_NAME, main
+from acbrightspace.course import Course
+from acbrightspace.errors import AuthenticationError, HttpStatusError
+from acbrightspace.mock_server import SESSION_COOKIE, Dataset, MockBrightspaceServer
+
+def fraction(value):
+    return (value.numerator, value.denominator) if value is not None else None
+
+def test_dataset_is_reproducible():
+    first = Dataset.generate(seed=7, course_count=3)
+    second = Dataset.generate(seed=7, course_count=3)
+    assert [mock.course.full_name for mock in first.courses] == [mock.course.full_name for mock in second.courses]
+    assert [grade.name for _, grade in first.courses[0].grades] == [grade.name for _, grade in second.courses[0].grades]
+
+def test_get_courses(mock_server, http_client):
+    courses = http_client().get_courses()
+
+    assert [(course.full_code, course.is_active, course.org_unit_id) for course in courses] == [
+        (mock.course.full_code, mock.course.is_active, mock.course.org_unit_id) for mock in mock_server.dataset.courses
+    ]
+    assert [course.semester.name for course in courses] == [mock.course.semester.name for mock in mock_server.dataset.courses]
+
+def test_get_courses_with_filters(mock_server, http_client, monkeypatch):
+    parsed = []
+    from_string = Course.from_string.__func__
+    monkeypatch.setattr(Course, "from_string", classmethod(lambda cls, text, org_unit_id: parsed.append(text) or from_string(cls, text, org_unit_id)))
+    closed = next(mock.course for mock in mock_server.dataset.courses if not mock.course.is_active)
+
+    courses = http_client().get_courses(semester=closed.semester.code)
+
+    expected = [mock.course.full_code for mock in mock_server.dataset.courses if mock.course.semester == closed.semester]
+    assert [course.full_code for course in courses] == expected
+    # Only the cards of the semester's tab were parsed
+    assert len(parsed) == len(expected)
+
+    parsed.clear()
+    assert all(course.is_active for course in http_client().get_courses(is_active=True))
+    assert len(parsed) == sum(mock.course.is_active for mock in mock_server.dataset.courses)
+
+    code = closed.full_code.split("_")[1]
+    assert [course.full_code for course in http_client().get_courses(code_prefix=code)] == [
+        mock.course.full_code for mock in mock_server.dataset.courses if mock.course.full_code.split("_")[1].startswith(code)
+    ]
+
+def test_get_grades(mock_server, http_client):
+    mock = mock_server.dataset.courses[0]
+
+    grades = http_client().get_grades(str(mock.course.org_unit_id))
+
+    assert [(grade.name, fraction(grade.points), fraction(grade.weight), grade.comments) for grade in grades] == [
+        (grade.name, fraction(grade.points), fraction(grade.weight), grade.comments) for _, grade in mock.grades
+    ]
+
+def test_get_assignments_across_pages(mock_server, http_client):
+    mock = mock_server.dataset.courses[1]
+
+    assignments = http_client().get_assignments(str(mock.course.org_unit_id))
+
+    expected = [assignment for _, assignment in mock.assignments]
+    assert [(a.name, a.starts_at, a.ends_at, a.due_at, fraction(a.score), a.completion_status, a.evaluation_status) for a in assignments] == [
+        (a.name, a.starts_at, a.ends_at, a.due_at, fraction(a.score), a.completion_status, a.evaluation_status) for a in expected
+    ]
+    # 230 rows do not fit on the largest page of 200
+    assert sum("folders_list" in path for path in mock_server.requests) == 3
+
+def test_injected_errors_are_retried(mock_server, http_client):
+    mock_server.inject_errors(2)
+
+    grades = http_client().get_grades(str(mock_server.dataset.courses[0].course.org_unit_id))
+
+    assert len(grades) == 45
+    assert len(mock_server.requests) == 4
+
+def test_injected_errors_surface_after_retries(mock_server, http_client):
+    mock_server.inject_errors(3)
+
+    with pytest.raises(HttpStatusError) as error:
+        http_client().get_grades(str(mock_server.dataset.courses[0].course.org_unit_id))
+    assert error.value.status == 503
+
+def test_requires_login(http_client):
+    with pytest.raises(AuthenticationError):
+        http_client(cookies={}).get_courses()
+
+def test_login_form(mock_server):
+    mock_server.totp_secret = pyotp.random_base32()
+    pool = urllib3.PoolManager()
+
+    response = pool.request("POST", f"{mock_server.base_url}/d2l/login/complete", fields={
+        "loginfmt": "student@algonquinlive.com",
+        "passwd": "password",
+        "otc": pyotp.TOTP(mock_server.totp_secret).now(),
+    }, encode_multipart=False, redirect=False)
+    assert response.status == 302
+    assert response.headers["Set-Cookie"].startswith(f"{SESSION_COOKIE}={mock_server.session_token}")
+
+    response = pool.request("POST", f"{mock_server.base_url}/d2l/login/complete", fields={"otc": "000000"}, encode_multipart=False, redirect=False)
+    assert response.status == 200
+    assert "Incorrect credentials" in response.data.decode()
+
+def test_load_hundreds_of_courses(tmp_path, capsys):
+    dataset = Dataset.generate(seed=2, course_count=200, grade_count=15, assignment_count=10)
+    with MockBrightspaceServer(dataset, require_login=True, latency=0.001) as server:
+        (tmp_path / COOKIES_NAME).write_text(json.dumps(server.session_cookies))
+
+        status = main(["sync", "--all", "--backend", "http", "--base-url", server.base_url,
+                       "--cache-dir", str(tmp_path), "--concurrency", "16", "--format", "json"])
+
+    assert status == 0
+    results = json.loads(capsys.readouterr().out)
+    assert len(results) == 200
+    assert all(result["grades"] == 15 and result["assignments"] == 10 for result in results)
+
+def test_expired_saved_login_is_replaced(mock_server, http_client, tmp_path, capsys):
+    cookies_path = tmp_path / COOKIES_NAME
+    cookies_path.write_text(json.dumps({SESSION_COOKIE: "expired"}))
+    logins = []
+
+    # Chrome logs in and gets a fresh session
+    with patch("acbrightspace.cli._browser", side_effect=lambda *args: http_client()), \
+         patch("acbrightspace.cli._login", side_effect=lambda brightspace, timings: logins.append(brightspace)):
+        status = main(["courses", "--backend", "http", "--base-url", mock_server.base_url, "--cache-dir", str(tmp_path), "--format", "json"])
+
+    assert status == 0
+    assert len(logins) == 1
+    assert json.loads(cookies_path.read_text()) == mock_server.session_cookies
+    assert len(json.loads(capsys.readouterr().out)) == 5
@@ -0,0 +1,159 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import urllib3
+from selenium.webdriver.common.by import By
+
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.html import HtmlDocument
+from acbrightspace.pager import PAGE_PARAMETER, PAGE_SIZE_PARAMETER, Pager, fetch_pages, page_url
+from acbrightspace.session import HttpSession
+
+FOLDERS = [(f"Category {index // 10}", f"Lab {index}") for index in range(45)]
+
+def render_folders(page: int, page_size: int, page_sizes: list[int]) -> str:
+    """Renders one page of a dropbox folder table with a pager."""
+    rows = ["<tr><th>Folder</th><th>Completion Status</th></tr>"]
+    start = (page - 1) * page_size
+    category = FOLDERS[start - 1][0] if start else None
+    for folder_category, name in FOLDERS[start:start + page_size]:
+        if folder_category != category:
+            category = folder_category
+            rows.append(f'<tr><th scope="row" colspan="2">{category}</th></tr>')
+        rows.append(f"<tr><td></td><th>{name}</th><td>Not Submitted</td></tr>")
+
+    page_count = -(-len(FOLDERS) // page_size)
+    size_options = "".join(f'<option value="{size}"{" selected" if size == page_size else ""}>{size}</option>' for size in page_sizes)
+    page_options = "".join(f'<option value="{number}"{" selected" if number == page else ""}>{number} of {page_count}</option>' for number in range(1, page_count + 1))
+    return f"""<html><body>
+        <table id="z_a">{''.join(rows)}</table>
+        <select title="Results Per Page">{size_options}</select>
+        <select title="Page Number">{page_options}</select>
+    </body></html>"""
+
+class StubHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        query = parse_qs(urlsplit(self.path).query)
+        page = int(query.get(PAGE_PARAMETER, ["1"])[0])
+        page_size = int(query.get(PAGE_SIZE_PARAMETER, [str(self.server.page_sizes[0])])[0])
+        body = render_folders(page, page_size, self.server.page_sizes).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []
+    server.page_sizes = [10, 20]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def base_url(server):
+    host, port = server.server_address
+    return f"http://{host}:{port}"
+
+class StaticDriver:
+    """Stands in for a WebDriver by loading pages without running JavaScript."""
+
+    def __init__(self):
+        self._pool = urllib3.PoolManager()
+        self.document = HtmlDocument()
+
+    @property
+    def current_url(self):
+        return self.document.url
+
+    @property
+    def title(self):
+        return self.document.title
+
+    def get(self, url):
+        self.document = HtmlDocument.parse(self._pool.request("GET", url).data.decode(), url=url)
+
+    def get_cookies(self):
+        return []
+
+    def execute_script(self, script, *args):
+        return None
+
+    def find_element(self, by, value):
+        return self.document.find_element(by, value)
+
+    def find_elements(self, by, value):
+        return self.document.find_elements(by, value)
+
+@pytest.fixture
+def brightspace(base_url):
+    with patch("acbrightspace.brightspace.webdriver.Chrome"):
+        bs = Brightspace(base_url=base_url)
+    bs.driver = StaticDriver()
+    return bs
+
+
+class TestPager:
+    def test_find(self):
+        pager = Pager.find(HtmlDocument.parse(render_folders(2, 10, [10, 20])))
+        assert pager == Pager(page_sizes=[10, 20], page_size=10, page_count=5, page=2)
+        assert pager.largest_page_size == 20
+        assert pager.can_grow
+
+    def test_find_without_pager(self):
+        assert Pager.find(HtmlDocument.parse("<table id='z_a'></table>")) is None
+
+    def test_single_page_cannot_grow(self):
+        pager = Pager.find(HtmlDocument.parse(render_folders(1, 50, [10, 50])))
+        assert pager.page_count == 1
+        assert not pager.can_grow
+
+    def test_page_url(self):
+        url = page_url("https://example.com/folders_list.d2l?ou=1&isprv=0&d2l_page=3", page=2, page_size=50)
+        assert parse_qs(urlsplit(url).query) == {"ou": ["1"], "isprv": ["0"], PAGE_SIZE_PARAMETER: ["50"], PAGE_PARAMETER: ["2"]}
+
+
+class TestFetchPages:
+    def test_fetches_pages_in_order(self, base_url):
+        session = HttpSession(base_url=base_url)
+        urls = [page_url("/folders_list.d2l?ou=1", page=page, page_size=10) for page in (3, 2)]
+        tables = fetch_pages(session, urls, "z_a")
+        first_rows = [table.find_elements(By.TAG_NAME, "tr")[2].text for table in tables]
+        assert first_rows == ["Lab 20 Not Submitted", "Lab 10 Not Submitted"]
+
+
+class TestGetTableRows:
+    def test_requests_largest_page_size_then_fetches_remaining_pages(self, server, brightspace):
+        rows = brightspace._get_table_rows(f"{brightspace.base_url}/folders_list.d2l?ou=1", "z_a")
+
+        assert [row.cells[0] for row in rows] == [name for _, name in FOLDERS]
+        # First page, first page at the largest size, then pages 2 and 3 at the largest size
+        assert len(server.requests) == 4
+        assert sorted(server.requests[2:]) == [
+            page_url("/folders_list.d2l?ou=1", page=2, page_size=20),
+            page_url("/folders_list.d2l?ou=1", page=3, page_size=20),
+        ]
+
+    def test_category_carries_across_pages(self, brightspace):
+        rows = brightspace._get_table_rows(f"{brightspace.base_url}/folders_list.d2l?ou=1", "z_a")
+
+        # Lab 20 starts page 2 without a category header of its own
+        assert rows[20].cells == ["Lab 20", "Not Submitted"]
+
+    def test_single_request_when_largest_page_fits(self, server, brightspace):
+        server.page_sizes = [10, 100]
+        rows = brightspace._get_table_rows(f"{brightspace.base_url}/folders_list.d2l?ou=1", "z_a")
+
+        assert len(rows) == len(FOLDERS)
+        assert len(server.requests) == 2
@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+
+from acbrightspace.mock_server import Dataset
+from acbrightspace.pool import ClientPool
+
+@pytest.fixture
+def mock_dataset():
+    return Dataset.generate(seed=3, course_count=4, grade_count=30, assignment_count=60)
+
+def grade_names(grades):
+    return [grade.name for grade in grades]
+
+def assignment_names(assignments):
+    return [assignment.name for assignment in assignments]
+
+def expected(mock, kind):
+    if kind == "grades":
+        return [grade.name for _, grade in mock.grades]
+    return [assignment.name for _, assignment in mock.assignments]
+
+def fetch(brightspace, mock, kind):
+    org_unit_id = str(mock.course.org_unit_id)
+    if kind == "grades":
+        return grade_names(brightspace.get_grades(org_unit_id))
+    return assignment_names(brightspace.get_assignments(org_unit_id))
+
+def test_one_client_from_several_threads(mock_server, http_client):
+    brightspace = http_client()
+    jobs = [(mock, kind) for mock in mock_server.dataset.courses for kind in ("grades", "assignments")] * 3
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda job: fetch(brightspace, *job), jobs))
+
+    # Every call sees its own pages, even though all of them share one driver
+    assert results == [expected(mock, kind) for mock, kind in jobs]
+
+def test_pool_map_keeps_order(mock_server, http_client):
+    pool = ClientPool([http_client() for _ in range(3)])
+    courses = [mock for mock in mock_server.dataset.courses] * 2
+
+    assert pool.map(lambda brightspace, mock: fetch(brightspace, mock, "grades"), courses) == [
+        expected(mock, "grades") for mock in courses
+    ]
+
+def test_checkout_hands_each_client_to_one_worker():
+    pool = ClientPool(["a", "b"])
+    active = set()
+    overlaps = []
+    lock = threading.Lock()
+
+    def work(_):
+        with pool.checkout() as name:
+            with lock:
+                overlaps.append(name in active)
+                active.add(name)
+            threading.Event().wait(0.005)
+            with lock:
+                active.discard(name)
+        return name
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        names = list(executor.map(work, range(30)))
+
+    assert not any(overlaps)
+    assert set(names) <= {"a", "b"}
+
+def test_checkout_timeout():
+    pool = ClientPool(["a"])
+    with pool.checkout():
+        with pytest.raises(TimeoutError):
+            with pool.checkout(timeout=0.01):
+                pass
+    with pool.checkout(timeout=0.01) as name:
+        assert name == "a"
+
+def test_empty_pool():
+    with pytest.raises(ValueError):
+        ClientPool([])
@@ -0,0 +1,166 @@
+from types import SimpleNamespace
+
+import pytest
+
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.drivers import HttpDriver
+from acbrightspace.mock_server import Dataset, MockBrightspaceServer
+from acbrightspace.prefetch import OPEN_TAB_SCRIPT, READY_STATE_SCRIPT, TabPrefetcher
+from acbrightspace.session import HttpSession
+
+class TabbedBrowser:
+    """Browser double whose tabs each load pages from a mock server over HTTP."""
+
+    def __init__(self, server):
+        self.server = server
+        self.tabs = {"tab-0": self._new_tab()}
+        self.current_window_handle = "tab-0"
+        self.opened = 0
+        self.ready_state = "complete"
+        self.switch_to = SimpleNamespace(window=self._switch)
+
+    def _new_tab(self):
+        return HttpDriver(HttpSession(self.server.session_cookies, base_url=self.server.base_url))
+
+    def _switch(self, handle):
+        if handle not in self.tabs:
+            raise KeyError(handle)
+        self.current_window_handle = handle
+
+    @property
+    def window_handles(self):
+        return list(self.tabs)
+
+    @property
+    def tab(self):
+        return self.tabs[self.current_window_handle]
+
+    def get(self, url):
+        self.tab.get(url)
+
+    @property
+    def current_url(self):
+        return self.tab.current_url
+
+    @property
+    def title(self):
+        return self.tab.title
+
+    def find_element(self, by, value):
+        return self.tab.find_element(by, value)
+
+    def find_elements(self, by, value):
+        return self.tab.find_elements(by, value)
+
+    def execute_script(self, script, *args):
+        if script == OPEN_TAB_SCRIPT:
+            self.opened += 1
+            tab = self._new_tab()
+            tab.get(args[0])
+            self.tabs[f"tab-{self.opened}"] = tab
+        elif script == READY_STATE_SCRIPT:
+            return self.ready_state
+
+    def close(self):
+        del self.tabs[self.current_window_handle]
+
+    def get_cookies(self):
+        return [{"name": name, "value": value} for name, value in self.server.session_cookies.items()]
+
+    def quit(self):
+        pass
+
+@pytest.fixture
+def server():
+    dataset = Dataset.generate(seed=3, course_count=4, grade_count=8, assignment_count=8)
+    with MockBrightspaceServer(dataset) as server:
+        yield server
+
+def test_prefetch_opens_background_tab(server):
+    browser = TabbedBrowser(server)
+    prefetcher = TabPrefetcher(browser, max_tabs=2)
+
+    assert prefetcher.prefetch(f"{server.base_url}/d2l/home")
+    assert not prefetcher.prefetch(f"{server.base_url}/d2l/home")
+    assert browser.current_window_handle == "tab-0"
+    assert len(browser.window_handles) == 2
+
+def test_take_switches_to_loaded_tab(server):
+    browser = TabbedBrowser(server)
+    prefetcher = TabPrefetcher(browser)
+    url = f"{server.base_url}/d2l/home"
+    prefetcher.prefetch(url)
+
+    assert prefetcher.take(url)
+    assert browser.current_window_handle == "tab-1"
+    assert browser.current_url == url
+    # The tab that was in use was closed
+    assert browser.window_handles == ["tab-1"]
+    assert not prefetcher.take(url)
+    assert (prefetcher.stats.hits, prefetcher.stats.misses) == (1, 1)
+
+def test_tab_that_does_not_load_is_closed(server):
+    browser = TabbedBrowser(server)
+    brightspace = Brightspace(base_url=server.base_url, driver=browser, prefetch_tabs=4)
+    brightspace.prefetcher.load_timeout = 0.1
+    org_unit_ids = [mock.course.org_unit_id for mock in server.dataset.courses[:2]]
+    brightspace.prefetch(org_unit_ids)
+    browser.ready_state = "loading"
+
+    grades = brightspace.get_grades(str(org_unit_ids[0]))
+
+    assert [grade.name for grade in grades] == [grade.name for _, grade in server.dataset.courses[0].grades]
+    assert browser.current_window_handle == "tab-0"
+    assert "tab-1" not in browser.window_handles
+    assert brightspace.prefetcher.stats.misses == 1
+    # The client keeps working afterwards
+    assert len(brightspace.get_assignments(str(org_unit_ids[1]))) == 8
+
+def test_least_recently_prefetched_tab_is_closed(server):
+    browser = TabbedBrowser(server)
+    prefetcher = TabPrefetcher(browser, max_tabs=2)
+    urls = [f"{server.base_url}/d2l/home?page={page}" for page in range(3)]
+
+    prefetcher.prefetch(urls[0])
+    prefetcher.prefetch(urls[1])
+    prefetcher.prefetch(urls[0]) # Refreshes the first tab
+    prefetcher.prefetch(urls[2])
+
+    assert urls[0] in prefetcher and urls[2] in prefetcher and urls[1] not in prefetcher
+    assert len(browser.window_handles) == 3
+    assert prefetcher.stats.evicted == 1
+    assert browser.current_window_handle == "tab-0"
+
+def test_get_grades_uses_prefetched_tabs(server):
+    browser = TabbedBrowser(server)
+    brightspace = Brightspace(base_url=server.base_url, driver=browser, prefetch_tabs=4)
+    org_unit_ids = [mock.course.org_unit_id for mock in server.dataset.courses[:2]]
+
+    assert brightspace.prefetch(org_unit_ids) == 4
+    loaded = len(server.requests)
+    grades = brightspace.get_grades(str(org_unit_ids[0]))
+    assignments = brightspace.get_assignments(str(org_unit_ids[1]))
+
+    assert len(server.requests) == loaded
+    assert [grade.name for grade in grades] == [grade.name for _, grade in server.dataset.courses[0].grades]
+    assert [assignment.name for assignment in assignments] == [assignment.name for _, assignment in server.dataset.courses[1].assignments]
+    assert brightspace.prefetcher.stats.hits == 2
+    assert len(browser.window_handles) == 3
+
+def test_prefetch_is_limited_to_the_most_urgent_pages(server):
+    brightspace = Brightspace(base_url=server.base_url, driver=TabbedBrowser(server), prefetch_tabs=3)
+    org_unit_ids = [mock.course.org_unit_id for mock in server.dataset.courses]
+
+    assert brightspace.prefetch(org_unit_ids) == 3
+    assert brightspace.grades_url(org_unit_ids[0]) in brightspace.prefetcher
+    assert brightspace.grades_url(org_unit_ids[1]) in brightspace.prefetcher
+    assert brightspace.grades_url(org_unit_ids[2]) not in brightspace.prefetcher
+
+def test_static_drivers_do_not_prefetch(server):
+    brightspace = Brightspace(
+        base_url=server.base_url,
+        driver=HttpDriver(HttpSession(server.session_cookies, base_url=server.base_url)),
+        prefetch_tabs=4,
+    )
+    assert brightspace.prefetcher is None
+    assert brightspace.prefetch([1]) == 0
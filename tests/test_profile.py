@@ -0,0 +1,176 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.errors import BrightspaceError
+from acbrightspace.profile import ChromeProfile, directory_size
+
+def write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+def test_concurrent_profiles_use_separate_slots(tmp_path):
+    first = ChromeProfile(tmp_path, slots=2)
+    second = ChromeProfile(tmp_path, slots=2)
+    third = ChromeProfile(tmp_path, slots=2, lock_timeout=0.2)
+
+    assert first.acquire() == tmp_path / "slot-0"
+    assert second.acquire() == tmp_path / "slot-1"
+    with pytest.raises(BrightspaceError, match="in use"):
+        third.acquire()
+
+    first.release()
+    assert third.acquire() == tmp_path / "slot-0"
+
+def test_warm_after_first_use(tmp_path):
+    profile = ChromeProfile(tmp_path)
+    profile.acquire()
+    assert not profile.was_warm
+    # Chrome creates the Default profile on its first run
+    (profile.path / "Default").mkdir()
+    profile.release()
+
+    profile.acquire()
+    assert profile.was_warm
+
+def test_prunes_caches_before_cookies(tmp_path):
+    slot = tmp_path / "slot-0"
+    write(slot / "Default" / "Cookies", 100)
+    write(slot / "Default" / "Cache" / "data_0", 1000)
+    write(slot / "Default" / "Code Cache" / "js" / "index", 100)
+
+    profile = ChromeProfile(tmp_path, max_size=500)
+    profile.acquire()
+
+    assert not (slot / "Default" / "Cache").exists()
+    assert (slot / "Default" / "Code Cache" / "js" / "index").exists()
+    assert (slot / "Default" / "Cookies").exists()
+    assert profile.was_warm
+
+def test_rotates_when_pruning_is_not_enough(tmp_path):
+    slot = tmp_path / "slot-0"
+    write(slot / "Default" / "IndexedDB" / "big", 1000)
+
+    profile = ChromeProfile(tmp_path, max_size=500)
+    profile.acquire()
+
+    assert directory_size(slot) == 0
+    assert not profile.was_warm
+
+def test_failed_preparation_releases_slot(tmp_path):
+    profile = ChromeProfile(tmp_path)
+    with patch("acbrightspace.profile.directory_size", side_effect=PermissionError("denied")):
+        with pytest.raises(PermissionError):
+            profile.acquire()
+
+    assert profile.path is None
+    other = ChromeProfile(tmp_path, lock_timeout=0)
+    assert other.acquire() == tmp_path / "slot-0"
+    # The failed profile holds no lock, so it can try again
+    profile.lock_timeout = 0
+    with pytest.raises(BrightspaceError, match="in use"):
+        profile.acquire()
+
+def test_options(tmp_path):
+    profile = ChromeProfile(tmp_path)
+    profile.acquire()
+    assert f"--user-data-dir={(tmp_path / 'slot-0').resolve()}" in profile.options().arguments
+
+def test_brightspace_locks_profile_until_closed(tmp_path):
+    profile = ChromeProfile(tmp_path)
+    with patch("acbrightspace.brightspace.webdriver.Chrome") as chrome:
+        brightspace = Brightspace(profile=profile)
+
+    options = chrome.call_args.kwargs["options"]
+    assert f"--user-data-dir={(tmp_path / 'slot-0').resolve()}" in options.arguments
+    with pytest.raises(BrightspaceError):
+        ChromeProfile(tmp_path, lock_timeout=0).acquire()
+
+    brightspace.close()
+    ChromeProfile(tmp_path, lock_timeout=0).acquire()
+
+def test_first_navigation_time(tmp_path):
+    with patch("acbrightspace.brightspace.webdriver.Chrome") as chrome:
+        brightspace = Brightspace(profile=ChromeProfile(tmp_path))
+    chrome.return_value.current_url = "https://brightspace.algonquincollege.com/d2l/home"
+    chrome.return_value.title = "Homepage"
+
+    # The login page does not count
+    brightspace.login("test@algonquincollege.com", "password123", "JBSWY3DPEHPK3PXP")
+    assert brightspace.first_navigation_seconds is None
+    brightspace._navigate("https://brightspace.algonquincollege.com/d2l/home")
+    first = brightspace.first_navigation_seconds
+    brightspace._navigate("https://brightspace.algonquincollege.com/d2l/home")
+
+    assert first is not None
+    assert brightspace.first_navigation_seconds == first
+
+class FakeField:
+    def __init__(self, browser, next_step):
+        self.browser = browser
+        self.next_step = next_step
+
+    def send_keys(self, keys):
+        if keys == Keys.RETURN:
+            self.browser.step = self.next_step
+            if self.next_step == "home":
+                # Chrome keeps the session cookie in the profile
+                self.browser.cookies.write_text("session")
+
+class FakeChrome:
+    """Stands in for Chrome with a login form, keeping its session cookie in the profile directory."""
+
+    FIELDS = {"username": ((By.NAME, "loginfmt"), "password"), "password": ((By.ID, "passwordInput"), "totp"), "totp": ((By.NAME, "otc"), "home")}
+
+    def __init__(self, options):
+        directory = next(argument.split("=", 1)[1] for argument in options.arguments if argument.startswith("--user-data-dir="))
+        self.cookies = Path(directory) / "Default" / "Cookies"
+        self.cookies.parent.mkdir(parents=True, exist_ok=True)
+        self.step = None
+        self.forms_shown = 0
+
+    def get(self, url):
+        self.step = "home" if self.cookies.exists() else "username"
+        self.forms_shown += self.step == "username"
+
+    @property
+    def current_url(self):
+        path = "/d2l/home" if self.step == "home" else "/common/oauth2/authorize"
+        host = "brightspace.algonquincollege.com" if self.step == "home" else "login.microsoftonline.com"
+        return f"https://{host}{path}"
+
+    def find_element(self, by, value):
+        fields = self.find_elements(by, value)
+        if not fields:
+            raise NoSuchElementException(value)
+        return fields[0]
+
+    def find_elements(self, by, value):
+        locator, next_step = self.FIELDS.get(self.step, (None, None))
+        return [FakeField(self, next_step)] if locator == (by, value) else []
+
+    def quit(self):
+        pass
+
+def test_second_login_reuses_session_of_warm_profile(tmp_path):
+    browsers = []
+
+    def chrome(options):
+        browsers.append(FakeChrome(options))
+        return browsers[-1]
+
+    for _ in range(2):
+        with patch("acbrightspace.brightspace.webdriver.Chrome", side_effect=chrome):
+            brightspace = Brightspace(profile=ChromeProfile(tmp_path))
+        try:
+            brightspace.login("test@algonquincollege.com", "password123", "JBSWY3DPEHPK3PXP")
+            assert brightspace.driver.current_url.endswith("/d2l/home")
+        finally:
+            brightspace.close()
+
+    assert [browser.forms_shown for browser in browsers] == [1, 0]
@@ -0,0 +1,85 @@
+import re
+import threading
+import time
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.drivers import HttpDriver
+from acbrightspace.html import HtmlDocument
+from acbrightspace.mock_server import Dataset, MockBrightspaceServer
+from acbrightspace.profiler import DRIVER, NO_PHASE, OTHER, PARSING, Profiler, classify
+from acbrightspace.schema import GRADES_SCHEMA
+from acbrightspace.session import HttpSession
+from acbrightspace.table import Table
+
+def test_classify():
+    brightspace = ("acbrightspace.brightspace", "Brightspace.get_grades")
+    assert classify((brightspace, ("acbrightspace.table", "Table.parse_cell"), ("_strptime", "_strptime"))) == PARSING
+    assert classify((brightspace, ("acbrightspace.drivers", "HttpDriver.get"), ("urllib3.connectionpool", "HTTPConnectionPool.urlopen"))) == DRIVER
+    # HTML parsed after a page load is parsing, even though a driver call made it
+    assert classify((brightspace, ("acbrightspace.drivers", "HttpDriver.get"), ("acbrightspace.html", "HtmlDocument.parse"))) == PARSING
+    assert classify((brightspace, ("acbrightspace.resilience", "Resilience.call"))) == OTHER
+    assert classify((("acbrightspace.pool", "ClientPool.map"), ("concurrent.futures._base", "Future.result"), ("threading", "Condition.wait"))) is None
+
+def grades_table(count):
+    rows = "".join(f"<tr><th>Lab {index}</th><td>{index % 10} / 10</td><td>1 / 2</td><td></td><td></td></tr>" for index in range(count))
+    header = "<tr><th>Grade Item</th><th>Points</th><th>Weight Achieved</th><th>Grade</th><th>Comments and Assessments</th></tr>"
+    return HtmlDocument.parse(f"<table id='z_f'>{header}{rows}</table>").find_element(By.ID, "z_f")
+
+def test_parsing_in_worker_threads():
+    table = grades_table(200)
+    profiler = Profiler(interval=0.001)
+
+    def work():
+        with profiler.phase("grades"):
+            deadline = time.perf_counter() + 0.2
+            while time.perf_counter() < deadline:
+                Table(GRADES_SCHEMA).parse(table)
+
+    with profiler:
+        worker = threading.Thread(target=work)
+        worker.start()
+        worker.join()
+
+    seconds = profiler.seconds()
+    assert seconds["grades"][PARSING] > 0.1
+    assert seconds["grades"][PARSING] > seconds["grades"][OTHER]
+    assert "acbrightspace.table:Table.parse_cell" in dict(profiler.functions(PARSING))
+    # The main thread only waited for the worker
+    assert NO_PHASE not in seconds
+
+def test_waiting_on_the_driver():
+    dataset = Dataset.generate(seed=1, course_count=2, grade_count=20, assignment_count=20)
+    with MockBrightspaceServer(dataset, latency=0.05) as server:
+        brightspace = Brightspace(base_url=server.base_url, driver=HttpDriver(HttpSession(server.session_cookies, base_url=server.base_url)))
+        with Profiler(interval=0.002) as profiler:
+            for mock in dataset.courses:
+                with profiler.phase("assignments"):
+                    brightspace.get_assignments(str(mock.course.org_unit_id))
+
+    assert profiler.seconds()["assignments"][DRIVER] > 0.05
+    assert any(name.startswith("acbrightspace.") for name, _ in profiler.functions(DRIVER))
+
+def test_report_and_folded_stacks(tmp_path):
+    table = grades_table(100)
+    with Profiler(interval=0.001) as profiler:
+        with profiler.phase("grades"):
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                Table(GRADES_SCHEMA).parse(table)
+
+    report, folded = profiler.write(tmp_path / "profile")
+
+    text = report.read_text()
+    assert re.search(r"^grades +[\d.]+s", text, re.MULTILINE)
+    assert "Parsing functions" in text
+    lines = folded.read_text().splitlines()
+    assert lines and all(re.fullmatch(r"[^ ]+ \d+", line) for line in lines)
+    assert any(line.startswith("grades;parsing;") and "acbrightspace.table:Table.parse_cell" in line for line in lines)
+
+def test_profiler_cannot_start_twice():
+    with Profiler() as profiler:
+        with pytest.raises(RuntimeError):
+            profiler.start()
@@ -0,0 +1,120 @@
+from datetime import datetime
+from urllib.parse import urljoin
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.drivers import HttpDriver
+from acbrightspace.fraction import Fraction
+from acbrightspace.mock_server import Dataset
+from acbrightspace.quiz import Quiz, QuizAttempt
+from acbrightspace.serialization import decode, encode
+from acbrightspace.session import HttpSession
+from acbrightspace.table import SNAPSHOT_SCRIPT
+
+@pytest.fixture
+def mock_dataset():
+    return Dataset.generate(seed=5, course_count=2, grade_count=4, assignment_count=4, quiz_count=4)
+
+class ScriptingBrowser:
+    """Browser double that loads pages over HTTP and answers the table snapshot script like Chrome would."""
+
+    def __init__(self, server):
+        self.base_url = server.base_url
+        self.tab = HttpDriver(HttpSession(server.session_cookies, base_url=server.base_url))
+        self.snapshots = 0
+
+    def get(self, url):
+        self.tab.get(url)
+
+    @property
+    def current_url(self):
+        return self.tab.current_url
+
+    @property
+    def title(self):
+        return self.tab.title
+
+    def find_element(self, by, value):
+        return self.tab.find_element(by, value)
+
+    def find_elements(self, by, value):
+        return self.tab.find_elements(by, value)
+
+    def get_cookies(self):
+        return self.tab.get_cookies()
+
+    def execute_script(self, script, *args):
+        if script != SNAPSHOT_SCRIPT:
+            return None
+        self.snapshots += 1
+        return [
+            [
+                [
+                    cell.tag_name, cell.text, cell.get_attribute("scope"), cell.get_attribute("colspan"),
+                    [urljoin(self.base_url, link.get_attribute("href")) for link in cell.find_elements(By.CSS_SELECTOR, "a[href]")],
+                ]
+                for cell in row.find_elements(By.XPATH, ".//td | .//th")
+            ]
+            for row in args[0].find_elements(By.TAG_NAME, "tr")
+        ]
+
+    def quit(self):
+        self.tab.quit()
+
+def quiz_requests(server, page):
+    return [path for path in server.requests if f"/quizzing/user/{page}.d2l" in path]
+
+def test_get_quizzes(mock_server, http_client):
+    mock = mock_server.dataset.courses[0]
+
+    quizzes = http_client().get_quizzes(str(mock.course.org_unit_id))
+
+    assert quizzes == mock.quizzes
+    assert any(attempt.questions for quiz in quizzes for attempt in quiz.attempts)
+    assert len(quiz_requests(mock_server, "quiz_submissions_attempt")) == sum(len(quiz.attempts) for quiz in mock.quizzes)
+
+def test_unattempted_quizzes_are_not_opened(mock_server, http_client):
+    mock = mock_server.dataset.courses[0]
+    mock.quizzes[1].attempts.clear()
+
+    quizzes = http_client().get_quizzes(str(mock.course.org_unit_id))
+
+    assert quizzes[1].attempts == []
+    assert not any(f"qi={mock.quizzes[1].id}&" in path for path in quiz_requests(mock_server, "quiz_submissions"))
+    assert len(quiz_requests(mock_server, "quiz_submissions")) == len(mock.quizzes) - 1
+
+def test_without_attempt_details(mock_server, http_client):
+    mock = mock_server.dataset.courses[1]
+
+    quizzes = http_client().get_quizzes(str(mock.course.org_unit_id), attempt_details=False)
+
+    assert [len(quiz.attempts) for quiz in quizzes] == [len(quiz.attempts) for quiz in mock.quizzes]
+    assert all(not attempt.questions for quiz in quizzes for attempt in quiz.attempts)
+    assert quiz_requests(mock_server, "quiz_submissions_attempt") == []
+
+def test_browser_reads_each_table_in_one_script_call(mock_server):
+    mock = mock_server.dataset.courses[0]
+    browser = ScriptingBrowser(mock_server)
+    brightspace = Brightspace(base_url=mock_server.base_url, driver=browser)
+
+    assert brightspace.get_quizzes(str(mock.course.org_unit_id)) == mock.quizzes
+    # The quiz list and the attempts table of each attempted quiz
+    assert browser.snapshots == 1 + sum(1 for quiz in mock.quizzes if quiz.attempts)
+
+def test_best_score():
+    quiz = Quiz(id=1, name="Quiz 1", starts_at=None, ends_at=None, due_at=None, evaluation_status=None, attempts=[
+        QuizAttempt(number=1, score=Fraction(6, 10), submitted_at=None),
+        QuizAttempt(number=2, score=Fraction(4, 5), submitted_at=None),
+        QuizAttempt(number=3, score=None, submitted_at=None),
+    ])
+    assert quiz.best_score == Fraction(4, 5)
+    assert Quiz(id=2, name="Quiz 2", starts_at=None, ends_at=None, due_at=None, evaluation_status=None).best_score is None
+
+def test_quizzes_round_trip(mock_server):
+    quizzes = mock_server.dataset.courses[0].quizzes
+    assert decode(encode(quizzes)) == quizzes
+    assert [Quiz.from_dict(quiz.to_dict()) for quiz in quizzes] == quizzes
+    with pytest.raises(ValueError, match="version"):
+        Quiz.from_dict(quizzes[0].to_dict(), version=2)
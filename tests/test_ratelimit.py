@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+import pytest
+
+from acbrightspace.brightspace import Brightspace
+from acbrightspace.drivers import HttpDriver
+from acbrightspace.mock_server import Dataset, MockBrightspaceServer
+from acbrightspace.ratelimit import LOGIN, PAGE, FileBuckets, RateLimit, RateLimiter
+from acbrightspace.session import HttpSession
+
+class FakeClock:
+    """Clock that only moves when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+def limiter(clock, page=RateLimit(rate=2, burst=2), **kwargs):
+    kwargs.setdefault("sleep", clock.sleep)
+    return RateLimiter(limits={PAGE: page}, clock=clock, **kwargs)
+
+def test_bursts_then_waits():
+    clock = FakeClock()
+    rate_limiter = limiter(clock)
+
+    delays = [rate_limiter.acquire("https://a.example/page") for _ in range(4)]
+
+    assert delays == [0, 0, 0.5, 0.5]
+    assert clock.sleeps == [0.5, 0.5]
+
+def test_waiting_requests_queue_in_order():
+    clock = FakeClock()
+    rate_limiter = limiter(clock, sleep=lambda seconds: None)
+
+    # Nobody sleeps, so each reservation waits behind the previous ones
+    assert [rate_limiter.acquire("https://a.example/") for _ in range(5)] == [0, 0, 0.5, 1.0, 1.5]
+
+def test_tokens_refill_over_time():
+    clock = FakeClock()
+    rate_limiter = limiter(clock)
+    rate_limiter.acquire("https://a.example/")
+    rate_limiter.acquire("https://a.example/")
+
+    clock.now += 10
+    assert [rate_limiter.acquire("https://a.example/") for _ in range(2)] == [0, 0]
+
+def test_hosts_and_budgets_are_separate():
+    clock = FakeClock()
+    rate_limiter = limiter(clock, page=RateLimit(rate=1, burst=1))
+
+    assert rate_limiter.acquire("https://a.example/") == 0
+    assert rate_limiter.acquire("https://b.example/") == 0
+    assert rate_limiter.acquire("https://a.example/login", LOGIN) == 0
+    assert rate_limiter.acquire("https://a.example/") == 1
+
+def test_account_budget_covers_every_host():
+    clock = FakeClock()
+    rate_limiter = limiter(clock, page=RateLimit(rate=1, burst=1))
+
+    assert rate_limiter.acquire("https://a.example/", account="Student@example.com") == 0
+    assert rate_limiter.acquire("https://b.example/", account="student@example.com") == 1
+
+def test_unknown_budget():
+    with pytest.raises(ValueError):
+        RateLimiter().acquire("https://a.example/", "uploads")
+
+def test_stats_and_callback():
+    clock = FakeClock()
+    acquired = []
+    rate_limiter = limiter(clock, on_acquire=lambda category, delay: acquired.append((category, delay)))
+    for _ in range(3):
+        rate_limiter.acquire("https://a.example/")
+
+    stats = rate_limiter.stats()[PAGE]
+    assert (stats.requests, stats.delayed, stats.total_delay, stats.max_delay) == (3, 1, 0.5, 0.5)
+    assert stats.mean_delay == pytest.approx(0.5 / 3)
+    assert acquired == [(PAGE, 0), (PAGE, 0), (PAGE, 0.5)]
+
+def test_file_buckets_are_shared_between_limiters(tmp_path):
+    clock = FakeClock()
+    path = tmp_path / "ratelimit.json"
+    first = limiter(clock, store=FileBuckets(path))
+    second = limiter(clock, store=FileBuckets(path), sleep=lambda seconds: None)
+
+    assert first.acquire("https://a.example/") == 0
+    assert second.acquire("https://a.example/") == 0
+    assert second.acquire("https://a.example/") == 0.5
+
+def test_acquire_async():
+    rate_limiter = RateLimiter(limits={PAGE: RateLimit(rate=50, burst=1)})
+
+    async def run():
+        return await asyncio.gather(*[rate_limiter.acquire_async("https://a.example/") for _ in range(4)])
+
+    start = time.monotonic()
+    delays = asyncio.run(run())
+    assert sorted(delays)[0] == 0
+    assert time.monotonic() - start >= 0.05
+    assert rate_limiter.stats()[PAGE].requests == 4
+
+def test_http_driver_session_is_limited():
+    dataset = Dataset.generate(seed=1, course_count=2, grade_count=5, assignment_count=5)
+    with MockBrightspaceServer(dataset) as server:
+        rate_limiter = RateLimiter()
+        brightspace = Brightspace(
+            base_url=server.base_url,
+            driver=HttpDriver(HttpSession(server.session_cookies, base_url=server.base_url)),
+            rate_limiter=rate_limiter,
+        )
+        brightspace.get_grades(str(dataset.courses[0].course.org_unit_id))
+
+    assert rate_limiter.stats()[PAGE].requests >= 1
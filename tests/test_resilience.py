@@ -0,0 +1,168 @@
+import random
+
+import pytest
+import urllib3
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
+from acbrightspace.errors import AuthenticationError, CircuitOpenError, HttpStatusError
+from acbrightspace.resilience import CircuitBreaker, CircuitState, ErrorKind, Resilience, RetryPolicy, classify
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.mark.parametrize("error,kind", [
+    (TimeoutException(), ErrorKind.TIMEOUT),
+    (urllib3.exceptions.ReadTimeoutError(None, "/", "timed out"), ErrorKind.TIMEOUT),
+    (StaleElementReferenceException(), ErrorKind.STALE_ELEMENT),
+    (HttpStatusError("Service Unavailable", 503), ErrorKind.SERVER_ERROR),
+    (HttpStatusError("Forbidden", 403), ErrorKind.AUTH),
+    (HttpStatusError("Not Found", 404), ErrorKind.UNKNOWN),
+    (AuthenticationError("Logged out"), ErrorKind.AUTH),
+    (ConnectionResetError(), ErrorKind.CONNECTION),
+    (ValueError("Invalid course string format"), ErrorKind.UNKNOWN),
+])
+def test_classify(error, kind):
+    assert classify(error) == kind
+
+
+class TestRetryPolicy:
+    def test_delay_grows_exponentially_up_to_max(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        generator = random.Random(0)
+        for attempt, ceiling in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0), (10, 5.0)]:
+            delays = [policy.delay(attempt, generator) for _ in range(200)]
+            assert all(0 <= delay <= ceiling for delay in delays)
+            # Full jitter spreads delays over the whole range
+            assert max(delays) > ceiling * 0.9
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_allows_one_trial(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()
+        # Only one trial at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failed_trial_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        breaker.before_call()
+        breaker.record_failure()
+
+        clock.now = 15
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+
+class TestResilience:
+    def make(self, **retry):
+        self.sleeps = []
+        return Resilience(
+            retry=RetryPolicy(**retry),
+            breaker=CircuitBreaker(failure_threshold=5, clock=FakeClock()),
+            sleep=self.sleeps.append,
+        )
+
+    def test_retries_transient_errors(self):
+        resilience = self.make(max_attempts=3)
+        results = iter([TimeoutException(), HttpStatusError("Bad Gateway", 502), "ok"])
+
+        def operation():
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        assert resilience.call(operation) == "ok"
+        assert len(self.sleeps) == 2
+
+    def test_gives_up_after_max_attempts(self):
+        resilience = self.make(max_attempts=2)
+        calls = []
+
+        def operation():
+            calls.append(1)
+            raise TimeoutException()
+
+        with pytest.raises(TimeoutException):
+            resilience.call(operation)
+        assert len(calls) == 2
+
+    def test_does_not_retry_auth_errors(self):
+        resilience = self.make(max_attempts=3)
+        calls = []
+
+        def operation():
+            calls.append(1)
+            raise AuthenticationError("Logged out")
+
+        with pytest.raises(AuthenticationError):
+            resilience.call(operation)
+        assert len(calls) == 1
+
+    def test_interrupted_trial_allows_another(self):
+        clock = FakeClock()
+        resilience = self.make()
+        resilience.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        resilience.breaker.record_failure()
+        clock.now = 10
+
+        def interrupted():
+            raise KeyboardInterrupt()
+
+        with pytest.raises(KeyboardInterrupt):
+            resilience.call(interrupted)
+        assert resilience.call(lambda: "ok") == "ok"
+        assert resilience.breaker.state is CircuitState.CLOSED
+
+    def test_circuit_stops_retries(self):
+        resilience = self.make(max_attempts=10)
+        resilience.breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        calls = []
+
+        def operation():
+            calls.append(1)
+            raise HttpStatusError("Service Unavailable", 503)
+
+        with pytest.raises(CircuitOpenError):
+            resilience.call(operation)
+        assert len(calls) == 2
+
+        # Other callers fail fast while the circuit is open
+        with pytest.raises(CircuitOpenError):
+            resilience.call(lambda: "ok")
+        assert len(calls) == 2
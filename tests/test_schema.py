@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import pytest
+
+from acbrightspace.schema import DROPBOX_SCHEMA, GRADES_SCHEMA, ColumnType, DatedText, SchemaMismatchError
+
+class TestColumnType:
+    def test_text_keeps_lines(self):
+        assert ColumnType.TEXT.convert(["Great work.", "See rubric."]) == "Great work.\nSee rubric."
+
+    def test_empty_cells(self):
+        for column_type in ColumnType:
+            assert column_type.convert([]) is None
+
+    def test_fraction(self):
+        fraction = ColumnType.FRACTION.convert(["8.5 / 10", "85 %"])
+        assert fraction.numerator == 8.5
+        assert fraction.denominator == 10.0
+
+    def test_fraction_without_value(self):
+        assert ColumnType.FRACTION.convert(["- / -"]) is None
+
+    def test_invalid_fraction(self):
+        assert ColumnType.FRACTION.convert(["Exempt"]) is None
+
+    def test_status_joins_lines(self):
+        assert ColumnType.STATUS.convert(["1 Submission,", "1 File"]) == "1 Submission, 1 File"
+
+    def test_date(self):
+        assert ColumnType.DATE.convert(["Jan 23, 2026 11:59 PM"]) == datetime(2026, 1, 23, 23, 59)
+        assert ColumnType.DATE.convert(["Not submitted"]) is None
+
+    def test_date_list(self):
+        value = ColumnType.DATE_LIST.convert([
+            "Lab 1",
+            "Due on Jan 23, 2026 11:59 PM",
+            "Available on Jan 5, 2026 8:00 AM Access restricted before availability starts.",
+            "Some other note",
+        ])
+        assert value == DatedText(text="Lab 1", dates={
+            "due": datetime(2026, 1, 23, 23, 59),
+            "starts": datetime(2026, 1, 5, 8, 0),
+        })
+
+
+class TestTableSchema:
+    def test_bind_by_header(self):
+        columns = GRADES_SCHEMA.bind(["Grade Item", "Points", "Weight Achieved", "Grade", "Comments and Assessments"])
+        assert [column.name for column in columns] == ["name", "points", "weight", "grade", "comments"]
+
+    def test_bind_is_case_insensitive_and_ignores_unknown_columns(self):
+        columns = DROPBOX_SCHEMA.bind(["assignment", "Completion Status", "Something New", "Score"])
+        assert [column and column.name for column in columns] == ["folder", "completion_status", None, "score"]
+
+    def test_missing_required_column(self):
+        with pytest.raises(SchemaMismatchError, match="dropbox table does not match its schema: missing 'Completion Status'"):
+            DROPBOX_SCHEMA.bind(["Assignment", "Score"])
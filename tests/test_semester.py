@@ -81,4 +81,25 @@ class TestSemesterFromCode:
 
     def test_invalid_year_not_integer(self):
         with pytest.raises(ValueError):
-            Semester.from_code("ABW")
\ No newline at end of file
+            Semester.from_code("ABW")
+
+class TestSemesterParse:
+    @pytest.mark.parametrize("value", ["26W", "26w", " 26W ", "2026 Winter", "2026 winter", Semester(2026, "Winter")])
+    def test_name_or_code(self, value):
+        assert Semester.parse(value) == Semester(2026, "Winter")
+
+    def test_invalid_value(self):
+        with pytest.raises(ValueError):
+            Semester.parse("Winter")
+
+class TestSemesterEquality:
+    def test_equal_semesters(self):
+        assert Semester(2026, "Winter") == Semester.from_code("26W")
+        assert Semester(2026, "Winter") != Semester(2026, "Fall")
+
+    def test_hashable(self):
+        assert len({Semester(2026, "Winter"), Semester.from_name("2026 Winter")}) == 1
+
+    def test_round_trip_dict(self):
+        semester = Semester(2025, "Spring")
+        assert Semester.from_dict(semester.to_dict()) == semester
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+import json
+
+import pytest
+
+from acbrightspace.assignment import Assignment
+from acbrightspace.course import Course
+from acbrightspace.fraction import Fraction
+from acbrightspace.grade_item import GradeItem
+from acbrightspace.mock_server import Dataset
+from acbrightspace.semester import Semester
+from acbrightspace.serialization import MAGIC, decode, encode, from_dict, pack, to_dict, unpack
+
+@pytest.fixture(scope="module")
+def dataset():
+    return Dataset.generate(seed=7, course_count=4, grade_count=30, assignment_count=30)
+
+def model_lists(dataset):
+    return [
+        [mock.course for mock in dataset.courses],
+        [grade for mock in dataset.courses for _, grade in mock.grades],
+        [assignment for mock in dataset.courses for _, assignment in mock.assignments],
+    ]
+
+@pytest.mark.parametrize("value", [
+    None, True, False, 0, 127, 128, -1, -32, -33, 255, 256, 65536, 2**32, 2**63, -2**63, -200, -40000,
+    0.5, -1e300, "", "é" * 40, "x" * 300, "y" * 70000, b"\x00\x01", [], list(range(20)), {"a": [1, {"b": None}]},
+    {str(number): number for number in range(20)},
+    datetime(2026, 1, 12, 9, 30, 15, 123456), datetime(1960, 5, 1),
+    datetime(2026, 1, 12, 9, 30, tzinfo=timezone(timedelta(hours=-5))),
+])
+def test_pack_round_trip(value):
+    assert unpack(pack(value)) == value
+
+def test_pack_uses_small_encodings():
+    assert pack(5) == b"\x05"
+    assert pack(-3) == b"\xfd"
+    assert pack("abc") == b"\xa3abc"
+    assert pack([1, 2]) == b"\x92\x01\x02"
+    assert pack({"a": None}) == b"\x81\xa1a\xc0"
+
+def test_pack_rejects_unsupported_types():
+    with pytest.raises(TypeError):
+        pack(object())
+    with pytest.raises(OverflowError):
+        pack(2**64)
+
+def test_unpack_rejects_damaged_data():
+    with pytest.raises(ValueError):
+        unpack(pack("abc")[:-1])
+    with pytest.raises(ValueError):
+        unpack(pack(1) + b"\x00")
+
+def test_models_round_trip(dataset):
+    for models in model_lists(dataset):
+        assert decode(encode(models)) == models
+        assert decode(encode(models[0])) == models[0]
+        assert from_dict(json.loads(json.dumps(to_dict(models)))) == models
+
+def test_semester_and_fraction_round_trip():
+    assert decode(encode(Semester(2025, "Fall"))) == Semester(2025, "Fall")
+    assert decode(encode(Fraction(8.5, 10))) == Fraction(8.5, 10)
+    # Whole numbers are stored as integers but come back as floats
+    fraction = decode(encode(Fraction(8.0, 10.0)))
+    assert isinstance(fraction.numerator, float) and fraction == Fraction(8, 10)
+
+def test_optional_fields_round_trip():
+    grade = GradeItem(name="Participation", points=None, weight=None, comments=None)
+    assignment = Assignment(name="Lab 1", starts_at=None, ends_at=None, due_at=None, score=None, completion_status=None, evaluation_status=None)
+    assert decode(encode(grade)) == grade
+    assert decode(encode(assignment)) == assignment
+    assert Assignment.from_dict(assignment.to_dict()) == assignment
+
+def test_assignments_without_folder_ids():
+    assignment = Assignment(name="Lab 1", starts_at=None, ends_at=None, due_at=None, score=None, completion_status=None, evaluation_status=None, folder_id=42)
+    assert decode(encode(assignment)).folder_id == 42
+    # Data written before folder IDs were read
+    data = encode(assignment)
+    name, is_list, row = unpack(data[5:])
+    assert decode(data[:5] + pack([name, is_list, row[:7]])).folder_id is None
+    assert Assignment.from_dict({key: value for key, value in assignment.to_dict().items() if key != "folder_id"}).folder_id is None
+
+def test_to_dict_is_versioned():
+    course = Course.from_string("26W_CST8514_300 Business, 26W_CST8514_300, 2026 Winter, Ends April 27, 2026 at 12:00 AM", org_unit_id=1)
+    envelope = to_dict(course)
+
+    assert (envelope["version"], envelope["type"]) == (1, "Course")
+    assert envelope["data"]["semester"] == {"year": 2026, "term": "Winter"}
+    assert envelope["data"]["ends_at"] == "2026-04-27T00:00:00"
+    with pytest.raises(ValueError, match="version"):
+        from_dict({**envelope, "version": 99})
+    with pytest.raises(ValueError, match="type"):
+        from_dict({**envelope, "type": "Survey"})
+
+def test_binary_is_smaller_than_json(dataset):
+    for models in model_lists(dataset):
+        assert len(encode(models)) < len(json.dumps(to_dict(models)))
+
+def test_encode_rejects_mixed_and_empty_lists():
+    with pytest.raises(TypeError):
+        encode([Fraction(1, 2), Semester(2026, "Fall")])
+    with pytest.raises(TypeError):
+        encode({"name": "not a model"})
+    with pytest.raises(ValueError):
+        encode([])
+
+def test_decode_rejects_foreign_data():
+    with pytest.raises(ValueError):
+        decode(b"not encoded")
+    with pytest.raises(ValueError, match="version"):
+        decode(MAGIC + b"\x63" + pack(["Fraction", False, [1, 2]]))
+    with pytest.raises(ValueError, match="damaged"):
+        decode(MAGIC + b"\x01" + pack(["Survey", False, []]))
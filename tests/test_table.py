@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.webdriver.common.by import By
+
+from acbrightspace.fraction import Fraction
+from acbrightspace.html import HtmlDocument
+from acbrightspace.schema import GRADES_SCHEMA
+from acbrightspace.table import Table, TableState
+
+HEADER = "<th>Grade Item</th><th>Points</th><th>Weight Achieved</th><th>Grade</th><th>Comments and Assessments</th>"
+
+def category_row(name):
+    return f"<tr><th scope='row' colspan='2'>{name}</th><td></td><td></td><td></td></tr>"
+
+def grade_row(name, points, blank):
+    return f"<tr>{'<td></td>' * blank}<th>{name}</th><td>{points} / 10</td><td>1 / 2</td><td></td><td>Note {name}</td></tr>"
+
+def grades_table(prefix, count, category=True, blank=None):
+    """A grades table whose items are named after the table, so mixed up rows are noticed.
+
+    Tables with categories have a blank column in front of the items, and so do
+    later pages of such a table, even without a category header row of their own.
+    """
+    blank = category if blank is None else blank
+    rows = [category_row(f"{prefix} items")] if category else []
+    rows += [grade_row(f"{prefix} {index}", index % 11, blank) for index in range(count)]
+    header = f"<tr>{'<th></th>' * blank}{HEADER}</tr>"
+    return HtmlDocument.parse(f"<table id='z_f'>{header}{''.join(rows)}</table>").find_element(By.ID, "z_f")
+
+def summary(rows):
+    return [(row.values["name"], row.values["points"], row.values["comments"]) for row in rows]
+
+def expected(prefix, count):
+    return [(f"{prefix} {index}", Fraction(index % 11, 10), f"Note {prefix} {index}") for index in range(count)]
+
+def test_state_carries_over_between_pages():
+    table = Table(GRADES_SCHEMA)
+    state = TableState()
+
+    first = table.parse(grades_table("A", 3), state)
+    # The second page starts without a category header row or a recognizable header
+    second = table.parse(grades_table("B", 2, category=False, blank=True), state)
+
+    assert state.category == "A items"
+    assert [column.name if column else None for column in state.columns][:3] == ["name", "points", "weight"]
+    assert summary(first + second) == expected("A", 3) + expected("B", 2)
+
+def test_tables_do_not_share_state():
+    table = Table(GRADES_SCHEMA)
+    table.parse(grades_table("A", 3))
+    # A table without categories is not shifted by the category of the previous one
+    assert summary(table.parse(grades_table("B", 2, category=False))) == expected("B", 2)
+
+def test_concurrent_parses_with_one_table():
+    table = Table(GRADES_SCHEMA)
+    jobs = [(f"T{index}", 5 + index % 30, index % 3 != 0) for index in range(300)]
+    elements = {prefix: grades_table(prefix, count, category) for prefix, count, category in jobs}
+
+    def parse(job):
+        prefix, count, category = job
+        # Half of the jobs parse their table as two pages sharing one state
+        if count % 2:
+            return summary(table.parse(elements[prefix]))
+        return summary(list(table.parse_pages([elements[prefix], grades_table(f"{prefix}b", 3, category=False, blank=category)])))
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(parse, jobs))
+
+    for (prefix, count, _), result in zip(jobs, results):
+        assert result == expected(prefix, count) + ([] if count % 2 else expected(f"{prefix}b", 3))